@@ -7,24 +7,30 @@ from __future__ import annotations
 import json
 import logging
 import random
-import re
-import threading
+from datetime import timedelta
 from functools import wraps
 from typing import TYPE_CHECKING
-from urllib import error, parse, request
 
 from django.conf import settings
 from django.http import Http404, JsonResponse
+from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition
 
 from ..cms.constants import feedback_ratings
 from ..cms.models import Language, Region
+from ..cms.utils.api_snapshot_utils import (
+    get_content_version,
+    get_last_content_update,
+)
+from ..matomo_api.matomo_tracking_queue import matomo_tracking_queue
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from datetime import datetime
     from typing import Any
 
-    from django.http import HttpRequest, HttpResponseRedirect
+    from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 
 logger = logging.getLogger(__name__)
 
@@ -120,38 +126,104 @@ def json_response(function: Callable) -> Callable:
     return wrap
 
 
-def matomo_tracking(func: Callable) -> Callable:
+def conditional_response(endpoint: str, time_dependent: bool = False) -> Callable:
     """
-    This decorator is supposed to be applied to API content endpoints. It will track
-    the request in Matomo. The request to the Matomo API is executed asynchronously in its
-    own thread to not block the Integreat CMS API request.
+    This decorator can be applied to API content endpoints to support conditional requests. It sets the ``ETag`` and
+    ``Last-Modified`` headers based on the content version of the endpoint in the current region (see
+    :mod:`~integreat_cms.cms.utils.api_snapshot_utils`) and answers requests with matching ``If-None-Match`` or
+    ``If-Modified-Since`` headers with HTTP status 304 without executing the view function.
 
-    Only the URL and the User Agent will be sent to Matomo.
+    This is only active if :attr:`~integreat_cms.core.settings.API_SNAPSHOTS_ENABLED` is set, because the content
+    versions have to be shared between all processes.
 
-    :param func: decorated function
-    :return: The decorated feedback view function
+    :param endpoint: The name of the API endpoint
+    :param time_dependent: Whether the result of the endpoint depends on the current date (e.g. because past events
+                           are excluded). If ``True``, the ETag changes every day.
+    :return: The decorator
     """
 
-    def matomo_request(host: str, data: dict) -> None:
+    # pylint: disable=unused-argument
+    def get_etag(request: HttpRequest, *args: Any, **kwargs: Any) -> str:
+        r"""
+        Get the ETag of the requested content
+
+        :param request: Django request
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied kwargs
+        :return: The ETag
         """
-        Wrap HTTP request to Matomo in threaded function.
+        etag = get_content_version(request.region.id, endpoint)
+        if time_dependent:
+            etag += f"_{timezone.localdate()}"
+        return etag
+
+    # pylint: disable=unused-argument
+    def get_last_modified(
+        request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> datetime | None:
+        r"""
+        Get the time of the last modification of the requested content.
+        The ``Last-Modified`` header only has a granularity of one second, so it is omitted while the second of the
+        last modification is not over yet. Otherwise, a later change within the same second would be answered with
+        HTTP status 304 for ``If-Modified-Since``. In this case, only the ``ETag`` is used.
 
-        :param host: Hostname + protocol of Matomo installation
-        :param data: Data to send to Matomo API
+        :param request: Django request
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied kwargs
+        :return: The time of the last modification (or ``None`` if it is within the current second)
         """
-        data_str = parse.urlencode(data)
-        url = f"{host}/matomo.php?{data_str}"
-        req = request.Request(url)
-        try:
-            with request.urlopen(req):
-                pass
-        except error.HTTPError as e:
-            logger.error(
-                "Matomo Tracking API request to %r failed with: %s",
-                # Mask auth token in log
-                re.sub(r"&token_auth=[^&]+", "&token_auth=********", url),
-                e,
+        last_modified = get_last_content_update(request.region.id, endpoint)
+        if time_dependent:
+            start_of_day = timezone.localtime().replace(
+                hour=0, minute=0, second=0, microsecond=0
             )
+            last_modified = max(last_modified, start_of_day)
+        if timezone.now() < last_modified.replace(microsecond=0) + timedelta(seconds=1):
+            return None
+        return last_modified
+
+    def decorator(func: Callable) -> Callable:
+        """
+        The actual decorator
+
+        :param func: decorated function
+        :return: The decorated function
+        """
+        conditional_func = condition(
+            etag_func=get_etag, last_modified_func=get_last_modified
+        )(func)
+
+        @wraps(func)
+        def wrap(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            r"""
+            The inner function for this decorator.
+
+            :param request: Django request
+            :param \*args: The supplied arguments
+            :param \**kwargs: The supplied kwargs
+            :return: The response of the given function or a 304 :class:`~django.http.HttpResponseNotModified`
+            """
+            if not settings.API_SNAPSHOTS_ENABLED:
+                return func(request, *args, **kwargs)
+            return conditional_func(request, *args, **kwargs)
+
+        return wrap
+
+    return decorator
+
+
+def matomo_tracking(func: Callable) -> Callable:
+    """
+    This decorator is supposed to be applied to API content endpoints. It will track
+    the request in Matomo. The request to the Matomo API is added to the process-wide
+    :class:`~integreat_cms.matomo_api.matomo_tracking_queue.MatomoTrackingQueue` and sent
+    in batches by its worker threads to not block the Integreat CMS API request.
+
+    Only the URL and the User Agent will be sent to Matomo.
+
+    :param func: decorated function
+    :return: The decorated feedback view function
+    """
 
     @wraps(func)
     def wrap(request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
@@ -169,19 +241,17 @@ def matomo_tracking(func: Callable) -> Callable:
             or not request.region.matomo_token
         ):
             return func(request, *args, **kwargs)
-        data = {
-            "idsite": request.region.matomo_id,
-            "token_auth": request.region.matomo_token,
-            "rec": 1,
-            "url": request.build_absolute_uri(),
-            "urlref": settings.BASE_URL,
-            "ua": request.META.get("HTTP_USER_AGENT", "unknown user agent"),
-            "cip": f"{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}",
-        }
-
-        t = threading.Thread(target=matomo_request, args=(settings.MATOMO_URL, data))
-        t.daemon = True
-        t.start()
+        matomo_tracking_queue.track(
+            {
+                "idsite": request.region.matomo_id,
+                "token_auth": request.region.matomo_token,
+                "rec": 1,
+                "url": request.build_absolute_uri(),
+                "urlref": settings.BASE_URL,
+                "ua": request.META.get("HTTP_USER_AGENT", "unknown user agent"),
+                "cip": f"{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}",
+            }
+        )
         return func(request, *args, **kwargs)
 
     return wrap
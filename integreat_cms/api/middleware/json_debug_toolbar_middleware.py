@@ -42,7 +42,12 @@ class JsonDebugToolbarMiddleware:
         """
         response = self.get_response(request)
         if "debug" in request.GET and response["Content-Type"] == "application/json":
-            content = json.dumps(json.loads(response.content), sort_keys=True, indent=2)
+            raw_content = (
+                b"".join(response.streaming_content)
+                if response.streaming
+                else response.content
+            )
+            content = json.dumps(json.loads(raw_content), sort_keys=True, indent=2)
             response = HttpResponse(
                 f"<!DOCTYPE html><html><body><pre>{content}</pre></body></html>"
             )
@@ -0,0 +1,93 @@
+"""
+This module contains helpers for the delta sync of the content endpoints.
+
+If the ``since`` parameter is given (e.g. ``/api/v3/augsburg/de/pages/?since=2024-01-01T12:00:00Z``), the endpoints only
+return the objects which changed after the given timestamp. Objects which are no longer available (because they were
+archived, unpublished or are filtered out) are returned as tombstones in the form
+``{"id": ..., "url": ..., "path": ..., "deleted": true}``. Clients should use the time at which they sent their
+previous request as ``since`` parameter for their next request.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from typing import Any
+
+    from django.http import HttpRequest
+
+    from ...cms.models.abstract_content_model import (
+        AbstractContentModel,
+        ContentQuerySet,
+    )
+
+
+def parse_since(request: HttpRequest) -> datetime | None:
+    """
+    Parse the ``since`` parameter of the request
+
+    :param request: The current request
+    :raises ValueError: If the timestamp is invalid
+    :return: The timestamp (or ``None`` if the parameter is not given)
+    """
+    if not (since := request.GET.get("since")):
+        return None
+    # A literal "+" of the UTC offset is decoded as space if it was not url-encoded by the client
+    if (timestamp := parse_datetime(since.replace(" ", "+"))) is None:
+        raise ValueError(f"Invalid timestamp {since!r}, use the ISO 8601 format.")
+    if timezone.is_naive(timestamp):
+        timestamp = timezone.make_aware(timestamp)
+    return timestamp
+
+
+def get_changed_ids(
+    content_objects: ContentQuerySet, since: datetime, *lookups: str
+) -> set[int]:
+    r"""
+    Get the ids of all content objects which themselves or whose translations were changed after the given timestamp.
+    Each lookup is queried separately to allow the database to use the indices on the modification dates.
+
+    :param content_objects: The content objects which should be checked
+    :param since: The timestamp
+    :param \*lookups: Additional relations whose modification should also count as change of the content object
+    :return: The ids of the changed content objects
+    """
+    changed_ids: set[int] = set()
+    for lookup in ["", "translations__", *lookups]:
+        changed_ids.update(
+            content_objects.filter(**{f"{lookup}last_updated__gt": since})
+            .order_by()
+            .values_list("id", flat=True)
+            .distinct()
+        )
+    return changed_ids
+
+
+def transform_tombstone(
+    content_object: AbstractContentModel, language_slug: str
+) -> dict[str, Any] | None:
+    """
+    Create a tombstone for a content object which is no longer available in the given language
+
+    :param content_object: The content object
+    :param language_slug: The slug of the requested language
+    :return: The tombstone (or ``None`` if the object never existed in the given language)
+    """
+    translation = content_object.get_public_translation(
+        language_slug
+    ) or content_object.get_translation(language_slug)
+    if not translation:
+        return None
+    absolute_url = translation.get_absolute_url()
+    return {
+        "id": translation.id,
+        "url": settings.BASE_URL + absolute_url,
+        "path": absolute_url,
+        "deleted": True,
+    }
@@ -4,24 +4,29 @@ This module includes functions related to the event API endpoint.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
 
+from django.apps import apps
 from django.conf import settings
+from django.db.models import F, Prefetch, Q
 from django.http import JsonResponse
 from django.utils import timezone
 from django.utils.html import strip_tags
 
-from ..decorators import json_response
+from ...core.utils.streaming_json_response import StreamingJsonResponse
+from ..decorators import conditional_response, json_response
+from .delta_sync import get_changed_ids, parse_since, transform_tombstone
 from .locations import transform_poi
 
 if TYPE_CHECKING:
     from datetime import date
-    from typing import Any, Iterator
+    from typing import Any, Iterable, Iterator
 
     from django.http import HttpRequest
 
-    from ...cms.models import Event, EventTranslation, POITranslation
+    from ...cms.models import Event, EventTranslation, POITranslation, Region
 
 
 def transform_event(event: Event, custom_date: date | None = None) -> dict[str, Any]:
@@ -144,6 +149,9 @@ def transform_event_recurrences(
 ) -> Iterator[dict[str, Any]]:
     """
     Yield all future recurrences of the event.
+    The recurrences are taken from the materialized occurrences of the event (see
+    :mod:`~integreat_cms.cms.utils.event_occurrence_utils`), which can be prefetched with :func:`get_occurrences_prefetch`.
+    If the occurrences are not materialized far enough yet, they are calculated from the recurrence rule instead.
 
     :param event_translation: The event translation object which should be converted
     :param poi_translation: The poi translation object which is associated to this event
@@ -162,8 +170,21 @@ def transform_event_recurrences(
     start_date = event.start_local.date()
     event_translation.id = None
 
-    # Calculate all recurrences of this event
-    for recurrence_date in event.recurrence_rule.iter_after(start_date):
+    until = max(start_date, today) + timedelta(
+        days=settings.API_EVENTS_MAX_TIME_SPAN_DAYS
+    )
+    if event.occurrences_until and event.occurrences_until >= until:
+        recurrence_dates: Iterable[date] = (
+            timezone.localtime(occurrence.start, event.start_local.tzinfo).date()
+            for occurrence in event.occurrences.all()
+        )
+    else:
+        # The occurrences are materialized by the update_event_occurrences command, not during the request
+        recurrence_dates = event.recurrence_rule.iter_after(
+            start_date, max(start_date, today)
+        )
+
+    for recurrence_date in recurrence_dates:
         if recurrence_date - max(start_date, today) > timedelta(
             days=settings.API_EVENTS_MAX_TIME_SPAN_DAYS
         ):
@@ -176,11 +197,38 @@ def transform_event_recurrences(
         )
 
 
+def get_occurrences_prefetch(today: date, tzinfo: ZoneInfo) -> Prefetch:
+    """
+    Prefetch the occurrences of events which are relevant for :func:`transform_event_recurrences`
+
+    :param today: The first date at which occurrences are relevant
+    :param tzinfo: The timezone of the region
+    :return: The prefetch object for the occurrences
+    """
+    # Get model instead of importing it to avoid circular imports
+    EventOccurrence = apps.get_model(app_label="cms", model_name="EventOccurrence")
+    time_span = timedelta(days=settings.API_EVENTS_MAX_TIME_SPAN_DAYS + 1)
+    today_start = datetime.combine(today, time.min, tzinfo=tzinfo)
+    return Prefetch(
+        "occurrences",
+        queryset=EventOccurrence.objects.filter(
+            Q(start__lt=today_start + time_span)
+            | Q(start__lt=F("event__start") + time_span),
+            start__gte=today_start,
+        ),
+    )
+
+
 @json_response
+@conditional_response("events", time_dependent=True)
 # pylint: disable=unused-argument
-def events(request: HttpRequest, region_slug: str, language_slug: str) -> JsonResponse:
+def events(
+    request: HttpRequest, region_slug: str, language_slug: str
+) -> JsonResponse | StreamingJsonResponse:
     """
-    List all events of the region and transform result into JSON
+    List all events of the region and transform result into JSON.
+    If the ``since`` parameter is given, only the changed events are returned (see
+    :mod:`~integreat_cms.api.v3.delta_sync`).
 
     :param request: The current request
     :param region_slug: The slug of the requested region
@@ -190,13 +238,57 @@ def events(request: HttpRequest, region_slug: str, language_slug: str) -> JsonRe
     region = request.region
     # Throw a 404 error when the language does not exist or is disabled
     region.get_language_or_404(language_slug, only_active=True)
+    try:
+        since = parse_since(request)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    return StreamingJsonResponse(
+        get_public_events(
+            region, language_slug, "combine_recurring" in request.GET, since
+        )
+    )
+
+
+def get_public_events(
+    region: Region,
+    language_slug: str,
+    combine_recurring_events: bool,
+    since: datetime | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield the public translations of all upcoming events of the region.
+    If ``since`` is given, only the events which changed after this timestamp are yielded and tombstones are yielded
+    for changed events which are no longer available (see :mod:`~integreat_cms.api.v3.delta_sync`).
 
-    result: list[dict[str, str | int | None]] = []
+    :param region: The region of the events
+    :param language_slug: The slug of the requested language
+    :param combine_recurring_events: Whether recurring events should be returned as a single event
+    :param since: The timestamp of the last sync
+    :return: An iterator over the transformed event translations
+    """
     now = timezone.now().date()
-    combine_recurring_events = "combine_recurring" in request.GET
-    for event in region.events.prefetch_public_translations().filter(archived=False):
-        if not event.is_past and (
-            event_translation := event.get_public_translation(language_slug)
+    tzinfo = ZoneInfo(region.timezone)
+    events = region.events.prefetch_public_translations().prefetch_related(
+        get_occurrences_prefetch(now, tzinfo)
+    )
+    if since:
+        events = events.filter(
+            id__in=get_changed_ids(
+                region.events, since, "location__", "location__translations__"
+            )
+        ).prefetch_translations()
+    else:
+        # Only select events with upcoming occurrences instead of checking all past events
+        events = events.filter(archived=False).filter_upcoming(
+            datetime.combine(now, time.min, tzinfo=tzinfo)
+        )
+    for event in events:
+        if (
+            not event.archived
+            # Without ``since``, past events are already excluded by the query
+            and not (since and event.is_past)
+            and (event_translation := event.get_public_translation(language_slug))
         ):
             poi_translation = (
                 event.location.get_public_translation(language_slug)
@@ -204,18 +296,10 @@ def events(request: HttpRequest, region_slug: str, language_slug: str) -> JsonRe
                 else None
             )
             if event.is_recurring and not combine_recurring_events:
-                result.extend(
-                    iter(
-                        transform_event_recurrences(
-                            event_translation, poi_translation, now
-                        )
-                    )
+                yield from transform_event_recurrences(
+                    event_translation, poi_translation, now
                 )
             else:
-                result.append(
-                    transform_event_translation(event_translation, poi_translation)
-                )
-
-    return JsonResponse(
-        result, safe=False
-    )  # Turn off Safe-Mode to allow serializing arrays
+                yield transform_event_translation(event_translation, poi_translation)
+        elif since and (tombstone := transform_tombstone(event, language_slug)):
+            yield tombstone
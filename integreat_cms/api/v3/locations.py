@@ -15,16 +15,21 @@ from django.utils.html import strip_tags
 from ...cms.constants import status
 from ...cms.models import POICategoryTranslation
 from ...cms.models.pois.poi import get_default_opening_hours
+from ...core.utils.streaming_json_response import StreamingJsonResponse
 from ...core.utils.strtobool import strtobool
-from ..decorators import json_response
+from ..decorators import conditional_response, json_response
+from .delta_sync import get_changed_ids, parse_since, transform_tombstone
 from .location_categories import transform_location_category
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
     from typing import Any
 
+    from django.db.models.query import QuerySet
     from django.http import HttpRequest
 
-    from ...cms.models import POI, POITranslation
+    from ...cms.models import POI, POITranslation, Region
 
 
 def transform_poi(poi: POI | None) -> dict[str, Any]:
@@ -115,12 +120,15 @@ def transform_poi_translation(poi_translation: POITranslation) -> dict[str, Any]
 
 
 @json_response
+@conditional_response("locations")
 # pylint: disable=unused-argument
 def locations(
     request: HttpRequest, region_slug: str, language_slug: str
-) -> JsonResponse:
+) -> JsonResponse | StreamingJsonResponse:
     """
-    List all POIs of the region and transform result into JSON
+    List all POIs of the region and transform result into JSON.
+    If the ``since`` parameter is given, only the changed POIs are returned (see
+    :mod:`~integreat_cms.api.v3.delta_sync`).
 
     :param request: The current request
     :param region_slug: The slug of the requested region
@@ -130,7 +138,6 @@ def locations(
     region = request.region
     # Throw a 404 error when the language does not exist or is disabled
     region.get_language_or_404(language_slug, only_active=True)
-    result = []
     pois = (
         region.pois.prefetch_public_translations()
         .filter(
@@ -156,10 +163,45 @@ def locations(
             return JsonResponse({"error": str(e)}, status=400)
         pois = pois.filter(location_on_map=location_on_map)
 
-    for poi in pois:
-        if translation := poi.get_public_translation(language_slug):
-            result.append(transform_poi_translation(translation))
+    try:
+        since = parse_since(request)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    if since:
+        return StreamingJsonResponse(
+            get_changed_pois(region, pois, language_slug, since)
+        )
+
+    return StreamingJsonResponse(
+        transform_poi_translation(translation)
+        for poi in pois
+        if (translation := poi.get_public_translation(language_slug))
+    )
+
 
-    return JsonResponse(
-        result, safe=False
-    )  # Turn off Safe-Mode to allow serializing arrays
+def get_changed_pois(
+    region: Region, pois: QuerySet[POI], language_slug: str, since: datetime
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield the public translations of all locations which changed after the given timestamp and tombstones for
+    changed locations which are no longer available (see :mod:`~integreat_cms.api.v3.delta_sync`)
+
+    :param region: The requested region
+    :param pois: The available locations of the region
+    :param language_slug: The slug of the requested language
+    :param since: The timestamp of the last sync
+    :return: An iterator over the transformed location translations and tombstones
+    """
+    changed_ids = get_changed_ids(region.pois.all(), since)
+    public_ids = set()
+    for poi in pois.filter(id__in=changed_ids):
+        if translation := poi.get_public_translation(language_slug):
+            public_ids.add(poi.id)
+            yield transform_poi_translation(translation)
+    for poi in (
+        region.pois.filter(id__in=changed_ids - public_ids)
+        .prefetch_translations()
+        .prefetch_public_translations()
+    ):
+        if tombstone := transform_tombstone(poi, language_slug):
+            yield tombstone
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 from django.http import JsonResponse
 
 from ...cms.constants import postal_code
-from ..decorators import json_response
+from ..decorators import conditional_response, json_response
 
 if TYPE_CHECKING:
     from typing import Any
@@ -77,6 +77,7 @@ def transform_offer(offer: OfferTemplate, region: Region) -> dict[str, Any]:
 
 
 @json_response
+@conditional_response("offers")
 # pylint: disable=unused-argument
 def offers(
     request: HttpRequest, region_slug: str, language_slug: str | None = None
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING
 from django.conf import settings
 from django.core.exceptions import MultipleObjectsReturned
 from django.db.models import prefetch_related_objects
-from django.http import Http404, JsonResponse
+from django.http import Http404, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.html import strip_tags
@@ -20,15 +20,20 @@ from django.views.decorators.csrf import csrf_exempt
 
 from ...cms.forms import PageTranslationForm
 from ...cms.models import Page
-from ..decorators import json_response, matomo_tracking
+from ...cms.utils.api_snapshot_utils import get_api_snapshot
+from ...cms.utils.page_tree_index import get_page_tree_index
+from ...core.utils.streaming_json_response import StreamingJsonResponse
+from ..decorators import conditional_response, json_response, matomo_tracking
+from .delta_sync import get_changed_ids, parse_since, transform_tombstone
 from .offers import transform_offer
 
 if TYPE_CHECKING:
-    from typing import Any
+    from datetime import datetime
+    from typing import Any, Iterator
 
     from django.http import HttpRequest
 
-    from ...cms.models import PageTranslation
+    from ...cms.models import PageTranslation, Region
 
 logger = logging.getLogger(__name__)
 
@@ -110,22 +115,15 @@ def transform_page(page_translation: PageTranslation) -> dict[str, Any]:
     }
 
 
-@matomo_tracking
-@json_response
-# pylint: disable=unused-argument
-def pages(request: HttpRequest, region_slug: str, language_slug: str) -> JsonResponse:
+def get_public_pages(region: Region, language_slug: str) -> Iterator[dict[str, Any]]:
     """
-    Function to iterate through all non-archived pages of a region and return them as JSON.
+    Function to iterate through all non-archived pages of a region and transform their public translations.
 
-    :param request: Django request
-    :param region_slug: slug of a region
+    :param region: The region of the pages
     :param language_slug: language slug
-    :return: JSON object according to APIv3 pages endpoint definition
+    :return: An iterator over the transformed page translations (pages whose parent has no public translation are
+             skipped)
     """
-    region = request.region
-    # Throw a 404 error when the language does not exist or is disabled
-    region.get_language_or_404(language_slug, only_active=True)
-    result = []
     # The preliminary filter for explicitly_archived=False is not strictly required, but reduces the number of entries
     # requested from the database
     for page in (
@@ -137,10 +135,104 @@ def pages(request: HttpRequest, region_slug: str, language_slug: str) -> JsonRes
         .cache_tree(archived=False, language_slug=language_slug)
     ):
         if page_translation := page.get_public_translation(language_slug):
-            result.append(transform_page(page_translation))
-    return JsonResponse(
-        result, safe=False
-    )  # Turn off Safe-Mode to allow serializing arrays
+            try:
+                yield transform_page(page_translation)
+            except Http404:
+                # The response is already being streamed, so unreachable pages can only be skipped
+                continue
+
+
+def get_changed_pages(
+    region: Region, language_slug: str, since: datetime
+) -> Iterator[dict[str, Any]]:
+    """
+    Function to iterate through all pages of a region which changed after the given timestamp (see
+    :mod:`~integreat_cms.api.v3.delta_sync`). Since the path of a page contains the slugs of its ancestors, the
+    descendants of changed pages are included as well.
+
+    :param region: The region of the pages
+    :param language_slug: language slug
+    :param since: The timestamp of the last sync
+    :return: An iterator over the transformed page translations and tombstones of removed or unreachable pages
+    """
+    changed_ids = get_changed_ids(region.pages, since, "mirrored_page__translations__")
+    if not changed_ids:
+        return
+    tree_index = get_page_tree_index(region.id)
+    if not all(page_id in tree_index for page_id in changed_ids):
+        # The tree was modified concurrently, so the cached index is outdated
+        tree_index = get_page_tree_index(region.id, refresh=True)
+    affected_ids = set(changed_ids)
+    for page_id in changed_ids:
+        affected_ids.update(tree_index.get_descendant_ids(page_id))
+    tree_ids = {
+        tree_index.tree_ids[tree_index.positions[page_id]] for page_id in affected_ids
+    }
+    public_ids = set()
+    for page in (
+        region.pages.select_related("organization__icon")
+        .prefetch_related("embedded_offers")
+        .filter(explicitly_archived=False, tree_id__in=tree_ids)
+        .cache_tree(archived=False, language_slug=language_slug)
+    ):
+        if page.id in affected_ids and (
+            page_translation := page.get_public_translation(language_slug)
+        ):
+            try:
+                transformed_page = transform_page(page_translation)
+            except Http404:
+                # Pages below a parent without public translation are removed from the client like deleted pages
+                continue
+            public_ids.add(page.id)
+            yield transformed_page
+    for page in (
+        region.pages.filter(id__in=affected_ids - public_ids)
+        .prefetch_translations()
+        .prefetch_public_translations()
+    ):
+        if tombstone := transform_tombstone(page, language_slug):
+            yield tombstone
+
+
+@matomo_tracking
+@json_response
+@conditional_response("pages")
+# pylint: disable=unused-argument
+def pages(
+    request: HttpRequest, region_slug: str, language_slug: str
+) -> HttpResponse | JsonResponse | StreamingJsonResponse:
+    """
+    Function to iterate through all non-archived pages of a region and return them as JSON.
+    If the ``since`` parameter is given, only the changed pages are returned (see
+    :mod:`~integreat_cms.api.v3.delta_sync`).
+    If enabled, the serialized result is stored as snapshot per region and language (see
+    :func:`~integreat_cms.cms.utils.api_snapshot_utils.get_api_snapshot`), otherwise it is streamed.
+
+    :param request: Django request
+    :param region_slug: slug of a region
+    :param language_slug: language slug
+    :return: JSON object according to APIv3 pages endpoint definition
+    """
+    region = request.region
+    # Throw a 404 error when the language does not exist or is disabled
+    region.get_language_or_404(language_slug, only_active=True)
+    try:
+        since = parse_since(request)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    if since:
+        return StreamingJsonResponse(get_changed_pages(region, language_slug, since))
+    if not settings.API_SNAPSHOTS_ENABLED:
+        return StreamingJsonResponse(get_public_pages(region, language_slug))
+    return HttpResponse(
+        get_api_snapshot(
+            region.id,
+            language_slug,
+            "pages",
+            lambda: get_public_pages(region, language_slug),
+        ),
+        content_type="application/json",
+    )
 
 
 def get_single_page(request: HttpRequest, language_slug: str) -> Page:
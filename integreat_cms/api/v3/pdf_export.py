@@ -17,7 +17,7 @@ from ...cms.utils.pdf_utils import generate_pdf
 from ..decorators import json_response
 
 if TYPE_CHECKING:
-    from django.http import HttpRequest, HttpResponseRedirect
+    from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ logger = logging.getLogger(__name__)
 # pylint: disable=unused-argument
 def pdf_export(
     request: HttpRequest, region_slug: str, language_slug: str
-) -> HttpResponseRedirect:
+) -> HttpResponse | HttpResponseRedirect:
     """
     View function that either returns the requested page specified by the
     url parameter or returns all pages of current region and language as PDF document
@@ -38,7 +38,7 @@ def pdf_export(
     :param language_slug: current language slug
     :raises ~django.http.Http404: HTTP status 404 if the requested page translation cannot be found.
 
-    :return: The redirect to the generated PDF document
+    :return: The redirect to the generated PDF document (or HTTP status 202 if it is still being generated)
     """
     region = request.region
     # Request unrestricted queryset because pdf generator performs further operations (e.g. aggregation) on the queryset
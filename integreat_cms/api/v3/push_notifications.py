@@ -11,7 +11,7 @@ from django.http import JsonResponse
 from django.utils import timezone
 
 from ...cms.models import PushNotificationTranslation
-from ..decorators import json_response
+from ..decorators import conditional_response, json_response
 
 if TYPE_CHECKING:
     from typing import Any
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
 
 
 @json_response
+@conditional_response("fcm", time_dependent=True)
 def sent_push_notifications(
     request: HttpRequest, region_slug: str, language_slug: str
 ) -> JsonResponse:
@@ -0,0 +1,32 @@
+"""
+This module contains the possible status of background jobs.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.utils.translation import gettext_lazy as _
+
+if TYPE_CHECKING:
+    from typing import Final
+
+    from django.utils.functional import Promise
+
+
+#: Waiting for a worker (or for the next attempt)
+PENDING: Final = "PENDING"
+#: Currently run by a worker
+RUNNING: Final = "RUNNING"
+#: Finished successfully
+SUCCEEDED: Final = "SUCCEEDED"
+#: Failed in all attempts
+FAILED: Final = "FAILED"
+
+#: Choices to use these constants in a database field
+CHOICES: Final[list[tuple[str, Promise]]] = [
+    (PENDING, _("Pending")),
+    (RUNNING, _("Running")),
+    (SUCCEEDED, _("Succeeded")),
+    (FAILED, _("Failed")),
+]
@@ -28,3 +28,26 @@ LINK_TYPES: Final = [
     ("phone", _("Phone links")),
     ("invalid", _("Invalid links")),
 ]
+
+#: All links of the url in the region are ignored
+IGNORED: Final = "ignored"
+#: The url was checked successfully
+VALID: Final = "valid"
+#: The check of the url failed
+INVALID: Final = "invalid"
+#: The url is an email address
+EMAIL: Final = "email"
+#: The url is a phone number
+PHONE: Final = "phone"
+#: The url was not checked yet
+UNCHECKED: Final = "unchecked"
+
+#: Choices for the categories of urls in a region (see :func:`~integreat_cms.cms.utils.linkcheck_utils.filter_urls`)
+URL_CATEGORIES: Final = [
+    (IGNORED, _("Ignored")),
+    (VALID, _("Valid")),
+    (INVALID, _("Invalid")),
+    (EMAIL, _("Email")),
+    (PHONE, _("Phone")),
+    (UNCHECKED, _("Unchecked")),
+]
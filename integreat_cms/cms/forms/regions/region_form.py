@@ -2,29 +2,25 @@ from __future__ import annotations
 
 import json
 import logging
-import threading
-import time
-from copy import deepcopy
 from typing import TYPE_CHECKING
 from zoneinfo import available_timezones
 
 from django import forms
 from django.apps import apps
 from django.conf import settings
-from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import override
-from linkcheck.listeners import disable_listeners, tasks_queue
-from linkcheck.models import Link
 
 from integreat_cms.cms.utils.linkcheck_utils import replace_links
 
 from ....gvz_api.utils import GvzRegion
 from ....matomo_api.matomo_api_client import MatomoException
 from ....nominatim_api.nominatim_api_client import NominatimApiClient
-from ...constants import duplicate_pbo_behaviors, status
-from ...models import LanguageTreeNode, OfferTemplate, Page, PageTranslation, Region
+from ...constants import duplicate_pbo_behaviors
+from ...models import OfferTemplate, Region
 from ...models.regions.region import format_mt_help_text
+from ...utils.background_job_utils import background_task, enqueue_job
+from ...utils.region_duplication_utils import duplicate_region_content
 from ...utils.slug_utils import generate_unique_slug_helper
 from ...utils.translation_utils import gettext_many_lazy as __
 from ..custom_model_form import CustomModelForm
@@ -33,7 +29,7 @@ from ..icon_widget import IconWidget
 if TYPE_CHECKING:
     from typing import Any
 
-    from django.db.models.query import QuerySet
+    from ...utils.background_job_utils import JobContext
 
 logger = logging.getLogger(__name__)
 
@@ -285,30 +281,19 @@ class RegionForm(CustomModelForm):
                     id__in=region.offers.values_list("id", flat=True)
                 )
 
-            # Duplicate language tree
-            logger.info("Duplicating language tree of %r to %r", source_region, region)
-            duplicate_language_tree(source_region, region)
-            # Disable linkcheck listeners to prevent links to be created for outdated versions
-            with disable_listeners():
-                # Duplicate pages
-                logger.info("Duplicating page tree of %r to %r", source_region, region)
-                duplicate_pages(
-                    source_region,
-                    region,
-                    keep_status=keep_status,
-                    offers_to_discard=offers_to_discard,
-                )
-                # Duplicate Imprint
-                if source_region.imprint:
-                    logger.info(
-                        "Duplicating imprint of %r to %r", source_region, region
-                    )
-                    duplicate_imprint(source_region, region)
-            # Duplicate media content
-            duplicate_media(source_region, region)
+            duplicate_region_content(
+                source_region,
+                region,
+                keep_status=keep_status,
+                offers_to_discard=offers_to_discard,
+            )
 
-            # Create links for the most recent versions of all translations manually and replace internal links
-            create_and_replace_links_async(source_region, region)
+            # Replace internal links to the source region in the background
+            enqueue_job(
+                replace_internal_links,
+                region=region,
+                source_region_slug=source_region.slug,
+            )
 
         return region
 
@@ -607,334 +592,22 @@ class RegionForm(CustomModelForm):
         return cleaned_data
 
 
-def duplicate_language_tree(
-    source_region: Region,
-    target_region: Region,
-    source_parent: LanguageTreeNode | None = None,
-    target_parent: LanguageTreeNode | None = None,
-    logging_prefix: str = "",
-) -> None:
-    """
-    Function to duplicate the language tree of one region to another.
-
-    Usage: duplicate_language_tree(source_region, target_region)
-
-    This is a recursive function to walk the whole language tree. It starts at root level with the default parent None.
-    The recursion is necessary because the new nodes need their correct (also duplicated) parent node.
-
-    :param source_region: The region from which the language tree should be duplicated
-    :param target_region: The region to which the language tree should be added
-    :param source_parent: The current parent node id of the recursion
-    :param target_parent: The node of the target region which is the duplicate of the source parent node
-    :param logging_prefix: recursion level to get a pretty log output
-    """
-    logger.debug(
-        "%s Duplicating child nodes",
-        logging_prefix + "└─",
-    )
-    logging_prefix += "  "
-
-    # Iterate over all children of the current source parent, beginning with the root node
-    source_nodes = source_region.language_tree_nodes.filter(parent=source_parent)
-    num_source_nodes = len(source_nodes)
-    for i, source_node in enumerate(source_nodes):
-        logger.debug(
-            "%s Duplicating node %r",
-            logging_prefix + ("└─" if i == num_source_nodes - 1 else "├─"),
-            source_node,
-        )
-        row_logging_prefix = logging_prefix + (
-            "  " if i == num_source_nodes - 1 else "│  "
-        )
-        if target_parent:
-            # If the target parent already exist, we inherit its tree id for all its sub nodes
-            target_tree_id = target_parent.tree_id
-        else:
-            # If the language tree node is a root node, we need to assign a new tree id
-            last_root_node = LanguageTreeNode.get_last_root_node()
-            target_tree_id = last_root_node.tree_id + 1
-            logger.debug(
-                "%s Node is a root node, assigning new tree_id %r",
-                row_logging_prefix + "├─",
-                target_tree_id,
-            )
-        # Copy the target node to leave the source node unchanged for next iteration
-        target_node = deepcopy(source_node)
-        # Change the region and parent to its new values
-        target_node.region = target_region
-        target_node.parent = target_parent
-        # Set new tree id
-        target_node.tree_id = target_tree_id
-        # Delete the primary key to force an insert
-        target_node.pk = None
-        # Check if the resulting node is valid
-        target_node.full_clean()
-        # Save the duplicated node
-        target_node.save()
-        logger.debug(
-            "%s Created target node %r",
-            row_logging_prefix + ("└─" if source_node.is_leaf() else "├─"),
-            target_node,
-        )
-        if not source_node.is_leaf():
-            # Call the function recursively for all children of the current node
-            duplicate_language_tree(
-                source_region,
-                target_region,
-                source_node,
-                target_node,
-                row_logging_prefix,
-            )
-
-
-# pylint: disable=too-many-locals
-def duplicate_pages(
-    source_region: Region,
-    target_region: Region,
-    source_parent: Page | None = None,
-    target_parent: Page | None = None,
-    logging_prefix: str = "",
-    keep_status: bool = False,
-    offers_to_discard: QuerySet[OfferTemplate] | None = None,
-) -> None:
-    """
-    Function to duplicate all non-archived pages from one region to another
-
-    Usage: duplicate_pages(source_region, target_region)
-
-    This is a recursive function to walk the whole page tree. It starts at root level with the default parent None.
-    The recursion is necessary because the new pages need their correct (also duplicated) parent page.
-
-    :param source_region: The region from which the pages should be duplicated
-    :param target_region: The region to which the pages should be added
-    :param source_parent: The current parent page id of the recursion
-    :param target_parent: The page of the target region which is the duplicate of the source parent page
-    :param logging_prefix: Recursion level to get a pretty log output
-    :param keep_status: Parameter to indicate whether the status of the cloned pages should be kept
-    :param offers_to_discard: Offers which might be embedded in the source region, but not in the target region
-    """
-
-    logger.debug(
-        "%s Duplicating child nodes",
-        logging_prefix + "└─",
-    )
-    logging_prefix += "  "
-
-    # At first, get all pages from the source region with a specific parent page, except archived ones
-    # As the parent will be None for the initial call, this returns all pages from the root level
-    source_pages = source_region.pages.filter(
-        parent=source_parent, explicitly_archived=False
-    )
-    num_source_pages = len(source_pages)
-    for i, source_page in enumerate(source_pages):
-        logger.debug(
-            "%s Duplicating page %r",
-            logging_prefix + ("└─" if i == num_source_pages - 1 else "├─"),
-            source_page,
-        )
-        row_logging_prefix = logging_prefix + (
-            "  " if i == num_source_pages - 1 else "│  "
-        )
-        if target_parent:
-            # If the target parent already exist, we inherit its tree id for all its subpages
-            target_tree_id = target_parent.tree_id
-        else:
-            # If the page is a root page, we need to assign a new tree id
-            last_root_page = Page.get_last_root_node()
-            target_tree_id = last_root_page.tree_id + 1
-            logger.debug(
-                "%s Page is a root page, assigning new tree_id %r",
-                row_logging_prefix + "├─",
-                target_tree_id,
-            )
-        # Copy the target node to leave the source node unchanged for next iteration
-        target_page = deepcopy(source_page)
-        # Set the parent of the new page to the previously created target parent
-        target_page.parent = target_parent
-        # Set the region of the new page to the target region
-        target_page.region = target_region
-        # Set new tree id
-        target_page.tree_id = target_tree_id
-        # Delete the primary key to duplicate the object instance instead of updating it
-        target_page.pk = None
-        # Set push API token to blank for duplicated page
-        target_page.api_token = ""
-        # Check if the page is valid
-        target_page.full_clean()
-        # Save duplicated page
-        target_page.save()
-        # Set embedded offers ManyToMany field
-        embedded_offers = (
-            source_page.embedded_offers.all()
-            if not offers_to_discard
-            else source_page.embedded_offers.exclude(
-                id__in=offers_to_discard.values_list("id", flat=True)
-            )
-        )
-        target_page.embedded_offers.add(*embedded_offers)
-        logger.debug(
-            "%s Created %r",
-            row_logging_prefix + "├─",
-            target_page,
-        )
-        duplicate_page_translations(
-            source_page, target_page, row_logging_prefix, keep_status
-        )
-        if not source_page.is_leaf():
-            # Recursively call this function with the current pages as new parents
-            duplicate_pages(
-                source_region,
-                target_region,
-                source_page,
-                target_page,
-                row_logging_prefix,
-                keep_status,
-                offers_to_discard,
-            )
-
-
-def duplicate_page_translations(
-    source_page: Page, target_page: Page, logging_prefix: str, keep_status: bool
-) -> None:
-    """
-    Duplicate all translations of a given source page to a given target page
-
-    :param source_page: The given source page
-    :param target_page: The desired target page
-    :param logging_prefix: The prefix to be used for logging
-    :param keep_status: Parameter to indicate whether the status of the cloned pages should be kept
-    """
-    logger.debug(
-        "%s Duplicating page translations",
-        logging_prefix + ("└─" if source_page.is_leaf() else "├─"),
-    )
-    # Clone all page translations of the source page
-    source_page_translations = source_page.translations.all()
-    num_translations = len(source_page_translations)
-    translation_row_logging_prefix = logging_prefix + (
-        "  " if source_page.is_leaf() else "│  "
-    )
-
-    for i, page_translation in enumerate(source_page_translations):
-        # Set the page of the source translation to the new page
-        page_translation.page = target_page
-        # Delete the primary key to duplicate the object instance instead of updating it
-        page_translation.pk = None
-        # Set the translation to draft if keep_status is false
-        if keep_status is False:
-            page_translation.status = status.DRAFT
-        # Check if the page translation is valid
-        page_translation.full_clean()
-        # Save duplicated page translation
-        page_translation.save(update_timestamp=False)
-        logger.debug(
-            "%s Created %r",
-            translation_row_logging_prefix
-            + ("└─" if i == num_translations - 1 else "├─"),
-            page_translation,
-        )
-
-
-def duplicate_imprint(source_region: Region, target_region: Region) -> None:
-    """
-    Function to duplicate the imprint from one region to another.
-
-    :param source_region: the source region from which the imprint should be duplicated
-    :param target_region: the target region
-    """
-    source_imprint = source_region.imprint
-    target_imprint = deepcopy(source_imprint)
-    target_imprint.region = target_region
-    # Delete the primary key to duplicate the object instance instead of updating it
-    target_imprint.pk = None
-    # Check if the new imprint object is valid
-    target_imprint.full_clean()
-
-    target_imprint.save()
-
-    # Duplicate imprint translations by iterating to all existing ones
-    source_page_translations = source_imprint.translations.all()
-
-    for imprint_translation in source_page_translations:
-        # Set the page of the source translation to the new imprint
-        imprint_translation.page = target_imprint
-        # Delete the primary key to duplicate the object instance instead of updating it
-        imprint_translation.pk = None
-        # Set the translation to draft
-        imprint_translation.status = status.DRAFT
-        # Check if the imprint translation is valid
-        imprint_translation.full_clean()
-        # Save duplicated imprint translation
-        imprint_translation.save(update_timestamp=False)
-
-
-# pylint: disable=unused-argument,fixme
-def duplicate_media(source_region: Region, target_region: Region) -> None:
-    """
-    Function to duplicate all media of one region to another.
-
-    :param source_region: the source region from which the pages should be duplicated
-    :param target_region: the target region
-    """
-    # TODO: implement duplication of all media files
-
-
-def create_and_replace_links_async(source_region: Region, region: Region) -> None:
-    """
-    Create all links for the latest versions of the region's page translations, then replace all links in the content.
-    This is run as a background task.
-
-
-    :param source_region: The region with the slug of the to be replaced links
-    :type source_region: ~integreat_cms.cms.models.regions.region.Region
-
-    :param region: The region in which the links should be replaced and created
-    :type region: ~integreat_cms.cms.models.regions.region.Region
-    """
-
-    def create_and_update_links() -> None:
-        find_links(region)
-        replace_internal_links(source_region, region)
-
-    t = threading.Thread(target=create_and_update_links, daemon=True)
-    t.start()
-    if not settings.BACKGROUND_TASKS_ENABLED:
-        t.join()
-
-
-def find_links(region: Region) -> None:
+@background_task
+def replace_internal_links(context: JobContext, source_region_slug: str) -> None:
     """
-    Find all link objects in the latest versions of the region's page translations
+    Replace all internal link objects with the latest versions of the region's page translations.
+    This is run as a background job.
 
-    :param region: The region which should be scanned for links
+    :param context: The context of the background job (its region is the region in which the links should be replaced)
+    :param source_region_slug: The slug of the region of the to be replaced links
     """
-    logger.info("Scanning for broken links in region %r", region)
-    # Get the latest page translations of the region
-    translations = PageTranslation.objects.filter(page__region=region).distinct(
-        "page_id", "language_id"
-    )
-    # Trigger post-save signal to create link objects
-    for translation in translations:
-        translation.save(update_timestamp=False)
-    # Wait until all post-save signals have been processed
-    time.sleep(0.1)
-    tasks_queue.join()
-    # Check whether finding links succeeded
-    logger.debug(
-        "Found links: %r", Link.objects.filter(Q(page_translation__page__region=region))
-    )
-
-
-def replace_internal_links(source_region: Region, region: Region) -> None:
-    """
-    Replace all internal link objects with the latest versions of the region's page translations
-
-    :param source_region: The region with the slug of the to be replaced links
-    :type source_region: ~integreat_cms.cms.models.regions.region.Region
-
-    :param region: The region in which the links should be replaced
-    :type region: ~integreat_cms.cms.models.regions.region.Region
-    """
-    old_link = f"{settings.WEBAPP_URL}/{source_region.slug}/"
+    region = context.job.region
+    old_link = f"{settings.WEBAPP_URL}/{source_region_slug}/"
     new_link = f"{settings.WEBAPP_URL}/{region.slug}/"
-    replace_links(old_link, new_link, region=region, link_types=["internal"])
+    replace_links(
+        old_link,
+        new_link,
+        region=region,
+        link_types=["internal"],
+        progress=context.set_progress,
+    )
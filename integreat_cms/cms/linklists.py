@@ -74,7 +74,7 @@ class PageTranslationLinklist(ActiveLanguageLinklist):
             pages = Page.objects.all().cache_tree(archived=False)
             objects = objects.filter(page__in=pages)
 
-        return objects.distinct("page__pk", "language__pk")
+        return objects.filter(is_latest=True)
 
 
 class NonArchivedLinkList(ActiveLanguageLinklist):
@@ -94,8 +94,8 @@ class NonArchivedLinkList(ActiveLanguageLinklist):
         objects = super().filter_callable(objects)
         # Exclude archived events/locations
         objects = objects.filter(
-            **{f"{objects.model.foreign_field()}__archived": False}
-        ).distinct(f"{objects.model.foreign_field()}__pk", "language__pk")
+            **{f"{objects.model.foreign_field()}__archived": False}, is_latest=True
+        )
 
         return objects
 
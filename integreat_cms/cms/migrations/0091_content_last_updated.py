@@ -0,0 +1,79 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Add modification date to content objects and indices on the modification dates of contents and translations
+    """
+
+    dependencies = [
+        ("cms", "0090_pagetranslation_hix_feedback"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="last_updated",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, verbose_name="modification date"
+            ),
+        ),
+        migrations.AddField(
+            model_name="imprintpage",
+            name="last_updated",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, verbose_name="modification date"
+            ),
+        ),
+        migrations.AddField(
+            model_name="page",
+            name="last_updated",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, verbose_name="modification date"
+            ),
+        ),
+        migrations.AddField(
+            model_name="poi",
+            name="last_updated",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, verbose_name="modification date"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["region", "last_updated"], name="event_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="page",
+            index=models.Index(
+                fields=["region", "last_updated"], name="page_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="poi",
+            index=models.Index(
+                fields=["region", "last_updated"], name="poi_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eventtranslation",
+            index=models.Index(
+                fields=["last_updated"], name="eventtranslation_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pagetranslation",
+            index=models.Index(
+                fields=["last_updated"], name="pagetranslation_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="poitranslation",
+            index=models.Index(
+                fields=["last_updated"], name="poitranslation_updated_idx"
+            ),
+        ),
+    ]
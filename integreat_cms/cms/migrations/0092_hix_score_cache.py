@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.management import call_command
+from django.db import migrations
+
+if TYPE_CHECKING:
+    from django.apps.registry import Apps
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+#: The name of the database table of the HIX score cache
+HIX_SCORE_CACHE_TABLE = "cms_hix_score_cache"
+
+
+# pylint: disable=unused-argument
+def create_hix_score_cache(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """
+    Create the database table of the HIX score cache
+
+    :param apps: The configuration of installed applications
+    :param schema_editor: The database abstraction layer that creates actual SQL code
+    """
+    call_command(
+        "createcachetable",
+        HIX_SCORE_CACHE_TABLE,
+        database=schema_editor.connection.alias,
+        verbosity=0,
+    )
+
+
+# pylint: disable=unused-argument
+def delete_hix_score_cache(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """
+    Delete the database table of the HIX score cache
+
+    :param apps: The configuration of installed applications
+    :param schema_editor: The database abstraction layer that creates actual SQL code
+    """
+    schema_editor.execute(
+        f"DROP TABLE IF EXISTS {schema_editor.quote_name(HIX_SCORE_CACHE_TABLE)}"
+    )
+
+
+class Migration(migrations.Migration):
+    """
+    Create the database table of the HIX score cache
+    """
+
+    dependencies = [
+        ("cms", "0091_content_last_updated"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_hix_score_cache, delete_hix_score_cache),
+    ]
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import migrations, models
+
+from ..constants import status
+
+if TYPE_CHECKING:
+    from django.apps.registry import Apps
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+#: The translation models and the names of their foreign fields
+TRANSLATION_MODELS = [
+    ("eventtranslation", "event"),
+    ("imprintpagetranslation", "page"),
+    ("pagetranslation", "page"),
+    ("poitranslation", "poi"),
+]
+
+
+# pylint: disable=unused-argument
+def mark_latest_versions(apps: Apps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """
+    Mark the latest versions and the latest public versions of all existing content translations
+
+    :param apps: The configuration of installed applications
+    :param schema_editor: The database abstraction layer that creates actual SQL code
+    """
+    for model_name, foreign_field in TRANSLATION_MODELS:
+        TranslationModel = apps.get_model("cms", model_name)
+        version_history = (f"{foreign_field}_id", "language_id")
+        for marker, versions in [
+            ("is_latest", TranslationModel.objects.all()),
+            (
+                "is_latest_public",
+                TranslationModel.objects.filter(status=status.PUBLIC),
+            ),
+        ]:
+            TranslationModel.objects.filter(
+                id__in=versions.order_by(*version_history, "-version")
+                .distinct(*version_history)
+                .values("id")
+            ).update(**{marker: True})
+
+
+class Migration(migrations.Migration):
+    """
+    Add markers for the latest versions of content translations
+    """
+
+    dependencies = [
+        ("cms", "0092_hix_score_cache"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="eventtranslation",
+            name="is_latest",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="eventtranslation",
+            name="is_latest_public",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest public version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="imprintpagetranslation",
+            name="is_latest",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="imprintpagetranslation",
+            name="is_latest_public",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest public version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="pagetranslation",
+            name="is_latest",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="pagetranslation",
+            name="is_latest_public",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest public version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="poitranslation",
+            name="is_latest",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest version"
+            ),
+        ),
+        migrations.AddField(
+            model_name="poitranslation",
+            name="is_latest_public",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="latest public version"
+            ),
+        ),
+        migrations.RunPython(mark_latest_versions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="eventtranslation",
+            index=models.Index(
+                condition=models.Q(("is_latest", True)),
+                fields=["event", "language"],
+                name="eventtranslation_latest_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eventtranslation",
+            index=models.Index(
+                condition=models.Q(("is_latest_public", True)),
+                fields=["event", "language"],
+                name="eventtranslation_public_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="imprintpagetranslation",
+            index=models.Index(
+                condition=models.Q(("is_latest", True)),
+                fields=["page", "language"],
+                name="imprint_translation_latest_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="imprintpagetranslation",
+            index=models.Index(
+                condition=models.Q(("is_latest_public", True)),
+                fields=["page", "language"],
+                name="imprint_translation_public_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pagetranslation",
+            index=models.Index(
+                condition=models.Q(("is_latest", True)),
+                fields=["page", "language"],
+                name="pagetranslation_latest_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pagetranslation",
+            index=models.Index(
+                condition=models.Q(("is_latest_public", True)),
+                fields=["page", "language"],
+                name="pagetranslation_public_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="poitranslation",
+            index=models.Index(
+                condition=models.Q(("is_latest", True)),
+                fields=["poi", "language"],
+                name="poitranslation_latest_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="poitranslation",
+            index=models.Index(
+                condition=models.Q(("is_latest_public", True)),
+                fields=["poi", "language"],
+                name="poitranslation_public_idx",
+            ),
+        ),
+    ]
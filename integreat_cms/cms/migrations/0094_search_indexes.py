@@ -0,0 +1,74 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+
+class Migration(migrations.Migration):
+    """
+    Add trigram indices for the search of contents, push notifications and media
+    """
+
+    dependencies = [
+        ("cms", "0093_content_translation_latest_versions"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="directory",
+            index=GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="directory_search_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eventtranslation",
+            index=GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                OpClass(Upper("slug"), name="gin_trgm_ops"),
+                condition=models.Q(
+                    ("is_latest", True), ("is_latest_public", True), _connector="OR"
+                ),
+                name="eventtranslation_search_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mediafile",
+            index=GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                OpClass(Upper("alt_text"), name="gin_trgm_ops"),
+                OpClass(Upper("file"), name="gin_trgm_ops"),
+                name="mediafile_search_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pagetranslation",
+            index=GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                OpClass(Upper("slug"), name="gin_trgm_ops"),
+                condition=models.Q(
+                    ("is_latest", True), ("is_latest_public", True), _connector="OR"
+                ),
+                name="pagetranslation_search_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="poitranslation",
+            index=GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                OpClass(Upper("slug"), name="gin_trgm_ops"),
+                condition=models.Q(
+                    ("is_latest", True), ("is_latest_public", True), _connector="OR"
+                ),
+                name="poitranslation_search_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pushnotificationtranslation",
+            index=GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="push_notification_search_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,108 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Add the models for the stored translation coverage statistics
+    """
+
+    dependencies = [
+        ("cms", "0094_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PageTranslationCoverage",
+            fields=[
+                (
+                    "page",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="translation_coverage",
+                        serialize=False,
+                        to="cms.page",
+                        verbose_name="page",
+                    ),
+                ),
+                (
+                    "translation_states",
+                    models.JSONField(
+                        default=dict,
+                        help_text="The translation state and the number of words to be translated per language id",
+                        verbose_name="translation states",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "page translation coverage",
+                "verbose_name_plural": "page translation coverage",
+                "default_permissions": (),
+            },
+        ),
+        migrations.CreateModel(
+            name="TranslationCoverage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "translation_state",
+                    models.CharField(
+                        choices=[
+                            ("UP_TO_DATE", "Translation up-to-date"),
+                            ("IN_TRANSLATION", "Currently in translation"),
+                            ("OUTDATED", "Translation outdated"),
+                            ("MISSING", "Translation missing"),
+                            ("MACHINE_TRANSLATED", "Machine translated"),
+                        ],
+                        max_length=18,
+                        verbose_name="translation state",
+                    ),
+                ),
+                (
+                    "page_count",
+                    models.IntegerField(default=0, verbose_name="number of pages"),
+                ),
+                (
+                    "word_count",
+                    models.IntegerField(
+                        default=0,
+                        help_text="The number of words of the source translations which have to be translated",
+                        verbose_name="number of words",
+                    ),
+                ),
+                (
+                    "language",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translation_coverage",
+                        to="cms.language",
+                        verbose_name="language",
+                    ),
+                ),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translation_coverage",
+                        to="cms.region",
+                        verbose_name="region",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "translation coverage",
+                "verbose_name_plural": "translation coverage",
+                "default_permissions": (),
+                "unique_together": {("region", "language", "translation_state")},
+            },
+        ),
+    ]
@@ -0,0 +1,78 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Add the model for the translation memory of machine translations
+    """
+
+    dependencies = [
+        ("cms", "0095_translation_coverage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TranslationMemoryEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "provider",
+                    models.CharField(
+                        max_length=32, verbose_name="machine translation provider"
+                    ),
+                ),
+                (
+                    "source_language",
+                    models.CharField(
+                        help_text="The language code which was sent to the provider",
+                        max_length=35,
+                        verbose_name="source language",
+                    ),
+                ),
+                (
+                    "target_language",
+                    models.CharField(
+                        help_text="The language code which was sent to the provider",
+                        max_length=35,
+                        verbose_name="target language",
+                    ),
+                ),
+                (
+                    "segment_hash",
+                    models.CharField(
+                        help_text="The SHA-256 hash of the normalized source text",
+                        max_length=64,
+                        verbose_name="segment hash",
+                    ),
+                ),
+                (
+                    "translated_text",
+                    models.TextField(verbose_name="translated text"),
+                ),
+                (
+                    "created_date",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        verbose_name="creation date",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "translation memory entry",
+                "verbose_name_plural": "translation memory entries",
+                "default_permissions": (),
+                "unique_together": {
+                    ("provider", "source_language", "target_language", "segment_hash")
+                },
+            },
+        ),
+    ]
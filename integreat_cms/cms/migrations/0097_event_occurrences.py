@@ -0,0 +1,62 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Add the model for the materialized occurrences of events
+    """
+
+    dependencies = [
+        ("cms", "0096_translation_memory"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="occurrences_until",
+            field=models.DateField(
+                blank=True,
+                editable=False,
+                null=True,
+                verbose_name="occurrences materialized until",
+            ),
+        ),
+        migrations.CreateModel(
+            name="EventOccurrence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("start", models.DateTimeField(verbose_name="start")),
+                ("end", models.DateTimeField(verbose_name="end")),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="occurrences",
+                        to="cms.event",
+                        verbose_name="event",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "event occurrence",
+                "verbose_name_plural": "event occurrences",
+                "ordering": ["event", "start"],
+                "default_permissions": (),
+                "indexes": [
+                    models.Index(
+                        fields=["event", "end"], name="eventoccurrence_end_idx"
+                    ),
+                    models.Index(fields=["start"], name="eventoccurrence_start_idx"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,164 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Add the model for the database-backed job queue
+    """
+
+    dependencies = [
+        ("cms", "0097_event_occurrences"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BackgroundJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "task",
+                    models.CharField(
+                        help_text="The import path of the function which is executed",
+                        max_length=255,
+                        verbose_name="task",
+                    ),
+                ),
+                (
+                    "kwargs",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="The keyword arguments of the task",
+                        verbose_name="arguments",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("RUNNING", "Running"),
+                            ("SUCCEEDED", "Succeeded"),
+                            ("FAILED", "Failed"),
+                        ],
+                        default="PENDING",
+                        max_length=9,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "priority",
+                    models.SmallIntegerField(
+                        default=0,
+                        help_text="Jobs with a higher priority are executed first",
+                        verbose_name="priority",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="attempts"
+                    ),
+                ),
+                (
+                    "max_attempts",
+                    models.PositiveSmallIntegerField(
+                        default=1, verbose_name="maximum attempts"
+                    ),
+                ),
+                (
+                    "run_after",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="The job is not executed before this date",
+                        verbose_name="run after",
+                    ),
+                ),
+                (
+                    "progress",
+                    models.PositiveSmallIntegerField(
+                        default=0,
+                        help_text="The progress of the job in percent",
+                        verbose_name="progress",
+                    ),
+                ),
+                (
+                    "messages",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="The messages of the job for the user who started it",
+                        verbose_name="messages",
+                    ),
+                ),
+                ("error", models.TextField(blank=True, verbose_name="error")),
+                (
+                    "created_date",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        verbose_name="creation date",
+                    ),
+                ),
+                (
+                    "started_date",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="The start of the latest attempt",
+                        null=True,
+                        verbose_name="start date",
+                    ),
+                ),
+                (
+                    "finished_date",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="finished date"
+                    ),
+                ),
+                (
+                    "creator",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="background_jobs",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="creator",
+                    ),
+                ),
+                (
+                    "region",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="background_jobs",
+                        to="cms.region",
+                        verbose_name="region",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "background job",
+                "verbose_name_plural": "background jobs",
+                "ordering": ["-created_date"],
+                "default_permissions": (),
+                "indexes": [
+                    models.Index(
+                        fields=["status", "-priority", "run_after"],
+                        name="backgroundjob_queue_idx",
+                    )
+                ],
+            },
+        ),
+    ]
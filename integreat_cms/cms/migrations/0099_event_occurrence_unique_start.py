@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+if TYPE_CHECKING:
+    from django.apps.registry import Apps
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+
+# pylint: disable=unused-argument
+def delete_duplicate_occurrences(
+    apps: Apps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    """
+    Delete the duplicate occurrences which were created by concurrent updates of the same event
+
+    :param apps: The configuration of installed applications
+    :param schema_editor: The database abstraction layer that creates actual SQL code
+    """
+    EventOccurrence = apps.get_model("cms", "EventOccurrence")
+    duplicates = (
+        EventOccurrence.objects.values("event_id", "start")
+        .annotate(count=Count("id"), first_id=Min("id"))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        EventOccurrence.objects.filter(
+            event_id=duplicate["event_id"], start=duplicate["start"]
+        ).exclude(id=duplicate["first_id"]).delete()
+
+
+class Migration(migrations.Migration):
+    """
+    Make sure every event has at most one occurrence per start date
+    """
+
+    dependencies = [
+        ("cms", "0098_background_job"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_occurrences, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="eventoccurrence",
+            constraint=models.UniqueConstraint(
+                fields=("event", "start"), name="eventoccurrence_unique_start"
+            ),
+        ),
+    ]
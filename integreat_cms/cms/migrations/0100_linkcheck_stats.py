@@ -0,0 +1,117 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Add the models for the stored linkcheck statistics
+    """
+
+    dependencies = [
+        ("linkcheck", "0003_redirect_to_as_textfield"),
+        ("cms", "0099_event_occurrence_unique_start"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LinkcheckStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("ignored", "Ignored"),
+                            ("valid", "Valid"),
+                            ("invalid", "Invalid"),
+                            ("email", "Email"),
+                            ("phone", "Phone"),
+                            ("unchecked", "Unchecked"),
+                        ],
+                        max_length=9,
+                        verbose_name="category",
+                    ),
+                ),
+                (
+                    "url_count",
+                    models.IntegerField(default=0, verbose_name="number of urls"),
+                ),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="linkcheck_stats",
+                        to="cms.region",
+                        verbose_name="region",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "linkcheck statistics",
+                "verbose_name_plural": "linkcheck statistics",
+                "default_permissions": (),
+                "unique_together": {("region", "category")},
+            },
+        ),
+        migrations.CreateModel(
+            name="RegionUrlCategory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("ignored", "Ignored"),
+                            ("valid", "Valid"),
+                            ("invalid", "Invalid"),
+                            ("email", "Email"),
+                            ("phone", "Phone"),
+                            ("unchecked", "Unchecked"),
+                        ],
+                        max_length=9,
+                        verbose_name="category",
+                    ),
+                ),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="url_categories",
+                        to="cms.region",
+                        verbose_name="region",
+                    ),
+                ),
+                (
+                    "url",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="region_categories",
+                        to="linkcheck.url",
+                        verbose_name="url",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "region url category",
+                "verbose_name_plural": "region url categories",
+                "default_permissions": (),
+                "unique_together": {("region", "url")},
+            },
+        ),
+    ]
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from .chat.chat_message import ChatMessage
 from .events.event import Event
+from .events.event_occurrence import EventOccurrence
 from .events.event_translation import EventTranslation
 from .events.recurrence_rule import RecurrenceRule
 from .feedback.event_feedback import EventFeedback
@@ -20,8 +21,12 @@ from .feedback.page_feedback import PageFeedback
 from .feedback.poi_feedback import POIFeedback
 from .feedback.region_feedback import RegionFeedback
 from .feedback.search_result_feedback import SearchResultFeedback
+from .jobs.background_job import BackgroundJob
 from .languages.language import Language
 from .languages.language_tree_node import LanguageTreeNode
+from .languages.translation_memory_entry import TranslationMemoryEntry
+from .linkcheck.linkcheck_stats import LinkcheckStats
+from .linkcheck.region_url_category import RegionUrlCategory
 from .media.directory import Directory
 from .media.media_file import MediaFile
 from .offers.offer_template import OfferTemplate
@@ -29,6 +34,8 @@ from .pages.imprint_page import ImprintPage
 from .pages.imprint_page_translation import ImprintPageTranslation
 from .pages.page import Page
 from .pages.page_translation import PageTranslation
+from .pages.page_translation_coverage import PageTranslationCoverage
+from .pages.translation_coverage import TranslationCoverage
 from .poi_categories.poi_category import POICategory
 from .poi_categories.poi_category_translation import POICategoryTranslation
 from .pois.poi import POI
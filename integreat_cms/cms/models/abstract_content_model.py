@@ -23,6 +23,22 @@ from .regions.region import Region
 logger = logging.getLogger(__name__)
 
 
+def get_latest_version_filter(filters: dict[str, Any]) -> dict[str, bool] | None:
+    """
+    Get the filter on the latest version markers of content translations which is equivalent to selecting the latest
+    version per language of the translations matching the given filters
+    (see :meth:`~integreat_cms.cms.models.abstract_content_translation.AbstractContentTranslation.update_latest_versions`)
+
+    :param filters: The filters which should be applied on the translations
+    :return: The filter on the markers (or ``None`` if there is no marker for the given filters)
+    """
+    if not filters:
+        return {"is_latest": True}
+    if filters == {"status": status.PUBLIC}:
+        return {"is_latest_public": True}
+    return None
+
+
 class ContentQuerySet(models.QuerySet):
     """
     This queryset provides the option to prefetch translations for content objects
@@ -41,13 +57,18 @@ class ContentQuerySet(models.QuerySet):
         """
         TranslationModel = self.model.get_translation_model()
         foreign_field = TranslationModel.foreign_field() + "_id"
+        if latest_version_filter := get_latest_version_filter(filters):
+            translations = TranslationModel.objects.filter(**latest_version_filter)
+        else:
+            translations = (
+                TranslationModel.objects.filter(**filters)
+                .order_by(foreign_field, "language_id", "-version")
+                .distinct(foreign_field, "language_id")
+            )
         return self.prefetch_related(
             models.Prefetch(
                 "translations",
-                queryset=TranslationModel.objects.filter(**filters)
-                .order_by(foreign_field, "language_id", "-version")
-                .distinct(foreign_field, "language_id")
-                .select_related("language"),
+                queryset=translations.select_related("language"),
                 to_attr=to_attr,
             )
         )
@@ -119,6 +140,9 @@ class AbstractContentModel(AbstractBaseModel):
     created_date = models.DateTimeField(
         default=timezone.now, verbose_name=_("creation date")
     )
+    last_updated = models.DateTimeField(
+        default=timezone.now, verbose_name=_("modification date")
+    )
 
     #: Custom model manager for content objects
     objects = ContentQuerySet.as_manager()
@@ -195,13 +219,18 @@ class AbstractContentModel(AbstractBaseModel):
             prefetched_translations = getattr(self, attr)
         except AttributeError:
             # If the translations were not prefetched, query it from the database
-            prefetched_translations = (
-                self.translations.filter(**filters)
-                .select_related("language")
-                .order_by("language__id", "-version")
-                .distinct("language__id")
-                .all()
-            )
+            if latest_version_filter := get_latest_version_filter(filters):
+                prefetched_translations = self.translations.filter(
+                    **latest_version_filter
+                ).select_related("language")
+            else:
+                prefetched_translations = (
+                    self.translations.filter(**filters)
+                    .select_related("language")
+                    .order_by("language__id", "-version")
+                    .distinct("language__id")
+                    .all()
+                )
         return {
             translation.language.slug: translation
             for translation in prefetched_translations
@@ -511,6 +540,18 @@ class AbstractContentModel(AbstractBaseModel):
         translation_slug = f", slug: {self.best_translation.slug}" if self.id else ""
         return f"<{class_name} (id: {self.id}, region: {self.region.slug}{translation_slug})>"
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        r"""
+        This overwrites the default Django :meth:`~django.db.models.Model.save` method,
+        to update the last_updated field on changes.
+
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied kwargs
+        """
+        if kwargs.pop("update_timestamp", True):
+            self.last_updated = timezone.now()
+        super().save(*args, **kwargs)
+
     class Meta:
         #: This model is an abstract base class
         abstract = True
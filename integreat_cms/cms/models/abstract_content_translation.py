@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from django.conf import settings
 from django.db import models
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -90,6 +90,18 @@ class AbstractContentTranslation(AbstractBaseModel):
             "Tick if updating this content should automatically refresh or create its translations."
         ),
     )
+    #: Whether this is the latest version of the foreign object in this language (maintained in :meth:`save`)
+    is_latest = models.BooleanField(
+        default=False,
+        editable=False,
+        verbose_name=_("latest version"),
+    )
+    #: Whether this is the latest public version of the foreign object in this language (maintained in :meth:`save`)
+    is_latest_public = models.BooleanField(
+        default=False,
+        editable=False,
+        verbose_name=_("latest public version"),
+    )
     #: The HIX score is ``None`` if not overwritten by a submodel
     hix_score = None
     #: Whether this object is read-only and not meant to be stored to the database
@@ -469,23 +481,59 @@ class AbstractContentTranslation(AbstractBaseModel):
         return translation_status.UP_TO_DATE
 
     @classmethod
-    def search(cls, region: Region, language_slug: str, query: str) -> QuerySet:
+    def search(
+        cls, region: Region, language_slug: str, query: str, public: bool = False
+    ) -> QuerySet:
         """
         Searches for all content translations which match the given `query` in their title or slug.
+        Only the latest versions are searched, which are covered by a trigram index on the title and slug.
+
         :param region: The current region
         :param language_slug: The language slug
         :param query: The query string used for filtering the content translations
+        :param public: Whether only the latest public versions should be searched instead of the latest versions
         :return: A query for all matching objects
         """
-        return (
-            cls.objects.filter(
-                **{cls.foreign_field() + "__region": region},
-                language__slug=language_slug,
-            )
-            .filter(Q(slug__icontains=query) | Q(title__icontains=query))
-            .distinct(cls.foreign_field())
+        return cls.objects.filter(
+            Q(slug__icontains=query) | Q(title__icontains=query),
+            **{
+                f"{cls.foreign_field()}__region": region,
+                "is_latest_public" if public else "is_latest": True,
+            },
+            language__slug=language_slug,
         )
 
+    @classmethod
+    def update_latest_versions(cls, **filters: Any) -> None:
+        r"""
+        Update the :attr:`is_latest` and :attr:`is_latest_public` markers of the versions matching the given filters.
+        This is done automatically in :meth:`save`, but has to be called manually whenever versions are changed or
+        deleted in bulk (e.g. via :meth:`~django.db.models.query.QuerySet.update`).
+        The filters have to select complete version histories, e.g. all translations of a content object.
+
+        :param \**filters: The filters which select the affected versions (e.g. ``page=page``)
+        """
+        versions = cls.objects.filter(**filters)
+        version_history = (f"{cls.foreign_field()}_id", "language_id")
+        for marker, candidates in [
+            ("is_latest", versions),
+            ("is_latest_public", versions.filter(status=status.PUBLIC)),
+        ]:
+            latest_ids = (
+                candidates.order_by(*version_history, "-version")
+                .distinct(*version_history)
+                .values("id")
+            )
+            # Only touch the rows whose marker actually changes
+            for outdated_versions, value in [
+                (versions.filter(**{marker: True}).exclude(id__in=latest_ids), False),
+                (versions.filter(**{marker: False}, id__in=latest_ids), True),
+            ]:
+                if settings.REDIS_CACHE:
+                    outdated_versions.invalidated_update(**{marker: value})
+                else:
+                    outdated_versions.update(**{marker: value})
+
     def path(self) -> str:
         """
         This method returns a human-readable path that should uniquely identify this object within a given region
@@ -577,7 +625,26 @@ class AbstractContentTranslation(AbstractBaseModel):
             )
         if kwargs.pop("update_timestamp", True):
             self.last_updated = timezone.now()
+        version_history = {
+            f"{self.foreign_field()}_id": getattr(self, f"{self.foreign_field()}_id"),
+            "language_id": self.language_id,
+        }
+        # Set the markers before saving, so post-save signal handlers (e.g. the link checker) already see them
+        newer_versions = (
+            type(self)
+            .objects.filter(**version_history, version__gt=self.version)
+            .exclude(id=self.id)
+            .aggregate(
+                total=Count("id"), public=Count("id", filter=Q(status=status.PUBLIC))
+            )
+        )
+        self.is_latest = not newer_versions["total"]
+        self.is_latest_public = (
+            self.status == status.PUBLIC and not newer_versions["public"]
+        )
         super().save(*args, **kwargs)
+        # Reset the markers of the previous versions
+        self.update_latest_versions(**version_history)
 
     class Meta:
         #: This model is an abstract base class
@@ -187,7 +187,18 @@ class AbstractTreeNode(NS_Node, AbstractBaseModel):
                  the root node and descending to the parent.
         """
         if not hasattr(self, "_cached_descendants"):
-            self._cached_descendants = list(self.get_descendants())
+            if hasattr(self, "_tree_index"):
+                # Look up the descendants in the tree index and only include the nodes which are connected to this
+                # node via nodes of the cached tree
+                connected_ids = {self.id}
+                self._cached_descendants = []
+                for descendant_id in self._tree_index.get_descendant_ids(self.id):
+                    descendant = self._cached_tree.get(descendant_id)
+                    if descendant and descendant.parent_id in connected_ids:
+                        connected_ids.add(descendant_id)
+                        self._cached_descendants.append(descendant)
+            else:
+                self._cached_descendants = list(self.get_descendants())
         if include_self:
             return [self, *self._cached_descendants]
         return self._cached_descendants
@@ -3,14 +3,16 @@ from __future__ import annotations
 from datetime import datetime, time
 from typing import TYPE_CHECKING
 
+from django.apps import apps
 from django.db import models
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from linkcheck.models import Link
 
 from ...constants import status
+from ...utils.event_occurrence_utils import get_occurrence_bounds
 from ...utils.slug_utils import generate_unique_slug
 from ..abstract_content_model import AbstractContentModel, ContentQuerySet
 from ..media.media_file import MediaFile
@@ -32,10 +34,16 @@ class EventQuerySet(ContentQuerySet):
     Custom QuerySet to facilitate the filtering by date while taking recurring events into account.
     """
 
-    def filter_upcoming(self, from_date: datetime | None = None) -> EventQuerySet:
+    def filter_upcoming(
+        self, from_date: date | datetime | None = None
+    ) -> EventQuerySet:
         """
-        Filter all events that take place after the given date. This is, per definition, if at least one of the
-        following conditions is true:
+        Filter all events that take place after the given date. This is, per definition, if at least one occurrence
+        of the event (see :class:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence`) ends at the given
+        date or later.
+
+        If the occurrences of an event are not materialized yet (or not far enough), the event is filtered by its
+        recurrence rule instead, i.e. it is upcoming if one of the following conditions is true:
 
             * The end date of the event is the given date or later
             * The event is indefinitely recurring
@@ -45,16 +53,23 @@ class EventQuerySet(ContentQuerySet):
         :return: The Queryset of events after the given date
         """
         from_date = from_date or timezone.now().date()
+        from_day = from_date.date() if isinstance(from_date, datetime) else from_date
+        # Get model instead of importing it to avoid circular imports
+        EventOccurrence = apps.get_model(app_label="cms", model_name="EventOccurrence")
+        recurring_after = Q(
+            recurrence_rule__isnull=False,
+            recurrence_rule__recurrence_end_date__isnull=True,
+        ) | Q(
+            recurrence_rule__isnull=False,
+            recurrence_rule__recurrence_end_date__gte=from_day,
+        )
         return self.filter(
-            Q(end__gte=from_date)
-            | Q(
-                recurrence_rule__isnull=False,
-                recurrence_rule__recurrence_end_date__isnull=True,
-            )
-            | Q(
-                recurrence_rule__isnull=False,
-                recurrence_rule__recurrence_end_date__gte=from_date,
+            Exists(
+                EventOccurrence.objects.filter(event=OuterRef("pk"), end__gte=from_date)
             )
+            | Q(occurrences_until__isnull=True, end__gte=from_date)
+            | (Q(occurrences_until__isnull=True) & recurring_after)
+            | (Q(occurrences_until__lt=from_day) & recurring_after)
         )
 
     def filter_completed(self, to_date: date | None = None) -> EventQuerySet:
@@ -110,6 +125,14 @@ class Event(AbstractContentModel):
         null=True,
     )
     archived = models.BooleanField(default=False, verbose_name=_("archived"))
+    #: The date up to which the occurrences of this event are materialized (see
+    #: :mod:`~integreat_cms.cms.utils.event_occurrence_utils`). ``None`` if they were not materialized yet.
+    occurrences_until = models.DateField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_("occurrences materialized until"),
+    )
 
     #: The default manager
     objects = EventQuerySet.as_manager()
@@ -212,20 +235,29 @@ class Event(AbstractContentModel):
         """
         Get occurrences of the event that overlap with ``[start, end]``.
         Expects ``start < end``.
+        Only the recurrences within the requested interval are calculated (see
+        :meth:`~integreat_cms.cms.models.events.recurrence_rule.RecurrenceRule.iter_between`).
 
         :param start: the begin of the requested interval.
         :param end: the end of the requested interval.
         :return: start datetimes of occurrences of the event that are in the given timeframe
         """
-        event_start = self.start
-        event_end = self.end
-        if self.is_recurring is not None:
-            return self.recurrence_rule.to_ical_rrule().between(start, end)
-        return (
-            [event_start]
-            if start <= event_start <= end or start <= event_end <= end
-            else []
-        )
+        if not self.is_recurring:
+            return [self.start] if self.start <= end and start <= self.end else []
+        start_date = self.start_local.date()
+        duration = self.end_local.date() - start_date
+        occurrences = []
+        for recurrence_date in self.recurrence_rule.iter_between(
+            start_date,
+            timezone.localtime(start, self.start_local.tzinfo).date() - duration,
+            timezone.localtime(end, self.start_local.tzinfo).date(),
+        ):
+            occurrence_start, occurrence_end = get_occurrence_bounds(
+                self, recurrence_date
+            )
+            if occurrence_start <= end and start <= occurrence_end:
+                occurrences.append(occurrence_start)
+        return occurrences
 
     def copy(self, user: User) -> Event:
         """
@@ -292,7 +324,7 @@ class Event(AbstractContentModel):
         self.save()
 
         # Restore related link objects
-        for translation in self.translations.distinct("event__pk", "language__pk"):
+        for translation in self.translations.filter(is_latest=True):
             # The post_save signal will create link objects from the content
             translation.save(update_timestamp=False)
 
@@ -309,3 +341,9 @@ class Event(AbstractContentModel):
         default_permissions = ("change", "delete", "view")
         #: The custom permissions for this model
         permissions = (("publish_event", "Can publish events"),)
+        #: The indices of this model
+        indexes = [
+            models.Index(
+                fields=["region", "last_updated"], name="%(class)s_updated_idx"
+            ),
+        ]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from ..abstract_base_model import AbstractBaseModel
+from .event import Event
+
+
+class EventOccurrence(AbstractBaseModel):
+    """
+    Data model representing a single occurrence of an event. Non-recurring events have exactly one occurrence, the
+    occurrences of recurring events are materialized up to a rolling horizon
+    (see :mod:`~integreat_cms.cms.utils.event_occurrence_utils`), so upcoming events can be selected with an indexed
+    range query instead of expanding all recurrence rules.
+    """
+
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name="occurrences",
+        verbose_name=_("event"),
+    )
+    start = models.DateTimeField(verbose_name=_("start"))
+    end = models.DateTimeField(verbose_name=_("end"))
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``EventOccurrence object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the event occurrence
+        """
+        return f"{self.event} ({self.start} - {self.end})"
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<EventOccurrence: EventOccurrence object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the event occurrence
+        """
+        return f"<EventOccurrence (id: {self.id}, event: {self.event_id}, start: {self.start}, end: {self.end})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("event occurrence")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("event occurrences")
+        #: The default permissions for this model
+        default_permissions = ()
+        #: The fields which are used to sort the returned objects of a QuerySet
+        ordering = ["event", "start"]
+        #: A list of database constraints for this model
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "start"],
+                name="%(class)s_unique_start",
+            ),
+        ]
+        #: The indices of this model
+        indexes = [
+            models.Index(fields=["event", "end"], name="%(class)s_end_idx"),
+            models.Index(fields=["start"], name="%(class)s_start_idx"),
+        ]
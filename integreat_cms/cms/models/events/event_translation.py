@@ -3,7 +3,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -101,3 +103,23 @@ class EventTranslation(AbstractContentTranslation):
                 name="%(class)s_unique_version",
             ),
         ]
+        #: The indices of this model
+        indexes = [
+            models.Index(fields=["last_updated"], name="%(class)s_updated_idx"),
+            models.Index(
+                fields=["event", "language"],
+                condition=models.Q(is_latest=True),
+                name="%(class)s_latest_idx",
+            ),
+            models.Index(
+                fields=["event", "language"],
+                condition=models.Q(is_latest_public=True),
+                name="%(class)s_public_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                OpClass(Upper("slug"), name="gin_trgm_ops"),
+                condition=models.Q(is_latest=True) | models.Q(is_latest_public=True),
+                name="%(class)s_search_idx",
+            ),
+        ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import calendar
 from datetime import date, datetime, time, timedelta
 from typing import TYPE_CHECKING
 
@@ -18,6 +19,45 @@ if TYPE_CHECKING:
     from typing import Iterator
 
 
+def ceil_div(dividend: int, divisor: int) -> int:
+    """
+    Divide two integers and round up
+
+    :param dividend: The dividend
+    :param divisor: The divisor
+    :return: The rounded up quotient
+    """
+    return -(-dividend // divisor)
+
+
+def get_month_index(month_date: date) -> int:
+    """
+    Get the number of months since the start of the calendar, which allows to calculate differences of months
+
+    :param month_date: The date
+    :return: The index of the month of the date
+    """
+    return month_date.year * 12 + month_date.month - 1
+
+
+def get_nth_weekday(month_date: date, weekday: int, n: int) -> date:
+    """
+    Get the nth occurrence of a given weekday in a specific month
+
+    :param month_date: the current date of month
+    :param weekday: the requested weekday
+    :param n: the requested number
+    :return: The nth weekday
+    """
+    month_date = month_date.replace(day=1)
+    month_date += timedelta((weekday - month_date.weekday()) % 7)
+    n_th_occurrence = month_date + timedelta(weeks=n - 1)
+    # If the occurrence is not in the desired month (because the last week is 4 and not 5), retry with 4
+    if n_th_occurrence.month != month_date.month:
+        n_th_occurrence = month_date + timedelta(weeks=n - 2)
+    return n_th_occurrence
+
+
 class RecurrenceRule(AbstractBaseModel):
     """
     Data model representing the recurrence frequency and interval of an event
@@ -75,104 +115,152 @@ class RecurrenceRule(AbstractBaseModel):
         ),
     )
 
-    def iter_after(self, start_date: date) -> Iterator[date]:
+    def seek(self, start_date: date, target_date: date) -> date | None:
         """
-        Iterate all recurrences after a given start date.
+        Get the first recurrence on or after a given date. Instead of iterating all recurrences since the start of the
+        event, the position of the target date within the recurrence pattern is calculated directly, so the cost does
+        not depend on how long ago the event started.
         This method assumes that ``weekdays_for_weekly`` contains at least one member
         and that ``weekday_for_monthly`` and ``week_for_monthly`` are not null.
 
-        :param start_date: The date on which the iteration should start
-        :return: An iterator over all dates defined by this recurrence rule
+        :param start_date: The start date of the event (the interval is counted from this date)
+        :param target_date: The date from which the next recurrence is requested
+        :return: The first recurrence on or after the target date or ``None`` if there is none
+        """
+        target_date = max(start_date, target_date)
+        if self.frequency == frequency.DAILY:
+            recurrence = self._seek_daily(start_date, target_date)
+        elif self.frequency == frequency.WEEKLY:
+            recurrence = self._seek_weekly(start_date, target_date)
+        elif self.frequency == frequency.MONTHLY:
+            recurrence = self._seek_monthly(start_date, target_date)
+        elif self.frequency == frequency.YEARLY:
+            recurrence = self._seek_yearly(start_date, target_date)
+        else:
+            return None
+        if self.recurrence_end_date and recurrence > self.recurrence_end_date:
+            return None
+        return recurrence
+
+    def _seek_daily(self, start_date: date, target_date: date) -> date:
+        """
+        Get the first daily recurrence on or after the target date
+
+        :param start_date: The start date of the event
+        :param target_date: The date from which the next recurrence is requested (not before the start date)
+        :return: The next recurrence
+        """
+        intervals = ceil_div((target_date - start_date).days, self.interval)
+        return start_date + timedelta(days=intervals * self.interval)
+
+    def _seek_weekly(self, start_date: date, target_date: date) -> date:
+        """
+        Get the first weekly recurrence on or after the target date.
+        The interval is counted in weeks from the week (starting on monday) of the start date.
+
+        :param start_date: The start date of the event
+        :param target_date: The date from which the next recurrence is requested (not before the start date)
+        :return: The next recurrence
+        """
+        first_monday = start_date - timedelta(days=start_date.weekday())
+        intervals = ceil_div((target_date - first_monday).days // 7, self.interval)
+        weekdays = sorted(self.weekdays_for_weekly)
+        while True:
+            monday = first_monday + timedelta(weeks=intervals * self.interval)
+            for weekday in weekdays:
+                if (recurrence := monday + timedelta(days=weekday)) >= target_date:
+                    return recurrence
+            intervals += 1
+
+    def _seek_monthly(self, start_date: date, target_date: date) -> date:
+        """
+        Get the first monthly recurrence on or after the target date.
+        The interval is counted in months from the first month with a recurrence on or after the start date.
+
+        :param start_date: The start date of the event
+        :param target_date: The date from which the next recurrence is requested (not before the start date)
+        :return: The next recurrence
+        """
+        first_month = get_month_index(start_date)
+        if (
+            get_nth_weekday(start_date, self.weekday_for_monthly, self.week_for_monthly)
+            < start_date
+        ):
+            first_month += 1
+        months = ceil_div(
+            max(0, get_month_index(target_date) - first_month), self.interval
+        )
+        while True:
+            month_index = first_month + months * self.interval
+            recurrence = get_nth_weekday(
+                date(month_index // 12, month_index % 12 + 1, 1),
+                self.weekday_for_monthly,
+                self.week_for_monthly,
+            )
+            if recurrence >= target_date:
+                return recurrence
+            months += 1
+
+    def _seek_yearly(self, start_date: date, target_date: date) -> date:
+        """
+        Get the first yearly recurrence on or after the target date.
+        Events on february 29 only recur in leap years, and the interval is counted in leap years.
+
+        :param start_date: The start date of the event
+        :param target_date: The date from which the next recurrence is requested (not before the start date)
+        :return: The next recurrence
         """
-        next_recurrence = start_date
-
-        def get_nth_weekday(month_date: date, weekday: int, n: int) -> date:
-            """
-            Get the nth occurrence of a given weekday in a specific month
-
-            :param month_date: the current date of month
-            :param weekday: the requested weekday
-            :param n: the requested number
-            :return: The nth weekday
-            """
-            month_date = month_date.replace(day=1)
-            month_date += timedelta((weekday - month_date.weekday()) % 7)
-            n_th_occurrence = month_date + timedelta(weeks=n - 1)
-            # If the occurrence is not in the desired month (because the last week is 4 and not 5), retry with 4
-            if n_th_occurrence.month != month_date.month:
-                n_th_occurrence = month_date + timedelta(weeks=n - 2)
-            return n_th_occurrence
-
-        def next_month(month_date: date) -> date:
-            """
-            Advance the given date by one month
-
-            :param month_date: the given date
-            :return: The same date one month later
-            """
-            month_date = month_date.replace(day=1)
-            if month_date.month < 12:
-                return month_date.replace(month=month_date.month + 1)
-            return month_date.replace(month=1, year=month_date.year + 1)
-
-        def advance() -> Iterator[date]:
-            """
-            Get the next occurrence by this rule
-
-            :return: date objects
-            """
-
-            nonlocal next_recurrence
-            if self.frequency == frequency.DAILY:
-                yield next_recurrence
-                next_recurrence += timedelta(days=1)
-            elif self.frequency == frequency.WEEKLY:
-                # Yield each day of the week that is valid, since
-                # ``interval`` should apply here only on weekly basis
-                for weekday in sorted(self.weekdays_for_weekly):
-                    if weekday < next_recurrence.weekday():
-                        continue
-                    next_recurrence += timedelta(
-                        days=weekday - next_recurrence.weekday()
-                    )
-                    yield next_recurrence
-                # advance to the next monday
-                next_recurrence += timedelta(days=7 - next_recurrence.weekday())
-            elif self.frequency == frequency.MONTHLY:
-                next_recurrence = get_nth_weekday(
-                    next_recurrence, self.weekday_for_monthly, self.week_for_monthly
+        if (start_date.month, start_date.day) != (2, 29):
+            years = ceil_div(target_date.year - start_date.year, self.interval)
+            while True:
+                recurrence = start_date.replace(
+                    year=start_date.year + years * self.interval
                 )
-                if next_recurrence < start_date:
-                    next_recurrence = get_nth_weekday(
-                        next_month(next_recurrence),
-                        self.weekday_for_monthly,
-                        self.week_for_monthly,
-                    )
-                yield next_recurrence
-                next_recurrence = next_month(next_recurrence)
-            elif self.frequency == frequency.YEARLY:
-                yield next_recurrence
-
-                # It is not possible to go simply to the next year if the current date is february 29
-                year_dif = 1
-                while True:
-                    try:
-                        next_recurrence = next_recurrence.replace(
-                            year=next_recurrence.year + year_dif
-                        )
-                        break
-                    except ValueError:
-                        year_dif += 1
-
-        i = 0
-        end_date = self.recurrence_end_date or date.max
+                if recurrence >= target_date:
+                    return recurrence
+                years += 1
+        year = target_date.year
         while True:
-            for _recurrence in advance():
-                if next_recurrence > end_date:
-                    return
-                if not i % self.interval:
-                    yield next_recurrence
-            i += 1
+            if calendar.isleap(year):
+                leap_years = calendar.leapdays(start_date.year, year)
+                recurrence = date(year, 2, 29)
+                if not leap_years % self.interval and recurrence >= target_date:
+                    return recurrence
+            year += 1
+
+    def iter_between(
+        self, start_date: date, from_date: date, to_date: date
+    ) -> Iterator[date]:
+        """
+        Iterate all recurrences within a given window (both dates inclusive).
+        The iteration starts directly at the first recurrence of the window (see :meth:`seek`).
+
+        :param start_date: The start date of the event (the interval is counted from this date)
+        :param from_date: The first date of the window
+        :param to_date: The last date of the window
+        :return: An iterator over all dates defined by this recurrence rule within the window
+        """
+        recurrence = self.seek(start_date, from_date)
+        while recurrence and recurrence <= to_date:
+            yield recurrence
+            recurrence = self.seek(start_date, recurrence + timedelta(days=1))
+
+    def iter_after(
+        self, start_date: date, from_date: date | None = None
+    ) -> Iterator[date]:
+        """
+        Iterate all recurrences after a given start date.
+        This method assumes that ``weekdays_for_weekly`` contains at least one member
+        and that ``weekday_for_monthly`` and ``week_for_monthly`` are not null.
+
+        :param start_date: The start date of the event (the interval is counted from this date)
+        :param from_date: The date on which the iteration should start (defaults to the start date)
+        :return: An iterator over all dates defined by this recurrence rule
+        """
+        recurrence = self.seek(start_date, from_date or start_date)
+        while recurrence:
+            yield recurrence
+            recurrence = self.seek(start_date, recurrence + timedelta(days=1))
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,3 @@
+"""
+This package contains all models for background jobs
+"""
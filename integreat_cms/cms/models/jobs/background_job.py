@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ...constants import job_status
+from ..abstract_base_model import AbstractBaseModel
+from ..regions.region import Region
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+class BackgroundJob(AbstractBaseModel):
+    """
+    Data model representing a long-running operation which is executed by a worker process of the database-backed job
+    queue (see :mod:`~integreat_cms.cms.utils.background_job_utils` and the ``run_background_jobs`` management
+    command).
+    """
+
+    task = models.CharField(
+        max_length=255,
+        verbose_name=_("task"),
+        help_text=_("The import path of the function which is executed"),
+    )
+    kwargs = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name=_("arguments"),
+        help_text=_("The keyword arguments of the task"),
+    )
+    #: Manage choices in :mod:`~integreat_cms.cms.constants.job_status`
+    status = models.CharField(
+        max_length=9,
+        choices=job_status.CHOICES,
+        default=job_status.PENDING,
+        verbose_name=_("status"),
+    )
+    priority = models.SmallIntegerField(
+        default=0,
+        verbose_name=_("priority"),
+        help_text=_("Jobs with a higher priority are executed first"),
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name=_("attempts"),
+    )
+    max_attempts = models.PositiveSmallIntegerField(
+        default=1,
+        verbose_name=_("maximum attempts"),
+    )
+    run_after = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("run after"),
+        help_text=_("The job is not executed before this date"),
+    )
+    progress = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name=_("progress"),
+        help_text=_("The progress of the job in percent"),
+    )
+    messages = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_("messages"),
+        help_text=_("The messages of the job for the user who started it"),
+    )
+    error = models.TextField(
+        blank=True,
+        verbose_name=_("error"),
+    )
+    region = models.ForeignKey(
+        Region,
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="background_jobs",
+        verbose_name=_("region"),
+    )
+    creator = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="background_jobs",
+        verbose_name=_("creator"),
+    )
+    created_date = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("creation date"),
+    )
+    started_date = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("start date"),
+        help_text=_("The start of the latest attempt"),
+    )
+    finished_date = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("finished date"),
+    )
+
+    @property
+    def is_finished(self) -> bool:
+        """
+        Whether the job is finished, regardless of whether it succeeded or failed
+
+        :return: Whether the job is finished
+        """
+        return self.status in (job_status.SUCCEEDED, job_status.FAILED)
+
+    def serialize(self) -> dict[str, Any]:
+        """
+        This method creates a serialized version of that object for the status endpoint of the job.
+        The arguments and the error are not included, because they are only relevant for administrators.
+
+        :return: The serialized representation of the job
+        """
+        return {
+            "id": self.id,
+            "status": self.status,
+            "progress": self.progress,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "messages": self.messages,
+            "created_date": self.created_date,
+            "started_date": self.started_date,
+            "finished_date": self.finished_date,
+        }
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``BackgroundJob object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the background job
+        """
+        return f"{self.task} ({self.get_status_display()})"
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<BackgroundJob: BackgroundJob object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the background job
+        """
+        return (
+            f"<BackgroundJob (id: {self.id}, task: {self.task}, status: {self.status}, "
+            f"attempt: {self.attempts}/{self.max_attempts})>"
+        )
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("background job")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("background jobs")
+        #: The default permissions for this model
+        default_permissions = ()
+        #: The fields which are used to sort the returned objects of a QuerySet
+        ordering = ["-created_date"]
+        #: The indices of this model
+        indexes = [
+            models.Index(
+                fields=["status", "-priority", "run_after"],
+                name="%(class)s_queue_idx",
+            ),
+        ]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ..abstract_base_model import AbstractBaseModel
+
+
+class TranslationMemoryEntry(AbstractBaseModel):
+    """
+    Data model representing a machine translation of a single text segment. Before text segments are sent to a machine
+    translation provider, they are looked up in the translation memory, so identical segments of different contents and
+    regions are only translated (and billed) once (see :mod:`~integreat_cms.cms.utils.translation_memory_utils`).
+    """
+
+    provider = models.CharField(
+        max_length=32,
+        verbose_name=_("machine translation provider"),
+    )
+    source_language = models.CharField(
+        max_length=35,
+        verbose_name=_("source language"),
+        help_text=_("The language code which was sent to the provider"),
+    )
+    target_language = models.CharField(
+        max_length=35,
+        verbose_name=_("target language"),
+        help_text=_("The language code which was sent to the provider"),
+    )
+    segment_hash = models.CharField(
+        max_length=64,
+        verbose_name=_("segment hash"),
+        help_text=_("The SHA-256 hash of the normalized source text"),
+    )
+    translated_text = models.TextField(
+        verbose_name=_("translated text"),
+    )
+    created_date = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("creation date"),
+    )
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``TranslationMemoryEntry object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the translation memory entry
+        """
+        return f"{self.provider} ({self.source_language} ➜ {self.target_language}): {self.translated_text}"
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<TranslationMemoryEntry: TranslationMemoryEntry object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the translation memory entry
+        """
+        return (
+            f"<TranslationMemoryEntry (id: {self.id}, provider: {self.provider}, source: {self.source_language}, "
+            f"target: {self.target_language}, hash: {self.segment_hash})>"
+        )
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("translation memory entry")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("translation memory entries")
+        #: The default permissions for this model
+        default_permissions = ()
+        #: Sets of field names that, taken together, must be unique:
+        unique_together = (
+            ("provider", "source_language", "target_language", "segment_hash"),
+        )
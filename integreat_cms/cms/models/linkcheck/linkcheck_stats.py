@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from ...constants.linkcheck import URL_CATEGORIES
+from ..abstract_base_model import AbstractBaseModel
+from ..regions.region import Region
+
+
+class LinkcheckStats(AbstractBaseModel):
+    """
+    Data model representing the number of urls of a region which belong to a specific category of the link checker.
+    These statistics are maintained incrementally by :mod:`~integreat_cms.cms.utils.linkcheck_utils` and shown in the
+    dashboard and the link list.
+    """
+
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.CASCADE,
+        related_name="linkcheck_stats",
+        verbose_name=_("region"),
+    )
+    category = models.CharField(
+        max_length=9,
+        choices=URL_CATEGORIES,
+        verbose_name=_("category"),
+    )
+    url_count = models.IntegerField(
+        default=0,
+        verbose_name=_("number of urls"),
+    )
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``LinkcheckStats object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the linkcheck statistics
+        """
+        return f"{self.region} ({self.get_category_display()})"
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<LinkcheckStats: LinkcheckStats object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the linkcheck statistics
+        """
+        return (
+            f"<LinkcheckStats (id: {self.id}, region: {self.region_id}, category: {self.category}, "
+            f"urls: {self.url_count})>"
+        )
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("linkcheck statistics")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("linkcheck statistics")
+        #: The default permissions for this model
+        default_permissions = ()
+        #: Sets of field names that, taken together, must be unique:
+        unique_together = (
+            (
+                "region",
+                "category",
+            ),
+        )
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from linkcheck.models import Url
+
+from ...constants.linkcheck import URL_CATEGORIES
+from ..abstract_base_model import AbstractBaseModel
+from ..regions.region import Region
+
+
+class RegionUrlCategory(AbstractBaseModel):
+    """
+    Data model representing the contribution of a single url to the
+    :class:`~integreat_cms.cms.models.linkcheck.linkcheck_stats.LinkcheckStats` of a region in which it is used.
+    Storing the category allows to update the statistics of the region by the difference to the new category whenever
+    the url is checked or one of its links changes, without categorizing all other urls of the region.
+    """
+
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.CASCADE,
+        related_name="url_categories",
+        verbose_name=_("region"),
+    )
+    url = models.ForeignKey(
+        Url,
+        on_delete=models.CASCADE,
+        related_name="region_categories",
+        verbose_name=_("url"),
+    )
+    category = models.CharField(
+        max_length=9,
+        choices=URL_CATEGORIES,
+        verbose_name=_("category"),
+    )
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``RegionUrlCategory object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the region url category
+        """
+        return f"{self.url} ({self.region}, {self.get_category_display()})"
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<RegionUrlCategory: RegionUrlCategory object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the region url category
+        """
+        return (
+            f"<RegionUrlCategory (id: {self.id}, region: {self.region_id}, url: {self.url_id}, "
+            f"category: {self.category})>"
+        )
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("region url category")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("region url categories")
+        #: The default permissions for this model
+        default_permissions = ()
+        #: Sets of field names that, taken together, must be unique:
+        unique_together = (
+            (
+                "region",
+                "url",
+            ),
+        )
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
 from django.db.models import Q
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.formats import localize
 from django.utils.translation import gettext_lazy as _
@@ -108,3 +110,10 @@ class Directory(AbstractBaseModel):
         verbose_name_plural = _("media directories")
         #: The fields which are used to sort the returned objects of a QuerySet
         ordering = ["-region", "name"]
+        #: The indices of this model
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="directory_search_idx",
+            ),
+        ]
@@ -13,10 +13,11 @@ from time import strftime
 from typing import TYPE_CHECKING
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Exists, OuterRef, Q, Value
-from django.db.models.functions import Concat
+from django.db.models.functions import Concat, Upper
 from django.template.defaultfilters import filesizeformat
 from django.utils import timezone
 from django.utils.formats import localize
@@ -405,3 +406,12 @@ class MediaFile(AbstractBaseModel):
             ("upload_mediafile", "Can upload media file"),
             ("replace_mediafile", "Can replace media file"),
         )
+        #: The indices of this model
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                OpClass(Upper("alt_text"), name="gin_trgm_ops"),
+                OpClass(Upper("file"), name="gin_trgm_ops"),
+                name="mediafile_search_idx",
+            ),
+        ]
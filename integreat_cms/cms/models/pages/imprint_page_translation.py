@@ -96,3 +96,16 @@ class ImprintPageTranslation(AbstractBasePageTranslation):
                 name="%(class)s_unique_version",
             ),
         ]
+        #: The indices of this model
+        indexes = [
+            models.Index(
+                fields=["page", "language"],
+                condition=models.Q(is_latest=True),
+                name="imprint_translation_latest_idx",
+            ),
+            models.Index(
+                fields=["page", "language"],
+                condition=models.Q(is_latest_public=True),
+                name="imprint_translation_public_idx",
+            ),
+        ]
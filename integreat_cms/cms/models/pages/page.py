@@ -11,6 +11,8 @@ from django.utils.translation import gettext_lazy as _
 from linkcheck.models import Link
 from treebeard.ns_tree import NS_NodeQuerySet
 
+from ...utils.page_tree_index import get_page_tree_index
+from ...utils.translation_coverage_utils import update_translation_coverage
 from ...utils.translation_utils import gettext_many_lazy as __
 from ..abstract_content_model import ContentQuerySet
 from ..abstract_tree_node import AbstractTreeNode
@@ -24,6 +26,8 @@ if TYPE_CHECKING:
     from django.db.models.base import ModelBase
     from django.utils.safestring import SafeString
 
+    from ...utils.page_tree_index import PageTreeIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +55,7 @@ class PageQuerySet(NS_NodeQuerySet, ContentQuerySet):
             )
         result: dict[int, Page] = {}
         skipped_pages: list[Page] = []
+        tree_indices: dict[int, PageTreeIndex] = {}
         for page in (
             self.prefetch_translations()
             .prefetch_public_translations()
@@ -58,7 +63,6 @@ class PageQuerySet(NS_NodeQuerySet, ContentQuerySet):
         ):
             # pylint: disable=protected-access
             page._cached_ancestors = []
-            page._cached_descendants = []
             page._cached_children = []
             # Determine whether the page should be included in the result
             # pylint: disable=too-many-boolean-expressions
@@ -82,26 +86,32 @@ class PageQuerySet(NS_NodeQuerySet, ContentQuerySet):
                 )
             ):
                 if page.parent_id in result:
+                    parent = result[page.parent_id]
                     # Cache the page as child of the parent page
                     # pylint: disable=protected-access
-                    result[page.parent_id]._cached_children.append(page)
-                    result[page.parent_id]._cached_descendants.append(page)
-                    # Cache the parent page as ancestor of the current page
-                    page._cached_ancestors.extend(
-                        result[page.parent_id]._cached_ancestors
-                    )
-                    page._cached_ancestors.append(result[page.parent_id])
-                    # Cache the current page as descendant of the parent's page ancestors
-                    for ancestor in result[page.parent_id]._cached_ancestors:
-                        if ancestor.id in result:
-                            result[ancestor.id]._cached_descendants.append(page)
+                    parent._cached_children.append(page)
+                    # Cache the parent page and its ancestors as ancestors of the current page
+                    page._cached_ancestors = [*parent._cached_ancestors, parent]
                     # Set the relative depth to the relative depth of the parent + 1
-                    page._relative_depth = result[page.parent_id].relative_depth + 1
+                    page._relative_depth = parent.relative_depth + 1
                 else:
                     # Set the relative depth to 1
                     page._relative_depth = 1
+                # The descendants are looked up lazily in the page tree index of the region
+                if page.region_id not in tree_indices:
+                    tree_indices[page.region_id] = get_page_tree_index(page.region_id)
+                if not tree_indices[page.region_id].matches(
+                    page.id, page.tree_id, page.lft, page.rgt
+                ):
+                    # The tree was modified concurrently, so the cached index is outdated
+                    tree_indices[page.region_id] = get_page_tree_index(
+                        page.region_id, refresh=True
+                    )
+                page._cached_tree = result
+                page._tree_index = tree_indices[page.region_id]
                 result[page.id] = page
             else:
+                page._cached_descendants = []
                 # Keep track of all skipped pages
                 skipped_pages.append(page)
         logger.debug("Cached result: %r", result)
@@ -244,6 +254,15 @@ class Page(AbstractTreeNode, AbstractBasePage):
 
         :return: Whether or not this page is implicitly archived
         """
+        if self.id and not hasattr(self, "_cached_ancestors"):
+            # Avoid querying the ancestors if the page tree index of the region is cached and up to date
+            tree_index = getattr(self, "_tree_index", None)
+            if tree_index is None and settings.PAGE_TREE_INDEX_CACHE_ENABLED:
+                tree_index = get_page_tree_index(self.region_id)
+            if tree_index is not None and tree_index.matches(
+                self.id, self.tree_id, self.lft, self.rgt
+            ):
+                return tree_index.is_implicitly_archived(self.id)
         return bool(self.explicitly_archived_ancestors)
 
     @cached_property
@@ -319,8 +338,22 @@ class Page(AbstractTreeNode, AbstractBasePage):
                     (choices: :mod:`~integreat_cms.cms.constants.position`)
         :raises ~treebeard.exceptions.InvalidPosition: If the node is moved to another region
         """
+        # The moved page is saved afterwards, which updates its modification date for the delta sync of the API and
+        # sends the signals which invalidate the API snapshots and the page tree index
         super().move(target, pos)
         invalidate_model(PageTranslation)
+        # The page might have been moved into or out of an archived subtree
+        self.update_translation_coverage()
+
+    def update_translation_coverage(self) -> None:
+        """
+        Update the translation coverage statistics of the region after the archived state of this page and its
+        descendants might have changed (see :func:`~integreat_cms.cms.utils.translation_coverage_utils.update_translation_coverage`)
+        """
+        tree_index = get_page_tree_index(self.region_id)
+        update_translation_coverage(
+            self.region, [self.id, *tree_index.get_descendant_ids(self.id)]
+        )
 
     def archive(self) -> None:
         """
@@ -338,6 +371,7 @@ class Page(AbstractTreeNode, AbstractBasePage):
         self.mirrored_page = None
         self.save()
         invalidate_obj(self)
+        self.update_translation_coverage()
 
     def restore(self) -> None:
         """
@@ -345,13 +379,12 @@ class Page(AbstractTreeNode, AbstractBasePage):
         """
         self.explicitly_archived = False
         self.save()
+        self.update_translation_coverage()
 
         if not self.implicitly_archived:
             # Restore related link objects
             for child_page in self.get_non_archived_children():
-                for translation in child_page.translations.distinct(
-                    "page__pk", "language__pk"
-                ):
+                for translation in child_page.translations.filter(is_latest=True):
                     # The post_save signal will create link objects from the content
                     translation.save(update_timestamp=False)
 
@@ -392,3 +425,9 @@ class Page(AbstractTreeNode, AbstractBasePage):
             ("publish_page", "Can publish page"),
             ("grant_page_permissions", "Can grant page permission"),
         )
+        #: The indices of this model
+        indexes = [
+            models.Index(
+                fields=["region", "last_updated"], name="%(class)s_updated_idx"
+            ),
+        ]
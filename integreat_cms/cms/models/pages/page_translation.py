@@ -6,7 +6,9 @@ from typing import TYPE_CHECKING
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils.functional import cached_property
@@ -301,8 +303,8 @@ class PageTranslation(AbstractBasePageTranslation):
         :param language: The requested :class:`~integreat_cms.cms.models.languages.language.Language`
         :return: A :class:`~django.db.models.query.QuerySet` of all page translations of a region in a specific language
         """
-        return cls.objects.filter(page__region=region, language=language).distinct(
-            "page"
+        return cls.objects.filter(
+            page__region=region, language=language, is_latest=True
         )
 
     @classmethod
@@ -317,13 +319,7 @@ class PageTranslation(AbstractBasePageTranslation):
         :param language: The requested :class:`~integreat_cms.cms.models.languages.language.Language`
         :return: All up to date translations of a region in a specific language
         """
-        return [
-            t
-            for t in cls.objects.filter(
-                page__region=region, language=language
-            ).distinct("page")
-            if t.is_up_to_date
-        ]
+        return [t for t in cls.get_translations(region, language) if t.is_up_to_date]
 
     @classmethod
     def get_current_translations(
@@ -339,9 +335,7 @@ class PageTranslation(AbstractBasePageTranslation):
         """
         return [
             t
-            for t in cls.objects.filter(
-                page__region=region, language=language
-            ).distinct("page")
+            for t in cls.get_translations(region, language)
             if t.currently_in_translation
         ]
 
@@ -357,13 +351,7 @@ class PageTranslation(AbstractBasePageTranslation):
         :param language: The requested :class:`~integreat_cms.cms.models.languages.language.Language`
         :return: All outdated translations of a region in a specific language
         """
-        return [
-            t
-            for t in cls.objects.filter(
-                page__region=region, language=language
-            ).distinct("page")
-            if t.is_outdated
-        ]
+        return [t for t in cls.get_translations(region, language) if t.is_outdated]
 
     def path(self) -> SafeString:
         """
@@ -409,3 +397,23 @@ class PageTranslation(AbstractBasePageTranslation):
                 name="%(class)s_unique_version",
             ),
         ]
+        #: The indices of this model
+        indexes = [
+            models.Index(fields=["last_updated"], name="%(class)s_updated_idx"),
+            models.Index(
+                fields=["page", "language"],
+                condition=models.Q(is_latest=True),
+                name="%(class)s_latest_idx",
+            ),
+            models.Index(
+                fields=["page", "language"],
+                condition=models.Q(is_latest_public=True),
+                name="%(class)s_public_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                OpClass(Upper("slug"), name="gin_trgm_ops"),
+                condition=models.Q(is_latest=True) | models.Q(is_latest_public=True),
+                name="%(class)s_search_idx",
+            ),
+        ]
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from ..abstract_base_model import AbstractBaseModel
+from .page import Page
+
+
+class PageTranslationCoverage(AbstractBaseModel):
+    """
+    Data model representing the contribution of a single page to the
+    :class:`~integreat_cms.cms.models.pages.translation_coverage.TranslationCoverage` of its region.
+    Storing the contribution allows to update the statistics of the region by the difference to the new contribution
+    whenever the page or one of its translations changes, without recalculating the states of all other pages.
+    """
+
+    page = models.OneToOneField(
+        Page,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="translation_coverage",
+        verbose_name=_("page"),
+    )
+    translation_states = models.JSONField(
+        default=dict,
+        verbose_name=_("translation states"),
+        help_text=_(
+            "The translation state and the number of words to be translated per language id"
+        ),
+    )
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``PageTranslationCoverage object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the page translation coverage
+        """
+        return str(self.page)
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<PageTranslationCoverage: PageTranslationCoverage object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the page translation coverage
+        """
+        return f"<PageTranslationCoverage (page: {self.page_id}, translation states: {self.translation_states})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("page translation coverage")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("page translation coverage")
+        #: The default permissions for this model
+        default_permissions = ()
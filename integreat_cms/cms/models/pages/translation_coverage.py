@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from ...constants import translation_status
+from ..abstract_base_model import AbstractBaseModel
+from ..languages.language import Language
+from ..regions.region import Region
+
+
+class TranslationCoverage(AbstractBaseModel):
+    """
+    Data model representing the number of pages and the number of words of a region which have a specific translation
+    state in a specific language. These statistics are maintained incrementally by
+    :mod:`~integreat_cms.cms.utils.translation_coverage_utils` and shown in the translation coverage analytics.
+    """
+
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.CASCADE,
+        related_name="translation_coverage",
+        verbose_name=_("region"),
+    )
+    language = models.ForeignKey(
+        Language,
+        on_delete=models.CASCADE,
+        related_name="translation_coverage",
+        verbose_name=_("language"),
+    )
+    translation_state = models.CharField(
+        max_length=18,
+        choices=translation_status.CHOICES,
+        verbose_name=_("translation state"),
+    )
+    page_count = models.IntegerField(
+        default=0,
+        verbose_name=_("number of pages"),
+    )
+    word_count = models.IntegerField(
+        default=0,
+        verbose_name=_("number of words"),
+        help_text=_(
+            "The number of words of the source translations which have to be translated"
+        ),
+    )
+
+    def __str__(self) -> str:
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``TranslationCoverage object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the translation coverage
+        """
+        return (
+            f"{self.region} ({self.language}, {self.get_translation_state_display()})"
+        )
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<TranslationCoverage: TranslationCoverage object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the translation coverage
+        """
+        return (
+            f"<TranslationCoverage (id: {self.id}, region: {self.region_id}, language: {self.language_id}, "
+            f"state: {self.translation_state}, pages: {self.page_count}, words: {self.word_count})>"
+        )
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("translation coverage")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("translation coverage")
+        #: The default permissions for this model
+        default_permissions = ()
+        #: Sets of field names that, taken together, must be unique:
+        unique_together = (
+            (
+                "region",
+                "language",
+                "translation_state",
+            ),
+        )
@@ -162,7 +162,7 @@ class POI(AbstractContentModel):
         self.save()
 
         # Restore related link objects
-        for translation in self.translations.distinct("poi__pk", "language__pk"):
+        for translation in self.translations.filter(is_latest=True):
             # The post_save signal will create link objects from the content
             translation.save(update_timestamp=False)
 
@@ -177,3 +177,9 @@ class POI(AbstractContentModel):
         default_permissions = ("change", "delete", "view")
         #: The fields which are used to sort the returned objects of a QuerySet
         ordering = ["pk"]
+        #: The indices of this model
+        indexes = [
+            models.Index(
+                fields=["region", "last_updated"], name="%(class)s_updated_idx"
+            ),
+        ]
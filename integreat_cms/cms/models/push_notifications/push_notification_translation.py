@@ -3,7 +3,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 from ...constants import push_notifications as pnt_const
@@ -131,3 +133,10 @@ class PushNotificationTranslation(AbstractBaseModel):
         default_permissions = ()
         #: Sets of field names that, taken together, must be unique
         unique_together = ["push_notification", "language"]
+        #: The indices of this model
+        indexes = [
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="push_notification_search_idx",
+            ),
+        ]
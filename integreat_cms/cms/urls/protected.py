@@ -507,6 +507,11 @@ urlpatterns: list[URLPattern] = [
                     utils.search_content_ajax,
                     name="search_content_ajax",
                 ),
+                path(
+                    "jobs/<int:job_id>/",
+                    utils.background_job_status_ajax,
+                    name="background_job_status_ajax",
+                ),
             ]
         ),
     ),
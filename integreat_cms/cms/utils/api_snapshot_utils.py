@@ -0,0 +1,186 @@
+"""
+This module contains a snapshot store for serialized API responses.
+
+The full payload of an API endpoint is serialized once per region and language and stored as bytes in the cache.
+Every region has a content version per endpoint which is part of the snapshot key. Whenever content of a region
+changes, the content version is bumped (see :mod:`~integreat_cms.core.signals.api_snapshot_signals`), which makes all
+previous snapshots of this region unreachable, so they are rebuilt on the next request.
+The content versions are also used to answer conditional requests (see
+:func:`~integreat_cms.api.decorators.conditional_response`).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from functools import partial
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from ...core.utils.streaming_json_response import iter_json_array
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing import Any, Final
+
+logger = logging.getLogger(__name__)
+
+#: The prefix of all cache keys of this module
+API_SNAPSHOT_PREFIX: Final[str] = "api_snapshot"
+
+#: The API endpoints whose responses are stored as snapshots
+API_SNAPSHOT_ENDPOINTS: Final[list[str]] = [
+    "pages",
+    "events",
+    "locations",
+    "offers",
+    "fcm",
+]
+
+
+def get_content_versions(region_id: int, endpoint: str) -> list[int]:
+    """
+    Get the current global content version and the content version of the region for the given endpoint.
+    The versions are the timestamps in nanoseconds of the last change. If a version does not exist yet, the current
+    time is used as initial value. Using timestamps instead of counters makes sure that a version is never reused
+    after the cache entry has been evicted.
+
+    :param region_id: The id of the region
+    :param endpoint: The name of the API endpoint
+    :return: The global and the regional content version
+    """
+    cache_keys = [
+        get_content_version_key(None, endpoint),
+        get_content_version_key(region_id, endpoint),
+    ]
+    versions = cache.get_many(cache_keys)
+    for cache_key in cache_keys:
+        if cache_key not in versions:
+            # Use add() instead of set() to not overwrite a version which was set concurrently by another process
+            cache.add(cache_key, time.time_ns(), timeout=None)
+            versions[cache_key] = cache.get(cache_key) or time.time_ns()
+    return [versions[cache_key] for cache_key in cache_keys]
+
+
+def get_content_version(region_id: int, endpoint: str) -> str:
+    """
+    Get the current content version of an endpoint in a region.
+    It consists of the global version and the version of the region.
+
+    :param region_id: The id of the region
+    :param endpoint: The name of the API endpoint
+    :return: The current content version
+    """
+    return "_".join(map(str, get_content_versions(region_id, endpoint)))
+
+
+def get_last_content_update(region_id: int, endpoint: str) -> datetime:
+    """
+    Get the time of the last content change of an endpoint in a region.
+    In contrast to :attr:`~integreat_cms.cms.models.regions.region.Region.last_content_update`, this does not require
+    any database queries, but it might be later than the actual change if the content version has been evicted.
+
+    :param region_id: The id of the region
+    :param endpoint: The name of the API endpoint
+    :return: The time of the last content change
+    """
+    return datetime.fromtimestamp(
+        max(get_content_versions(region_id, endpoint)) / 10**9, tz=dt_timezone.utc
+    )
+
+
+def invalidate_api_snapshots(
+    region_id: int | None, endpoints: list[str] | None = None
+) -> None:
+    """
+    Invalidate the snapshots of a region by bumping its content versions.
+    If this is called inside a transaction, the versions are bumped again after the commit, because a concurrent
+    request could otherwise store a snapshot (and answer conditional requests) with the data from before the commit
+    under the new version.
+
+    :param region_id: The id of the region (or ``None`` to invalidate the snapshots of all regions, which is only
+                      required for changes which are not bound to a specific region, e.g. of offer templates)
+    :param endpoints: The endpoints which should be invalidated (defaults to all endpoints)
+    """
+    endpoints = endpoints or API_SNAPSHOT_ENDPOINTS
+    logger.debug("Invalidating API snapshots %r of region %r", endpoints, region_id)
+    bump_content_versions(region_id, endpoints)
+    if connection.in_atomic_block:
+        transaction.on_commit(partial(bump_content_versions, region_id, endpoints))
+
+
+def bump_content_versions(region_id: int | None, endpoints: list[str]) -> None:
+    """
+    Set the content versions of the given endpoints of a region to the current time
+
+    :param region_id: The id of the region (or ``None`` for the global versions)
+    :param endpoints: The endpoints
+    """
+    cache.set_many(
+        {
+            get_content_version_key(region_id, endpoint): time.time_ns()
+            for endpoint in endpoints
+        },
+        timeout=None,
+    )
+
+
+def get_api_snapshot(
+    region_id: int,
+    language_slug: str,
+    endpoint: str,
+    build_result: Callable[[], Iterable[Any]],
+) -> bytes:
+    """
+    Get the serialized response of an API endpoint.
+    If there is no valid snapshot in the cache, the result is built, serialized and stored.
+
+    :param region_id: The id of the region
+    :param language_slug: The slug of the requested language
+    :param endpoint: The name of the API endpoint
+    :param build_result: A function which returns the items of the JSON array of the endpoint
+    :return: The JSON encoded response body
+    """
+    if not settings.API_SNAPSHOTS_ENABLED:
+        return encode_api_result(build_result())
+    # Determine the key before the result is built to make sure that changes
+    # which happen while building do not end up in an outdated snapshot
+    cache_key = (
+        f"{API_SNAPSHOT_PREFIX}_{endpoint}_{region_id}_{language_slug}_"
+        f"{get_content_version(region_id, endpoint)}"
+    )
+    if (snapshot := cache.get(cache_key)) is not None:
+        logger.debug("Using API snapshot %r", cache_key)
+        return snapshot
+    snapshot = encode_api_result(build_result())
+    cache.set(cache_key, snapshot, timeout=settings.API_SNAPSHOTS_TIMEOUT)
+    logger.debug("Stored API snapshot %r (%d bytes)", cache_key, len(snapshot))
+    return snapshot
+
+
+def encode_api_result(items: Iterable[Any]) -> bytes:
+    """
+    Encode the items of an API result in the same way as :class:`~django.http.JsonResponse` does.
+    The items are encoded while they are produced, so only the encoded result is kept in memory.
+
+    :param items: The JSON serializable items of the result
+    :return: The encoded result
+    """
+    return "".join(iter_json_array(items)).encode(settings.DEFAULT_CHARSET)
+
+
+def get_content_version_key(region_id: int | None, endpoint: str) -> str:
+    """
+    This function returns the key that is used to store the content version in the cache.
+    It should not be used outside of this module.
+
+    :param region_id: The id of the region (or ``None`` for the global version)
+    :param endpoint: The name of the API endpoint
+    :return: The key to use
+    """
+    return f"{API_SNAPSHOT_PREFIX}_version_{endpoint}_{region_id or 'global'}"
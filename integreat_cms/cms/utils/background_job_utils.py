@@ -0,0 +1,272 @@
+"""
+This module contains the database-backed job queue for long-running operations
+(see :class:`~integreat_cms.cms.models.jobs.background_job.BackgroundJob`).
+
+Tasks are plain functions marked with :func:`background_task`, which receive a :class:`JobContext` and the keyword
+arguments of the job. Jobs are created with :func:`enqueue_job` and executed by the worker processes of the
+``run_background_jobs`` management command, which claim the pending jobs ordered by their priority with
+``SELECT ... FOR UPDATE SKIP LOCKED``, so any number of workers can run in parallel without a message broker.
+Failed jobs are retried with an exponential backoff and jobs of killed workers are executed again after
+:attr:`~integreat_cms.core.settings.BACKGROUND_JOB_TIMEOUT` seconds.
+
+The workers are only used if :attr:`~integreat_cms.core.settings.BACKGROUND_JOB_QUEUE_ENABLED` is set. Otherwise, jobs
+are executed in a background thread of the process which creates them, or immediately if
+:attr:`~integreat_cms.core.settings.BACKGROUND_TASKS_ENABLED` is disabled (e.g. in tests). Without workers, failed jobs
+are not retried.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import timedelta
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection, transaction
+from django.db.models import Q
+from django.http import HttpRequest
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from ...core.storages import BackgroundJobMessageStorage
+from ..constants import job_status
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from ..models import BackgroundJob, Region, User
+
+logger = logging.getLogger(__name__)
+
+
+def background_task(func: Callable[..., None]) -> Callable[..., None]:
+    """
+    Mark a function as task which can be executed as background job.
+    Only marked functions are executed by the workers, so the import path of a job can never point to arbitrary code.
+
+    :param func: The task function, which receives the :class:`JobContext` and the keyword arguments of the job
+    :return: The marked function
+    """
+    func.is_background_task = True  # type: ignore[attr-defined]
+    return func
+
+
+class JobContext:
+    """
+    The context of a background job which is passed to its task
+    """
+
+    def __init__(self, job: BackgroundJob, request: HttpRequest | None = None) -> None:
+        """
+        Initialize the job context
+
+        :param job: The background job
+        :param request: The current request if the job is executed immediately
+        """
+        self.job = job
+        self._request = request
+
+    @cached_property
+    def request(self) -> HttpRequest:
+        """
+        The request of the job. If the job is executed by a worker, a request of the creator of the job in the region
+        of the job is simulated, so tasks can reuse code which depends on the request. The messages of the simulated
+        request are stored in the job (see :class:`~integreat_cms.core.storages.BackgroundJobMessageStorage`).
+
+        :return: The current or simulated request
+        """
+        if self._request:
+            return self._request
+        request = HttpRequest()
+        request.user = self.job.creator or AnonymousUser()
+        request.region = self.job.region
+        # pylint: disable=protected-access
+        request._messages = BackgroundJobMessageStorage(request, self.job)
+        return request
+
+    def set_progress(self, done: int, total: int) -> None:
+        """
+        Report the progress of the job. The progress is only written to the database if the percentage changed.
+
+        :param done: The number of finished steps
+        :param total: The total number of steps
+        """
+        progress = min(100, 100 * done // total) if total else 100
+        if progress != self.job.progress:
+            self.job.progress = progress
+            self.job.save(update_fields=["progress", "messages"])
+
+
+def enqueue_job(
+    task: Callable[..., None],
+    *,
+    priority: int = 0,
+    region: Region | None = None,
+    user: User | AnonymousUser | None = None,
+    request: HttpRequest | None = None,
+    max_attempts: int | None = None,
+    **kwargs: Any,
+) -> BackgroundJob:
+    r"""
+    Create a background job. If the job queue is disabled, the job is executed in a background thread after the
+    current transaction was committed, or immediately if background tasks are disabled.
+
+    :param task: The task function (see :func:`background_task`)
+    :param priority: Jobs with a higher priority are executed first
+    :param region: The region of the job
+    :param user: The user who started the job
+    :param request: The current request (only used if the job is executed immediately)
+    :param max_attempts: The number of attempts (defaults to
+                         :attr:`~integreat_cms.core.settings.BACKGROUND_JOB_MAX_ATTEMPTS`)
+    :param \**kwargs: The keyword arguments of the task (must be JSON serializable)
+    :raises ValueError: If the task is not marked as background task
+    :return: The created job
+    """
+    if not getattr(task, "is_background_task", False):
+        raise ValueError(f"{task!r} is not marked as background task")
+    # Get model instead of importing it to avoid circular imports
+    BackgroundJob = apps.get_model(app_label="cms", model_name="BackgroundJob")
+    job = BackgroundJob.objects.create(
+        task=f"{task.__module__}.{task.__qualname__}",
+        kwargs=kwargs,
+        priority=priority,
+        region=region,
+        creator=user if user and user.is_authenticated else None,
+        max_attempts=max_attempts or settings.BACKGROUND_JOB_MAX_ATTEMPTS,
+    )
+    logger.debug("Enqueued %r", job)
+    if settings.BACKGROUND_JOB_QUEUE_ENABLED:
+        return job
+    # Mark the job as running, so it is not claimed by a worker which was started nevertheless
+    job.status = job_status.RUNNING
+    job.attempts = 1
+    job.started_date = timezone.now()
+    job.save(update_fields=["status", "attempts", "started_date"])
+    if settings.BACKGROUND_TASKS_ENABLED:
+        # Start the thread after the commit, so it can see the job and the data it depends on
+        transaction.on_commit(
+            threading.Thread(target=run_job_in_thread, args=(job,), daemon=True).start
+        )
+    else:
+        run_job(job, request)
+    return job
+
+
+def run_job_in_thread(job: BackgroundJob) -> None:
+    """
+    Execute a background job in a thread of the process which created it (see :func:`enqueue_job`)
+
+    :param job: The job
+    """
+    try:
+        run_job(job)
+    finally:
+        # The thread does not handle requests, so its connection is not closed automatically
+        connection.close()
+
+
+def claim_job() -> BackgroundJob | None:
+    """
+    Claim the next background job: The pending job with the highest priority whose retry delay is over, or a running
+    job which exceeded :attr:`~integreat_cms.core.settings.BACKGROUND_JOB_TIMEOUT` (because its worker was killed).
+    Jobs which are locked by other workers are skipped.
+
+    :return: The claimed job or ``None`` if there is no job to execute
+    """
+    BackgroundJob = apps.get_model(app_label="cms", model_name="BackgroundJob")
+    now = timezone.now()
+    with transaction.atomic():
+        job = (
+            BackgroundJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=job_status.PENDING, run_after__lte=now)
+                | Q(
+                    status=job_status.RUNNING,
+                    started_date__lt=now
+                    - timedelta(seconds=settings.BACKGROUND_JOB_TIMEOUT),
+                )
+            )
+            .order_by("-priority", "run_after", "id")
+            .first()
+        )
+        if job:
+            job.status = job_status.RUNNING
+            job.attempts += 1
+            job.started_date = now
+            job.save(update_fields=["status", "attempts", "started_date"])
+    return job
+
+
+def run_job(job: BackgroundJob, request: HttpRequest | None = None) -> None:
+    """
+    Execute a claimed background job and store its result. If the job fails and has attempts left, it is scheduled
+    again after :attr:`~integreat_cms.core.settings.BACKGROUND_JOB_RETRY_DELAY` seconds (doubled after each attempt).
+    If :attr:`~integreat_cms.core.settings.BACKGROUND_JOB_QUEUE_ENABLED` is disabled, there is no worker which could
+    retry the job, so it fails immediately.
+
+    :param job: The claimed job
+    :param request: The current request if the job is executed immediately
+    """
+    logger.info("Running %r", job)
+    if job.attempts > job.max_attempts:
+        # The job was claimed again after its last attempt timed out
+        finish_job(job, job_status.FAILED, "The job timed out in all attempts")
+        return
+    # Only keep the messages of the latest attempt
+    job.messages = []
+    try:
+        task = import_string(job.task)
+        if not getattr(task, "is_background_task", False):
+            raise ValueError(f"{job.task} is not marked as background task")
+        task(JobContext(job, request), **job.kwargs)
+    # pylint: disable=broad-exception-caught
+    except Exception as e:
+        logger.exception("%r failed", job)
+        if settings.BACKGROUND_JOB_QUEUE_ENABLED and job.attempts < job.max_attempts:
+            job.status = job_status.PENDING
+            job.error = f"{type(e).__name__}: {e}"
+            job.run_after = timezone.now() + timedelta(
+                seconds=settings.BACKGROUND_JOB_RETRY_DELAY * 2 ** (job.attempts - 1)
+            )
+            job.save()
+        else:
+            finish_job(job, job_status.FAILED, f"{type(e).__name__}: {e}")
+        return
+    job.progress = 100
+    finish_job(job, job_status.SUCCEEDED)
+
+
+def finish_job(job: BackgroundJob, status: str, error: str = "") -> None:
+    """
+    Mark a background job as finished
+
+    :param job: The job
+    :param status: The final status (see :mod:`~integreat_cms.cms.constants.job_status`)
+    :param error: The error of the last attempt
+    """
+    job.status = status
+    job.error = error
+    job.finished_date = timezone.now()
+    job.save()
+    logger.info("Finished %r", job)
+
+
+def delete_finished_jobs() -> int:
+    """
+    Delete the background jobs which finished more than
+    :attr:`~integreat_cms.core.settings.BACKGROUND_JOB_RETENTION_DAYS` days ago
+
+    :return: The number of deleted jobs
+    """
+    BackgroundJob = apps.get_model(app_label="cms", model_name="BackgroundJob")
+    deleted, _ = BackgroundJob.objects.filter(
+        status__in=[job_status.SUCCEEDED, job_status.FAILED],
+        finished_date__lt=timezone.now()
+        - timedelta(days=settings.BACKGROUND_JOB_RETENTION_DAYS),
+    ).delete()
+    return deleted
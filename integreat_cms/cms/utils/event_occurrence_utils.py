@@ -0,0 +1,208 @@
+"""
+This module contains utilities to maintain the materialized occurrences of events
+(see :class:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence`).
+
+Non-recurring events have exactly one occurrence. The occurrences of recurring events are materialized up to a rolling
+horizon of :attr:`~integreat_cms.core.settings.EVENT_OCCURRENCES_HORIZON_DAYS` days (plus the first occurrence after
+the horizon, so every event which is not over yet has at least one upcoming occurrence), and the date up to which they
+are complete is stored in :attr:`~integreat_cms.cms.models.events.event.Event.occurrences_until`.
+
+The occurrences of an event are rebuilt whenever the event or its recurrence rule is saved. The horizon is rolled
+forward periodically via the ``update_event_occurrences`` management command (see :func:`ensure_event_occurrences`),
+never during requests. Events whose occurrences are not materialized far enough (e.g. after loading fixtures) are
+handled by their recurrence rule instead.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.db.models.query import QuerySet
+
+    from ..models import Event
+
+logger = logging.getLogger(__name__)
+
+
+def get_occurrence_bounds(
+    event: Event, recurrence_date: date
+) -> tuple[datetime, datetime]:
+    """
+    Get the start and end of the occurrence of an event at a given (local) date.
+    The occurrence keeps the local start and end time of the event and its duration in days.
+
+    :param event: The event
+    :param recurrence_date: The local start date of the occurrence
+    :return: The start and end of the occurrence
+    """
+    start_local = event.start_local
+    end_local = event.end_local
+    start = datetime.combine(
+        recurrence_date, start_local.time(), tzinfo=start_local.tzinfo
+    )
+    end = datetime.combine(
+        recurrence_date + (end_local.date() - start_local.date()),
+        end_local.time(),
+        tzinfo=end_local.tzinfo,
+    )
+    return start, end
+
+
+def iter_occurrence_dates(
+    event: Event, until: date, after: date | None = None
+) -> Iterator[date]:
+    """
+    Iterate the local start dates of all occurrences of an event up to the given date and the first one after it
+
+    :param event: The event
+    :param until: The last date which should be materialized
+    :param after: If given, only occurrences after this date are iterated
+    :return: An iterator over the local start dates of the occurrences
+    """
+    start_date = event.start_local.date()
+    if not event.is_recurring:
+        if not after or start_date > after:
+            yield start_date
+        return
+    # Seek directly to the first required occurrence instead of iterating all previous ones
+    from_date = after + timedelta(days=1) if after else start_date
+    for recurrence_date in event.recurrence_rule.iter_after(start_date, from_date):
+        yield recurrence_date
+        if recurrence_date > until:
+            return
+
+
+def get_horizon(event: Event, today: date | None = None) -> date:
+    """
+    Get the date up to which the occurrences of an event are materialized
+
+    :param event: The event
+    :param today: The current date
+    :return: The horizon of the event
+    """
+    today = today or timezone.now().date()
+    horizon_days = max(
+        settings.EVENT_OCCURRENCES_HORIZON_DAYS, settings.API_EVENTS_MAX_TIME_SPAN_DAYS
+    )
+    return max(event.start_local.date(), today) + timedelta(days=horizon_days)
+
+
+def update_event_occurrences(
+    event: Event, today: date | None = None, rebuild: bool = False
+) -> None:
+    """
+    Materialize the occurrences of an event up to its horizon. If the occurrences were already materialized up to an
+    earlier date, only the missing occurrences are added.
+    The event is locked during the update, so concurrent updates of the same event are executed one after another and
+    each of them sees the occurrences of the previous one.
+
+    :param event: The event
+    :param today: The current date
+    :param rebuild: Whether all existing occurrences should be replaced
+    """
+    # Get model instead of importing it to avoid circular imports
+    EventOccurrence = apps.get_model(app_label="cms", model_name="EventOccurrence")
+    with transaction.atomic():
+        locked_until = (
+            type(event)
+            .objects.select_for_update()
+            .filter(id=event.id)
+            .values_list("occurrences_until", flat=True)
+            .first()
+        )
+        previous_until = None if rebuild else locked_until
+        if previous_until == date.max:
+            # All occurrences are already materialized
+            event.occurrences_until = previous_until
+            return
+        until = get_horizon(event, today)
+        if previous_until and previous_until >= until:
+            # The occurrences were updated concurrently
+            event.occurrences_until = previous_until
+            return
+        occurrences = []
+        complete = True
+        for recurrence_date in iter_occurrence_dates(event, until, previous_until):
+            if recurrence_date > until:
+                complete = False
+            start, end = get_occurrence_bounds(event, recurrence_date)
+            occurrences.append(EventOccurrence(event=event, start=start, end=end))
+        occurrences_until = until if not complete else date.max
+        if previous_until:
+            # Remove the first occurrence after the previous horizon, it is contained in the new occurrences
+            start, _ = get_occurrence_bounds(event, previous_until + timedelta(days=1))
+            EventOccurrence.objects.filter(event=event, start__gte=start).delete()
+        else:
+            EventOccurrence.objects.filter(event=event).delete()
+        EventOccurrence.objects.bulk_create(occurrences)
+        events = type(event).objects.filter(id=event.id)
+        if settings.REDIS_CACHE:
+            events.invalidated_update(occurrences_until=occurrences_until)
+        else:
+            events.update(occurrences_until=occurrences_until)
+    event.occurrences_until = occurrences_until
+    logger.debug(
+        "Materialized %d occurrences of %r until %s",
+        len(occurrences),
+        event,
+        occurrences_until,
+    )
+
+
+def rebuild_event_occurrences(event: Event) -> None:
+    """
+    Rebuild all occurrences of an event, e.g. after its dates or its recurrence rule changed
+
+    :param event: The event
+    """
+    update_event_occurrences(event, rebuild=True)
+
+
+def invalidate_event_occurrences(events: QuerySet[Event]) -> None:
+    """
+    Invalidate the occurrences of the given events. They are materialized again the next time they are requested.
+
+    :param events: The events
+    """
+    # Get model instead of importing it to avoid circular imports
+    EventOccurrence = apps.get_model(app_label="cms", model_name="EventOccurrence")
+    with transaction.atomic():
+        EventOccurrence.objects.filter(event__in=events).delete()
+        if settings.REDIS_CACHE:
+            events.invalidated_update(occurrences_until=None)
+        else:
+            events.update(occurrences_until=None)
+
+
+def ensure_event_occurrences(events: QuerySet[Event], until: date) -> int:
+    """
+    Make sure the occurrences of the given events are materialized at least up to the given date
+
+    :param events: The events
+    :param until: The date up to which the occurrences are required
+    :return: The number of updated events
+    """
+    outdated_events = (
+        events.filter(
+            Q(occurrences_until__isnull=True) | Q(occurrences_until__lt=until)
+        )
+        .select_related("recurrence_rule", "region")
+        .order_by()
+    )
+    count = 0
+    today = timezone.now().date()
+    for event in outdated_events:
+        update_event_occurrences(event, today)
+        count += 1
+    return count
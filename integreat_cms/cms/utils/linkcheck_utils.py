@@ -3,15 +3,19 @@ from __future__ import annotations
 import logging
 import re
 import time
+from collections import Counter, defaultdict
 from copy import deepcopy
 from functools import partial
 from typing import TYPE_CHECKING
 from urllib.parse import ParseResult, unquote, urlparse
 
+from cacheops import invalidate_model
 from django.conf import settings
-from django.db.models import Prefetch, Q, Subquery
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import F, Prefetch, Q, Subquery
 from django.db.models.sql import Query
-from linkcheck import update_lock
+from django.utils import timezone
 from linkcheck.listeners import tasks_queue
 from linkcheck.models import Link, Url
 from lxml.html import rewrite_links
@@ -19,20 +23,50 @@ from lxml.html import rewrite_links
 from integreat_cms.cms.models import (
     EventTranslation,
     ImprintPageTranslation,
+    LinkcheckStats,
     PageTranslation,
     POITranslation,
     Region,
+    RegionUrlCategory,
 )
 
+from ..constants import status
+from ..constants.linkcheck import (
+    EMAIL,
+    IGNORED,
+    INVALID,
+    PHONE,
+    UNCHECKED,
+    URL_CATEGORIES,
+    VALID,
+)
 from ..models.abstract_content_translation import AbstractContentTranslation
+from .api_snapshot_utils import invalidate_api_snapshots
+from .background_job_utils import background_task, enqueue_job
+from .page_tree_index import get_page_tree_index
+from .translation_coverage_utils import invalidate_translation_coverage
 
 if TYPE_CHECKING:
-    from typing import Any
+    from collections.abc import Callable
+    from typing import Any, Final, Iterable
 
     from ..models import Language, Region, User
+    from .background_job_utils import JobContext
+    from .page_tree_index import PageTreeIndex
 
 logger = logging.getLogger(__name__)
 
+#: The lookups from links to the content translations in which they occur and the foreign fields of the translations
+LINK_TRANSLATION_LOOKUPS: Final[dict[str, str]] = {
+    "page_translation": "page",
+    "imprint_translation": "page",
+    "event_translation": "event",
+    "poi_translation": "poi",
+}
+
+#: The number of translations whose links are replaced in one transaction
+REPLACE_LINKS_BATCH_SIZE: Final[int] = 500
+
 
 def get_urls(
     region_slug: str | None = None,
@@ -84,24 +118,23 @@ def get_region_links(region: Region) -> Query:
     latest_pagetranslation_versions = Subquery(
         PageTranslation.objects.filter(
             page__id__in=Subquery(region.non_archived_pages.values("pk")),
-        )
-        .distinct("page__id", "language__id")
-        .values_list("pk", flat=True)
+            is_latest=True,
+        ).values_list("pk", flat=True)
     )
     latest_poitranslation_versions = Subquery(
-        POITranslation.objects.filter(poi__region=region)
-        .distinct("poi__id", "language__id")
-        .values_list("pk", flat=True)
+        POITranslation.objects.filter(poi__region=region, is_latest=True).values_list(
+            "pk", flat=True
+        )
     )
     latest_eventtranslation_versions = Subquery(
-        EventTranslation.objects.filter(event__region=region)
-        .distinct("event__id", "language__id")
-        .values_list("pk", flat=True)
+        EventTranslation.objects.filter(
+            event__region=region, is_latest=True
+        ).values_list("pk", flat=True)
     )
     latest_imprinttranslation_versions = Subquery(
-        ImprintPageTranslation.objects.filter(page__region=region)
-        .distinct("page__id", "language__id")
-        .values_list("pk", flat=True)
+        ImprintPageTranslation.objects.filter(
+            page__region=region, is_latest=True
+        ).values_list("pk", flat=True)
     )
     # Get all link objects of the requested region
     region_links = Link.objects.filter(
@@ -117,15 +150,298 @@ def get_region_links(region: Region) -> Query:
 def get_url_count(region_slug: str | None = None) -> dict[str, int]:
     """
     Count all urls by status. The content objects are not prefetched because they are not needed for the counter.
+    The counters of a region are taken from its linkcheck statistics (see :func:`get_linkcheck_stats`).
 
     :param region_slug: The slug of the current region
     :return: A dictionary containing the counters of all remaining urls
     """
-    _, count_dict = filter_urls(region_slug=region_slug, prefetch_content_objects=False)
+    if region_slug:
+        return get_linkcheck_stats(Region.objects.get(slug=region_slug))["counts"]
+    _, count_dict = filter_urls(prefetch_content_objects=False)
+    return count_dict
+
+
+def get_url_category(url: Url, ignored: bool) -> str:
+    """
+    Get the category of a url in a region (see :data:`~integreat_cms.cms.constants.linkcheck.URL_CATEGORIES`)
+
+    :param url: The url
+    :param ignored: Whether all links of the url in the region are ignored
+    :raises NotImplementedError: If the url does not fit into any of the categories
+    :return: The category of the url
+    """
+    if ignored:
+        return IGNORED
+    if url.status:
+        return VALID
+    if url.status is False:
+        # Explicitly check for False, because status is None means unchecked
+        return INVALID
+    if url.type == "mailto":
+        return EMAIL
+    if url.type == "phone":
+        return PHONE
+    if not url.last_checked:
+        return UNCHECKED
+    raise NotImplementedError(
+        f"Url {url!r} does not fit into any of the defined categories"
+    )
+
+
+def get_count_dict(counts: dict[str, int]) -> dict[str, int]:
+    """
+    Convert the number of urls per category into the counters which are used as template context
+
+    :param counts: The number of urls per category
+    :return: A dictionary containing the counters of all urls
+    """
+    count_dict = {
+        "number_all_urls": sum(counts.values()),
+        "number_valid_urls": counts.get(VALID, 0),
+        "number_unchecked_urls": counts.get(UNCHECKED, 0),
+        "number_ignored_urls": counts.get(IGNORED, 0),
+        "number_invalid_urls": counts.get(INVALID, 0),
+    }
+    if settings.LINKCHECK_EMAIL_ENABLED:
+        count_dict["number_email_urls"] = counts.get(EMAIL, 0)
+    if settings.LINKCHECK_PHONE_ENABLED:
+        count_dict["number_phone_urls"] = counts.get(PHONE, 0)
     return count_dict
 
 
-# pylint: disable=too-many-branches
+def calculate_url_categories(
+    url_ids: Iterable[int] | None = None, region_ids: Iterable[int] | None = None
+) -> dict[tuple[int, int], str]:
+    """
+    Calculate the categories of urls in the regions in which they occur.
+    Like in :func:`get_region_links`, only the links of the latest versions of non-archived pages and of the latest
+    versions of all other contents are taken into account.
+
+    :param url_ids: The ids of the urls which should be calculated (defaults to all urls)
+    :param region_ids: The ids of the regions which should be calculated (defaults to all regions)
+    :return: A mapping from region and url ids to the category of the url in the region
+    """
+    links = Link.objects.all()
+    if url_ids is not None:
+        links = links.filter(url_id__in=url_ids)
+    ignored: dict[tuple[int, int], bool] = {}
+    tree_indices: dict[int, PageTreeIndex] = {}
+    for translation, content in LINK_TRANSLATION_LOOKUPS.items():
+        translation_links = links.filter(**{f"{translation}__is_latest": True})
+        if region_ids is not None:
+            translation_links = translation_links.filter(
+                **{f"{translation}__{content}__region_id__in": region_ids}
+            )
+        for url_id, ignore, region_id, content_id in translation_links.values_list(
+            "url_id",
+            "ignore",
+            f"{translation}__{content}__region_id",
+            f"{translation}__{content}_id",
+        ):
+            if translation == "page_translation":
+                if region_id not in tree_indices:
+                    tree_indices[region_id] = get_page_tree_index(region_id)
+                if content_id not in tree_indices[region_id]:
+                    # The tree was modified concurrently, so the cached index is outdated
+                    tree_indices[region_id] = get_page_tree_index(
+                        region_id, refresh=True
+                    )
+                if tree_indices[region_id].is_archived(content_id):
+                    continue
+            ignored[region_id, url_id] = (
+                ignored.get((region_id, url_id), True) and ignore
+            )
+    urls = Url.objects.in_bulk({url_id for _, url_id in ignored})
+    return {
+        (region_id, url_id): get_url_category(urls[url_id], url_ignored)
+        for (region_id, url_id), url_ignored in ignored.items()
+        if url_id in urls
+        and urls[url_id].type not in settings.LINKCHECK_IGNORED_URL_TYPES
+    }
+
+
+def rebuild_linkcheck_stats(region: Region, only_missing: bool = False) -> None:
+    """
+    Recalculate the categories of all urls of a region and store the linkcheck statistics of the region.
+    Concurrent rebuilds of the same region are serialized by locking the region.
+
+    :param region: The region
+    :param only_missing: Whether the statistics should only be built if they do not exist (e.g. because a concurrent
+                         request built them while this one was waiting for the lock)
+    """
+    with transaction.atomic():
+        # Lock the region, so concurrent rebuilds cannot insert the same statistics twice
+        list(Region.objects.select_for_update().filter(id=region.id).values_list("id"))
+        if only_missing and LinkcheckStats.objects.filter(region=region).exists():
+            return
+        logger.debug("Rebuilding linkcheck statistics of %r", region)
+        categories = calculate_url_categories(region_ids=[region.id])
+        counts = Counter(categories.values())
+        RegionUrlCategory.objects.filter(region=region).delete()
+        RegionUrlCategory.objects.bulk_create(
+            RegionUrlCategory(region=region, url_id=url_id, category=category)
+            for (_, url_id), category in categories.items()
+        )
+        LinkcheckStats.objects.filter(region=region).delete()
+        # Make sure the statistics contain all categories, even if they do not occur in the region
+        LinkcheckStats.objects.bulk_create(
+            LinkcheckStats(region=region, category=category, url_count=counts[category])
+            for category, _ in URL_CATEGORIES
+        )
+
+
+def update_linkcheck_stats(url_ids: Iterable[int], deleted: bool = False) -> None:
+    """
+    Recalculate the categories of the given urls and update the linkcheck statistics of the regions in which they
+    occur by the difference to the previous categories. This is idempotent, so it can safely be called multiple times
+    for the same change. Regions whose statistics were not built yet are skipped.
+
+    :param url_ids: The ids of the changed urls
+    :param deleted: Whether the urls are about to be deleted
+    """
+    if not LinkcheckStats.objects.exists():
+        # Skip the calculation if no statistics were built yet
+        return
+    url_ids = set(url_ids)
+    with transaction.atomic():
+        previous_categories = {
+            (region_id, url_id): category
+            for region_id, url_id, category in RegionUrlCategory.objects.select_for_update()
+            .filter(url_id__in=url_ids)
+            .values_list("region_id", "url_id", "category")
+        }
+        categories = {} if deleted else calculate_url_categories(url_ids)
+        built_region_ids = set(
+            LinkcheckStats.objects.filter(
+                region_id__in={
+                    region_id for region_id, _ in previous_categories | categories
+                }
+            )
+            .values_list("region_id", flat=True)
+            .distinct()
+        )
+        deltas: Counter[tuple[int, str]] = Counter()
+        for region_id, url_id in previous_categories.keys() | categories.keys():
+            if region_id not in built_region_ids:
+                continue
+            previous_category = previous_categories.get((region_id, url_id))
+            category = categories.get((region_id, url_id))
+            if category == previous_category:
+                continue
+            if previous_category:
+                deltas[region_id, previous_category] -= 1
+            if category:
+                deltas[region_id, category] += 1
+                RegionUrlCategory.objects.update_or_create(
+                    region_id=region_id, url_id=url_id, defaults={"category": category}
+                )
+            else:
+                RegionUrlCategory.objects.filter(
+                    region_id=region_id, url_id=url_id
+                ).delete()
+        apply_linkcheck_stats_deltas(deltas)
+
+
+def update_url_category(url: Url) -> None:
+    """
+    Update the category of a url in all regions after it was (re-)checked.
+    Checking a url only changes its status, so the links of the url do not have to be loaded: Urls whose links are
+    all ignored stay ignored and all other urls get the same category in every region.
+
+    :param url: The checked url
+    """
+    if url.type in settings.LINKCHECK_IGNORED_URL_TYPES:
+        return
+    category = get_url_category(url, ignored=False)
+    with transaction.atomic():
+        changed_categories = list(
+            RegionUrlCategory.objects.select_for_update()
+            .filter(url=url)
+            .exclude(category__in=[IGNORED, category])
+            .values_list("id", "region_id", "category")
+        )
+        if not changed_categories:
+            return
+        deltas: Counter[tuple[int, str]] = Counter()
+        for _, region_id, previous_category in changed_categories:
+            deltas[region_id, previous_category] -= 1
+            deltas[region_id, category] += 1
+        RegionUrlCategory.objects.filter(
+            id__in=[category_id for category_id, _, _ in changed_categories]
+        ).update(category=category)
+        apply_linkcheck_stats_deltas(deltas)
+
+
+def apply_linkcheck_stats_deltas(deltas: Counter[tuple[int, str]]) -> None:
+    """
+    Add the given differences to the stored linkcheck statistics
+
+    :param deltas: The difference of the number of urls per region id and category
+    """
+    # Sort the updates to always lock the rows in the same order
+    for (region_id, category), delta in sorted(deltas.items()):
+        if delta:
+            LinkcheckStats.objects.filter(
+                region_id=region_id, category=category
+            ).update(url_count=F("url_count") + delta)
+
+
+def invalidate_linkcheck_stats(region_ids: Iterable[int]) -> None:
+    """
+    Invalidate the linkcheck statistics of the given regions, e.g. after links were changed in bulk.
+    The statistics are rebuilt the next time they are requested.
+
+    :param region_ids: The ids of the regions whose urls or links changed
+    """
+    logger.debug("Invalidating linkcheck statistics of regions %r", region_ids)
+    with transaction.atomic():
+        RegionUrlCategory.objects.filter(region_id__in=region_ids).delete()
+        LinkcheckStats.objects.filter(region_id__in=region_ids).delete()
+
+
+def get_linkcheck_stats(region: Region) -> dict[str, Any]:
+    """
+    Get the linkcheck statistics of a region, which contain the counters of all url categories (see
+    :func:`filter_urls`) and the ids of the first invalid url and one of its links in this region.
+    The statistics are maintained incrementally whenever a url is checked or a link changes (see
+    :mod:`~integreat_cms.core.signals.linkcheck_stats_signals`). If they are not built yet, they are calculated first.
+
+    :param region: The region
+    :return: The linkcheck statistics of the region
+    """
+    if not (
+        counts := dict(
+            LinkcheckStats.objects.filter(region=region).values_list(
+                "category", "url_count"
+            )
+        )
+    ):
+        rebuild_linkcheck_stats(region, only_missing=True)
+        counts = dict(
+            LinkcheckStats.objects.filter(region=region).values_list(
+                "category", "url_count"
+            )
+        )
+    invalid_url_id = (
+        RegionUrlCategory.objects.filter(region=region, category=INVALID)
+        .order_by("url_id")
+        .values_list("url_id", flat=True)
+        .first()
+    )
+    return {
+        "counts": get_count_dict(counts),
+        "invalid_url_id": invalid_url_id,
+        "invalid_link_id": (
+            get_region_links(region)
+            .filter(url_id=invalid_url_id)
+            .values_list("id", flat=True)
+            .first()
+            if invalid_url_id
+            else None
+        ),
+    }
+
+
 def filter_urls(
     region_slug: str | None = None,
     url_filter: str | None = None,
@@ -144,67 +460,37 @@ def filter_urls(
         region_slug=region_slug, prefetch_content_objects=prefetch_content_objects
     )
     # Split url lists into their respective categories
-    ignored_urls, valid_urls, invalid_urls, email_links, phone_links, unchecked_urls = (
-        [] for i in range(6)
-    )
+    categorized_urls: dict[str, list[Url]] = {
+        category: [] for category, _ in URL_CATEGORIES
+    }
     for url in urls:
         links = url.region_links if region_slug else url.links.all()
-        if all(link.ignore for link in links):
-            ignored_urls.append(url)
-        elif url.status:
-            valid_urls.append(url)
-        elif url.status is False:
-            # Explicitly check for False, because status is None means unchecked
-            invalid_urls.append(url)
-        elif url.type == "mailto":
-            email_links.append(url)
-        elif url.type == "phone":
-            phone_links.append(url)
-        elif not url.last_checked:
-            unchecked_urls.append(url)
-        else:
-            raise NotImplementedError(
-                f"Url {url!r} does not fit into any of the defined categories"
-            )
+        categorized_urls[
+            get_url_category(url, all(link.ignore for link in links))
+        ].append(url)
     # Pass the number of urls to a dict which can be used as extra template context
-    count_dict = {
-        "number_all_urls": len(urls),
-        "number_valid_urls": len(valid_urls),
-        "number_unchecked_urls": len(unchecked_urls),
-        "number_ignored_urls": len(ignored_urls),
-        "number_invalid_urls": len(invalid_urls),
-    }
-    if settings.LINKCHECK_EMAIL_ENABLED:
-        count_dict["number_email_urls"] = len(email_links)
-    if settings.LINKCHECK_PHONE_ENABLED:
-        count_dict["number_phone_urls"] = len(phone_links)
+    count_dict = get_count_dict(
+        {
+            category: len(category_urls)
+            for category, category_urls in categorized_urls.items()
+        }
+    )
     # Return the requested urls
-    if url_filter == "valid":
-        urls = valid_urls
-    elif url_filter == "unchecked":
-        urls = unchecked_urls
-    elif url_filter == "ignored":
-        urls = ignored_urls
-    elif url_filter == "invalid":
-        urls = invalid_urls
-    elif url_filter == "email":
-        urls = email_links
-    elif url_filter == "phone":
-        urls = phone_links
+    if url_filter in categorized_urls:
+        urls = categorized_urls[url_filter]
 
     return urls, count_dict
 
 
-def replace_link_helper(old_url: str, new_url: str, link: str) -> str:
+def replace_link_helper(rules: dict[str, str], link: str) -> str:
     """
     A small helper function which can be passed to :meth:`lxml.html.HtmlMixin.rewrite_links`
 
-    :param old_url: The url which should be replaced
-    :param new_url: The url which should be inserted instead of the old url
+    :param rules: A dict which maps the urls which should be replaced to the urls which should be inserted instead
     :param link: The current link
     :return: The replaced link
     """
-    return new_url if link == old_url else link
+    return rules.get(link, link)
 
 
 def save_new_version(
@@ -237,9 +523,14 @@ def replace_links(
     user: User | None = None,
     commit: bool = True,
     link_types: list[str] | None = None,
+    progress: Callable[[int, int], None] | None = None,
 ) -> None:
     """
-    Perform search & replace in the content links
+    Perform search & replace in the content links.
+    Instead of scanning all translations, the affected translations are looked up via the link objects of the link
+    checker, so only the latest versions which actually contain a matching link are changed.
+    The new versions are created in batches and the link objects are moved to them directly (see
+    :func:`replace_links_batch`), so there is no need to wait for the listeners of the link checker.
 
     :param search: The (partial) URL to search
     :param replace: The (partial) URL to replace
@@ -247,6 +538,7 @@ def replace_links(
     :param user: The creator of the replaced translations
     :param commit: Whether changes should be written to the database
     :param link_types: Which kind of links should be replaced
+    :param progress: An optional callback which is called with the number of finished and total affected translations
     """
     region_msg = f' of "{region!r}"' if region else ""
     user_msg = f' by "{user!r}"' if user else ""
@@ -258,42 +550,212 @@ def replace_links(
         user_msg,
     )
     models = [PageTranslation, EventTranslation, POITranslation]
-    with update_lock:
-        for model in models:
-            filters = {}
-            if region:
-                filters[f"{model.foreign_field()}__region"] = region
-
-            for translation in model.objects.filter(**filters).distinct(
-                model.foreign_field(), "language"
-            ):
-                new_translation = deepcopy(translation)
-                for link in translation.links.select_related("url"):
-                    url = link.url.url
-                    should_replace = search in url and (
-                        not link_types or link.url.type in link_types
-                    )
-                    if should_replace:
-                        fixed_url = url.replace(search, replace)
-                        new_translation.content = rewrite_links(
-                            new_translation.content,
-                            partial(replace_link_helper, url, fixed_url),
-                        )
-                        logger.debug(
-                            "Replacing %r with %r in %r", url, fixed_url, translation
-                        )
-                new_translation.content = fix_content_link_encoding(
-                    new_translation.content
+    # Collect the matching urls of the affected translations
+    replacements: dict[type[AbstractContentTranslation], dict[int, dict[str, str]]] = {}
+    for model in models:
+        replacements[model] = defaultdict(dict)
+        links = Link.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            url__url__contains=search,
+        ).select_related("url")
+        for link in links:
+            if not link_types or link.url.type in link_types:
+                replacements[model][link.object_id][link.url.url] = (
+                    link.url.url.replace(search, replace)
                 )
-                if new_translation.content != translation.content and commit:
-                    save_new_version(translation, new_translation, user)
-    # Wait until all post-save signals have been processed
-    logger.debug("Waiting for linkcheck listeners to update link database...")
-    time.sleep(0.1)
-    tasks_queue.join()
+    # Only replace the links in the latest versions of the requested region
+    affected_ids = {}
+    for model, replacements_by_id in replacements.items():
+        translations = model.objects.filter(id__in=replacements_by_id, is_latest=True)
+        if region:
+            translations = translations.filter(
+                **{f"{model.foreign_field()}__region": region}
+            )
+        affected_ids[model] = sorted(translations.values_list("id", flat=True))
+    total = sum(len(ids) for ids in affected_ids.values())
+    logger.debug("Found %d translations with matching links", total)
+    done = 0
+    region_ids: set[int] = set()
+    waiting_for_listeners = False
+    for model, ids in affected_ids.items():
+        for i in range(0, len(ids), REPLACE_LINKS_BATCH_SIZE):
+            if progress:
+                progress(done, total)
+            batch = ids[i : i + REPLACE_LINKS_BATCH_SIZE]
+            batch_region_ids, saved_individually = replace_links_batch(
+                model,
+                {
+                    translation_id: replacements[model][translation_id]
+                    for translation_id in batch
+                },
+                user,
+                commit,
+            )
+            region_ids |= batch_region_ids
+            waiting_for_listeners |= saved_individually
+            done += len(batch)
+    if region_ids:
+        # Bulk operations neither send signals nor invalidate the query cache
+        for model in [*models, Link, Url]:
+            invalidate_model(model)
+        invalidate_linkcheck_stats(region_ids)
+        for region_id in region_ids:
+            invalidate_api_snapshots(region_id)
+            invalidate_translation_coverage(region_id)
+    if waiting_for_listeners:
+        # Wait until all post-save signals of the individually saved versions have been processed
+        logger.debug("Waiting for linkcheck listeners to update link database...")
+        time.sleep(0.1)
+        tasks_queue.join()
     logger.info("Finished replacing %r with %r in content links", search, replace)
 
 
+def replace_links_batch(
+    model: type[AbstractContentTranslation],
+    replacements: dict[int, dict[str, str]],
+    user: User | None,
+    commit: bool,
+) -> tuple[set[int], bool]:
+    """
+    Replace the links of a batch of translations in one transaction (see :func:`bulk_create_versions`).
+    Only if the content contained other links whose encoding had to be fixed, the new version is saved individually,
+    so the link checker extracts its links again.
+
+    :param model: The translation model
+    :param replacements: A dict which maps the ids of the translations to their url replacements
+    :param user: The creator of the new versions
+    :param commit: Whether changes should be written to the database
+    :return: The ids of the regions of the changed translations and whether any version was saved individually
+    """
+    new_translations = {}
+    individual_versions = []
+    region_ids = set()
+    with transaction.atomic():
+        for translation in model.objects.filter(id__in=replacements).select_related(
+            model.foreign_field()
+        ):
+            urls = replacements[translation.id]
+            new_translation = deepcopy(translation)
+            new_translation.content = rewrite_links(
+                translation.content, partial(replace_link_helper, urls)
+            )
+            for url, fixed_url in urls.items():
+                logger.debug("Replacing %r with %r in %r", url, fixed_url, translation)
+            fixed_content = fix_content_link_encoding(new_translation.content)
+            if fixed_content == translation.content or not commit:
+                continue
+            region_ids.add(getattr(translation, model.foreign_field()).region_id)
+            if fixed_content != new_translation.content:
+                new_translation.content = fixed_content
+                individual_versions.append((translation, new_translation))
+                continue
+            new_translation.pk = None
+            new_translation.version += 1
+            new_translation.minor_edit = True
+            new_translation.creator = user
+            new_translation.last_updated = timezone.now()
+            new_translation.is_latest = True
+            new_translation.is_latest_public = new_translation.status == status.PUBLIC
+            new_translations[translation.id] = new_translation
+        if new_translations:
+            bulk_create_versions(model, new_translations, replacements)
+    # Save the other versions after the transaction, so the listeners of the link checker can see them
+    for translation, new_translation in individual_versions:
+        save_new_version(translation, new_translation, user)
+    return region_ids, bool(individual_versions)
+
+
+def bulk_create_versions(
+    model: type[AbstractContentTranslation],
+    new_translations: dict[int, AbstractContentTranslation],
+    replacements: dict[int, dict[str, str]],
+) -> None:
+    """
+    Create new translation versions with replaced links and move the link objects of the previous versions to them.
+    Urls which did not exist before are checked afterwards (see :func:`check_new_urls`).
+
+    :param model: The translation model
+    :param new_translations: A dict which maps the ids of the previous versions to the unsaved new versions
+    :param replacements: A dict which maps the ids of the previous versions to their url replacements
+    """
+    model.objects.bulk_create(new_translations.values())
+    logger.debug("Created %d new translation versions", len(new_translations))
+    model.update_latest_versions(
+        **{
+            f"{model.foreign_field()}_id__in": {
+                getattr(new_translation, f"{model.foreign_field()}_id")
+                for new_translation in new_translations.values()
+            }
+        }
+    )
+    fixed_urls = {
+        fixed_url
+        for translation_id in new_translations
+        for fixed_url in replacements[translation_id].values()
+    }
+    existing_urls = set(
+        Url.objects.filter(url__in=fixed_urls).values_list("url", flat=True)
+    )
+    Url.objects.bulk_create(
+        [Url(url=fixed_url) for fixed_url in fixed_urls - existing_urls],
+        ignore_conflicts=True,
+    )
+    url_ids = dict(Url.objects.filter(url__in=fixed_urls).values_list("url", "id"))
+    links = list(
+        Link.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            object_id__in=new_translations,
+        ).select_related("url")
+    )
+    replaced_url_ids = set()
+    for link in links:
+        if fixed_url := replacements[link.object_id].get(link.url.url):
+            replaced_url_ids.add(link.url_id)
+            link.url_id = url_ids[fixed_url]
+        link.object_id = new_translations[link.object_id].id
+    Link.objects.bulk_update(links, ["object_id", "url"])
+    # Delete the urls which are not linked anymore, like the link checker does when link objects are deleted
+    Url.objects.filter(id__in=replaced_url_ids, links__isnull=True).delete()
+    # Bulk inserts bypass the listeners of the link checker, so the new urls have to be checked explicitly
+    check_new_urls(url_ids[fixed_url] for fixed_url in fixed_urls - existing_urls)
+
+
+def check_new_urls(url_ids: Iterable[int]) -> None:
+    """
+    Check urls which were created in bulk instead of by the listeners of the link checker.
+    Internal urls are checked immediately, because this only requires database queries (see
+    :func:`~integreat_cms.cms.utils.internal_link_checker.check_internal`). All other urls are checked in a background
+    job after the current transaction was committed.
+
+    :param url_ids: The ids of the new urls
+    """
+    external_url_ids = []
+    for url in Url.objects.filter(id__in=url_ids):
+        if url.type == "internal":
+            url.check_url()
+        else:
+            external_url_ids.append(url.id)
+    if external_url_ids:
+        transaction.on_commit(
+            partial(enqueue_job, check_urls, url_ids=external_url_ids)
+        )
+
+
+@background_task
+def check_urls(context: JobContext, url_ids: list[int]) -> None:
+    """
+    Check the given urls (see :meth:`~linkcheck.models.Url.check_url`).
+    This is run as a background job.
+
+    :param context: The context of the background job
+    :param url_ids: The ids of the urls which should be checked
+    """
+    urls = list(Url.objects.filter(id__in=url_ids))
+    for done, url in enumerate(urls):
+        context.set_progress(done, len(urls))
+        url.check_url()
+
+
 def fix_domain_encoding(url: re.Match[str]) -> str:
     """
     Fix the encoding of punycode domains
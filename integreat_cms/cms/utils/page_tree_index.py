@@ -0,0 +1,281 @@
+"""
+This module contains a compact index of the page tree of a region.
+
+The index stores the structure of all pages of a region (ids, parents, nested set values, depth and archived flags)
+in flat arrays in depth-first order, so structural questions like "which pages are descendants of this page" or
+"is this page implicitly archived" can be answered without loading any page objects and without walking the tree.
+The index is stored in the cache together with the version of the page tree of the region, which is bumped whenever a
+page is created, deleted, moved or archived (see :mod:`~integreat_cms.core.signals.page_tree_index_signals`). This way,
+a cached index can be validated without any database query.
+The index is only cached if :attr:`~integreat_cms.core.settings.PAGE_TREE_INDEX_CACHE_ENABLED` is set, because a
+process-local cache would hold a copy of the indices of all regions in each process. Otherwise, it is built from the
+database whenever it is requested.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from array import array
+from functools import partial
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+if TYPE_CHECKING:
+    from typing import Final
+
+logger = logging.getLogger(__name__)
+
+#: The prefix of all cache keys of this module
+PAGE_TREE_INDEX_PREFIX: Final[str] = "page_tree_index"
+
+#: The timeout in seconds of cached page tree indices
+PAGE_TREE_INDEX_TIMEOUT: Final[int] = 24 * 60 * 60
+
+
+class PageTreeIndex:
+    """
+    A compact, immutable index of the page tree of a region.
+    All arrays are ordered by ``tree_id`` and ``lft``, which means the descendants of a page directly follow the page
+    itself.
+    """
+
+    def __init__(
+        self, rows: list[tuple[int, int | None, int, int, int, int, bool]]
+    ) -> None:
+        """
+        Build the index
+
+        :param rows: Tuples of ``id``, ``parent_id``, ``tree_id``, ``lft``, ``rgt``, ``depth`` and
+                     ``explicitly_archived`` of all pages of a region, ordered by ``tree_id`` and ``lft``
+        """
+        #: The ids of the pages
+        self.ids = array("q")
+        #: The positions of the parent pages (or -1 for root pages)
+        self.parents = array("q")
+        #: The tree ids of the pages
+        self.tree_ids = array("q")
+        #: The left nested set values of the pages
+        self.lft = array("q")
+        #: The right nested set values of the pages
+        self.rgt = array("q")
+        #: The depths of the pages
+        self.depth = array("q")
+        #: Whether the pages are archived explicitly or implicitly via one of their ancestors
+        self.archived = bytearray()
+        #: The positions of the pages in the arrays
+        self.positions: dict[int, int] = {}
+        for position, (
+            page_id,
+            parent_id,
+            tree_id,
+            lft,
+            rgt,
+            depth,
+            explicitly_archived,
+        ) in enumerate(rows):
+            parent = self.positions.get(parent_id, -1) if parent_id else -1
+            self.ids.append(page_id)
+            self.parents.append(parent)
+            self.tree_ids.append(tree_id)
+            self.lft.append(lft)
+            self.rgt.append(rgt)
+            self.depth.append(depth)
+            # Parents precede their children, so the archived flag of the parent is already known
+            self.archived.append(
+                explicitly_archived or (parent >= 0 and self.archived[parent] == 1)
+            )
+            self.positions[page_id] = position
+
+    def __contains__(self, page_id: int) -> bool:
+        """
+        Check whether a page is contained in the index
+
+        :param page_id: The id of the page
+        :return: Whether the page is contained in the index
+        """
+        return page_id in self.positions
+
+    def __len__(self) -> int:
+        """
+        Get the number of pages in the index
+
+        :return: The number of pages
+        """
+        return len(self.ids)
+
+    def matches(self, page_id: int, tree_id: int, lft: int, rgt: int) -> bool:
+        """
+        Check whether the index contains the given page at the given position
+
+        :param page_id: The id of the page
+        :param tree_id: The tree id of the page
+        :param lft: The left nested set value of the page
+        :param rgt: The right nested set value of the page
+        :return: Whether the position of the page in the index is up to date
+        """
+        position = self.positions.get(page_id)
+        return (
+            position is not None
+            and self.tree_ids[position] == tree_id
+            and self.lft[position] == lft
+            and self.rgt[position] == rgt
+        )
+
+    def get_parent_id(self, page_id: int) -> int | None:
+        """
+        Get the id of the parent page
+
+        :param page_id: The id of the page
+        :return: The id of the parent page (or ``None`` for root pages)
+        """
+        parent = self.parents[self.positions[page_id]]
+        return self.ids[parent] if parent >= 0 else None
+
+    def get_ancestor_ids(self, page_id: int) -> list[int]:
+        """
+        Get the ids of the ancestors of a page, starting with the root page
+
+        :param page_id: The id of the page
+        :return: The ids of the ancestors
+        """
+        ancestor_ids = []
+        parent = self.parents[self.positions[page_id]]
+        while parent >= 0:
+            ancestor_ids.append(self.ids[parent])
+            parent = self.parents[parent]
+        ancestor_ids.reverse()
+        return ancestor_ids
+
+    def get_descendant_ids(self, page_id: int) -> array:
+        """
+        Get the ids of the descendants of a page in depth-first order
+
+        :param page_id: The id of the page
+        :return: The ids of the descendants
+        """
+        position = self.positions[page_id]
+        num_descendants = (self.rgt[position] - self.lft[position] - 1) // 2
+        return self.ids[position + 1 : position + 1 + num_descendants]
+
+    def get_children_ids(self, page_id: int) -> list[int]:
+        """
+        Get the ids of the children of a page
+
+        :param page_id: The id of the page
+        :return: The ids of the children
+        """
+        position = self.positions[page_id]
+        return [
+            descendant_id
+            for descendant_id in self.get_descendant_ids(page_id)
+            if self.parents[self.positions[descendant_id]] == position
+        ]
+
+    def is_archived(self, page_id: int) -> bool:
+        """
+        Check whether a page is archived explicitly or implicitly
+
+        :param page_id: The id of the page
+        :return: Whether the page is archived
+        """
+        return self.archived[self.positions[page_id]] == 1
+
+    def is_implicitly_archived(self, page_id: int) -> bool:
+        """
+        Check whether one of the ancestors of a page is archived
+
+        :param page_id: The id of the page
+        :return: Whether the page is implicitly archived
+        """
+        parent = self.parents[self.positions[page_id]]
+        return parent >= 0 and self.archived[parent] == 1
+
+
+def get_page_tree_index_version_key(region_id: int) -> str:
+    """
+    Get the cache key of the page tree version of a region
+
+    :param region_id: The id of the region
+    :return: The cache key
+    """
+    return f"{PAGE_TREE_INDEX_PREFIX}_{region_id}_version"
+
+
+def invalidate_page_tree_index(region_id: int) -> None:
+    """
+    Invalidate the cached page tree index of a region by bumping its version.
+    If this is called inside a transaction, the version is bumped again after the commit, because a concurrent request
+    could otherwise cache an index of the page tree from before the commit under the new version.
+
+    :param region_id: The id of the region
+    """
+    logger.debug("Invalidating page tree index of region with id %r", region_id)
+    bump_page_tree_version(region_id)
+    if connection.in_atomic_block:
+        transaction.on_commit(partial(bump_page_tree_version, region_id))
+
+
+def bump_page_tree_version(region_id: int) -> None:
+    """
+    Set the page tree version of a region to the current time
+
+    :param region_id: The id of the region
+    """
+    cache.set(get_page_tree_index_version_key(region_id), time.time_ns(), timeout=None)
+
+
+def get_page_tree_index(region_id: int, refresh: bool = False) -> PageTreeIndex:
+    """
+    Get the page tree index of a region from the cache or build it if the page tree changed or the cache is disabled.
+
+    :param region_id: The id of the region
+    :param refresh: Whether the index should be rebuilt even if it is cached
+    :return: The page tree index
+    """
+    if not settings.PAGE_TREE_INDEX_CACHE_ENABLED:
+        return build_page_tree_index(region_id)
+    version_key = get_page_tree_index_version_key(region_id)
+    cache_key = f"{PAGE_TREE_INDEX_PREFIX}_{region_id}"
+    cached = cache.get_many([version_key, cache_key])
+    if (version := cached.get(version_key)) is None:
+        # Initialize the version atomically, in case another process does the same concurrently
+        cache.add(version_key, time.time_ns(), timeout=None)
+        version = cache.get(version_key)
+    elif not refresh and cache_key in cached and cached[cache_key][0] == version:
+        return cached[cache_key][1]
+    index = build_page_tree_index(region_id)
+    if version is not None:
+        cache.set(cache_key, (version, index), timeout=PAGE_TREE_INDEX_TIMEOUT)
+    return index
+
+
+def build_page_tree_index(region_id: int) -> PageTreeIndex:
+    """
+    Build the page tree index of a region from the database
+
+    :param region_id: The id of the region
+    :return: The page tree index
+    """
+    logger.debug("Building page tree index of region with id %r", region_id)
+    # Get model instead of importing it to avoid circular imports
+    Page = apps.get_model(app_label="cms", model_name="Page")
+    return PageTreeIndex(
+        list(
+            Page.objects.filter(region_id=region_id)
+            .order_by("tree_id", "lft")
+            .values_list(
+                "id",
+                "parent_id",
+                "tree_id",
+                "lft",
+                "rgt",
+                "depth",
+                "explicitly_archived",
+            )
+        )
+    )
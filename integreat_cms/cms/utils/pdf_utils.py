@@ -2,13 +2,21 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import multiprocessing
 import os
+import signal
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from typing import TYPE_CHECKING
 from urllib.parse import unquote, urlparse
 
+import django
 from django.conf import settings
 from django.contrib.staticfiles import finders
-from django.core.files.base import ContentFile
+from django.core.cache import cache
 from django.core.files.storage import FileSystemStorage
 from django.db.models import Min
 from django.http import HttpResponse
@@ -23,6 +31,9 @@ from ..models import Language, Page
 from .text_utils import truncate_bytewise
 
 if TYPE_CHECKING:
+    from types import FrameType
+    from typing import Final
+
     from django.http.response import HttpResponseRedirect
 
     from ..models import Region
@@ -32,16 +43,43 @@ logger = logging.getLogger(__name__)
 
 pdf_storage = FileSystemStorage(location=settings.PDF_ROOT, base_url=settings.PDF_URL)
 
+#: The maximum time in seconds a PDF rendering blocks other requests from rendering the same PDF
+PDF_RENDERING_LOCK_TIMEOUT: Final[int] = 10 * 60
+
+#: The interval in seconds in which requests check whether a PDF rendered by another process is finished
+PDF_RENDERING_POLL_INTERVAL: Final[float] = 0.5
+
+#: The time in seconds after which clients should retry requests for PDFs which are still rendered
+PDF_RENDERING_RETRY_AFTER: Final[int] = 5
+
+#: The prefix of the cache keys of the global PDF rendering slots (see :func:`acquire_pdf_rendering_slot`)
+PDF_RENDERING_SLOT_PREFIX: Final[str] = "pdf_rendering_slot"
+
+#: The pool of processes which render the PDF documents (see :func:`get_pdf_rendering_pool`)
+pdf_rendering_pool: ProcessPoolExecutor | None = None
+#: The id of the process which created the PDF rendering pool
+pdf_rendering_pool_pid: int | None = None
+#: The PDFs which are currently rendered by this process by their hash
+pending_pdfs: dict[str, Future] = {}
+#: The lock which protects the pending PDFs and the PDF rendering pool
+pending_pdfs_lock = threading.RLock()
+
 
 # pylint: disable=too-many-locals
 def generate_pdf(
     region: Region, language_slug: str, pages: PageQuerySet
-) -> HttpResponseRedirect:
+) -> HttpResponse | HttpResponseRedirect:
     """
     Function for handling a pdf export request for pages.
     The pages were either selected by cms user or by API request (see :func:`~integreat_cms.api.v3.pdf_export`)
     For more information on xhtml2pdf, see :doc:`xhtml2pdf:index`
 
+    The PDF is rendered in one of the global rendering slots (see :func:`acquire_pdf_rendering_slot`), optionally in a
+    background process (see :func:`get_pdf_rendering_pool`), and concurrent requests for the same PDF wait for the
+    same rendering. If no slot is free or the PDF is not finished within
+    :attr:`~integreat_cms.core.settings.PDF_RENDERING_WAIT_TIMEOUT` seconds, the request is answered with HTTP status
+    202 and a ``Retry-After`` header, so the client can request the PDF again later.
+
     :param region: region which requested the pdf document
     :param language_slug: bcp47 slug of the current language
     :param pages: at least on page to render as PDF document
@@ -68,6 +106,13 @@ def generate_pdf(
         return HttpResponse(
             _("No valid pages selected for PDF generation."), status=400
         )
+    if settings.PDF_MAX_PAGES and amount_pages > settings.PDF_MAX_PAGES:
+        return HttpResponse(
+            _(
+                "Too many pages selected for PDF generation (at most {} pages are allowed)."
+            ).format(settings.PDF_MAX_PAGES),
+            status=400,
+        )
     if amount_pages == 1:
         # If pdf contains only one page, take its title as filename
         title = pages.first().get_public_translation(language_slug).title
@@ -93,28 +138,126 @@ def generate_pdf(
     name = f"{settings.BRANDING_TITLE} - {language.translated_name} - {title}"
     filename = f"{pdf_hash}/{truncate_bytewise(name, max_len)}{ext}"
     # Only generate new pdf if not already exists
+    if pdf_storage.exists(filename):
+        return redirect(pdf_storage.url(filename))
+    # Make sure the same PDF is only rendered once at a time, even if it is requested concurrently
+    with pending_pdfs_lock:
+        future = pending_pdfs.get(pdf_hash)
+        is_renderer = False
+        if future is None and cache.add(
+            f"pdf_rendering_{pdf_hash}", True, timeout=PDF_RENDERING_LOCK_TIMEOUT
+        ):
+            if (slot := acquire_pdf_rendering_slot()) is None:
+                # Too many PDFs are rendered at the moment, so the client has to request it again later
+                cache.delete(f"pdf_rendering_{pdf_hash}")
+                return get_pdf_pending_response()
+            future = pending_pdfs[pdf_hash] = Future()
+            future.add_done_callback(
+                lambda finished_future: release_pending_pdf(
+                    pdf_hash, slot, finished_future
+                )
+            )
+            is_renderer = True
+    if is_renderer:
+        try:
+            # Convert queryset to annotated list which can be rendered better
+            annotated_pages = Page.get_annotated_list_qs(pages)
+            context = {
+                "right_to_left": language.text_direction
+                == text_directions.RIGHT_TO_LEFT,
+                "region": region,
+                "annotated_pages": annotated_pages,
+                "language": language,
+                "amount_pages": amount_pages,
+                "prevent_italics": ["ar", "fa"],
+                "BRANDING": settings.BRANDING,
+                "BRANDING_TITLE": settings.BRANDING_TITLE,
+            }
+            html = get_template("pages/page_pdf.html").render(context)
+            submit_pdf_rendering(html, pdf_storage.path(filename), future)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+    if not wait_for_pdf(filename, future):
+        # The PDF is still rendered, so the client has to request it again later
+        return get_pdf_pending_response()
     if not pdf_storage.exists(filename):
-        # Convert queryset to annotated list which can be rendered better
-        annotated_pages = Page.get_annotated_list_qs(pages)
-        context = {
-            "right_to_left": language.text_direction == text_directions.RIGHT_TO_LEFT,
-            "region": region,
-            "annotated_pages": annotated_pages,
-            "language": language,
-            "amount_pages": amount_pages,
-            "prevent_italics": ["ar", "fa"],
-            "BRANDING": settings.BRANDING,
-            "BRANDING_TITLE": settings.BRANDING_TITLE,
-        }
-        html = get_template("pages/page_pdf.html").render(context)
-        # Save empty file
-        pdf_storage.save(filename, ContentFile(""))
-
-        # Get fixed version of default pdf styling (see https://github.com/digitalfabrik/integreat-cms/issues/1537)
-        fixed_css = DEFAULT_CSS.replace("background-color: transparent;", "", 1)
-
-        # Write PDF content into file
-        with pdf_storage.open(filename, "w+b") as pdf_file:
+        logger.error(
+            "The following PDF could not be rendered: %r, %r, %r",
+            region,
+            language,
+            pages,
+        )
+        return HttpResponse(
+            _("The PDF could not be successfully generated."), status=500
+        )
+    return redirect(pdf_storage.url(filename))
+
+
+def get_pdf_pending_response() -> HttpResponse:
+    """
+    Get the response for requests of PDFs which are not rendered yet
+
+    :return: A response with HTTP status 202 and a ``Retry-After`` header
+    """
+    response = HttpResponse(
+        _("The PDF is being generated. Please try again in a few seconds."),
+        status=202,
+    )
+    response["Retry-After"] = PDF_RENDERING_RETRY_AFTER
+    return response
+
+
+def acquire_pdf_rendering_slot() -> int | None:
+    """
+    Acquire one of the :attr:`~integreat_cms.core.settings.PDF_RENDERING_SLOTS` global rendering slots, which limit the
+    number of PDFs rendered at the same time independently of the number of web workers and rendering processes.
+    The slots are stored in the cache and expire after :attr:`PDF_RENDERING_LOCK_TIMEOUT` seconds, so slots of
+    crashed processes are released eventually.
+
+    :return: The number of the acquired slot (or ``None`` if all slots are taken)
+    """
+    for slot in range(settings.PDF_RENDERING_SLOTS):
+        if cache.add(
+            f"{PDF_RENDERING_SLOT_PREFIX}_{slot}",
+            True,
+            timeout=PDF_RENDERING_LOCK_TIMEOUT,
+        ):
+            return slot
+    return None
+
+
+def render_pdf(html: str, path: str) -> bool:
+    """
+    Render the given html into a PDF file.
+    This is executed in the processes of the PDF rendering pool (see :func:`get_pdf_rendering_pool`).
+    The document is written into a temporary file which is moved to the final path when it is complete, so an
+    incomplete document is never served.
+    In the processes of the rendering pool, the rendering is aborted after
+    :attr:`~integreat_cms.core.settings.PDF_RENDERING_TIME_BUDGET` seconds.
+
+    :param html: The html which should be rendered
+    :param path: The absolute path of the PDF file
+    :return: Whether the PDF was rendered successfully
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # Get fixed version of default pdf styling (see https://github.com/digitalfabrik/integreat-cms/issues/1537)
+    fixed_css = DEFAULT_CSS.replace("background-color: transparent;", "", 1)
+    # Alarms can only be used in the main thread of the processes of the rendering pool
+    use_alarm = bool(settings.PDF_RENDERING_TIME_BUDGET) and (
+        multiprocessing.parent_process() is not None
+        and threading.current_thread() is threading.main_thread()
+    )
+    start = time.monotonic()
+    # Write PDF content into temporary file
+    with tempfile.NamedTemporaryFile(
+        dir=directory, suffix=".tmp", delete=False
+    ) as pdf_file:
+        try:
+            if use_alarm:
+                signal.signal(signal.SIGALRM, abort_pdf_rendering)
+                signal.alarm(settings.PDF_RENDERING_TIME_BUDGET)
             pisa_status = pisa.CreatePDF(
                 html,
                 dest=pdf_file,
@@ -122,18 +265,153 @@ def generate_pdf(
                 encoding="UTF-8",
                 default_css=fixed_css,
             )
-        # pylint: disable=no-member
-        if pisa_status.err:
+            failed = pisa_status.err
+        except TimeoutError:
             logger.error(
-                "The following PDF could not be rendered: %r, %r, %r",
-                region,
-                language,
-                pages,
+                "Rendering of PDF %r exceeded the time budget of %d seconds",
+                path,
+                settings.PDF_RENDERING_TIME_BUDGET,
             )
-            return HttpResponse(
-                _("The PDF could not be successfully generated."), status=500
+            failed = True
+        finally:
+            if use_alarm:
+                signal.alarm(0)
+    # pylint: disable=no-member
+    if failed:
+        os.remove(pdf_file.name)
+        return False
+    logger.debug(
+        "Rendered PDF %r with %d bytes in %.2f seconds",
+        path,
+        os.path.getsize(pdf_file.name),
+        time.monotonic() - start,
+    )
+    os.chmod(pdf_file.name, 0o644)
+    os.replace(pdf_file.name, path)
+    return True
+
+
+# pylint: disable=unused-argument
+def abort_pdf_rendering(signum: int, frame: FrameType | None) -> None:
+    """
+    Abort the current PDF rendering because it exceeded its time budget
+
+    :param signum: The number of the received signal
+    :param frame: The current stack frame
+    :raises TimeoutError: To abort the rendering
+    """
+    raise TimeoutError("The PDF rendering exceeded its time budget")
+
+
+def get_pdf_rendering_pool() -> ProcessPoolExecutor:
+    """
+    Get the pool of processes which render the PDF documents of this process.
+    The worker processes are spawned instead of forked to not inherit the state of the web worker, so Django has to
+    be set up in each of them. They are started with the interpreter
+    :attr:`~integreat_cms.core.settings.PDF_RENDERING_PYTHON`, because :attr:`sys.executable` is not a Python
+    interpreter if the CMS is embedded into another executable (e.g. under mod_wsgi).
+    The number of PDFs rendered at the same time is limited globally by :func:`acquire_pdf_rendering_slot`.
+
+    :return: The process pool
+    """
+    # pylint: disable=global-statement
+    global pdf_rendering_pool, pdf_rendering_pool_pid
+    with pending_pdfs_lock:
+        if pdf_rendering_pool is None or pdf_rendering_pool_pid != os.getpid():
+            mp_context = multiprocessing.get_context("spawn")
+            mp_context.set_executable(settings.PDF_RENDERING_PYTHON)
+            pdf_rendering_pool = ProcessPoolExecutor(
+                max_workers=settings.PDF_RENDERING_WORKERS,
+                mp_context=mp_context,
+                initializer=django.setup,
             )
-    return redirect(pdf_storage.url(filename))
+            pdf_rendering_pool_pid = os.getpid()
+        return pdf_rendering_pool
+
+
+def submit_pdf_rendering(html: str, path: str, future: Future) -> None:
+    """
+    Render the given html into a PDF file in the background and pass the result to the given future.
+    If :attr:`~integreat_cms.core.settings.PDF_RENDERING_WORKERS` is ``0``, the PDF is rendered synchronously.
+
+    :param html: The html which should be rendered
+    :param path: The absolute path of the PDF file
+    :param future: The future which receives the result of the rendering
+    """
+    if not settings.PDF_RENDERING_WORKERS:
+        future.set_result(render_pdf(html, path))
+        return
+
+    def transfer_result(rendering: Future) -> None:
+        """
+        Pass the result of the rendering to the future of the pending PDF
+
+        :param rendering: The finished rendering
+        """
+        if exception := rendering.exception():
+            if isinstance(exception, BrokenProcessPool):
+                # The pool is unusable after one of its processes died, so a new one is created on the next request
+                reset_pdf_rendering_pool()
+            future.set_exception(exception)
+        else:
+            future.set_result(rendering.result())
+
+    try:
+        rendering = get_pdf_rendering_pool().submit(render_pdf, html, path)
+    except BrokenProcessPool:
+        reset_pdf_rendering_pool()
+        rendering = get_pdf_rendering_pool().submit(render_pdf, html, path)
+    rendering.add_done_callback(transfer_result)
+
+
+def reset_pdf_rendering_pool() -> None:
+    """
+    Discard the current PDF rendering pool
+    """
+    # pylint: disable=global-statement
+    global pdf_rendering_pool
+    with pending_pdfs_lock:
+        if pdf_rendering_pool is not None:
+            pdf_rendering_pool.shutdown(wait=False)
+        pdf_rendering_pool = None
+
+
+def release_pending_pdf(pdf_hash: str, slot: int, future: Future) -> None:
+    """
+    Remove a finished PDF from the pending PDFs, so it can be rendered again if it was not rendered successfully, and
+    release its rendering slot
+
+    :param pdf_hash: The hash of the PDF
+    :param slot: The rendering slot of the PDF (see :func:`acquire_pdf_rendering_slot`)
+    :param future: The finished future
+    """
+    if exception := future.exception():
+        logger.error("Rendering of the PDF %r failed: %r", pdf_hash, exception)
+    with pending_pdfs_lock:
+        if pending_pdfs.get(pdf_hash) is future:
+            del pending_pdfs[pdf_hash]
+    cache.delete(f"pdf_rendering_{pdf_hash}")
+    cache.delete(f"{PDF_RENDERING_SLOT_PREFIX}_{slot}")
+
+
+def wait_for_pdf(filename: str, future: Future | None) -> bool:
+    """
+    Wait until a PDF is rendered, but at most :attr:`~integreat_cms.core.settings.PDF_RENDERING_WAIT_TIMEOUT` seconds.
+    If the PDF is rendered by another process, the file system is polled.
+
+    :param filename: The filename of the PDF in the PDF storage
+    :param future: The future of the rendering if the PDF is rendered by this process
+    :return: Whether the rendering is finished
+    """
+    if future is not None:
+        done, _ = wait([future], timeout=settings.PDF_RENDERING_WAIT_TIMEOUT)
+        return bool(done)
+    deadline = time.monotonic() + settings.PDF_RENDERING_WAIT_TIMEOUT
+    while not pdf_storage.exists(filename):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(PDF_RENDERING_POLL_INTERVAL)
+    return True
 
 
 # pylint: disable=unused-argument
@@ -0,0 +1,113 @@
+"""
+This module contains a cache of :class:`~integreat_cms.cms.models.regions.region.Region` objects which are resolved
+from the region slug of each request (see :class:`~integreat_cms.core.middleware.region_middleware.RegionMiddleware`).
+
+The regions are stored with their prebuilt language tree in the shared cache and additionally in a process-local
+cache, so most requests only have to check the current cache version instead of running any database queries.
+Whenever a region, a language tree node or a language changes, the cache version is bumped (see
+:mod:`~integreat_cms.core.signals.region_cache_signals`), which makes all cached regions unreachable.
+The cached regions are stored pickled, so every request gets its own copy which it can modify without side effects.
+"""
+
+from __future__ import annotations
+
+import logging
+import pickle
+import time
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+if TYPE_CHECKING:
+    from typing import Final
+
+    from ..models import Region
+
+logger = logging.getLogger(__name__)
+
+#: The prefix of all cache keys of this module
+REGION_CACHE_PREFIX: Final[str] = "region_cache"
+
+#: The cache key of the current version of all cached regions
+REGION_CACHE_VERSION_KEY: Final[str] = f"{REGION_CACHE_PREFIX}_version"
+
+#: The cached properties of regions which are evaluated before a region is stored in the cache
+REGION_CACHE_PREBUILT_PROPERTIES: Final[list[str]] = [
+    "language_tree",
+    "language_node_by_id",
+    "language_node_by_slug",
+    "languages",
+    "active_languages",
+    "visible_languages",
+    "language_tree_root",
+    "default_language",
+    "prefix",
+    "full_name",
+]
+
+#: The process-local cache which maps region slugs to their cache version and pickled region
+local_region_cache: dict[str, tuple[int, bytes]] = {}
+
+
+def get_region_cache_version() -> int:
+    """
+    Get the current version of the region cache.
+    Like the content versions of the API snapshots, the version is the timestamp in nanoseconds of the last change.
+
+    :return: The current cache version
+    """
+    if (version := cache.get(REGION_CACHE_VERSION_KEY)) is None:
+        # Use add() instead of set() to not overwrite a version which was set concurrently by another process
+        cache.add(REGION_CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(REGION_CACHE_VERSION_KEY) or time.time_ns()
+    return version
+
+
+def invalidate_region_cache() -> None:
+    """
+    Invalidate all cached regions in all processes.
+    If this is called inside a transaction, the cache is invalidated again after the commit, because a concurrent
+    request could otherwise cache a region with the data from before the commit under the new version.
+    """
+    logger.debug("Invalidating region cache")
+    bump_region_cache_version()
+    if connection.in_atomic_block:
+        transaction.on_commit(bump_region_cache_version)
+
+
+def bump_region_cache_version() -> None:
+    """
+    Set the version of the region cache to the current time and clear the process-local cache
+    """
+    cache.set(REGION_CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+    local_region_cache.clear()
+
+
+def get_cached_region(region_slug: str) -> Region:
+    """
+    Get the region with the given slug from the cache or load it from the database if it is not cached yet.
+    The cache is bypassed if :attr:`~integreat_cms.core.settings.REGION_CACHE_ENABLED` is not set.
+
+    :param region_slug: The slug of the region
+    :raises ~integreat_cms.cms.models.regions.region.Region.DoesNotExist: If no region with the given slug exists
+    :return: A copy of the cached region
+    """
+    # Get model instead of importing it to avoid circular imports
+    Region = apps.get_model(app_label="cms", model_name="Region")
+    if not settings.REGION_CACHE_ENABLED:
+        return Region.objects.get(slug=region_slug)
+    version = get_region_cache_version()
+    local_version, pickled_region = local_region_cache.get(region_slug, (None, b""))
+    if local_version != version:
+        cache_key = f"{REGION_CACHE_PREFIX}_{version}_{region_slug}"
+        if (pickled_region := cache.get(cache_key)) is None:
+            region = Region.objects.get(slug=region_slug)
+            for cached_property in REGION_CACHE_PREBUILT_PROPERTIES:
+                getattr(region, cached_property)
+            pickled_region = pickle.dumps(region, pickle.HIGHEST_PROTOCOL)
+            cache.set(cache_key, pickled_region, timeout=settings.REGION_CACHE_TIMEOUT)
+        local_region_cache[region_slug] = (version, pickled_region)
+    return pickle.loads(pickled_region)
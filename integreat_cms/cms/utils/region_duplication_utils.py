@@ -0,0 +1,503 @@
+"""
+This module contains utilities to duplicate the content of one region into another region, e.g. when a new region is
+created from a template region (see :meth:`~integreat_cms.cms.forms.regions.region_form.RegionForm.save`).
+
+The duplication is set-based: All source objects are fetched at once, the nested set values of the target trees are
+computed up front (see :func:`get_nested_set_values`) and the copies are inserted with
+:meth:`~django.db.models.query.QuerySet.bulk_create` (one query per tree level, because the children need the ids
+of their duplicated parents). Since bulk inserts do not send any ``save`` signals, the work of the signal handlers is
+done once for the whole region afterwards: The HIX scores are copied from the identical source content, the link
+objects of the link checker are copied instead of scanning all translations again and the cached statistics and API
+snapshots of the target region are invalidated.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+from cacheops import invalidate_model
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Max
+from linkcheck.models import Link
+
+from ..constants import status
+from .api_snapshot_utils import invalidate_api_snapshots
+from .linkcheck_utils import invalidate_linkcheck_stats
+from .page_tree_index import invalidate_page_tree_index
+from .translation_coverage_utils import invalidate_translation_coverage
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any, TypeVar
+
+    from django.db.models import Model
+    from django.db.models.query import QuerySet
+
+    from ..models import ImprintPage, MediaFile, OfferTemplate, Page, Region
+    from ..models.abstract_tree_node import AbstractTreeNode
+
+    ModelT = TypeVar("ModelT", bound=Model)
+
+logger = logging.getLogger(__name__)
+
+
+def copy_instance(instance: ModelT, **fields: Any) -> ModelT:
+    r"""
+    Create an unsaved copy of a model instance without its primary key
+
+    :param instance: The instance which should be copied
+    :param \**fields: The attribute names of the concrete fields which should be overwritten (e.g. ``region_id``)
+    :return: The unsaved copy
+    """
+    values = {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+        if not field.primary_key
+    }
+    values.update(fields)
+    return type(instance)(**values)
+
+
+def get_nested_set_values(
+    nodes: Iterable[AbstractTreeNode], first_tree_id: int
+) -> dict[int, dict[str, int]]:
+    """
+    Compute the nested set values of copies of the given tree nodes.
+    Each root node starts a new tree with consecutive tree ids, so the copies do not share trees with the originals.
+    Nodes whose parent is not among the given nodes are skipped together with their descendants.
+
+    :param nodes: The source nodes in depth-first order (i.e. ordered by ``tree_id`` and ``lft``)
+    :param first_tree_id: The tree id of the first copied tree
+    :return: A dict which maps the ids of the copied source nodes to their new ``tree_id``, ``lft``, ``rgt`` and
+             ``depth``
+    """
+    values: dict[int, dict[str, int]] = {}
+    # The ids of the nodes whose right value is still open, starting from the root of the current tree
+    ancestors: list[int] = []
+    tree_id = first_tree_id - 1
+    counter = 0
+
+    def close_nodes(parent_id: int | None) -> None:
+        nonlocal counter
+        while ancestors and ancestors[-1] != parent_id:
+            counter += 1
+            values[ancestors.pop()]["rgt"] = counter
+
+    for node in nodes:
+        if node.parent_id is not None and node.parent_id not in values:
+            continue
+        close_nodes(node.parent_id)
+        if not ancestors:
+            tree_id += 1
+            counter = 0
+        counter += 1
+        values[node.id] = {
+            "tree_id": tree_id,
+            "lft": counter,
+            "depth": len(ancestors) + 1,
+        }
+        ancestors.append(node.id)
+    close_nodes(None)
+    return values
+
+
+def duplicate_tree(
+    source_nodes: list[AbstractTreeNode], target_region: Region, **fields: Any
+) -> dict[int, AbstractTreeNode]:
+    r"""
+    Insert copies of the given tree nodes into the target region. The nodes are inserted level by level, because the
+    copies need the ids of their duplicated parents.
+
+    :param source_nodes: The source nodes in depth-first order (see :func:`get_nested_set_values`)
+    :param target_region: The region to which the nodes should be added
+    :param \**fields: Additional field values of all copies
+    :return: A dict which maps the ids of the copied source nodes to their copies
+    """
+    if not source_nodes:
+        return {}
+    model = type(source_nodes[0])
+    last_tree_id = model.objects.aggregate(max_tree_id=Max("tree_id"))["max_tree_id"]
+    nested_set_values = get_nested_set_values(source_nodes, (last_tree_id or 0) + 1)
+    # Group the copied nodes by their depth
+    levels: dict[int, list[AbstractTreeNode]] = {}
+    for source_node in source_nodes:
+        if values := nested_set_values.get(source_node.id):
+            levels.setdefault(values["depth"], []).append(source_node)
+    target_nodes: dict[int, AbstractTreeNode] = {}
+    for depth in sorted(levels):
+        level = levels[depth]
+        copies = model.objects.bulk_create(
+            [
+                copy_instance(
+                    source_node,
+                    region_id=target_region.id,
+                    parent_id=(
+                        target_nodes[source_node.parent_id].id
+                        if source_node.parent_id
+                        else None
+                    ),
+                    **nested_set_values[source_node.id],
+                    **fields,
+                )
+                for source_node in level
+            ]
+        )
+        target_nodes.update(
+            (source_node.id, copy) for source_node, copy in zip(level, copies)
+        )
+    logger.debug(
+        "Created %d %s objects in %d levels",
+        len(target_nodes),
+        model.__name__,
+        len(levels),
+    )
+    return target_nodes
+
+
+def duplicate_language_tree(source_region: Region, target_region: Region) -> None:
+    """
+    Duplicate the language tree of one region to another
+
+    :param source_region: The region from which the language tree should be duplicated
+    :param target_region: The region to which the language tree should be added
+    """
+    LanguageTreeNode = apps.get_model(app_label="cms", model_name="LanguageTreeNode")
+    duplicate_tree(
+        list(
+            LanguageTreeNode.objects.filter(region=source_region).order_by(
+                "tree_id", "lft"
+            )
+        ),
+        target_region,
+    )
+
+
+def duplicate_pages(
+    source_region: Region,
+    target_region: Region,
+    keep_status: bool = False,
+    offers_to_discard: QuerySet[OfferTemplate] | None = None,
+    media_files: dict[int, MediaFile] | None = None,
+) -> dict[int, int]:
+    """
+    Duplicate all non-archived pages and their translations from one region to another.
+    Descendants of archived pages are skipped as well.
+
+    :param source_region: The region from which the pages should be duplicated
+    :param target_region: The region to which the pages should be added
+    :param keep_status: Whether the status of the duplicated translations should be kept (otherwise, they are drafts)
+    :param offers_to_discard: Offers which might be embedded in the source region, but not in the target region
+    :param media_files: A dict which maps the ids of duplicated media files to their copies (used for the page icons)
+    :return: A dict which maps the ids of the source translations to the ids of their copies
+    """
+    Page = apps.get_model(app_label="cms", model_name="Page")
+    PageTranslation = apps.get_model(app_label="cms", model_name="PageTranslation")
+    source_pages = list(
+        Page.objects.filter(region=source_region, explicitly_archived=False).order_by(
+            "tree_id", "lft"
+        )
+    )
+    # Only the push API token is not duplicated
+    target_pages = duplicate_tree(source_pages, target_region, api_token="")
+    media_files = media_files or {}
+    icon_pages = [page for page in target_pages.values() if page.icon_id in media_files]
+    for page in icon_pages:
+        page.icon_id = media_files[page.icon_id].id
+    Page.objects.bulk_update(icon_pages, ["icon"])
+
+    # Set embedded offers ManyToMany field
+    EmbeddedOffer = Page.embedded_offers.through
+    embedded_offers = EmbeddedOffer.objects.filter(page_id__in=target_pages)
+    if offers_to_discard:
+        embedded_offers = embedded_offers.exclude(
+            offertemplate_id__in=offers_to_discard.values_list("id", flat=True)
+        )
+    EmbeddedOffer.objects.bulk_create(
+        [
+            EmbeddedOffer(
+                page_id=target_pages[embedded_offer.page_id].id,
+                offertemplate_id=embedded_offer.offertemplate_id,
+            )
+            for embedded_offer in embedded_offers
+        ]
+    )
+
+    return duplicate_translations(
+        PageTranslation.objects.filter(page_id__in=target_pages),
+        target_pages,
+        target_region,
+        keep_status,
+    )
+
+
+def duplicate_imprint(source_region: Region, target_region: Region) -> ImprintPage:
+    """
+    Duplicate the imprint and its translations from one region to another.
+    The duplicated translations are always drafts.
+
+    :param source_region: the source region from which the imprint should be duplicated
+    :param target_region: the target region
+    :return: The duplicated imprint
+    """
+    source_imprint = source_region.imprint
+    target_imprint = copy_instance(source_imprint, region_id=target_region.id)
+    target_imprint.save()
+    duplicate_translations(
+        source_imprint.translations.all(),
+        {source_imprint.id: target_imprint},
+        target_region,
+        keep_status=False,
+    )
+    return target_imprint
+
+
+def duplicate_translations(
+    source_translations: QuerySet,
+    target_pages: dict[int, Page | ImprintPage],
+    target_region: Region,
+    keep_status: bool,
+) -> dict[int, int]:
+    """
+    Duplicate the given translations of (imprint) pages to their duplicated pages.
+    This replaces the ``save`` signals of the translations: The HIX scores are copied from the source translations,
+    because the content is identical, and the latest version markers are updated once afterwards.
+
+    :param source_translations: The source translations
+    :param target_pages: A dict which maps the ids of the source pages to their copies
+    :param target_region: The region to which the translations should be added
+    :param keep_status: Whether the status of the duplicated translations should be kept (otherwise, they are drafts)
+    :return: A dict which maps the ids of the source translations to the ids of their copies
+    """
+    source_translations = list(source_translations)
+    if not source_translations:
+        return {}
+    model = type(source_translations[0])
+    fields: dict[str, Any] = {} if keep_status else {"status": status.DRAFT}
+    # The HIX scores are only stored for page translations
+    if not target_region.hix_enabled and model._meta.model_name == "pagetranslation":
+        fields.update(hix_score=None, hix_feedback=None)
+    copies = model.objects.bulk_create(
+        [
+            copy_instance(
+                translation, page_id=target_pages[translation.page_id].id, **fields
+            )
+            for translation in source_translations
+        ]
+    )
+    # The status of the copies might differ from the source, so the markers have to be recalculated
+    model.update_latest_versions(page__region=target_region)
+    logger.debug("Created %d %s objects", len(copies), model.__name__)
+    return {
+        translation.id: copy.id
+        for translation, copy in zip(source_translations, copies)
+    }
+
+
+def duplicate_links(translations: dict[int, int]) -> None:
+    """
+    Duplicate the link checker's link objects of page translations.
+    This replaces the scan of all duplicated translations, because their content is identical to the source content.
+    Links which were ignored in the source region are not ignored in the target region.
+
+    :param translations: A dict which maps the ids of the source page translations to the ids of their copies
+    """
+    content_type = ContentType.objects.get_for_model(
+        apps.get_model(app_label="cms", model_name="PageTranslation")
+    )
+    links = Link.objects.bulk_create(
+        [
+            Link(
+                content_type=content_type,
+                object_id=translations[link.object_id],
+                field=link.field,
+                url_id=link.url_id,
+                text=link.text,
+            )
+            for link in Link.objects.filter(
+                content_type=content_type, object_id__in=translations
+            )
+        ]
+    )
+    logger.debug("Created %d link objects", len(links))
+
+
+def get_duplicate_file_name(
+    name: str, source_region: Region, target_region: Region
+) -> str:
+    """
+    Get an available storage name for the copy of a media file of another region.
+    The name only differs from the original name in the region subdirectory (see
+    :func:`~integreat_cms.cms.models.media.media_file.upload_path`).
+
+    :param name: The storage name of the source file
+    :param source_region: The region of the source file
+    :param target_region: The region of the copy
+    :return: The storage name of the copy
+    """
+    source_prefix = f"regions/{source_region.id}/"
+    target_prefix = f"regions/{target_region.id}/"
+    if name.startswith(source_prefix):
+        name = target_prefix + name.removeprefix(source_prefix)
+    else:
+        name = target_prefix + os.path.basename(name)
+    return default_storage.get_available_name(name, max_length=512)
+
+
+def link_file(source_path: str, target_path: str) -> None:
+    """
+    Create a hard link to a physical file. If this is not possible (e.g. because the target is on a different file
+    system), the file is copied instead.
+    Hard links are safe for media files, because they are never modified in place: Replacing a media file removes the
+    old path and stores the new file under a new path.
+
+    :param source_path: The path of the source file
+    :param target_path: The path of the new file
+    """
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    try:
+        os.link(source_path, target_path)
+    except OSError:
+        shutil.copyfile(source_path, target_path)
+
+
+def duplicate_media(
+    source_region: Region, target_region: Region
+) -> dict[int, MediaFile]:
+    """
+    Duplicate all media directories and files of one region to another.
+    The physical files are hard-linked (see :func:`link_file`), so duplicating a region does not use additional disk
+    space for its media library.
+
+    :param source_region: the source region from which the media should be duplicated
+    :param target_region: the target region
+    :return: A dict which maps the ids of the source media files to their copies
+    """
+    Directory = apps.get_model(app_label="cms", model_name="Directory")
+    MediaFile = apps.get_model(app_label="cms", model_name="MediaFile")
+
+    # Directories only have a parent field, so they are inserted level by level starting at the root level
+    source_directories = list(Directory.objects.filter(region=source_region))
+    target_directories: dict[int, Any] = {}
+    level = [directory for directory in source_directories if not directory.parent_id]
+    while level:
+        copies = Directory.objects.bulk_create(
+            [
+                copy_instance(
+                    directory,
+                    region_id=target_region.id,
+                    parent_id=(
+                        target_directories[directory.parent_id].id
+                        if directory.parent_id
+                        else None
+                    ),
+                )
+                for directory in level
+            ]
+        )
+        target_directories.update(
+            (directory.id, copy) for directory, copy in zip(level, copies)
+        )
+        level = [
+            directory
+            for directory in source_directories
+            if directory.parent_id in target_directories
+            and directory.id not in target_directories
+        ]
+
+    target_files = []
+    source_files = list(MediaFile.objects.filter(region=source_region))
+    for source_file in source_files:
+        fields: dict[str, Any] = {
+            "region_id": target_region.id,
+            "parent_directory_id": (
+                target_directories[source_file.parent_directory_id].id
+                if source_file.parent_directory_id
+                else None
+            ),
+        }
+        for field_name in ["file", "thumbnail"]:
+            source_field = getattr(source_file, field_name)
+            if not source_field:
+                continue
+            name = get_duplicate_file_name(
+                source_field.name, source_region, target_region
+            )
+            try:
+                link_file(source_field.path, default_storage.path(name))
+            except FileNotFoundError:
+                logger.warning(
+                    "The %s of %r does not exist and could not be duplicated",
+                    field_name,
+                    source_file,
+                )
+            fields[field_name] = name
+        target_files.append(copy_instance(source_file, **fields))
+    target_files = MediaFile.objects.bulk_create(target_files)
+    logger.debug(
+        "Created %d directories and %d media files",
+        len(target_directories),
+        len(target_files),
+    )
+    return {
+        source_file.id: target_file
+        for source_file, target_file in zip(source_files, target_files)
+    }
+
+
+def duplicate_region_content(
+    source_region: Region,
+    target_region: Region,
+    keep_status: bool = False,
+    offers_to_discard: QuerySet[OfferTemplate] | None = None,
+) -> None:
+    """
+    Duplicate the language tree, the media library, the non-archived pages and the imprint of one region to another
+    in a single transaction and invalidate the cached data of the target region afterwards.
+
+    :param source_region: The region from which the content should be duplicated
+    :param target_region: The region to which the content should be added
+    :param keep_status: Whether the status of the duplicated page translations should be kept
+    :param offers_to_discard: Offers which might be embedded in the source region, but not in the target region
+    """
+    with transaction.atomic():
+        logger.info(
+            "Duplicating language tree of %r to %r", source_region, target_region
+        )
+        duplicate_language_tree(source_region, target_region)
+        logger.info("Duplicating media of %r to %r", source_region, target_region)
+        media_files = duplicate_media(source_region, target_region)
+        logger.info("Duplicating page tree of %r to %r", source_region, target_region)
+        translations = duplicate_pages(
+            source_region,
+            target_region,
+            keep_status=keep_status,
+            offers_to_discard=offers_to_discard,
+            media_files=media_files,
+        )
+        duplicate_links(translations)
+        if source_region.imprint:
+            logger.info("Duplicating imprint of %r to %r", source_region, target_region)
+            duplicate_imprint(source_region, target_region)
+
+    # Bulk inserts neither send signals nor invalidate the query cache
+    for model_name in [
+        "LanguageTreeNode",
+        "Directory",
+        "MediaFile",
+        "Page",
+        "PageTranslation",
+        "ImprintPage",
+        "ImprintPageTranslation",
+    ]:
+        invalidate_model(apps.get_model(app_label="cms", model_name=model_name))
+    invalidate_model(Link)
+    invalidate_translation_coverage(target_region.id)
+    invalidate_linkcheck_stats([target_region.id])
+    invalidate_page_tree_index(target_region.id)
+    invalidate_api_snapshots(target_region.id)
@@ -0,0 +1,249 @@
+"""
+This module contains utilities to maintain the translation coverage statistics of regions
+(see :class:`~integreat_cms.cms.models.pages.translation_coverage.TranslationCoverage`).
+
+Instead of calculating the translation state of every page in every language whenever the statistics are requested,
+the contribution of each page is stored in :class:`~integreat_cms.cms.models.pages.page_translation_coverage.PageTranslationCoverage`.
+Whenever a page or one of its translations changes, only the contribution of this page is recalculated and the
+statistics of the region are updated by the difference between the old and the new contribution.
+If the language tree of a region changes, the statistics are invalidated and rebuilt from scratch the next time they
+are requested (or explicitly via the ``rebuild_translation_coverage`` management command).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import F
+
+from ..constants.translation_status import CHOICES, MISSING, OUTDATED, UP_TO_DATE
+from .page_tree_index import get_page_tree_index
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ..models import Language, Region
+
+logger = logging.getLogger(__name__)
+
+
+def calculate_translation_states(
+    region: Region, page_ids: Iterable[int] | None = None
+) -> dict[int, dict[str, list[str | int]]]:
+    """
+    Calculate the contributions of pages to the translation coverage of their region.
+    Only non-archived pages which have an up-to-date translation in the default language are taken into account.
+
+    :param region: The region of the pages
+    :param page_ids: The ids of the pages which should be calculated (defaults to all pages of the region)
+    :return: A mapping from page ids to their translation state and the number of words which have to be translated
+             per language id (in the format of
+             :attr:`~integreat_cms.cms.models.pages.page_translation_coverage.PageTranslationCoverage.translation_states`)
+    """
+    default_language = region.default_language
+    languages = [
+        language for language in region.active_languages if language != default_language
+    ]
+    if not default_language or not languages:
+        return {}
+    tree_index = get_page_tree_index(region.id)
+    pages = region.pages.all().prefetch_translations().prefetch_major_translations()
+    if page_ids is not None:
+        pages = pages.filter(id__in=page_ids)
+    translation_states = {}
+    for page in pages:
+        if page.id not in tree_index or tree_index.is_archived(page.id):
+            continue
+        # Reuse the language tree of the given region instead of loading it for every page
+        page.region = region
+        # Ignore all pages which do not have a published translation in the default language
+        if page.get_translation_state(default_language.slug) != UP_TO_DATE:
+            continue
+        translation_states[page.id] = {}
+        for language in languages:
+            translation_state = page.get_translation_state(language.slug)
+            word_count = 0
+            # If the state is either outdated or missing, keep track of the word count
+            if translation_state in [OUTDATED, MISSING]:
+                source_language = region.get_source_language(language.slug)
+                # If the source translation does not exist, fall back to the default translation
+                translation = page.get_translation(
+                    source_language.slug
+                ) or page.get_translation(default_language.slug)
+                # Provide a rough estimation of the word count
+                word_count = len(translation.content.split())
+            translation_states[page.id][str(language.id)] = [
+                translation_state,
+                word_count,
+            ]
+    return translation_states
+
+
+def rebuild_translation_coverage(region: Region, only_missing: bool = False) -> None:
+    """
+    Recalculate the translation coverage of all pages of a region and store the statistics of the region.
+    Concurrent rebuilds of the same region are serialized by locking the region.
+
+    :param region: The region
+    :param only_missing: Whether the statistics should only be built if they do not exist (e.g. because a concurrent
+                         request built them while this one was waiting for the lock)
+    """
+    # Get models instead of importing them to avoid circular imports
+    PageTranslationCoverage = apps.get_model(
+        app_label="cms", model_name="PageTranslationCoverage"
+    )
+    Region = apps.get_model(app_label="cms", model_name="Region")
+    TranslationCoverage = apps.get_model(
+        app_label="cms", model_name="TranslationCoverage"
+    )
+    with transaction.atomic():
+        # Lock the region, so concurrent rebuilds cannot insert the same statistics twice
+        list(Region.objects.select_for_update().filter(id=region.id).values_list("id"))
+        if only_missing and TranslationCoverage.objects.filter(region=region).exists():
+            return
+        logger.debug("Rebuilding translation coverage of %r", region)
+        translation_states = calculate_translation_states(region)
+        totals: defaultdict[tuple[int, str], list[int]] = defaultdict(lambda: [0, 0])
+        # Make sure the statistics contain all languages and states, even if they do not occur in any page
+        for language in region.active_languages:
+            if language != region.default_language:
+                for translation_state, _ in CHOICES:
+                    totals[language.id, translation_state] = [0, 0]
+        for page_states in translation_states.values():
+            for language_id, (translation_state, word_count) in page_states.items():
+                totals[int(language_id), translation_state][0] += 1
+                totals[int(language_id), translation_state][1] += word_count
+        PageTranslationCoverage.objects.filter(page__region=region).delete()
+        PageTranslationCoverage.objects.bulk_create(
+            PageTranslationCoverage(page_id=page_id, translation_states=page_states)
+            for page_id, page_states in translation_states.items()
+        )
+        TranslationCoverage.objects.filter(region=region).delete()
+        TranslationCoverage.objects.bulk_create(
+            TranslationCoverage(
+                region=region,
+                language_id=language_id,
+                translation_state=translation_state,
+                page_count=page_count,
+                word_count=word_count,
+            )
+            for (language_id, translation_state), (
+                page_count,
+                word_count,
+            ) in totals.items()
+        )
+
+
+def update_translation_coverage(region: Region, page_ids: Iterable[int]) -> None:
+    """
+    Recalculate the contributions of the given pages and update the translation coverage of their region by the
+    difference to the previous contributions. This is idempotent, so it can safely be called multiple times for the
+    same change. If the statistics of the region were not built yet, nothing is done.
+
+    :param region: The region of the pages
+    :param page_ids: The ids of the changed pages
+    """
+    # Get models instead of importing them to avoid circular imports
+    PageTranslationCoverage = apps.get_model(
+        app_label="cms", model_name="PageTranslationCoverage"
+    )
+    TranslationCoverage = apps.get_model(
+        app_label="cms", model_name="TranslationCoverage"
+    )
+    if not TranslationCoverage.objects.filter(region=region).exists():
+        return
+    page_ids = set(page_ids)
+    deltas: defaultdict[tuple[int, str], list[int]] = defaultdict(lambda: [0, 0])
+    with transaction.atomic():
+        previous_states = {
+            coverage.page_id: coverage.translation_states
+            for coverage in PageTranslationCoverage.objects.select_for_update().filter(
+                page_id__in=page_ids
+            )
+        }
+        translation_states = calculate_translation_states(region, page_ids)
+        for page_id in page_ids:
+            previous_page_states = previous_states.get(page_id, {})
+            page_states = translation_states.get(page_id, {})
+            if page_states == previous_page_states:
+                continue
+            for sign, states in [(-1, previous_page_states), (1, page_states)]:
+                for language_id, (translation_state, word_count) in states.items():
+                    deltas[int(language_id), translation_state][0] += sign
+                    deltas[int(language_id), translation_state][1] += sign * word_count
+            if page_states:
+                PageTranslationCoverage.objects.update_or_create(
+                    page_id=page_id, defaults={"translation_states": page_states}
+                )
+            else:
+                PageTranslationCoverage.objects.filter(page_id=page_id).delete()
+        for (language_id, translation_state), (page_count, word_count) in sorted(
+            deltas.items()
+        ):
+            if not page_count and not word_count:
+                continue
+            if not TranslationCoverage.objects.filter(
+                region=region,
+                language_id=language_id,
+                translation_state=translation_state,
+            ).update(
+                page_count=F("page_count") + page_count,
+                word_count=F("word_count") + word_count,
+            ):
+                TranslationCoverage.objects.create(
+                    region=region,
+                    language_id=language_id,
+                    translation_state=translation_state,
+                    page_count=page_count,
+                    word_count=word_count,
+                )
+
+
+def invalidate_translation_coverage(region_id: int) -> None:
+    """
+    Invalidate the translation coverage of a region, e.g. after its language tree changed.
+    The statistics are rebuilt the next time they are requested.
+
+    :param region_id: The id of the region
+    """
+    # Get model instead of importing it to avoid circular imports
+    TranslationCoverage = apps.get_model(
+        app_label="cms", model_name="TranslationCoverage"
+    )
+    logger.debug("Invalidating translation coverage of region with id %r", region_id)
+    TranslationCoverage.objects.filter(region_id=region_id).delete()
+
+
+def get_translation_coverage(
+    region: Region,
+) -> tuple[dict[Language, Counter], dict[Language, Counter]]:
+    """
+    Get the translation coverage of all active languages of a region except the default language.
+    If the statistics are not built yet, they are calculated first.
+
+    :param region: The region
+    :return: The number of pages and the number of words to be translated per language and translation state
+    """
+    # Get model instead of importing it to avoid circular imports
+    TranslationCoverage = apps.get_model(
+        app_label="cms", model_name="TranslationCoverage"
+    )
+    if not (coverage := list(TranslationCoverage.objects.filter(region=region))):
+        rebuild_translation_coverage(region, only_missing=True)
+        coverage = list(TranslationCoverage.objects.filter(region=region))
+    translation_count: dict[Language, Counter] = {}
+    word_count: dict[Language, Counter] = {}
+    for language in region.active_languages:
+        if language != region.default_language:
+            translation_count[language] = Counter()
+            word_count[language] = Counter()
+    languages = {language.id: language for language in translation_count}
+    for entry in coverage:
+        if language := languages.get(entry.language_id):
+            translation_count[language][entry.translation_state] = entry.page_count
+            word_count[language][entry.translation_state] = entry.word_count
+    return translation_count, word_count
@@ -0,0 +1,138 @@
+"""
+This module contains utilities for the translation memory of machine translations
+(see :class:`~integreat_cms.cms.models.languages.translation_memory_entry.TranslationMemoryEntry`).
+
+Machine translation providers look up all text segments in the translation memory before calling their API and
+only send the segments which are not memorized yet. Segments are identified by the hash of their normalized text,
+so segments which only differ in insignificant whitespace share the same translation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import unicodedata
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.conf import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_segment(text: str) -> str:
+    """
+    Normalize a text segment: Apply the unicode normalization form NFC, collapse horizontal whitespace and strip all
+    lines. Line breaks are preserved, because they are significant for the translation.
+
+    :param text: The text segment
+    :return: The normalized text segment
+    """
+    text = unicodedata.normalize("NFC", text)
+    return "\n".join(
+        re.sub(r"[^\S\n]+", " ", line).strip() for line in text.strip().splitlines()
+    )
+
+
+def get_segment_hash(text: str) -> str:
+    """
+    Get the hash of a normalized text segment
+
+    :param text: The text segment
+    :return: The hex digest of the SHA-256 hash of the normalized text segment
+    """
+    return hashlib.sha256(normalize_segment(text).encode("utf-8")).hexdigest()
+
+
+class TranslationMemory:
+    """
+    The translation memory of one machine translation provider and language pair
+    """
+
+    def __init__(
+        self, provider: str, source_language: str, target_language: str
+    ) -> None:
+        """
+        Initialize the translation memory
+
+        :param provider: The name of the machine translation provider
+        :param source_language: The source language code which is sent to the provider
+        :param target_language: The target language code which is sent to the provider (including all other options
+                                which influence the translation)
+        """
+        self.provider = provider
+        self.source_language = source_language
+        self.target_language = target_language
+
+    def lookup(self, texts: Iterable[str]) -> dict[str, str]:
+        """
+        Look up the translations of text segments in one query
+
+        :param texts: The source text segments
+        :return: A dict which maps the hashes of all memorized segments to their translations
+        """
+        if not settings.TRANSLATION_MEMORY_ENABLED:
+            return {}
+        # Get model instead of importing it to avoid circular imports
+        TranslationMemoryEntry = apps.get_model(
+            app_label="cms", model_name="TranslationMemoryEntry"
+        )
+        segment_hashes = {get_segment_hash(text) for text in texts}
+        if not segment_hashes:
+            return {}
+        memorized = dict(
+            TranslationMemoryEntry.objects.filter(
+                provider=self.provider,
+                source_language=self.source_language,
+                target_language=self.target_language,
+                segment_hash__in=segment_hashes,
+            ).values_list("segment_hash", "translated_text")
+        )
+        logger.debug(
+            "%s translation memory (%s ➜ %s): %d of %d segments memorized",
+            self.provider,
+            self.source_language,
+            self.target_language,
+            len(memorized),
+            len(segment_hashes),
+        )
+        return memorized
+
+    def store(self, translations: dict[str, str]) -> None:
+        """
+        Store the translations of text segments in one query
+
+        :param translations: A dict which maps source text segments to their translations
+        """
+        if not settings.TRANSLATION_MEMORY_ENABLED or not translations:
+            return
+        # Get model instead of importing it to avoid circular imports
+        TranslationMemoryEntry = apps.get_model(
+            app_label="cms", model_name="TranslationMemoryEntry"
+        )
+        entries = {
+            get_segment_hash(text): TranslationMemoryEntry(
+                provider=self.provider,
+                source_language=self.source_language,
+                target_language=self.target_language,
+                segment_hash=get_segment_hash(text),
+                translated_text=translated_text,
+            )
+            for text, translated_text in translations.items()
+            if translated_text
+        }
+        TranslationMemoryEntry.objects.bulk_create(
+            entries.values(),
+            update_conflicts=True,
+            unique_fields=[
+                "provider",
+                "source_language",
+                "target_language",
+                "segment_hash",
+            ],
+            update_fields=["translated_text"],
+        )
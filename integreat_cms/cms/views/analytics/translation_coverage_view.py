@@ -1,30 +1,22 @@
 from __future__ import annotations
 
 import logging
-from collections import Counter
 from typing import TYPE_CHECKING
 
 from django.conf import settings
 from django.utils.decorators import method_decorator
 from django.views.generic import TemplateView
 
-from ...constants.translation_status import (
-    CHOICES,
-    COLORS,
-    MISSING,
-    OUTDATED,
-    UP_TO_DATE,
-)
+from ...constants.translation_status import CHOICES, COLORS, MISSING, OUTDATED
 from ...decorators import permission_required
 from ...models import PageTranslation
+from ...utils.translation_coverage_utils import get_translation_coverage
 
 if TYPE_CHECKING:
     from typing import Any
 
     from django.db.models.query import QuerySet
 
-    from ..models import Language
-
 logger = logging.getLogger(__name__)
 
 
@@ -44,50 +36,8 @@ class TranslationCoverageView(TemplateView):
         :param \**kwargs: The supplied keyword arguments
         :return: The context dictionary
         """
-        # The current region
-        region = self.request.region
-        # Initialize dicts which will hold the counter per language
-        translation_count: dict[Language, Counter] = {}
-        word_count: dict[Language, Counter] = {}
-        # Cache the page tree to avoid database overhead
-        pages = (
-            region.pages.filter(explicitly_archived=False)
-            .prefetch_major_translations()
-            .cache_tree(archived=False)
-        )
-        # Ignore all pages which do not have a published translation in the default language
-        pages = list(
-            filter(
-                lambda page: page.get_translation_state(region.default_language.slug)
-                == UP_TO_DATE,
-                pages,
-            )
-        )
-        # Iterate over all active languages of the current region
-        for language in region.active_languages:
-            # Only check pages that are not in the default language
-            if language == region.default_language:
-                continue
-            # Initialize counter dicts for both the translation count and the word count
-            translation_count[language] = Counter()
-            word_count[language] = Counter()
-            # Iterate over all non-archived pages
-            for page in pages:
-                # Retrieve the translation state of the current language
-                translation_state = page.get_translation_state(language.slug)
-                translation_count[language][translation_state] += 1
-                # If the state is either outdated or missing, keep track of the word count
-                if translation_state in [OUTDATED, MISSING]:
-                    # Check word count of translation in source language
-                    source_language = region.get_source_language(language.slug)
-                    # If the source translation does not exist, fall back to the default translation
-                    translation = page.get_translation(
-                        source_language.slug
-                    ) or page.get_translation(region.default_language.slug)
-                    # Provide a rough estimation of the word count
-                    word_count[language][translation_state] += len(
-                        translation.content.split()
-                    )
+        # Get the translation status count and the word count per language from the stored statistics
+        translation_count, word_count = get_translation_coverage(self.request.region)
         logger.debug("Translation status count: %r", translation_count)
         logger.debug("Word count: %r", word_count)
         # Assemble the ChartData in the format expected by ChartJS (one dataset for each translation status)
@@ -135,8 +85,10 @@ class TranslationCoverageView(TemplateView):
 
         # Get the latest versions of the page translations for these pages
         hix_translations = PageTranslation.objects.filter(
-            language__slug__in=settings.TEXTLAB_API_LANGUAGES, page__in=hix_pages
-        ).distinct("page_id", "language_id")
+            language__slug__in=settings.TEXTLAB_API_LANGUAGES,
+            page__in=hix_pages,
+            is_latest=True,
+        )
 
         # Get all hix translations where the score is set
         hix_translations_with_score = [pt for pt in hix_translations if pt.hix_score]
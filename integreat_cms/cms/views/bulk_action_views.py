@@ -13,13 +13,16 @@ from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.core.exceptions import PermissionDenied
 from django.http import Http404
 from django.urls import reverse
+from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
 from django.views.generic import RedirectView
 from django.views.generic.list import MultipleObjectMixin
 
-from ..constants import status
+from ...core.utils.machine_translation_api_client import translate_content_objects
+from ..constants import job_status, status
 from ..models import Page
+from ..utils.background_job_utils import enqueue_job
 from ..utils.stringify_list import iter_to_string
 from .utils.publication_status import change_publication_status
 
@@ -185,8 +188,36 @@ class BulkMachineTranslationView(BulkActionView):
             language_node.language,
             to_translate,
         )
-        api_client = language_node.mt_provider.api_client(request, self.form)
-        api_client.translate_queryset(to_translate, language_node.slug)
+        job = enqueue_job(
+            translate_content_objects,
+            priority=10,
+            region=request.region,
+            user=request.user,
+            request=request,
+            # Retrying partially finished translations could exceed the budget of the region
+            max_attempts=1,
+            model_label=self.model._meta.label,
+            form_class=f"{self.form.__module__}.{self.form.__qualname__}",
+            object_ids=[content_object.id for content_object in to_translate],
+            language_slug=language_node.slug,
+        )
+        if job.status == job_status.FAILED:
+            messages.error(
+                request,
+                _("The machine translation could not be completed."),
+            )
+        elif not job.is_finished:
+            messages.info(
+                request,
+                format_html(
+                    "{} <a href='{}' class='underline hover:no-underline'>{}</a>",
+                    _(
+                        "The selected content is being translated in the background. The translations will appear in a few minutes."
+                    ),
+                    reverse("background_job_status_ajax", kwargs={"job_id": job.id}),
+                    _("Show progress of job {}").format(job.id),
+                ),
+            )
 
         # Let the base view handle the redirect
         return super().post(request, *args, **kwargs)
@@ -9,10 +9,11 @@ from django.conf import settings
 from django.db.models import Q, Subquery
 from django.utils import translation
 from django.views.generic import TemplateView
+from linkcheck.models import Link
 
 from ...constants import status
 from ...models import Feedback, PageTranslation
-from ...utils.linkcheck_utils import filter_urls
+from ...utils.linkcheck_utils import get_linkcheck_stats
 from ..chat.chat_context_mixin import ChatContextMixin
 
 if TYPE_CHECKING:
@@ -62,8 +63,7 @@ class DashboardView(TemplateView, ChatContextMixin):
         context.update(self.get_unreviewed_pages_context())
         context.update(self.get_automatically_saved_pages())
         context.update(self.get_unread_feedback_context())
-        # Temporarily disable linkcheck todo for performance reasons
-        # context.update(self.get_broken_links_context())
+        context.update(self.get_broken_links_context())
         context.update(self.get_low_hix_value_context())
         context.update(self.get_outdated_pages_context())
 
@@ -75,15 +75,10 @@ class DashboardView(TemplateView, ChatContextMixin):
 
         :return: The ids of the latest page translations of the current region
         """
-        latest_version_ids = (
-            PageTranslation.objects.filter(
-                page__id__in=Subquery(
-                    self.request.region.non_archived_pages.values("pk")
-                ),
-            )
-            .distinct("page__id", "language__id")
-            .values_list("pk", flat=True)
-        )
+        latest_version_ids = PageTranslation.objects.filter(
+            page__id__in=Subquery(self.request.region.non_archived_pages.values("pk")),
+            is_latest=True,
+        ).values_list("pk", flat=True)
         return list(latest_version_ids)
 
     def get_unreviewed_pages_context(self) -> dict[str, QuerySet | str]:
@@ -141,23 +136,32 @@ class DashboardView(TemplateView, ChatContextMixin):
 
     def get_broken_links_context(
         self,
-    ) -> dict[str, list[Url] | Url | AbstractContentTranslation]:
+    ) -> dict[str, int | Url | AbstractContentTranslation | None]:
         r"""
-        Extend context by info on broken links
+        Extend context by info on broken links.
+        The numbers are taken from the precomputed linkcheck statistics of the region, so only the link which is
+        shown in the widget has to be loaded.
 
         :return: Dictionary containing the context for broken links
         """
-        invalid_urls = filter_urls(self.request.region.slug, "invalid")[0]
-        invalid_url = invalid_urls[0] if invalid_urls else None
+        if not self.request.user.has_perm("cms.view_broken_links"):
+            return {}
 
-        relevant_translation = (
-            invalid_url.region_links[0].content_object if invalid_url else None
+        linkcheck_stats = get_linkcheck_stats(self.request.region)
+        relevant_link = (
+            Link.objects.select_related("url")
+            .filter(id=linkcheck_stats["invalid_link_id"])
+            .first()
+            if linkcheck_stats["invalid_link_id"]
+            else None
         )
 
         return {
-            "broken_links": invalid_urls,
-            "relevant_translation": relevant_translation,
-            "relevant_url": invalid_url,
+            "number_broken_links": linkcheck_stats["counts"]["number_invalid_urls"],
+            "relevant_translation": (
+                relevant_link.content_object if relevant_link else None
+            ),
+            "relevant_url": relevant_link.url if relevant_link else None,
         }
 
     def get_low_hix_value_context(self) -> dict[str, QuerySet]:
@@ -232,6 +232,9 @@ class EventFormView(
                 event_translation_form.instance.event.translations.filter(
                     language__in=languages
                 ).update(status=status.DRAFT)
+                EventTranslation.update_latest_versions(
+                    event=event_translation_form.instance.event, language__in=languages
+                )
 
             elif (
                 event_translation_form.instance.status == status.PUBLIC
@@ -240,6 +243,9 @@ class EventFormView(
                 event_translation_form.instance.event.translations.filter(
                     language=language
                 ).update(status=status.PUBLIC)
+                EventTranslation.update_latest_versions(
+                    event=event_translation_form.instance.event, language=language
+                )
             # Show a message that the slug was changed if it was not unique
             if user_slug and user_slug != event_translation_form.cleaned_data["slug"]:
                 other_translation = EventTranslation.objects.filter(
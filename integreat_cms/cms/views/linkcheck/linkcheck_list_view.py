@@ -21,7 +21,12 @@ from lxml.html import rewrite_links
 
 from ...decorators import permission_required
 from ...forms.linkcheck.edit_url_form import EditUrlForm
-from ...utils.linkcheck_utils import filter_urls, fix_content_link_encoding, get_urls
+from ...utils.linkcheck_utils import (
+    filter_urls,
+    fix_content_link_encoding,
+    get_urls,
+    update_linkcheck_stats,
+)
 
 if TYPE_CHECKING:
     from typing import Any
@@ -231,6 +236,8 @@ class LinkcheckListView(ListView):
             time.sleep(1)
         invalidate_model(Link)
         invalidate_model(Url)
+        # Bulk updates of links do not send signals
+        update_linkcheck_stats([url.id for url in selected_urls])
         linkcheck_url = reverse("linkcheck", kwargs=kwargs)
         # Keep pagination settings
         return redirect(f"{linkcheck_url}{self.get_pagination_params()}")
@@ -32,6 +32,7 @@ from ...decorators import permission_required
 from ...forms import PageForm
 from ...models import Page, PageTranslation, Region
 from ...utils.file_utils import extract_zip_archive
+from ...utils.translation_coverage_utils import update_translation_coverage
 
 if TYPE_CHECKING:
     from django.http import HttpRequest
@@ -297,6 +298,7 @@ def cancel_translation_process_ajax(
         page_translation.all_versions.invalidated_update(currently_in_translation=False)
     else:
         page_translation.all_versions.update(currently_in_translation=False)
+    update_translation_coverage(region, [page.id])
     # Get new (respectively old) translation state
     translation_state = page.get_translation_state(language_slug)
     return JsonResponse(
@@ -585,8 +587,8 @@ def refresh_date(
 
     # Consider only the last version of each translation
     page_translations = page.translations.filter(
-        language__in=region.active_languages
-    ).distinct("page__pk", "language__pk")
+        language__in=region.active_languages, is_latest=True
+    )
     # Sort page translations according to the position of their languages in the
     # language tree to ensure that the translations are not considered outdated.
     page_translations = sorted(
@@ -377,6 +377,9 @@ class PageFormView(
                 page_translation_form.instance.page.translations.filter(
                     language__in=languages
                 ).update(status=status.DRAFT)
+                PageTranslation.update_latest_versions(
+                    page=page_translation_form.instance.page, language__in=languages
+                )
             # If this is the first version and the minor edit checkbox is checked, remove it
             if (
                 page_translation_form.instance.version == 1
@@ -399,6 +402,9 @@ class PageFormView(
                 page_translation_form.instance.page.translations.filter(
                     language=language
                 ).update(status=status.PUBLIC)
+                PageTranslation.update_latest_versions(
+                    page=page_translation_form.instance.page, language=language
+                )
 
             # Add the success message and redirect to the edit page
             if not page_instance:
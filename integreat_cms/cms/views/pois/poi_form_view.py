@@ -184,6 +184,9 @@ class POIFormView(
                 poi_translation_form.instance.poi.translations.filter(
                     language__in=languages
                 ).update(status=status.DRAFT)
+                POITranslation.update_latest_versions(
+                    poi=poi_translation_form.instance.poi, language__in=languages
+                )
             elif (
                 poi_translation_form.instance.status == status.PUBLIC
                 and poi_translation_form.instance.minor_edit
@@ -191,6 +194,9 @@ class POIFormView(
                 poi_translation_form.instance.poi.translations.filter(
                     language=language
                 ).update(status=status.PUBLIC)
+                POITranslation.update_latest_versions(
+                    poi=poi_translation_form.instance.poi, language=language
+                )
 
             # Show a message that the slug was changed if it was not unique
             if user_slug and user_slug != poi_translation_form.cleaned_data["slug"]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .background_job_status_ajax import background_job_status_ajax
 from .content_edit_lock import content_edit_lock_heartbeat, content_edit_lock_release
 from .hix import get_hix_score
 from .machine_translations import build_json_for_machine_translation
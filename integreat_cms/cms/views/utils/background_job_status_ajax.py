@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import PermissionDenied
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+
+from ...models import BackgroundJob
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+
+def background_job_status_ajax(request: HttpRequest, job_id: int) -> JsonResponse:
+    """
+    Return the status, progress and messages of a background job
+
+    :param request: The current request
+    :param job_id: The id of the background job
+    :return: The serialized background job
+    :raises ~django.core.exceptions.PermissionDenied: If the user did neither start the job nor is staff
+    """
+    job = get_object_or_404(BackgroundJob, id=job_id)
+    if job.creator_id != request.user.id and not request.user.is_staff:
+        raise PermissionDenied(
+            f"{request.user!r} does not have the permission to view {job!r}"
+        )
+    return JsonResponse(job.serialize())
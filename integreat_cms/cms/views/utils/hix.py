@@ -5,13 +5,14 @@ for a given text.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-from functools import lru_cache
 from typing import TYPE_CHECKING
-from urllib.error import URLError
 
+import requests
 from django.conf import settings
+from django.core.cache import caches
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 
@@ -30,47 +31,63 @@ logger = logging.getLogger(__name__)
 MAX_TEXT_LENGTH: Final[int] = 100_000
 
 
-class CacheMeIfYouCan(Exception):
+def normalize_text(text: str) -> str:
     """
-    Helper exception used for stopping @lru_cache from caching
+    Normalize the given text before it is passed to the Textlab API
+
+    :param text: The text to calculate the hix score for
+    :return: The normalized text
     """
+    # Replace all line breaks with <br> because Textlab API returns different HIX value depending on the line break character
+    return "<br>".join(text.splitlines())
 
 
-@lru_cache(maxsize=512)
-def lookup_hix_score_helper(text: str) -> dict:
+def get_hix_cache_key(normalized_text: str) -> str:
     """
-    This function returns the hix score for the given text.
-    It either performs an api request or returns the value from cache,
-    unless it is None, in which case an exception is raised to prevent
-    caching.
+    Get the key of the given text in the HIX score cache.
+    Only the hash of the text is used to keep the keys short and to not store the texts themselves.
 
-    :param text: The text to calculate the hix score for
-    :return: The score for the given text
+    :param normalized_text: The normalized text
+    :return: The cache key
     """
-    # Replace all line breaks with <br> because Textlab API returns different HIX value depending on the line break character
-    normalized_text = "<br>".join(text.splitlines())
+    return f"hix_score_{hashlib.sha256(normalized_text.encode()).hexdigest()}"
 
-    try:
-        return TextlabClient(
-            settings.TEXTLAB_API_USERNAME, settings.TEXTLAB_API_KEY
-        ).benchmark(normalized_text)
-    except (URLError, OSError) as e:
-        logger.warning("HIX benchmark API call failed: %r", e)
-        raise CacheMeIfYouCan from e
+
+def is_hix_score_cached(text: str) -> bool:
+    """
+    Check whether the hix score of the given text is already stored in the HIX score cache
+
+    :param text: The text to calculate the hix score for
+    :return: Whether the hix score can be looked up without an api request
+    """
+    return caches["hix_scores"].has_key(get_hix_cache_key(normalize_text(text)))
 
 
 def lookup_hix_score(text: str) -> dict | None:
     """
     This function returns the hix score for the given text.
-    It either performs an api request or returns the value from cache.
+    It either returns the value from the HIX score cache or performs an api request.
+    The cache is shared between all processes and identical texts in different regions or versions, so the Textlab
+    API is only requested once per text (see :attr:`~integreat_cms.core.settings.CACHES`).
+    Failed requests are not cached.
 
     :param text: The text to calculate the hix score for
     :return: The score for the given text
     """
+    normalized_text = normalize_text(text)
+    cache_key = get_hix_cache_key(normalized_text)
+    hix_cache = caches["hix_scores"]
+    if (data := hix_cache.get(cache_key)) is not None:
+        return data
     try:
-        return lookup_hix_score_helper(text)
-    except CacheMeIfYouCan:
+        data = TextlabClient(
+            settings.TEXTLAB_API_USERNAME, settings.TEXTLAB_API_KEY
+        ).benchmark(normalized_text)
+    except requests.RequestException as e:
+        logger.warning("HIX benchmark API call failed: %r", e)
         return None
+    hix_cache.set(cache_key, data)
+    return data
 
 
 @require_POST
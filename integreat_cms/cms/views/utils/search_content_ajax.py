@@ -6,24 +6,28 @@ from typing import TYPE_CHECKING
 
 from django.conf import settings
 from django.core.exceptions import PermissionDenied
+from django.db.models import Case, IntegerField, Value, When
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 
-from ...constants import status
 from ...models import (
     Directory,
     EventTranslation,
     Feedback,
     MediaFile,
+    Page,
+    PageTranslation,
     POITranslation,
     PushNotificationTranslation,
     Region,
 )
+from ...utils.page_tree_index import get_page_tree_index
 from ...utils.user_utils import search_users
 
 if TYPE_CHECKING:
     from typing import Any, Literal
 
+    from django.db.models.query import QuerySet
     from django.http import HttpRequest
 
     from ...models.abstract_content_translation import AbstractContentTranslation
@@ -34,6 +38,87 @@ logger = logging.getLogger(__name__)
 MAX_RESULT_COUNT: int = 20
 
 
+def get_rank(title: str, query: str) -> tuple[bool, str]:
+    """
+    Get the sort key of a search result: Results whose title starts with the query come first, then all results are
+    sorted alphabetically. This has to match the order of :func:`order_results`.
+
+    :param title: The title of the result
+    :param query: The search query
+    :return: The sort key of the result
+    """
+    return (not title.lower().startswith(query.lower()), title)
+
+
+def order_results(queryset: QuerySet, query: str, field: str = "title") -> QuerySet:
+    """
+    Order the matching objects like :func:`get_rank`, so the database only has to return the best matches when the
+    queryset is sliced.
+
+    :param queryset: The matching objects
+    :param query: The search query
+    :param field: The field which is used as title of the results
+    :return: The ordered objects
+    """
+    return queryset.annotate(
+        title_mismatch=Case(
+            When(**{f"{field}__istartswith": query}, then=Value(0)),
+            default=Value(1),
+            output_field=IntegerField(),
+        )
+    ).order_by("title_mismatch", field)
+
+
+def search_page_translations(
+    region: Region, language_slug: str, query: str, archived: bool
+) -> list[PageTranslation]:
+    """
+    Search the latest page translations of a region.
+    Instead of loading the whole page tree, the archived state is looked up in the page tree index and only the
+    ancestors of the results are loaded to render their paths.
+
+    :param region: The current region
+    :param language_slug: The slug of the current language
+    :param query: The search query
+    :param archived: Whether only archived or only non-archived pages should be returned
+    :return: The best matching page translations
+    """
+    tree_index = get_page_tree_index(region.id)
+    page_translations: list[PageTranslation] = []
+    matches = PageTranslation.search(region, language_slug, query).select_related(
+        "language"
+    )
+    for page_translation in order_results(matches, query).iterator():
+        if (
+            page_translation.page_id in tree_index
+            and tree_index.is_archived(page_translation.page_id) == archived
+        ):
+            page_translations.append(page_translation)
+            if len(page_translations) == MAX_RESULT_COUNT:
+                break
+    if not page_translations:
+        return []
+    ancestor_ids = {
+        page_translation.page_id: tree_index.get_ancestor_ids(page_translation.page_id)
+        for page_translation in page_translations
+    }
+    page_ids = set(ancestor_ids).union(*ancestor_ids.values())
+    pages = (
+        Page.objects.filter(id__in=page_ids)
+        .prefetch_translations()
+        .prefetch_public_translations()
+        .in_bulk()
+    )
+    for page_translation in page_translations:
+        page = pages[page_translation.page_id]
+        # pylint: disable=protected-access
+        page._cached_ancestors = [
+            pages[ancestor_id] for ancestor_id in ancestor_ids[page.id]
+        ]
+        page_translation.page = page
+    return page_translations
+
+
 def format_object_translation(
     object_translation: AbstractContentTranslation, typ: Literal["page", "event", "poi"]
 ) -> dict:
@@ -59,9 +144,9 @@ def search_content_ajax(
     region_slug: str | None = None,
     language_slug: str | None = None,
 ) -> JsonResponse:
-    """Searches all pois, events and pages for the current region and returns all that
-    match the search query. Results which match the query in the title or slug get ranked
-    higher than results which only match through their text content.
+    """Searches all pois, events and pages for the current region and returns the best results
+    that match the search query. Results whose title starts with the query get ranked higher,
+    and only the best ``MAX_RESULT_COUNT`` results of each object type are fetched from the database.
 
     :param request: The current request
     :param region_slug: The slug of the current region
@@ -94,12 +179,13 @@ def search_content_ajax(
         if not user.has_perm("cms.view_event"):
             raise PermissionDenied
         event_translations = (
-            EventTranslation.search(region, language_slug, query)
-            .filter(event__archived=archived_flag, status=status.PUBLIC)
+            EventTranslation.search(region, language_slug, query, public=True)
+            .filter(event__archived=archived_flag)
             .select_related("event__region", "language")
         )
         results.extend(
-            format_object_translation(obj, "event") for obj in event_translations
+            format_object_translation(obj, "event")
+            for obj in order_results(event_translations, query)[:MAX_RESULT_COUNT]
         )
 
     if "feedback" in object_types:
@@ -112,9 +198,11 @@ def search_content_ajax(
                 "url": None,
                 "type": "feedback",
             }
-            for feedback in Feedback.search(region, query).filter(
-                archived=archived_flag
-            )
+            for feedback in order_results(
+                Feedback.search(region, query).filter(archived=archived_flag),
+                query,
+                "comment",
+            )[:MAX_RESULT_COUNT]
         )
 
     if "page" in object_types:
@@ -123,14 +211,12 @@ def search_content_ajax(
         object_types.remove("page")
         if not user.has_perm("cms.view_page"):
             raise PermissionDenied
-        pages = region.pages.all().cache_tree(archived=archived_flag)
-        for page in pages:
-            page_translation = page.get_translation(language_slug)
-            if page_translation and (
-                query.lower() in page_translation.slug
-                or query.lower() in page_translation.title.lower()
-            ):
-                results.append(format_object_translation(page_translation, "page"))
+        results.extend(
+            format_object_translation(page_translation, "page")
+            for page_translation in search_page_translations(
+                region, language_slug, query, archived_flag
+            )
+        )
 
     if "poi" in object_types:
         if TYPE_CHECKING:
@@ -139,12 +225,13 @@ def search_content_ajax(
         if not user.has_perm("cms.view_poi"):
             raise PermissionDenied
         poi_translations = (
-            POITranslation.search(region, language_slug, query)
-            .filter(poi__archived=archived_flag, status=status.PUBLIC)
+            POITranslation.search(region, language_slug, query, public=True)
+            .filter(poi__archived=archived_flag)
             .select_related("poi__region", "language")
         )
         results.extend(
-            format_object_translation(obj, "poi") for obj in poi_translations
+            format_object_translation(obj, "poi")
+            for obj in order_results(poi_translations, query)[:MAX_RESULT_COUNT]
         )
 
     if "push_notification" in object_types:
@@ -159,9 +246,9 @@ def search_content_ajax(
                 "url": None,
                 "type": "push_notification",
             }
-            for push_notification in PushNotificationTranslation.search(
-                region, language_slug, query
-            )
+            for push_notification in order_results(
+                PushNotificationTranslation.search(region, language_slug, query), query
+            )[:MAX_RESULT_COUNT]
         )
 
     if "region" in object_types:
@@ -174,7 +261,9 @@ def search_content_ajax(
                 "url": None,
                 "type": "region",
             }
-            for region in Region.search(query)
+            for region in order_results(Region.search(query), query, "name")[
+                :MAX_RESULT_COUNT
+            ]
         )
 
     if "user" in object_types:
@@ -187,7 +276,9 @@ def search_content_ajax(
                 "url": None,
                 "type": "user",
             }
-            for user in search_users(region, query)
+            for user in order_results(search_users(region, query), query, "username")[
+                :MAX_RESULT_COUNT
+            ]
         )
 
     if "media" in object_types:
@@ -198,7 +289,9 @@ def search_content_ajax(
                 "url": None,
                 "type": "file",
             }
-            for file in MediaFile.search(region, query)
+            for file in order_results(MediaFile.search(region, query), query, "name")[
+                :MAX_RESULT_COUNT
+            ]
         )
         results.extend(
             {
@@ -206,13 +299,15 @@ def search_content_ajax(
                 "url": None,
                 "type": "directory",
             }
-            for directory in Directory.search(region, query)
+            for directory in order_results(
+                Directory.search(region, query), query, "name"
+            )[:MAX_RESULT_COUNT]
         )
 
     if object_types:
         raise AttributeError(f"Unexpected object type(s): {object_types}")
 
-    # sort alphabetically by title
-    results.sort(key=lambda k: k["title"])
+    # Merge the best matches of all object types
+    results.sort(key=lambda result: get_rank(result["title"], query))
 
     return JsonResponse({"data": results[:MAX_RESULT_COUNT]})
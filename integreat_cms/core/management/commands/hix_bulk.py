@@ -9,6 +9,7 @@ from django.core.management.base import CommandError
 from linkcheck.listeners import disable_listeners
 
 from ....cms.models import Region
+from ....cms.views.utils.hix import is_hix_score_cached
 from ..log_command import LogCommand
 
 if TYPE_CHECKING:
@@ -42,8 +43,11 @@ def calculate_hix_for_region(region: Region) -> None:
                 logger.debug("skipping %r: Empty content", translation)
                 continue
 
+            # Only wait between requests which actually reach the Textlab API
+            cached = is_hix_score_cached(translation.content)
             translation.save(update_timestamp=False)
-            time.sleep(settings.TEXTLAB_API_BULK_WAITING_TIME)
+            if not cached:
+                time.sleep(settings.TEXTLAB_API_BULK_WAITING_TIME)
 
 
 class Command(LogCommand):
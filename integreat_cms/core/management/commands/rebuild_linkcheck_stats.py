@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.core.management.base import CommandError
+
+from ....cms.models import Region
+from ....cms.utils.linkcheck_utils import rebuild_linkcheck_stats
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Command to rebuild the stored linkcheck statistics of regions
+    """
+
+    help = "Recalculates the linkcheck statistics of the given regions"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "region_slugs",
+            help="The slugs of the regions which should be processed. If empty, all regions will be processed",
+            nargs="*",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args: Any, region_slugs: list[str], **options: Any) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param region_slugs: The slugs of the given regions
+        :param \**options: The supplied keyword options
+        """
+        self.set_logging_stream()
+
+        if not region_slugs:
+            regions = Region.objects.all()
+        else:
+            regions = Region.objects.filter(slug__in=region_slugs)
+            if len(regions) != len(region_slugs):
+                diff = set(region_slugs) - {region.slug for region in regions}
+                raise CommandError(f"The following regions do not exist: {diff}")
+
+        for region in regions:
+            logger.info("Processing region %r", region)
+            rebuild_linkcheck_stats(region)
+
+        logger.success("✔ Rebuilt the linkcheck statistics")  # type: ignore[attr-defined]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import logging
+import signal
+import time
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from ....cms.utils.background_job_utils import (
+    claim_job,
+    delete_finished_jobs,
+    run_job,
+)
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from types import FrameType
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Command to run a worker process of the job queue
+    """
+
+    help = "Executes the pending background jobs"
+
+    #: Whether the worker should stop after the current job
+    stopping: bool = False
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Stop as soon as there are no pending jobs instead of waiting for new jobs",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            default=0,
+            help="Stop after the given number of jobs (e.g. to restart the worker regularly), 0 means no limit",
+        )
+
+    # pylint: disable=unused-argument
+    def stop(self, signum: int, frame: FrameType | None) -> None:
+        """
+        Stop the worker gracefully after the current job
+
+        :param signum: The number of the received signal
+        :param frame: The current stack frame
+        """
+        logger.info("Stopping worker after the current job...")
+        self.stopping = True
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args: Any, burst: bool, max_jobs: int, **options: Any) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param burst: Whether the worker should stop when there are no pending jobs
+        :param max_jobs: The maximum number of jobs this worker executes
+        :param \**options: The supplied keyword options
+        """
+        self.set_logging_stream()
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        if deleted := delete_finished_jobs():
+            logger.info("Deleted %d finished jobs", deleted)
+        executed = 0
+        while not self.stopping and not (max_jobs and executed >= max_jobs):
+            # Reconnect if the database connection was closed while waiting
+            close_old_connections()
+            if job := claim_job():
+                run_job(job)
+                executed += 1
+            elif burst:
+                break
+            else:
+                time.sleep(settings.BACKGROUND_JOB_POLL_INTERVAL)
+
+        logger.success("✔ Executed %d background jobs", executed)  # type: ignore[attr-defined]
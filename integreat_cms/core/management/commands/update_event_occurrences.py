@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from ....cms.models import Event, Region
+from ....cms.utils.event_occurrence_utils import (
+    ensure_event_occurrences,
+    invalidate_event_occurrences,
+)
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Command to roll the materialized occurrences of recurring events forward
+    """
+
+    help = "Materializes the occurrences of events up to the configured horizon"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "region_slugs",
+            help="The slugs of the regions which should be processed. If empty, all regions will be processed",
+            nargs="*",
+        )
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Rebuild the occurrences of all events instead of only adding the missing ones",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(
+        self, *args: Any, region_slugs: list[str], rebuild: bool, **options: Any
+    ) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param region_slugs: The slugs of the given regions
+        :param rebuild: Whether all occurrences should be rebuilt
+        :param \**options: The supplied keyword options
+        """
+        self.set_logging_stream()
+
+        if not region_slugs:
+            regions = Region.objects.all()
+        else:
+            regions = Region.objects.filter(slug__in=region_slugs)
+            if len(regions) != len(region_slugs):
+                diff = set(region_slugs) - {region.slug for region in regions}
+                raise CommandError(f"The following regions do not exist: {diff}")
+
+        # Roll the horizon forward well before the occurrences are required by the API
+        until = timezone.now().date() + timedelta(
+            days=settings.EVENT_OCCURRENCES_HORIZON_DAYS // 2
+        )
+        for region in regions:
+            logger.info("Processing region %r", region)
+            events = Event.objects.filter(region=region, archived=False)
+            if rebuild:
+                invalidate_event_occurrences(events)
+            count = ensure_event_occurrences(events, until)
+            logger.info("Updated the occurrences of %d events", count)
+
+        logger.success("✔ Updated the event occurrences")  # type: ignore[attr-defined]
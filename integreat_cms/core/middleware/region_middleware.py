@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 from django.urls import resolve
 
 from ...cms.models import Region
+from ...cms.utils.region_cache_utils import get_cached_region
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -19,6 +21,20 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def get_region_slug(path: str) -> str | None:
+    """
+    Get the region slug of the given path.
+    The result is cached because resolving the path is comparatively expensive and the number of distinct paths which
+    are requested frequently is limited.
+
+    :param path: The path of the request
+    :raises ~django.urls.Resolver404: When the path cannot be resolved
+    :return: The region slug of the path (or ``None`` if the path does not belong to a region)
+    """
+    return resolve(path).kwargs.get("region_slug")
+
+
 class RegionMiddleware:
     """
     Middleware class that adds the current region to the request variable
@@ -61,7 +77,8 @@ class RegionMiddleware:
         """
         This method returns the current region based on the current request.
         If the request path contains a region slug, the corresponding
-        :class:`~integreat_cms.cms.models.regions.region.Region` object is queried from the database.
+        :class:`~integreat_cms.cms.models.regions.region.Region` object is returned from the region cache (see
+        :func:`~integreat_cms.cms.utils.region_cache_utils.get_cached_region`).
 
         :param request: Django request
         :raises ~django.http.Http404: When the current request has a ``region_slug`` parameter, but there is no region
@@ -69,10 +86,11 @@ class RegionMiddleware:
 
         :return: The current region of this request
         """
-        # Resolve current url
-        resolver_match = resolve(request.path)
-        if region_slug := resolver_match.kwargs.get("region_slug"):
-            return get_object_or_404(Region, slug=region_slug)
+        if region_slug := get_region_slug(request.path):
+            try:
+                return get_cached_region(region_slug)
+            except Region.DoesNotExist as e:
+                raise Http404("No Region matches the given query.") from e
         return None
 
     @staticmethod
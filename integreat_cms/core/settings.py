@@ -58,6 +58,22 @@ MATOMO_TRACKING: Final[bool] = bool(
     strtobool(os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING", "False"))
 )
 
+#: The maximum number of tracking requests which are buffered before new requests are dropped
+#: (see :class:`~integreat_cms.matomo_api.matomo_tracking_queue.MatomoTrackingQueue`)
+MATOMO_TRACKING_QUEUE_SIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING_QUEUE_SIZE", 10000)
+)
+
+#: The number of worker threads per process which send the tracking requests to Matomo
+MATOMO_TRACKING_WORKERS: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING_WORKERS", 2)
+)
+
+#: The maximum number of tracking requests which are sent to Matomo in one bulk request
+MATOMO_TRACKING_BATCH_SIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING_BATCH_SIZE", 100)
+)
+
 #: The slug for the legal notice (see e.g. :class:`~integreat_cms.cms.models.pages.imprint_page_translation.ImprintPageTranslation`)
 IMPRINT_SLUG: Final[str] = os.environ.get("INTEGREAT_CMS_IMPRINT_SLUG", "disclaimer")
 
@@ -126,6 +142,11 @@ AUTHOR_CHAT_HISTORY_DAYS: Final[int] = 30
 #: The time span up to which recurrent events should be returned by the api
 API_EVENTS_MAX_TIME_SPAN_DAYS: Final[int] = 31
 
+#: The number of days up to which the occurrences of recurring events are materialized in advance (see
+#: :mod:`~integreat_cms.cms.utils.event_occurrence_utils`). Must be at least
+#: :attr:`~integreat_cms.core.settings.API_EVENTS_MAX_TIME_SPAN_DAYS`.
+EVENT_OCCURRENCES_HORIZON_DAYS: Final[int] = 365
+
 #: The maximum duration of an event
 MAX_EVENT_DURATION: Final[int] = int(
     os.environ.get("INTEGREAT_CMS_MAX_EVENT_DURATION", 28)
@@ -175,6 +196,26 @@ DEFAULT_REQUEST_TIMEOUT: Final[int] = int(
     os.environ.get("INTEGREAT_CMS_DEFAULT_REQUEST_TIMEOUT", 10)
 )
 
+#: The maximum number of pooled keep-alive connections per host of external APIs
+#: (see :mod:`~integreat_cms.core.utils.http_client`)
+HTTP_POOL_MAXSIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_HTTP_POOL_MAXSIZE", 10)
+)
+
+#: The number of seconds idle connections to external APIs are kept open
+HTTP_KEEPALIVE_TIMEOUT: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_HTTP_KEEPALIVE_TIMEOUT", 30)
+)
+
+#: The number of retries of idempotent requests to external APIs which failed because of connection errors or
+#: temporarily unavailable servers
+HTTP_MAX_RETRIES: Final[int] = int(os.environ.get("INTEGREAT_CMS_HTTP_MAX_RETRIES", 2))
+
+#: The backoff factor in seconds between retries of requests to external APIs (doubled for each retry)
+HTTP_RETRY_BACKOFF: Final[float] = float(
+    os.environ.get("INTEGREAT_CMS_HTTP_RETRY_BACKOFF", 0.5)
+)
+
 #: Where release notes are stored
 RELEASE_NOTES_DIRS: Final[str] = os.path.join(BASE_DIR, "release_notes")
 
@@ -186,10 +227,46 @@ CUSTOM_LOCALE_PATH: Final[str] = os.environ.get(
 #: The number of regions that are available via the dropdown
 NUM_REGIONS_QUICK_ACCESS: Final[int] = 15
 
+#: Whether long-running operations are executed in a background thread of the process which creates them (see
+#: :mod:`~integreat_cms.cms.utils.background_job_utils`). If disabled, they are executed immediately and block the
+#: request (e.g. in tests).
 BACKGROUND_TASKS_ENABLED = bool(
     strtobool(os.environ.get("INTEGREAT_CMS_BACKGROUND_TASKS_ENABLED", "True"))
 )
 
+#: Whether background jobs are executed by separate worker processes of the job queue instead of a thread of the
+#: process which creates them. Only enable this if at least one worker is running (see the ``run_background_jobs``
+#: management command), otherwise the jobs are never executed. Failed jobs are only retried by the workers.
+BACKGROUND_JOB_QUEUE_ENABLED = bool(
+    strtobool(os.environ.get("INTEGREAT_CMS_BACKGROUND_JOB_QUEUE_ENABLED", "False"))
+)
+
+#: The number of attempts of background jobs before they are marked as failed
+BACKGROUND_JOB_MAX_ATTEMPTS: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_BACKGROUND_JOB_MAX_ATTEMPTS", 3)
+)
+
+#: The delay in seconds before a failed background job is retried (doubled after each further attempt)
+BACKGROUND_JOB_RETRY_DELAY: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_BACKGROUND_JOB_RETRY_DELAY", 60)
+)
+
+#: The time in seconds after which running background jobs are considered abandoned (e.g. because their worker was
+#: killed) and are executed again
+BACKGROUND_JOB_TIMEOUT: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_BACKGROUND_JOB_TIMEOUT", 60 * 60)
+)
+
+#: The interval in seconds in which idle workers of the job queue check for new background jobs
+BACKGROUND_JOB_POLL_INTERVAL: Final[float] = float(
+    os.environ.get("INTEGREAT_CMS_BACKGROUND_JOB_POLL_INTERVAL", 2)
+)
+
+#: The number of days after which finished background jobs are deleted
+BACKGROUND_JOB_RETENTION_DAYS: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_BACKGROUND_JOB_RETENTION_DAYS", 30)
+)
+
 ##############################################################
 # Firebase Push Notifications (Firebase Cloud Messaging FCM) #
 ##############################################################
@@ -222,6 +299,10 @@ assert (
     not 60 % FCM_SCHEDULE_INTERVAL_MINUTES
 ), "Interval must be <= 60 and a divisor of 60"
 
+#: The number of threads which send the messages of one push notification to FCM in parallel
+#: (see :meth:`~integreat_cms.firebase_api.firebase_api_client.FirebaseApiClient.send_all`)
+FCM_SEND_WORKERS: Final[int] = int(os.environ.get("INTEGREAT_CMS_FCM_SEND_WORKERS", 10))
+
 ###########
 # GVZ API #
 ###########
@@ -294,6 +375,16 @@ TEXTLAB_API_DEFAULT_BENCHMARK_ID: Final[int] = int(
     os.environ.get("INTEGREAT_CMS_TEXTLAB_API_DEFAULT_BENCHMARK_ID", 420)
 )
 
+#: The time in seconds after which cached HIX scores of texts expire
+TEXTLAB_API_HIX_CACHE_TIMEOUT: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_TEXTLAB_API_HIX_CACHE_TIMEOUT", 90 * 24 * 60 * 60)
+)
+
+#: The maximum number of cached HIX scores of texts
+TEXTLAB_API_HIX_CACHE_MAX_ENTRIES: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_TEXTLAB_API_HIX_CACHE_MAX_ENTRIES", 100_000)
+)
+
 #: The minimum HIX score required for machine translation
 HIX_REQUIRED_FOR_MT: Final[float] = float(
     os.environ.get("INTEGREAT_CMS_HIX_REQUIRED_FOR_MT", 15.0)
@@ -894,6 +985,12 @@ MT_SOFT_MARGIN_FRACTION: Final[float] = float(
 #: The actual number of words which are used as soft margin
 MT_SOFT_MARGIN: Final[int] = int(MT_SOFT_MARGIN_FRACTION * MT_CREDITS_FREE)
 
+#: Whether machine translations of text segments are stored and reused for identical segments
+#: (see :mod:`~integreat_cms.cms.utils.translation_memory_utils`)
+TRANSLATION_MEMORY_ENABLED: Final[bool] = bool(
+    strtobool(os.environ.get("INTEGREAT_CMS_TRANSLATION_MEMORY_ENABLED", "True"))
+)
+
 
 #################################
 # DeepL - AUTOMATIC TRANSLATION #
@@ -909,6 +1006,12 @@ DEEPL_AUTH_KEY: str | None = os.environ.get("INTEGREAT_CMS_DEEPL_AUTH_KEY")
 #: This is ``True`` if :attr:`~integreat_cms.core.settings.DEEPL_AUTH_KEY` is set, ``False`` otherwise.
 DEEPL_ENABLED: bool = bool(DEEPL_AUTH_KEY)
 
+#: The number of threads which send the batches of one bulk machine translation to DeepL in parallel
+#: (see :meth:`~integreat_cms.deepl_api.deepl_api_client.DeepLApiClient.translate_texts`)
+DEEPL_TRANSLATION_WORKERS: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_DEEPL_TRANSLATION_WORKERS", 4)
+)
+
 
 ############################################
 # Google Translate - AUTOMATIC TRANSLATION #
@@ -1087,10 +1190,18 @@ MEDIA_MAX_UPLOAD_SIZE: Final[int] = int(
 
 #: Configuration for caches (see :setting:`django:CACHES` and :doc:`django:topics/cache`).
 #: Use a ``LocMemCache`` for development and a ``RedisCache`` whenever available.
-CACHES: dict[str, dict[str, str | dict[str, str | bool]]] = {
+#: The HIX scores of texts are stored in a ``DatabaseCache`` to share them between all processes and keep them
+#: across restarts (see :func:`~integreat_cms.cms.views.utils.hix.lookup_hix_score`).
+CACHES: dict[str, dict[str, str | int | dict[str, str | int | bool]]] = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
     },
+    "hix_scores": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "cms_hix_score_cache",
+        "TIMEOUT": TEXTLAB_API_HIX_CACHE_TIMEOUT,
+        "OPTIONS": {"MAX_ENTRIES": TEXTLAB_API_HIX_CACHE_MAX_ENTRIES},
+    },
 }
 
 # Use RedisCache when activated
@@ -1125,6 +1236,38 @@ CACHEOPS: Final[dict[str, dict[str, str]]] = {
 #: Degrade gracefully on redis fail
 CACHEOPS_DEGRADE_ON_FAILURE: Final[bool] = True
 
+#: Whether serialized API responses should be stored as snapshots in the cache
+#: (see :mod:`~integreat_cms.cms.utils.api_snapshot_utils`).
+#: Enabled by default when the shared redis cache is available.
+API_SNAPSHOTS_ENABLED: Final[bool] = bool(
+    strtobool(os.environ.get("INTEGREAT_CMS_API_SNAPSHOTS_ENABLED", str(REDIS_CACHE)))
+)
+
+#: The timeout in seconds after which API snapshots are rebuilt even if they were not invalidated
+API_SNAPSHOTS_TIMEOUT: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_API_SNAPSHOTS_TIMEOUT", 24 * 60 * 60)
+)
+
+#: Whether the regions of the requests should be cached (see :mod:`~integreat_cms.cms.utils.region_cache_utils`).
+#: Enabled by default when the shared redis cache is available.
+REGION_CACHE_ENABLED: Final[bool] = bool(
+    strtobool(os.environ.get("INTEGREAT_CMS_REGION_CACHE_ENABLED", str(REDIS_CACHE)))
+)
+
+#: The timeout in seconds after which cached regions are reloaded even if they were not invalidated
+REGION_CACHE_TIMEOUT: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_REGION_CACHE_TIMEOUT", 24 * 60 * 60)
+)
+
+#: Whether the page tree indices of the regions should be cached (see
+#: :mod:`~integreat_cms.cms.utils.page_tree_index`). Enabled by default when the shared redis cache is available.
+#: Otherwise, each process would keep its own copy of all indices.
+PAGE_TREE_INDEX_CACHE_ENABLED: Final[bool] = bool(
+    strtobool(
+        os.environ.get("INTEGREAT_CMS_PAGE_TREE_INDEX_CACHE_ENABLED", str(REDIS_CACHE))
+    )
+)
+
 
 ##############
 # PAGINATION #
@@ -1239,6 +1382,41 @@ PDF_ROOT: Final[str] = os.environ.get(
 #: The URL path where PDF files are served for download
 PDF_URL: Final[str] = "/pdf/"
 
+#: The maximum number of PDF documents which are rendered at the same time by all processes of the CMS (see
+#: :func:`~integreat_cms.cms.utils.pdf_utils.acquire_pdf_rendering_slot`). Requests for further PDFs are answered with
+#: HTTP status 202. The limit is only global if a shared cache like Redis is used.
+PDF_RENDERING_SLOTS: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_PDF_RENDERING_SLOTS", 2)
+)
+
+#: The number of processes per web worker which render PDF documents in the background (see
+#: :func:`~integreat_cms.cms.utils.pdf_utils.get_pdf_rendering_pool`). If set to ``0``, PDFs are rendered synchronously
+#: in the web worker.
+PDF_RENDERING_WORKERS: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_PDF_RENDERING_WORKERS", 0)
+)
+
+#: The Python interpreter which is used to start the PDF rendering processes. This has to be set explicitly if the CMS
+#: is embedded into another executable (e.g. when running under mod_wsgi), because the processes are spawned with
+#: :attr:`sys.executable` otherwise.
+PDF_RENDERING_PYTHON: Final[str] = os.environ.get(
+    "INTEGREAT_CMS_PDF_RENDERING_PYTHON", sys.executable
+)
+
+#: The maximum time in seconds a request waits for a PDF document before it is answered with HTTP status 202
+PDF_RENDERING_WAIT_TIMEOUT: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_PDF_RENDERING_WAIT_TIMEOUT", 20)
+)
+
+#: The maximum time in seconds the rendering of a PDF document may take in the background processes before it is
+#: aborted (``0`` disables the limit)
+PDF_RENDERING_TIME_BUDGET: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_PDF_RENDERING_TIME_BUDGET", 300)
+)
+
+#: The maximum number of pages which can be exported into a single PDF document (``0`` disables the limit)
+PDF_MAX_PAGES: Final[int] = int(os.environ.get("INTEGREAT_CMS_PDF_MAX_PAGES", 1000))
+
 
 #######################
 # XLIFF SERIALIZATION #
@@ -4,4 +4,16 @@ This package contains signal handlers (see :doc:`django:topics/signals`).
 
 from __future__ import annotations
 
-from . import auth_signals, feedback_signals, hix_signals, organization_signals
+from . import (
+    api_snapshot_signals,
+    auth_signals,
+    event_occurrence_signals,
+    feedback_signals,
+    hix_signals,
+    latest_version_signals,
+    linkcheck_stats_signals,
+    organization_signals,
+    page_tree_index_signals,
+    region_cache_signals,
+    translation_coverage_signals,
+)
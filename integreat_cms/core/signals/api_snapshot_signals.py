@@ -0,0 +1,293 @@
+"""
+This module contains signal handlers which bump the content versions of
+:mod:`~integreat_cms.cms.utils.api_snapshot_utils` whenever the underlying content changes.
+This invalidates the API snapshots and the ETags of the affected endpoints.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from ...cms.models import (
+    Event,
+    EventTranslation,
+    LanguageTreeNode,
+    MediaFile,
+    OfferTemplate,
+    Organization,
+    Page,
+    PageTranslation,
+    POI,
+    POICategory,
+    POICategoryTranslation,
+    POITranslation,
+    PushNotification,
+    PushNotificationTranslation,
+    RecurrenceRule,
+    Region,
+)
+from ...cms.utils.api_snapshot_utils import invalidate_api_snapshots
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def invalidate_page_snapshots(page_id: int, region_id: int | None) -> None:
+    """
+    Invalidate the snapshots of the page's region and of all regions which mirror this page
+
+    :param page_id: The id of the changed page
+    :param region_id: The id of the page's region
+    """
+    region_ids = {region_id}
+    region_ids.update(
+        Page.objects.filter(mirrored_page_id=page_id).values_list(
+            "region_id", flat=True
+        )
+    )
+    for affected_region_id in region_ids:
+        invalidate_api_snapshots(affected_region_id, ["pages"])
+
+
+@receiver(post_save, sender=PageTranslation)
+@receiver(post_delete, sender=PageTranslation)
+def page_translation_snapshot_handler(instance: PageTranslation, **kwargs: Any) -> None:
+    r"""
+    Invalidate the API snapshots after a page translation was changed
+
+    :param instance: The page translation that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw"):
+        # When loading fixtures, the related page might not exist yet
+        invalidate_api_snapshots(None, ["pages"])
+        return
+    invalidate_page_snapshots(
+        instance.page_id,
+        Page.objects.filter(id=instance.page_id)
+        .values_list("region_id", flat=True)
+        .first(),
+    )
+
+
+@receiver(post_save, sender=Page)
+@receiver(post_delete, sender=Page)
+def page_snapshot_handler(instance: Page, **kwargs: Any) -> None:
+    r"""
+    Invalidate the API snapshots after a page was changed
+
+    :param instance: The page that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    invalidate_page_snapshots(instance.id, instance.region_id)
+
+
+@receiver(m2m_changed, sender=Page.embedded_offers.through)
+def embedded_offers_snapshot_handler(
+    instance: Page | OfferTemplate, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the API snapshots after the embedded offers of a page were changed
+
+    :param instance: The page or offer template whose relation got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("action") not in ["post_add", "post_remove", "post_clear"]:
+        return
+    if isinstance(instance, Page):
+        invalidate_page_snapshots(instance.id, instance.region_id)
+    else:
+        invalidate_api_snapshots(None, ["pages"])
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def event_snapshot_handler(instance: Event, **kwargs: Any) -> None:
+    r"""
+    Invalidate the API snapshots after an event was changed
+
+    :param instance: The event that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    invalidate_api_snapshots(instance.region_id, ["events"])
+
+
+@receiver(post_save, sender=EventTranslation)
+@receiver(post_delete, sender=EventTranslation)
+@receiver(post_save, sender=RecurrenceRule)
+# Use pre_delete because the reference of the event is already removed after the deletion
+@receiver(pre_delete, sender=RecurrenceRule)
+def event_related_snapshot_handler(**kwargs: Any) -> None:
+    r"""
+    Invalidate the API snapshots after an event translation or recurrence rule was changed
+
+    :param \**kwargs: The supplied keyword arguments
+    """
+    instance = kwargs["instance"]
+    if kwargs.get("raw"):
+        invalidate_api_snapshots(None, ["events"])
+        return
+    if isinstance(instance, EventTranslation):
+        events = Event.objects.filter(id=instance.event_id)
+    else:
+        events = Event.objects.filter(recurrence_rule=instance)
+    for region_id in events.values_list("region_id", flat=True):
+        invalidate_api_snapshots(region_id, ["events"])
+
+
+@receiver(post_save, sender=POI)
+@receiver(post_delete, sender=POI)
+def poi_snapshot_handler(instance: POI, **kwargs: Any) -> None:
+    r"""
+    Invalidate the API snapshots after a location was changed.
+    Locations are also contained in the events endpoint.
+
+    :param instance: The location that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    invalidate_api_snapshots(instance.region_id, ["locations", "events"])
+
+
+@receiver(post_save, sender=POITranslation)
+@receiver(post_delete, sender=POITranslation)
+def poi_translation_snapshot_handler(instance: POITranslation, **kwargs: Any) -> None:
+    r"""
+    Invalidate the API snapshots after a location translation was changed
+
+    :param instance: The location translation that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("raw"):
+        invalidate_api_snapshots(None, ["locations", "events"])
+        return
+    for region_id in POI.objects.filter(id=instance.poi_id).values_list(
+        "region_id", flat=True
+    ):
+        invalidate_api_snapshots(region_id, ["locations", "events"])
+
+
+@receiver(post_save, sender=POICategory)
+@receiver(post_delete, sender=POICategory)
+@receiver(post_save, sender=POICategoryTranslation)
+@receiver(post_delete, sender=POICategoryTranslation)
+def poi_category_snapshot_handler(**kwargs: Any) -> None:
+    r"""
+    Invalidate the API snapshots of all regions after a location category was changed, because location categories
+    are global
+
+    :param \**kwargs: The supplied keyword arguments
+    """
+    invalidate_api_snapshots(None, ["locations", "events"])
+
+
+@receiver(post_save, sender=PushNotification)
+# Use pre_delete because the relations to the regions are already removed after the deletion
+@receiver(pre_delete, sender=PushNotification)
+@receiver(post_save, sender=PushNotificationTranslation)
+@receiver(post_delete, sender=PushNotificationTranslation)
+def push_notification_snapshot_handler(**kwargs: Any) -> None:
+    r"""
+    Invalidate the API snapshots after a push notification was changed.
+    Push notifications can belong to multiple regions, so all of them have to be invalidated.
+
+    :param \**kwargs: The supplied keyword arguments
+    """
+    instance = kwargs["instance"]
+    if kwargs.get("raw"):
+        invalidate_api_snapshots(None, ["fcm"])
+        return
+    push_notification_id = (
+        instance.id
+        if isinstance(instance, PushNotification)
+        else instance.push_notification_id
+    )
+    for region_id in Region.objects.filter(
+        push_notifications__id=push_notification_id
+    ).values_list("id", flat=True):
+        invalidate_api_snapshots(region_id, ["fcm"])
+
+
+@receiver(m2m_changed, sender=PushNotification.regions.through)
+def push_notification_regions_snapshot_handler(
+    instance: PushNotification | Region, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the API snapshots after the regions of a push notification were changed
+
+    :param instance: The push notification or region whose relation got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("action") not in ["post_add", "post_remove", "pre_clear"]:
+        return
+    if isinstance(instance, Region):
+        invalidate_api_snapshots(instance.id, ["fcm"])
+    elif region_ids := kwargs.get("pk_set"):
+        for region_id in region_ids:
+            invalidate_api_snapshots(region_id, ["fcm"])
+    else:
+        for region_id in instance.regions.values_list("id", flat=True):
+            invalidate_api_snapshots(region_id, ["fcm"])
+
+
+@receiver(m2m_changed, sender=Region.offers.through)
+def region_offers_snapshot_handler(
+    instance: Region | OfferTemplate, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the API snapshots after the offers of a region were changed
+
+    :param instance: The region or offer template whose relation got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if kwargs.get("action") not in ["post_add", "post_remove", "post_clear"]:
+        return
+    if isinstance(instance, Region):
+        invalidate_api_snapshots(instance.id, ["offers"])
+    else:
+        invalidate_api_snapshots(None, ["offers"])
+
+
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+def region_snapshot_handler(instance: Region, **kwargs: Any) -> None:
+    r"""
+    Invalidate the API snapshots after a region was changed, e.g. because the slug is part of all urls
+
+    :param instance: The region that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    invalidate_api_snapshots(instance.id)
+
+
+@receiver(post_save, sender=LanguageTreeNode)
+@receiver(post_delete, sender=LanguageTreeNode)
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+@receiver(post_save, sender=MediaFile)
+@receiver(post_delete, sender=MediaFile)
+def region_content_snapshot_handler(
+    instance: LanguageTreeNode | Organization | MediaFile, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the API snapshots after an object which is referenced by the content of a region was changed
+
+    :param instance: The object that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    # Media files without region are global and can be used in all regions
+    invalidate_api_snapshots(instance.region_id)
+
+
+@receiver(post_save, sender=OfferTemplate)
+@receiver(post_delete, sender=OfferTemplate)
+def offer_template_snapshot_handler(**kwargs: Any) -> None:
+    r"""
+    Invalidate the API snapshots of all regions after an offer template was changed, because offer templates can be
+    embedded into pages of all regions
+
+    :param \**kwargs: The supplied keyword arguments
+    """
+    invalidate_api_snapshots(None, ["pages", "offers"])
@@ -0,0 +1,69 @@
+"""
+This module contains signal handlers which keep the materialized occurrences of
+:mod:`~integreat_cms.cms.utils.event_occurrence_utils` up to date whenever events or their recurrence rules change.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from ...cms.models import Event, RecurrenceRule
+from ...cms.utils.event_occurrence_utils import (
+    invalidate_event_occurrences,
+    rebuild_event_occurrences,
+)
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+@receiver(post_save, sender=Event)
+def event_occurrence_handler(instance: Event, raw: bool, **kwargs: Any) -> None:
+    r"""
+    Rebuild the occurrences of an event after it was saved
+
+    :param instance: The changed event
+    :param raw: Whether the instance was saved exactly as presented (e.g. when loading a fixture)
+    :param \**kwargs: The supplied keyword arguments
+    """
+    # The occurrences are materialized when they are requested after fixtures were loaded
+    if not raw:
+        rebuild_event_occurrences(instance)
+
+
+@receiver(post_save, sender=RecurrenceRule)
+def recurrence_rule_occurrence_handler(
+    instance: RecurrenceRule, raw: bool, **kwargs: Any
+) -> None:
+    r"""
+    Rebuild the occurrences of an event after its recurrence rule was saved.
+    New recurrence rules are saved before their event, in this case the occurrences are built when the event is saved.
+
+    :param instance: The changed recurrence rule
+    :param raw: Whether the instance was saved exactly as presented (e.g. when loading a fixture)
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if raw:
+        return
+    try:
+        event = instance.event
+    except Event.DoesNotExist:
+        return
+    event.recurrence_rule = instance
+    rebuild_event_occurrences(event)
+
+
+@receiver(pre_delete, sender=RecurrenceRule)
+def recurrence_rule_delete_occurrence_handler(
+    instance: RecurrenceRule, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the occurrences of an event before its recurrence rule is deleted
+
+    :param instance: The deleted recurrence rule
+    :param \**kwargs: The supplied keyword arguments
+    """
+    invalidate_event_occurrences(Event.objects.filter(recurrence_rule=instance))
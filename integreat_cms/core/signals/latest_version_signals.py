@@ -0,0 +1,74 @@
+"""
+This module contains signal handlers which keep the latest version markers of content translations
+(see :meth:`~integreat_cms.cms.models.abstract_content_translation.AbstractContentTranslation.update_latest_versions`)
+up to date in the cases which are not covered by
+:meth:`~integreat_cms.cms.models.abstract_content_translation.AbstractContentTranslation.save`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ...cms.models import (
+    EventTranslation,
+    ImprintPageTranslation,
+    PageTranslation,
+    POITranslation,
+)
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from ...cms.models.abstract_content_translation import AbstractContentTranslation
+
+
+def update_version_history(instance: AbstractContentTranslation) -> None:
+    """
+    Update the latest version markers of all versions of the given translation
+
+    :param instance: The content translation
+    """
+    foreign_field = f"{instance.foreign_field()}_id"
+    instance.update_latest_versions(
+        **{foreign_field: getattr(instance, foreign_field)},
+        language_id=instance.language_id,
+    )
+
+
+@receiver(post_save, sender=EventTranslation)
+@receiver(post_save, sender=ImprintPageTranslation)
+@receiver(post_save, sender=PageTranslation)
+@receiver(post_save, sender=POITranslation)
+def raw_content_translation_save_handler(
+    instance: AbstractContentTranslation, raw: bool, **kwargs: Any
+) -> None:
+    r"""
+    Update the latest version markers after a content translation was loaded from a fixture,
+    because ``loaddata`` bypasses the model's ``save()`` method
+
+    :param instance: The saved content translation
+    :param raw: Whether the instance was saved exactly as presented (e.g. when loading a fixture)
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if raw:
+        update_version_history(instance)
+
+
+@receiver(post_delete, sender=EventTranslation)
+@receiver(post_delete, sender=ImprintPageTranslation)
+@receiver(post_delete, sender=PageTranslation)
+@receiver(post_delete, sender=POITranslation)
+def content_translation_delete_handler(
+    instance: AbstractContentTranslation, **kwargs: Any
+) -> None:
+    r"""
+    Mark the previous versions as latest after the latest version of a content translation was deleted
+
+    :param instance: The deleted content translation
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if instance.is_latest or instance.is_latest_public:
+        update_version_history(instance)
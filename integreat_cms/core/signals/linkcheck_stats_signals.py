@@ -0,0 +1,103 @@
+"""
+This module contains signal handlers which keep the linkcheck statistics of
+:mod:`~integreat_cms.cms.utils.linkcheck_utils` up to date whenever the status of a url changes or links are added,
+changed or removed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from linkcheck.models import Link, Url
+
+from ...cms.models import (
+    EventTranslation,
+    ImprintPageTranslation,
+    PageTranslation,
+    POITranslation,
+)
+from ...cms.utils.linkcheck_utils import update_linkcheck_stats, update_url_category
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from ...cms.models.abstract_content_translation import AbstractContentTranslation
+
+
+@receiver(post_save, sender=Url)
+def url_stats_handler(instance: Url, raw: bool, **kwargs: Any) -> None:
+    r"""
+    Update the category of a url in the linkcheck statistics after it was (re-)checked
+
+    :param instance: The saved url
+    :param raw: Whether the instance was saved exactly as presented (e.g. when loading a fixture)
+    :param \**kwargs: The supplied keyword arguments
+    """
+    # The statistics are built from scratch when they are requested after fixtures were loaded
+    if not raw:
+        update_url_category(instance)
+
+
+@receiver(pre_delete, sender=Url)
+def url_delete_stats_handler(instance: Url, **kwargs: Any) -> None:
+    r"""
+    Remove a url from the linkcheck statistics before it is deleted together with its stored categories
+
+    :param instance: The deleted url
+    :param \**kwargs: The supplied keyword arguments
+    """
+    update_linkcheck_stats([instance.id], deleted=True)
+
+
+@receiver(post_save, sender=Link)
+@receiver(post_delete, sender=Link)
+def link_stats_handler(instance: Link, raw: bool = False, **kwargs: Any) -> None:
+    r"""
+    Update the category of the url of a link in the linkcheck statistics after the link was changed
+
+    :param instance: The changed link
+    :param raw: Whether the instance was saved exactly as presented (e.g. when loading a fixture)
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not raw:
+        update_linkcheck_stats([instance.url_id])
+
+
+@receiver(post_save, sender=PageTranslation)
+@receiver(post_save, sender=ImprintPageTranslation)
+@receiver(post_save, sender=EventTranslation)
+@receiver(post_save, sender=POITranslation)
+def translation_stats_handler(
+    instance: AbstractContentTranslation, raw: bool, **kwargs: Any
+) -> None:
+    r"""
+    Update the categories of the urls of the previous versions of a translation after a new version was saved.
+    The previous versions are not the latest versions anymore, so their links don't count for the statistics.
+
+    :param instance: The saved translation
+    :param raw: Whether the instance was saved exactly as presented (e.g. when loading a fixture)
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if raw or instance.version <= 1:
+        return
+    url_ids = set(
+        Link.objects.filter(
+            content_type=ContentType.objects.get_for_model(instance),
+            object_id__in=type(instance)
+            .objects.filter(
+                **{
+                    f"{instance.foreign_field()}_id": getattr(
+                        instance, f"{instance.foreign_field()}_id"
+                    ),
+                    "language_id": instance.language_id,
+                }
+            )
+            .exclude(id=instance.id)
+            .values("id"),
+        ).values_list("url_id", flat=True)
+    )
+    if url_ids:
+        update_linkcheck_stats(url_ids)
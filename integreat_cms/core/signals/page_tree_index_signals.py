@@ -0,0 +1,29 @@
+"""
+This module contains signal handlers which invalidate the page tree indices of
+:mod:`~integreat_cms.cms.utils.page_tree_index` whenever a page is created, deleted, moved or archived.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ...cms.models import Page
+from ...cms.utils.page_tree_index import invalidate_page_tree_index
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+@receiver(post_save, sender=Page)
+@receiver(post_delete, sender=Page)
+def page_tree_index_handler(instance: Page, **kwargs: Any) -> None:
+    r"""
+    Invalidate the page tree index of the page's region after a page was changed
+
+    :param instance: The page that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    invalidate_page_tree_index(instance.region_id)
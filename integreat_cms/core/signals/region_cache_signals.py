@@ -0,0 +1,32 @@
+"""
+This module contains signal handlers which invalidate the cached regions of
+:mod:`~integreat_cms.cms.utils.region_cache_utils` whenever a region or its language tree changes.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ...cms.models import Language, LanguageTreeNode, Region
+from ...cms.utils.region_cache_utils import invalidate_region_cache
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+@receiver(post_save, sender=LanguageTreeNode)
+@receiver(post_delete, sender=LanguageTreeNode)
+@receiver(post_save, sender=Language)
+@receiver(post_delete, sender=Language)
+def region_cache_handler(**kwargs: Any) -> None:
+    r"""
+    Invalidate the cached regions after a region, language tree node or language was changed
+
+    :param \**kwargs: The supplied keyword arguments
+    """
+    invalidate_region_cache()
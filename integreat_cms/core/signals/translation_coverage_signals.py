@@ -0,0 +1,74 @@
+"""
+This module contains signal handlers which keep the translation coverage statistics of
+:mod:`~integreat_cms.cms.utils.translation_coverage_utils` up to date whenever page translations or the language tree
+of a region change.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ...cms.models import LanguageTreeNode, Page, PageTranslation
+from ...cms.utils.translation_coverage_utils import (
+    invalidate_translation_coverage,
+    update_translation_coverage,
+)
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.db.models import Model
+
+
+@receiver(post_save, sender=PageTranslation)
+def page_translation_coverage_handler(
+    instance: PageTranslation, raw: bool, **kwargs: Any
+) -> None:
+    r"""
+    Update the translation coverage of the page after one of its translations was saved
+
+    :param instance: The changed page translation
+    :param raw: Whether the instance was saved exactly as presented (e.g. when loading a fixture)
+    :param \**kwargs: The supplied keyword arguments
+    """
+    # The statistics are built from scratch when they are requested after fixtures were loaded
+    if not raw:
+        update_translation_coverage(instance.page.region, [instance.page_id])
+
+
+@receiver(post_delete, sender=PageTranslation)
+def page_translation_delete_coverage_handler(
+    instance: PageTranslation, origin: Model | QuerySet, **kwargs: Any
+) -> None:
+    r"""
+    Update the translation coverage of the page after one of its translations was deleted.
+    If the translation was deleted together with its page or its language, the statistics of the region are
+    invalidated anyway, so they are not updated for each of the deleted translations.
+
+    :param instance: The deleted page translation
+    :param origin: The model instance or queryset whose deletion caused the deletion of the translation
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if isinstance(origin, PageTranslation) or (
+        isinstance(origin, QuerySet) and origin.model is PageTranslation
+    ):
+        update_translation_coverage(instance.page.region, [instance.page_id])
+
+
+@receiver(post_delete, sender=Page)
+@receiver(post_save, sender=LanguageTreeNode)
+@receiver(post_delete, sender=LanguageTreeNode)
+def region_translation_coverage_handler(
+    instance: Page | LanguageTreeNode, **kwargs: Any
+) -> None:
+    r"""
+    Invalidate the translation coverage of a region after one of its pages was deleted or its language tree changed
+
+    :param instance: The deleted page or the changed language tree node
+    :param \**kwargs: The supplied keyword arguments
+    """
+    invalidate_translation_coverage(instance.region_id)
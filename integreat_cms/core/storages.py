@@ -8,15 +8,34 @@ import logging
 from typing import TYPE_CHECKING
 
 from django.conf import settings
+from django.contrib.messages.storage.base import BaseStorage, Message
 from django.contrib.messages.storage.fallback import FallbackStorage
 from django.utils.translation import override
 
 if TYPE_CHECKING:
+    from typing import Any
+
+    from django.http import HttpRequest
     from django.utils.functional import Promise
 
+    from ..cms.models import BackgroundJob
+
 logger = logging.getLogger(__name__)
 
 
+def log_message(level: int, message: str | Promise) -> None:
+    """
+    Log a message of the messages framework if :attr:`~integreat_cms.core.settings.MESSAGE_LOGGING_ENABLED` is set
+
+    :param level: The level of the message, see :ref:`message-level-constants`
+    :param message: The message
+    """
+    if settings.MESSAGE_LOGGING_ENABLED:
+        # Show logs in English if message was provided as lazy translated string
+        with override("en"):
+            logger.log(level, message)
+
+
 class MessageLoggerStorage(FallbackStorage):
     """
     Custom messages storage to add debug logging for all messages
@@ -32,8 +51,64 @@ class MessageLoggerStorage(FallbackStorage):
         :param message: The message
         :param extra_tags: Additional level tags
         """
-        if settings.MESSAGE_LOGGING_ENABLED:
-            # Show logs in English if message was provided as lazy translated string
-            with override("en"):
-                logger.log(level, message)
+        log_message(level, message)
         super().add(level, message, extra_tags)
+
+
+class BackgroundJobMessageStorage(BaseStorage):
+    """
+    Messages storage of the requests which are simulated for background jobs (see
+    :attr:`~integreat_cms.cms.utils.background_job_utils.JobContext.request`).
+    The messages are logged like in :class:`MessageLoggerStorage` and collected in the job, so they can be shown to the
+    user via the status endpoint of the job.
+    """
+
+    def __init__(self, request: HttpRequest, job: BackgroundJob) -> None:
+        """
+        Initialize the storage
+
+        :param request: The simulated request
+        :param job: The background job
+        """
+        super().__init__(request)
+        self.job = job
+
+    def _get(self, *args: Any, **kwargs: Any) -> tuple[list[Message], bool]:
+        r"""
+        The messages of background jobs are never retrieved from this storage
+
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied keyword arguments
+        :return: No messages
+        """
+        return [], True
+
+    def _store(
+        self, messages: list[Message], response: Any, *args: Any, **kwargs: Any
+    ) -> list[Message]:
+        r"""
+        The messages are already stored in the job when they are added
+
+        :param messages: The messages
+        :param response: The response (always ``None`` for background jobs)
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied keyword arguments
+        :return: No unstored messages
+        """
+        return []
+
+    def add(self, level: int, message: str | Promise, extra_tags: str = "") -> None:
+        """
+        Add a new message to the job
+
+        :param level: The level of the message, see :ref:`message-level-constants`
+        :param message: The message
+        :param extra_tags: Additional level tags
+        """
+        log_message(level, message)
+        if not message or level < self.level:
+            return
+        stored_message = Message(level, message, extra_tags=extra_tags)
+        self.job.messages.append(
+            {"level": stored_message.level_tag, "message": str(stored_message.message)}
+        )
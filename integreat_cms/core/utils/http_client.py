@@ -0,0 +1,407 @@
+"""
+This module contains the shared HTTP layer of all clients of external APIs.
+
+Instead of opening a new connection (including a new TLS handshake) and a new event loop for every request, all
+requests of a process share connection pools per host which keep idle connections open for reuse:
+
+* Synchronous clients use :func:`get_session`, which returns a :class:`requests.Session` with a pooling transport
+  adapter which applies the default timeout and retries idempotent requests with an exponential backoff.
+* Asynchronous clients run their coroutines with :func:`run_async` on a persistent event loop in a background thread
+  and use :func:`get_async_session`, which returns a long-lived :class:`aiohttp.ClientSession` of this loop.
+  :func:`async_request` performs a request with the same retry policy as the synchronous session.
+
+The number of requests, the number of failed requests and the total duration per host are counted for both variants
+and can be retrieved with :func:`get_http_metrics`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+import aiohttp
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Coroutine
+    from types import SimpleNamespace
+    from typing import Any, Final, TypeVar
+
+    from requests.models import PreparedRequest, Response
+
+    T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+#: The HTTP methods which are retried if the server is temporarily unavailable
+IDEMPOTENT_METHODS: Final[frozenset[str]] = frozenset(
+    ["DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"]
+)
+
+#: The HTTP status codes which indicate a temporarily unavailable server
+RETRY_STATUS_CODES: Final[frozenset[int]] = frozenset([502, 503, 504])
+
+#: The number of seconds resolved host names are cached by the asynchronous session
+DNS_CACHE_TIMEOUT: Final[int] = 300
+
+#: The maximum time in seconds the event loop waits for the session to close on shutdown
+SHUTDOWN_TIMEOUT: Final[int] = 5
+
+
+class HttpMetrics:
+    """
+    The request metrics of one host
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the counters
+        """
+        #: The number of sent requests (including retries)
+        self.requests = 0
+        #: The number of requests which failed with a connection error, a timeout or a server error
+        self.errors = 0
+        #: The total duration of all requests in seconds
+        self.duration = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """
+        Get the metrics as dictionary
+
+        :return: The metrics
+        """
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "duration": self.duration,
+        }
+
+
+#: The lock which protects the metrics and the sessions of this module
+lock = threading.Lock()
+
+#: The request metrics per host of the current process
+http_metrics: defaultdict[str, HttpMetrics] = defaultdict(HttpMetrics)
+
+
+def record_request(url: str, duration: float, failed: bool, attempts: int = 1) -> None:
+    """
+    Record a request in the metrics of its host
+
+    :param url: The url of the request
+    :param duration: The duration of the request in seconds
+    :param failed: Whether the request failed
+    :param attempts: The number of sent requests including retries
+    """
+    host = urlparse(str(url)).netloc
+    with lock:
+        metrics = http_metrics[host]
+        metrics.requests += attempts
+        metrics.errors += failed
+        metrics.duration += duration
+
+
+def get_http_metrics() -> dict[str, dict[str, int | float]]:
+    """
+    Get the request metrics of all hosts which were requested by the current process
+
+    :return: A dict which maps hosts to their metrics (see :meth:`HttpMetrics.as_dict`)
+    """
+    with lock:
+        return {host: metrics.as_dict() for host, metrics in http_metrics.items()}
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    A transport adapter which keeps a pool of connections per host, applies the default timeout to all requests
+    without explicit timeout, retries idempotent requests and records the metrics of all requests.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the adapter with the configured pool size and retry policy
+        """
+        super().__init__(
+            pool_connections=settings.HTTP_POOL_MAXSIZE,
+            pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=settings.HTTP_MAX_RETRIES,
+                backoff_factor=settings.HTTP_RETRY_BACKOFF,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=IDEMPOTENT_METHODS,
+                raise_on_status=False,
+            ),
+        )
+
+    # pylint: disable=arguments-differ
+    def send(
+        self, request: PreparedRequest, timeout: Any = None, **kwargs: Any
+    ) -> Response:
+        r"""
+        Send a request with the default timeout and record it in the metrics
+
+        :param request: The prepared request
+        :param timeout: The timeout of the request (defaults to :attr:`~integreat_cms.core.settings.DEFAULT_REQUEST_TIMEOUT`)
+        :param \**kwargs: The remaining arguments of :meth:`requests.adapters.HTTPAdapter.send`
+        :return: The response
+        """
+        if timeout is None:
+            timeout = settings.DEFAULT_REQUEST_TIMEOUT
+        start = time.perf_counter()
+        try:
+            response = super().send(request, timeout=timeout, **kwargs)
+        except requests.RequestException:
+            record_request(request.url, time.perf_counter() - start, True)
+            raise
+        # The retries of urllib3 happen within this call, so their number has to be taken from the response
+        retries = getattr(response.raw, "retries", None)
+        record_request(
+            request.url,
+            time.perf_counter() - start,
+            response.status_code >= 500,
+            1 + len(retries.history) if retries else 1,
+        )
+        return response
+
+
+#: The session of the current process and the id of the process it was created in
+session_of_process: tuple[int, requests.Session] | None = None
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared synchronous HTTP session of the current process.
+    The session is created lazily and again after the process was forked, because connections must not be shared
+    between processes.
+
+    :return: The shared session
+    """
+    global session_of_process  # pylint: disable=global-statement
+    with lock:
+        if session_of_process and session_of_process[0] == os.getpid():
+            return session_of_process[1]
+        session = requests.Session()
+        adapter = PooledHTTPAdapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session_of_process = (os.getpid(), session)
+        return session
+
+
+class AsyncHttpRuntime:
+    """
+    A persistent event loop in a background thread with a long-lived :class:`aiohttp.ClientSession`.
+    Synchronous code can run coroutines on this loop with :meth:`run`, so the loop and the connections are reused
+    across calls instead of creating a new event loop and session for every call.
+    The loop is started lazily (and again after the process was forked).
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the runtime
+        """
+        self.lock = threading.Lock()
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.thread: threading.Thread | None = None
+        self.session: aiohttp.ClientSession | None = None
+        self.pid: int | None = None
+        atexit.register(self.shutdown)
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the event loop if it is not running in the current process yet
+
+        :return: The event loop of the current process
+        """
+        with self.lock:
+            if self.pid == os.getpid() and self.loop:
+                return self.loop
+            # Threads are not inherited when the process is forked, so the loop has to be recreated
+            self.loop = asyncio.new_event_loop()
+            self.session = None
+            self.thread = threading.Thread(
+                target=self.loop.run_forever, name="async-http-runtime", daemon=True
+            )
+            self.thread.start()
+            self.pid = os.getpid()
+            return self.loop
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the event loop and wait for its result
+
+        :param coroutine: The coroutine
+        :raises RuntimeError: When called from within the event loop of the runtime
+        :return: The result of the coroutine
+        """
+        loop = self.get_loop()
+        if threading.current_thread() is self.thread:
+            coroutine.close()
+            raise RuntimeError(
+                "Coroutines cannot be run synchronously from within the async HTTP runtime"
+            )
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the session of the event loop. This has to be called from a coroutine running on the event loop.
+
+        :return: The shared asynchronous session
+        """
+        if self.session is None or self.session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(on_request_start)
+            trace_config.on_request_end.append(on_request_end)
+            trace_config.on_request_exception.append(on_request_exception)
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=settings.HTTP_POOL_MAXSIZE,
+                    keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=DNS_CACHE_TIMEOUT,
+                ),
+                timeout=aiohttp.ClientTimeout(total=settings.DEFAULT_REQUEST_TIMEOUT),
+                trace_configs=[trace_config],
+            )
+        return self.session
+
+    def shutdown(self) -> None:
+        """
+        Close the session and stop the event loop. This is called automatically when the process exits.
+        """
+        with self.lock:
+            if self.pid != os.getpid() or not self.loop:
+                return
+            loop, session, thread = self.loop, self.session, self.thread
+            self.pid, self.loop, self.session, self.thread = None, None, None, None
+        if session and not session.closed:
+            try:
+                asyncio.run_coroutine_threadsafe(session.close(), loop).result(
+                    SHUTDOWN_TIMEOUT
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("Async HTTP session could not be closed: %r", e)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread:
+            thread.join(SHUTDOWN_TIMEOUT)
+
+
+async def on_request_start(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceRequestStartParams,
+) -> None:
+    """
+    Remember the start time of an asynchronous request
+
+    :param session: The session of the request
+    :param context: The trace context of the request
+    :param params: The parameters of the request
+    """
+    context.start = time.perf_counter()
+
+
+async def on_request_end(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceRequestEndParams,
+) -> None:
+    """
+    Record a finished asynchronous request in the metrics
+
+    :param session: The session of the request
+    :param context: The trace context of the request
+    :param params: The parameters of the request
+    """
+    record_request(
+        params.url, time.perf_counter() - context.start, params.response.status >= 500
+    )
+
+
+async def on_request_exception(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceRequestExceptionParams,
+) -> None:
+    """
+    Record a failed asynchronous request in the metrics
+
+    :param session: The session of the request
+    :param context: The trace context of the request
+    :param params: The parameters of the request
+    """
+    record_request(params.url, time.perf_counter() - context.start, True)
+
+
+#: The async HTTP runtime of the current process
+async_http_runtime = AsyncHttpRuntime()
+
+
+def run_async(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the persistent event loop of the current process and wait for its result
+    (see :meth:`AsyncHttpRuntime.run`)
+
+    :param coroutine: The coroutine
+    :return: The result of the coroutine
+    """
+    return async_http_runtime.run(coroutine)
+
+
+def get_async_session() -> aiohttp.ClientSession:
+    """
+    Get the shared asynchronous HTTP session of the current process.
+    This has to be called from a coroutine which was started with :func:`run_async`.
+
+    :return: The shared session
+    """
+    return async_http_runtime.get_session()
+
+
+@asynccontextmanager
+async def async_request(
+    session: aiohttp.ClientSession, method: str, url: str, **kwargs: Any
+) -> AsyncIterator[aiohttp.ClientResponse]:
+    r"""
+    Perform an asynchronous request with the same retry policy as the synchronous session:
+    Requests which could not connect to the server are always retried, requests which were answered with a status
+    code of :attr:`RETRY_STATUS_CODES` only if the method is idempotent.
+
+    :param session: The session which is used for the request (usually :func:`get_async_session`)
+    :param method: The HTTP method
+    :param url: The url
+    :param \**kwargs: The remaining arguments of :meth:`aiohttp.ClientSession.request`
+    :return: The response
+    """
+    retries = settings.HTTP_MAX_RETRIES
+    for attempt in range(retries + 1):
+        try:
+            response = await session.request(method, url, **kwargs)
+        except aiohttp.ClientConnectorError as e:
+            if attempt == retries:
+                raise
+            logger.debug("Retrying %s %s after connection error: %s", method, url, e)
+        else:
+            if (
+                attempt == retries
+                or response.status not in RETRY_STATUS_CODES
+                or method.upper() not in IDEMPOTENT_METHODS
+            ):
+                break
+            logger.debug("Retrying %s %s after status %s", method, url, response.status)
+            response.release()
+        await asyncio.sleep(settings.HTTP_RETRY_BACKOFF * 2**attempt)
+    try:
+        yield response
+    finally:
+        response.release()
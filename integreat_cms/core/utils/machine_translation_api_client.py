@@ -9,10 +9,16 @@ from abc import ABC, abstractmethod
 from html import unescape
 from typing import TYPE_CHECKING
 
+from django.apps import apps
 from django.conf import settings
 from django.utils.html import strip_tags
+from django.utils.module_loading import import_string
+
+from ...cms.utils.background_job_utils import background_task
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from django.db.models.query import QuerySet
     from django.forms.models import ModelFormMetaclass
     from django.http import HttpRequest
@@ -26,6 +32,7 @@ if TYPE_CHECKING:
         POITranslation,
         Region,
     )
+    from ...cms.utils.background_job_utils import JobContext
 
 logger = logging.getLogger(__name__)
 
@@ -93,22 +100,41 @@ class MachineTranslationApiClient(ABC):
             getattr(source_translation, attr, None)
             for attr in self.translatable_attributes
         ]
-        content_to_translate = [
-            unescape(strip_tags(attr)) for attr in attributes if attr
-        ]
+        word_count = self.count_words(attr for attr in attributes if attr)
+        return (self.exceeds_budget(region, word_count), word_count)
+
+    @staticmethod
+    def count_words(texts: Iterable[str]) -> int:
+        """
+        Count the words of the given texts as they are billed against the budget of a region
 
-        content_to_translate_str = " ".join(content_to_translate)
+        :param texts: The (HTML) texts to be translated
+        :return: The total word count
+        """
+        content_to_translate_str = " ".join(
+            unescape(strip_tags(text)) for text in texts
+        )
         for char in "-;:,;!?\n":
             content_to_translate_str = content_to_translate_str.replace(char, " ")
-        word_count = len(content_to_translate_str.split())
+        return len(content_to_translate_str.split())
+
+    @staticmethod
+    def exceeds_budget(region: Region, word_count: int, refresh: bool = True) -> bool:
+        """
+        Check if translating the given number of words would exceed the region's word limit
 
+        :param region: region for which to check usage
+        :param word_count: The number of words to be translated
+        :param refresh: Whether the region should be reloaded from the database first. Pass ``False`` if the region
+                        is already locked and its usage is tracked by the caller.
+        :return: Whether the translation would exceed the limit
+        """
         # Check if translation would exceed MT usage limit
-        region.refresh_from_db()
+        if refresh:
+            region.refresh_from_db()
         # Allow up to MT_SOFT_MARGIN more words than the actual limit
         word_count_leeway = max(1, word_count - settings.MT_SOFT_MARGIN)
-        translation_exceeds_limit = region.mt_budget_remaining < word_count_leeway
-
-        return (translation_exceeds_limit, word_count)
+        return region.mt_budget_remaining < word_count_leeway
 
     def __str__(self) -> str:
         """
@@ -122,3 +148,45 @@ class MachineTranslationApiClient(ABC):
         """
         class_name = type(self).__name__
         return f"<{class_name} (request: {self.request!r}, region: {self.region!r}, form_class: {self.form_class})>"
+
+
+@background_task
+def translate_content_objects(
+    context: JobContext,
+    model_label: str,
+    form_class: str,
+    object_ids: list[int],
+    language_slug: str,
+) -> None:
+    """
+    Translate multiple content objects with the machine translation provider of the target language.
+    This is run as a background job, so bulk translations do not block the request.
+
+    :param context: The context of the background job
+    :param model_label: The label of the content model (e.g. ``cms.Page``)
+    :param form_class: The import path of the :class:`~integreat_cms.cms.forms.custom_content_model_form.CustomContentModelForm`
+                       subclass of the content type
+    :param object_ids: The ids of the content objects
+    :param language_slug: The target language slug
+    """
+    region = context.request.region
+    language_node = region.language_node_by_slug.get(language_slug)
+    if not language_node or not language_node.mt_provider:
+        logger.warning(
+            "Machine translations into %r are not available in %r anymore",
+            language_slug,
+            region,
+        )
+        return
+    model = apps.get_model(model_label)
+    queryset = model.objects.filter(
+        region=region, id__in=object_ids
+    ).prefetch_translations()
+    # The translations might have been updated since the job was enqueued
+    to_translate = language_node.mt_provider.is_needed(region, queryset, language_node)
+    if not to_translate:
+        return
+    api_client = language_node.mt_provider.api_client(
+        context.request, import_string(form_class)
+    )
+    api_client.translate_queryset(to_translate, language_slug)
@@ -0,0 +1,93 @@
+"""
+This module contains a streaming variant of :class:`~django.http.JsonResponse` for large JSON arrays.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Any, Final
+    from zoneinfo import ZoneInfo
+
+#: The minimal size of the chunks which are passed to the web server
+CHUNK_SIZE: Final[int] = 64 * 1024
+
+
+def iter_json_array(
+    items: Iterable[Any],
+    encoder: type[json.JSONEncoder] = DjangoJSONEncoder,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Encode the given items as JSON array while they are produced.
+    The concatenated output is identical to ``json.dumps(list(items), cls=encoder)``.
+
+    :param items: The JSON serializable items (e.g. a generator)
+    :param encoder: The JSON encoder class
+    :param chunk_size: The minimal number of characters per yielded chunk
+    :return: An iterator over the chunks of the encoded array
+    """
+    chunk = ["["]
+    chunk_length = 1
+    separator = ""
+    for item in items:
+        encoded_item = separator + json.dumps(item, cls=encoder)
+        separator = ", "
+        chunk.append(encoded_item)
+        chunk_length += len(encoded_item)
+        if chunk_length >= chunk_size:
+            yield "".join(chunk)
+            chunk = []
+            chunk_length = 0
+    chunk.append("]")
+    yield "".join(chunk)
+
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    """
+    A streaming HTTP response which encodes a JSON array while its items are produced.
+    In contrast to :class:`~django.http.JsonResponse`, the full result never has to be kept in memory and the client
+    receives the first bytes before the last item is serialized. The body is identical to the one of
+    ``JsonResponse(list(items), safe=False)``.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Any],
+        encoder: type[json.JSONEncoder] = DjangoJSONEncoder,
+        **kwargs: Any,
+    ) -> None:
+        r"""
+        Initialize the streaming response
+
+        :param items: The JSON serializable items of the array
+        :param encoder: The JSON encoder class
+        :param \**kwargs: The supplied keyword arguments
+        """
+        kwargs.setdefault("content_type", "application/json")
+        # The items are produced after the view returned, so make sure they are produced in the current time zone
+        super().__init__(
+            self.override_timezone(
+                iter_json_array(items, encoder), timezone.get_current_timezone()
+            ),
+            **kwargs,
+        )
+
+    @staticmethod
+    def override_timezone(chunks: Iterator[str], tz: ZoneInfo) -> Iterator[str]:
+        """
+        Produce the chunks while the given time zone is active
+
+        :param chunks: The chunks of the response
+        :param tz: The time zone
+        :return: An iterator over the chunks
+        """
+        with timezone.override(tz):
+            yield from chunks
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from html import unescape
 from typing import TYPE_CHECKING
 
@@ -14,11 +16,17 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
 
 from ..cms.utils.stringify_list import iter_to_string
+from ..cms.utils.translation_memory_utils import (
+    get_segment_hash,
+    TranslationMemory,
+)
 from ..core.utils.machine_translation_api_client import MachineTranslationApiClient
 from ..core.utils.machine_translation_provider import MachineTranslationProvider
 from ..textlab_api.utils import check_hix_score
 
 if TYPE_CHECKING:
+    from typing import Final
+
     from django.forms.models import ModelFormMetaclass
     from django.http import HttpRequest
 
@@ -26,9 +34,30 @@ if TYPE_CHECKING:
     from integreat_cms.cms.models.languages.language import Language
     from integreat_cms.cms.models.pages.page import Page
     from integreat_cms.cms.models.pois.poi import POI
+    from integreat_cms.cms.models.regions.region import Region
 
 logger = logging.getLogger(__name__)
 
+#: The maximum number of texts which DeepL accepts in one request
+MAX_TEXTS_PER_REQUEST: Final[int] = 50
+
+#: The maximum total size in bytes of the texts in one request (DeepL accepts 128 KiB per request including the
+#: other parameters, so some headroom is left)
+MAX_REQUEST_SIZE: Final[int] = 120 * 1024
+
+
+@lru_cache
+def get_translator(auth_key: str, server_url: str | None) -> deepl.Translator:
+    """
+    Get the DeepL translator for the given credentials. The translator is shared by all clients of the process, so
+    the connections of its session are kept open between requests instead of creating a new session per client.
+
+    :param auth_key: The authentication key of the DeepL API
+    :param server_url: The url of the DeepL API
+    :return: The translator
+    """
+    return deepl.Translator(auth_key=auth_key, server_url=server_url)
+
 
 class DeepLApiClient(MachineTranslationApiClient):
     """
@@ -52,8 +81,8 @@ class DeepLApiClient(MachineTranslationApiClient):
             )
         if not settings.DEEPL_ENABLED:
             raise RuntimeError("DeepL is disabled globally.")
-        self.translator = deepl.Translator(
-            auth_key=settings.DEEPL_AUTH_KEY, server_url=settings.DEEPL_API_URL
+        self.translator = get_translator(
+            settings.DEEPL_AUTH_KEY, settings.DEEPL_API_URL
         )
 
     @staticmethod
@@ -70,98 +99,212 @@ class DeepLApiClient(MachineTranslationApiClient):
                 return code
         return ""
 
+    def translate_texts(
+        self, texts: list[str], source_language: str, target_language: str
+    ) -> list[str]:
+        """
+        Translate multiple texts with as few requests as possible. The texts are split into batches which respect the
+        limits of the DeepL API (see :attr:`~integreat_cms.deepl_api.deepl_api_client.MAX_TEXTS_PER_REQUEST` and
+        :attr:`~integreat_cms.deepl_api.deepl_api_client.MAX_REQUEST_SIZE`), and the batches are sent in parallel by up to :attr:`~integreat_cms.core.settings.DEEPL_TRANSLATION_WORKERS` threads.
+
+        :param texts: The (HTML) texts to translate
+        :param source_language: The source language code
+        :param target_language: The target language code
+        :raises ~deepl.exceptions.DeepLException: If any of the requests fails
+        :return: The translated texts in the same order
+        """
+        batches: list[list[str]] = []
+        batch_size = 0
+        for text in texts:
+            # data has to be unescaped for DeepL to recognize Umlaute
+            text = unescape(text)
+            text_size = len(text.encode("utf-8"))
+            if not batches or (
+                len(batches[-1]) >= MAX_TEXTS_PER_REQUEST
+                or batch_size + text_size > MAX_REQUEST_SIZE
+            ):
+                batches.append([])
+                batch_size = 0
+            batches[-1].append(text)
+            batch_size += text_size
+
+        def translate_batch(batch: list[str]) -> list[str]:
+            results = self.translator.translate_text(
+                batch,
+                source_lang=source_language,
+                target_lang=target_language,
+                tag_handling="html",
+            )
+            if len(results) != len(batch):
+                raise DeepLException(
+                    f"Received {len(results)} translations for {len(batch)} texts"
+                )
+            return [result.text for result in results]
+
+        if (num_workers := min(settings.DEEPL_TRANSLATION_WORKERS, len(batches))) <= 1:
+            translated_batches = map(translate_batch, batches)
+            return [text for batch in translated_batches for text in batch]
+        with ThreadPoolExecutor(
+            max_workers=num_workers, thread_name_prefix="deepl"
+        ) as executor:
+            translated_batches = executor.map(translate_batch, batches)
+            return [text for batch in translated_batches for text in batch]
+
+    def update_budget(self, word_count: int) -> Region:
+        """
+        Bill (or refund) words to the machine translation budget of the current region
+
+        :param word_count: The number of words to bill (negative values refund words)
+        :return: The updated region
+        """
+        with transaction.atomic():
+            region = (
+                apps.get_model("cms", "Region")
+                .objects.select_for_update()
+                .get(id=self.request.region.id)
+            )
+            region.mt_budget_used = max(0, region.mt_budget_used + word_count)
+            region.save()
+        return region
+
     # pylint: disable=too-many-locals, too-many-branches, too-many-statements
     def translate_queryset(
         self, queryset: list[Event] | (list[Page] | list[POI]), language_slug: str
     ) -> None:
         """
-        This function translates a content queryset via DeepL
+        This function translates a content queryset via DeepL.
+        The texts of all objects are collected first, texts which are memorized in the translation memory are reused,
+        and the remaining texts are translated in few batched requests (see :meth:`translate_texts`). The region is
+        only locked while its budget is checked and billed, the translations are saved afterwards in one transaction.
 
         :param queryset: The content QuerySet
         :param language_slug: The target language slug
         """
+        # Get target language
+        target_language = self.request.region.get_language_or_404(language_slug)
+        source_language = self.request.region.get_source_language(language_slug)
+
+        target_language_key = self.get_target_language_key(target_language)
+        # Reuse previous translations of identical texts
+        translation_memory = TranslationMemory(
+            "DeepL", source_language.slug, target_language_key
+        )
+
+        failed_changes_because_no_source_translation = []
+        failed_changes_because_exceeds_limit = []
+        failed_changes_because_insufficient_hix_score = []
+        failed_changes_generic_error = []
+        successful_changes = []
+
+        # Collect the texts of all content objects which can be translated
+        candidates = []
+        for content_object in queryset:
+            source_translation = content_object.get_translation(source_language.slug)
+            if not source_translation:
+                failed_changes_because_no_source_translation.append(
+                    content_object.best_translation.title
+                )
+                continue
+
+            if not check_hix_score(
+                self.request, source_translation, show_message=False
+            ):
+                failed_changes_because_insufficient_hix_score.append(
+                    source_translation.title
+                )
+                continue
+
+            # Only translate existing, non-empty attributes
+            source_texts = {
+                attr: getattr(source_translation, attr)
+                for attr in self.translatable_attributes
+                if getattr(source_translation, attr, None)
+            }
+            candidates.append((content_object, source_translation, source_texts))
+
+        translated_texts = translation_memory.lookup(
+            text for _, _, source_texts in candidates for text in source_texts.values()
+        )
+
+        # Re-select the region from db and bill the words of all texts which have to be translated at once to prevent
+        # simultaneous requests exceeding the DeepL usage limit
+        missing_texts: dict[str, str] = {}
+        accepted_candidates = []
         with transaction.atomic():
-            # Re-select the region from db to prevent simultaneous
-            # requests exceeding the DeepL usage limit
             region = (
                 apps.get_model("cms", "Region")
                 .objects.select_for_update()
                 .get(id=self.request.region.id)
             )
-            # Get target language
-            target_language = region.get_language_or_404(language_slug)
-            source_language = region.get_source_language(language_slug)
-
-            target_language_key = self.get_target_language_key(target_language)
-
-            failed_changes_because_no_source_translation = []
-            failed_changes_because_exceeds_limit = []
-            failed_changes_because_insufficient_hix_score = []
-            failed_changes_generic_error = []
-            successful_changes = []
-
-            for content_object in queryset:
-                source_translation = content_object.get_translation(
-                    source_language.slug
-                )
-                if not source_translation:
-                    failed_changes_because_no_source_translation.append(
-                        content_object.best_translation.title
-                    )
-                    continue
-
-                if not check_hix_score(
-                    self.request, source_translation, show_message=False
+            for candidate in candidates:
+                _, source_translation, source_texts = candidate
+                # Only translate texts which are not memorized yet and identical texts only once
+                new_texts = {
+                    segment_hash: text
+                    for text in source_texts.values()
+                    if (segment_hash := get_segment_hash(text)) not in translated_texts
+                    and segment_hash not in missing_texts
+                }
+                word_count = self.count_words(new_texts.values())
+                if word_count and self.exceeds_budget(
+                    region, word_count, refresh=False
                 ):
-                    failed_changes_because_insufficient_hix_score.append(
+                    failed_changes_because_exceeds_limit.append(
                         source_translation.title
                     )
                     continue
+                # Update remaining DeepL usage for the region (memorized texts are not billed)
+                region.mt_budget_used += word_count
+                missing_texts.update(new_texts)
+                accepted_candidates.append(candidate)
+            region.save()
+        billed_word_count = self.count_words(missing_texts.values())
 
+        if missing_texts:
+            try:
+                translated_texts.update(
+                    zip(
+                        missing_texts.keys(),
+                        self.translate_texts(
+                            list(missing_texts.values()),
+                            source_language.slug,
+                            target_language_key,
+                        ),
+                    )
+                )
+            except DeepLException as e:
+                # Nothing was translated, so refund the billed words
+                self.update_budget(-billed_word_count)
+                messages.error(
+                    self.request,
+                    _(
+                        "A problem with DeepL API has occurred. Please contact an administrator."
+                    ),
+                )
+                logger.error(e)
+                return
+            translation_memory.store(
+                {
+                    text: translated_texts[segment_hash]
+                    for segment_hash, text in missing_texts.items()
+                }
+            )
+
+        with transaction.atomic():
+            for content_object, source_translation, source_texts in accepted_candidates:
                 existing_target_translation = content_object.get_translation(
                     target_language.slug
                 )
-
-                # Before translating, check if translation would exceed usage limit
-                (
-                    translation_exceeds_limit,
-                    word_count,
-                ) = self.check_usage(region, source_translation)
-                if translation_exceeds_limit:
-                    failed_changes_because_exceeds_limit.append(
-                        source_translation.title
-                    )
-                    continue
-
                 data = {
                     "status": source_translation.status,
                     "machine_translated": True,
                     "currently_in_translation": False,
+                    **{
+                        attr: translated_texts[get_segment_hash(text)]
+                        for attr, text in source_texts.items()
+                    },
                 }
 
-                for attr in self.translatable_attributes:
-                    # Only translate existing, non-empty attributes
-                    if hasattr(source_translation, attr) and getattr(
-                        source_translation, attr
-                    ):
-                        try:
-                            # data has to be unescaped for DeepL to recognize Umlaute
-                            data[attr] = self.translator.translate_text(
-                                unescape(getattr(source_translation, attr)),
-                                source_lang=source_language.slug,
-                                target_lang=target_language_key,
-                                tag_handling="html",
-                            )
-                        except DeepLException as e:
-                            messages.error(
-                                self.request,
-                                _(
-                                    "A problem with DeepL API has occurred. Please contact an administrator."
-                                ),
-                            )
-                            logger.error(e)
-                            return
-
                 content_translation_form = self.form_class(
                     data=data,
                     instance=existing_target_translation,
@@ -198,93 +341,87 @@ class DeepLApiClient(MachineTranslationApiClient):
                     )
                     failed_changes_generic_error.append(source_translation.title)
 
-                # Update remaining DeepL usage for the region
-                region.mt_budget_used += word_count
-                region.save()
-
-            if queryset:
-                meta = type(queryset[0])._meta
-                model_name = meta.verbose_name.title()
-                model_name_plural = meta.verbose_name_plural
-            else:
-                model_name = model_name_plural = ""
+        if queryset:
+            meta = type(queryset[0])._meta
+            model_name = meta.verbose_name.title()
+            model_name_plural = meta.verbose_name_plural
+        else:
+            model_name = model_name_plural = ""
 
-            if successful_changes:
-                messages.success(
-                    self.request,
-                    ngettext_lazy(
-                        "{model_name} {object_names} has successfully been translated ({source_language} ➜ {target_language}).",
-                        "The following {model_name_plural} have successfully been translated ({source_language} ➜ {target_language}): {object_names}",
-                        len(successful_changes),
-                    ).format(
-                        model_name=model_name,
-                        model_name_plural=model_name_plural,
-                        source_language=source_language,
-                        target_language=target_language,
-                        object_names=iter_to_string(successful_changes),
-                    ),
-                )
+        if successful_changes:
+            messages.success(
+                self.request,
+                ngettext_lazy(
+                    "{model_name} {object_names} has successfully been translated ({source_language} ➜ {target_language}).",
+                    "The following {model_name_plural} have successfully been translated ({source_language} ➜ {target_language}): {object_names}",
+                    len(successful_changes),
+                ).format(
+                    model_name=model_name,
+                    model_name_plural=model_name_plural,
+                    source_language=source_language,
+                    target_language=target_language,
+                    object_names=iter_to_string(successful_changes),
+                ),
+            )
 
-            if failed_changes_because_no_source_translation:
-                messages.error(
-                    self.request,
-                    ngettext_lazy(
-                        "{model_name} {object_names} could not be translated because its source translation is missing.",
-                        "The following {model_name_plural} could not be translated because their source translations are missing: {object_names}",
-                        len(failed_changes_because_exceeds_limit),
-                    ).format(
-                        model_name=model_name,
-                        model_name_plural=model_name_plural,
-                        object_names=iter_to_string(
-                            failed_changes_because_no_source_translation
-                        ),
+        if failed_changes_because_no_source_translation:
+            messages.error(
+                self.request,
+                ngettext_lazy(
+                    "{model_name} {object_names} could not be translated because its source translation is missing.",
+                    "The following {model_name_plural} could not be translated because their source translations are missing: {object_names}",
+                    len(failed_changes_because_exceeds_limit),
+                ).format(
+                    model_name=model_name,
+                    model_name_plural=model_name_plural,
+                    object_names=iter_to_string(
+                        failed_changes_because_no_source_translation
                     ),
-                )
+                ),
+            )
 
-            if failed_changes_because_exceeds_limit:
-                messages.error(
-                    self.request,
-                    ngettext_lazy(
-                        "{model_name} {object_names} could not be translated because it would exceed the remaining budget of {remaining_budget} words.",
-                        "The following {model_name_plural} could not be translated because they would exceed the remaining budget of {remaining_budget} words: {object_names}",
-                        len(failed_changes_because_exceeds_limit),
-                    ).format(
-                        model_name=model_name,
-                        model_name_plural=model_name_plural,
-                        remaining_budget=region.mt_budget_remaining,
-                        object_names=iter_to_string(
-                            failed_changes_because_exceeds_limit
-                        ),
-                    ),
-                )
+        if failed_changes_because_exceeds_limit:
+            messages.error(
+                self.request,
+                ngettext_lazy(
+                    "{model_name} {object_names} could not be translated because it would exceed the remaining budget of {remaining_budget} words.",
+                    "The following {model_name_plural} could not be translated because they would exceed the remaining budget of {remaining_budget} words: {object_names}",
+                    len(failed_changes_because_exceeds_limit),
+                ).format(
+                    model_name=model_name,
+                    model_name_plural=model_name_plural,
+                    remaining_budget=region.mt_budget_remaining,
+                    object_names=iter_to_string(failed_changes_because_exceeds_limit),
+                ),
+            )
 
-            if failed_changes_because_insufficient_hix_score:
-                messages.error(
-                    self.request,
-                    ngettext_lazy(
-                        "{model_name} {object_names} could not be translated because its HIX score is too low for machine translation (minimum required: {min_required}).",
-                        "The following {model_name_plural} could not be translated because their HIX score is too low for machine translation (minimum required: {min_required}): {object_names}",
-                        len(failed_changes_because_insufficient_hix_score),
-                    ).format(
-                        model_name=model_name,
-                        model_name_plural=model_name_plural,
-                        min_required=settings.HIX_REQUIRED_FOR_MT,
-                        object_names=iter_to_string(
-                            failed_changes_because_insufficient_hix_score
-                        ),
+        if failed_changes_because_insufficient_hix_score:
+            messages.error(
+                self.request,
+                ngettext_lazy(
+                    "{model_name} {object_names} could not be translated because its HIX score is too low for machine translation (minimum required: {min_required}).",
+                    "The following {model_name_plural} could not be translated because their HIX score is too low for machine translation (minimum required: {min_required}): {object_names}",
+                    len(failed_changes_because_insufficient_hix_score),
+                ).format(
+                    model_name=model_name,
+                    model_name_plural=model_name_plural,
+                    min_required=settings.HIX_REQUIRED_FOR_MT,
+                    object_names=iter_to_string(
+                        failed_changes_because_insufficient_hix_score
                     ),
-                )
+                ),
+            )
 
-            if failed_changes_generic_error:
-                messages.error(
-                    self.request,
-                    ngettext_lazy(
-                        "{model_name} {object_names} could not be translated automatically.",
-                        "The following {model_name_plural} could not translated automatically: {object_names}",
-                        len(failed_changes_generic_error),
-                    ).format(
-                        model_name=model_name,
-                        model_name_plural=model_name_plural,
-                        object_names=iter_to_string(failed_changes_generic_error),
-                    ),
-                )
+        if failed_changes_generic_error:
+            messages.error(
+                self.request,
+                ngettext_lazy(
+                    "{model_name} {object_names} could not be translated automatically.",
+                    "The following {model_name_plural} could not translated automatically: {object_names}",
+                    len(failed_changes_generic_error),
+                ).format(
+                    model_name=model_name,
+                    model_name_plural=model_name_plural,
+                    object_names=iter_to_string(failed_changes_generic_error),
+                ),
+            )
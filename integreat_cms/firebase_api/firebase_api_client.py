@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import google.auth
+import google.auth.transport.requests
 import requests
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
@@ -14,14 +19,55 @@ from ..cms.forms.push_notifications.push_notification_translation_form import (
     PushNotificationTranslation,
 )
 from ..cms.models import Region
+from ..core.utils.http_client import get_session
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from typing import Any
+
     from requests.models import Response
 
     from ..cms.models.push_notifications.push_notification import PushNotification
 
 logger = logging.getLogger(__name__)
 
+#: The lock which prevents concurrent refreshes of the cached credentials
+credentials_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_credentials(path: str) -> service_account.Credentials:
+    """
+    Load the service account credentials once per process, so their access token can be reused until it expires
+
+    :param path: The path to the service account file
+    :return: The (not yet refreshed) credentials
+    """
+    return service_account.Credentials.from_service_account_file(
+        path,
+        scopes=["https://www.googleapis.com/auth/firebase.messaging"],
+    )
+
+
+@dataclass
+class FcmResult:
+    """
+    The result of a single message which was sent to FCM
+    """
+
+    #: The sent push notification translation
+    pnt: PushNotificationTranslation
+    #: The region to which the message was sent
+    region: Region
+    #: Whether the message was accepted by FCM
+    success: bool
+    #: The HTTP status code of the response (``None`` if the request failed)
+    status_code: int | None = None
+    #: The message id assigned by FCM
+    fcm_id: str | None = None
+    #: The error message if the message could not be sent
+    error: str | None = None
+
 
 class FirebaseApiClient:
     """
@@ -46,6 +92,8 @@ class FirebaseApiClient:
         """
         self.push_notification = push_notification
         self.fcm_url = settings.FCM_URL
+        #: The results of all messages of the last call of :meth:`send_all`
+        self.results: list[FcmResult] = []
         self.prepared_pnts = []
         self.primary_pnt = PushNotificationTranslation.objects.get(
             push_notification=push_notification,
@@ -104,16 +152,18 @@ class FirebaseApiClient:
                 return False
         return True
 
-    def send_pn(self, pnt: PushNotificationTranslation, region: Region) -> Response:
+    def get_payload(
+        self, pnt: PushNotificationTranslation, region: Region
+    ) -> dict[str, Any]:
         """
-        Send single push notification translation
+        Get the FCM message of a push notification translation for a region
 
         :param pnt: The prepared push notification translation to be sent
         :param region: The region for which to send the prepared push notification translation
-        :return: Response of the :mod:`requests` library
+        :return: The payload of the request to the FCM API
         """
         # In debug mode, pass `validate_only`: True, to avoid messages actually being sent
-        payload = {
+        return {
             "validate_only": settings.DEBUG,
             "message": {
                 "topic": f"{region.slug}-{pnt.language.slug}-{self.push_notification.channel}",
@@ -137,59 +187,119 @@ class FirebaseApiClient:
                 },
             },
         }
+
+    def post(self, payload: dict[str, Any], access_token: str) -> Response:
+        """
+        Send a single message to the FCM API via the shared session (see :func:`~integreat_cms.core.utils.http_client.get_session`)
+
+        :param payload: The payload of the message (see :meth:`get_payload`)
+        :param access_token: The OAuth access token (see :meth:`_get_access_token`)
+        :return: Response of the :mod:`requests` library
+        """
         headers = {
-            "Authorization": f"Bearer {self._get_access_token()}",
+            "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json; UTF-8",
         }
-        return requests.post(
+        return get_session().post(
             self.fcm_url,
             json=payload,
             headers=headers,
-            timeout=settings.DEFAULT_REQUEST_TIMEOUT,
         )
 
+    def send_pn(self, pnt: PushNotificationTranslation, region: Region) -> Response:
+        """
+        Send single push notification translation
+
+        :param pnt: The prepared push notification translation to be sent
+        :param region: The region for which to send the prepared push notification translation
+        :return: Response of the :mod:`requests` library
+        """
+        return self.post(self.get_payload(pnt, region), self._get_access_token())
+
     def send_all(self) -> bool:
         """
-        Send all prepared push notification translations
+        Send all prepared push notification translations to all regions in which their language is active.
+        The payloads are prepared in the current thread, afterwards the messages are sent concurrently by up to
+        :attr:`~integreat_cms.core.settings.FCM_SEND_WORKERS` threads which share one access token and one connection
+        pool. The result of each message is stored in :attr:`results`.
 
         :return: Success status
         """
-        status = True
-        for pnt in self.prepared_pnts:
-            for region in self.regions:
-                if pnt.language in region.active_languages:
-                    res = self.send_pn(pnt, region)
-                    if res.status_code == 200:
-                        if name := res.json().get("name"):
-                            logger.info("%r sent, FCM id: %r", pnt, name)
-                        else:
-                            logger.warning(
-                                "%r sent, but unexpected API response: %r",
-                                pnt,
-                                res.json(),
-                            )
-                    else:
-                        status = False
-                        logger.error(
-                            "Received invalid response from FCM for %r, status: %r, body: %r",
-                            pnt,
-                            res.status_code,
-                            res.text,
-                        )
-        return status
+        messages = [
+            (pnt, region, self.get_payload(pnt, region))
+            for pnt in self.prepared_pnts
+            for region in self.regions
+            if pnt.language in region.active_languages
+        ]
+        self.results = []
+        if not messages:
+            return True
+        access_token = self._get_access_token()
+        num_workers = max(1, min(settings.FCM_SEND_WORKERS, len(messages)))
+        with ThreadPoolExecutor(
+            max_workers=num_workers, thread_name_prefix="fcm"
+        ) as executor:
+            futures = [
+                executor.submit(self.post, payload, access_token)
+                for _pnt, _region, payload in messages
+            ]
+            for (pnt, region, _payload), future in zip(messages, futures):
+                self.results.append(self.evaluate_response(pnt, region, future))
+        return all(result.success for result in self.results)
+
+    @staticmethod
+    def evaluate_response(
+        pnt: PushNotificationTranslation,
+        region: Region,
+        future: Future[Response],
+    ) -> FcmResult:
+        """
+        Wait for the response of a single message and log its result
+
+        :param pnt: The sent push notification translation
+        :param region: The region to which the push notification translation was sent
+        :param future: The future of the response
+        :return: The result of the message
+        """
+        try:
+            res = future.result()
+        except requests.RequestException as e:
+            logger.error("Could not send %r to FCM: %s", pnt, e)
+            return FcmResult(pnt, region, success=False, error=str(e))
+        if res.status_code == 200:
+            if name := res.json().get("name"):
+                logger.info("%r sent, FCM id: %r", pnt, name)
+            else:
+                logger.warning(
+                    "%r sent, but unexpected API response: %r",
+                    pnt,
+                    res.json(),
+                )
+            return FcmResult(
+                pnt, region, success=True, status_code=res.status_code, fcm_id=name
+            )
+        logger.error(
+            "Received invalid response from FCM for %r, status: %r, body: %r",
+            pnt,
+            res.status_code,
+            res.text,
+        )
+        return FcmResult(
+            pnt, region, success=False, status_code=res.status_code, error=res.text
+        )
 
     @staticmethod
     def _get_access_token() -> str:
         """
         Retrieve a valid access token that can be used to authorize requests.
-        This function is taken from https://github.com/firebase/quickstart-python/blob/2c68e7c5020f4dbb072cca4da03dba389fbbe4ec/messaging/messaging.py#L26-L35
+        The credentials are only loaded once per process and only refreshed when the current token is about to expire.
+        This function is adapted from https://github.com/firebase/quickstart-python/blob/2c68e7c5020f4dbb072cca4da03dba389fbbe4ec/messaging/messaging.py#L26-L35
 
         :return: Access token
         """
-        credentials = service_account.Credentials.from_service_account_file(
-            settings.FCM_CREDENTIALS,
-            scopes=["https://www.googleapis.com/auth/firebase.messaging"],
-        )
-        request = google.auth.transport.requests.Request()
-        credentials.refresh(request)
-        return credentials.token
+        with credentials_lock:
+            credentials = get_credentials(settings.FCM_CREDENTIALS)
+            if not credentials.valid:
+                request = google.auth.transport.requests.Request(session=get_session())
+                credentials.refresh(request)
+            return credentials.token
@@ -7,10 +7,10 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-import requests
 from django.conf import settings
 
 from ..cms.constants import administrative_division as ad
+from ..core.utils.http_client import get_session
 
 if TYPE_CHECKING:
     from typing import Any
@@ -39,10 +39,13 @@ class GvzApiWrapper:
         :return: JSON search results defined in the GVZ API
         """
         logger.debug("Searching for %r", region_name)
-        regions = requests.get(
-            f"{self.api_url}/api/administrative_divisions/?search={region_name}&division_category={division_category}",
-            timeout=settings.DEFAULT_REQUEST_TIMEOUT,
-        ).json()["results"]
+        regions = (
+            get_session()
+            .get(
+                f"{self.api_url}/api/administrative_divisions/?search={region_name}&division_category={division_category}",
+            )
+            .json()["results"]
+        )
         return regions
 
     def get_details(self, ags: str) -> dict | None:
@@ -53,10 +56,11 @@ class GvzApiWrapper:
         :return: dictionary containing longitude, latitude, type, id, name
         """
         logger.debug("GVZ API: Details for %r", ags)
-        result = requests.get(
-            f"{self.api_url}/api/administrative_divisions/?ags={ags}",
-            timeout=settings.DEFAULT_REQUEST_TIMEOUT,
-        ).json()
+        result = (
+            get_session()
+            .get(f"{self.api_url}/api/administrative_divisions/?ags={ags}")
+            .json()
+        )
         if result["count"] != 1:
             return None
         region = result["results"][0]
@@ -81,9 +85,7 @@ class GvzApiWrapper:
         """
         result = {}
         for url in child_urls:
-            response = requests.get(
-                url, timeout=settings.DEFAULT_REQUEST_TIMEOUT
-            ).json()
+            response = get_session().get(url).json()
             result[response["name"]] = {
                 "longitude": response["longitude"],
                 "latitude": response["latitude"],
@@ -13,10 +13,10 @@ from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from ..cms.constants import colors, matomo_periods
+from ..core.utils.http_client import async_request, get_async_session, run_async
 
 if TYPE_CHECKING:
     import sys
-    from asyncio import AbstractEventLoop
     from collections.abc import KeysView
     from typing import Any, TypeGuard
 
@@ -66,7 +66,8 @@ class MatomoApiClient:
         self, session: ClientSession, **kwargs: Any
     ) -> dict[str, Any] | list[int]:
         r"""
-        Uses :meth:`aiohttp.ClientSession.get` to perform an asynchronous GET request to the Matomo API.
+        Uses :func:`~integreat_cms.core.utils.http_client.async_request` to perform an asynchronous GET request to the
+        Matomo API.
 
         :param session: The session object which is used for the request
         :param \**kwargs: The parameters which are passed to the Matomo API
@@ -92,7 +93,7 @@ class MatomoApiClient:
             re.sub(r"&token_auth=[^&]+", "&token_auth=********", url),
         )
         try:
-            async with session.get(url) as response:
+            async with async_request(session, "GET", url) as response:
                 response_data = await response.json()
                 if (
                     isinstance(response_data, dict)
@@ -100,13 +101,13 @@ class MatomoApiClient:
                 ):
                     raise MatomoException(response_data["message"])
                 return response_data
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise MatomoException(str(e)) from e
 
     async def get_matomo_id_async(self, **query_params: Any) -> list[int]:
         r"""
         Async wrapper to fetch the Matomo ID with :mod:`aiohttp`.
-        Opens a :class:`~aiohttp.ClientSession` and calls :func:`~integreat_cms.matomo_api.matomo_api_client.MatomoApiClient.fetch`.
+        Calls :func:`~integreat_cms.matomo_api.matomo_api_client.MatomoApiClient.fetch` with the shared session.
         Called from :func:`~integreat_cms.matomo_api.matomo_api_client.MatomoApiClient.get_matomo_id`.
 
         :param \**query_params: The parameters which are passed to the Matomo API
@@ -114,11 +115,10 @@ class MatomoApiClient:
         :raises ~integreat_cms.matomo_api.matomo_api_client.MatomoException: When a :class:`~aiohttp.ClientError` was raised during a
                                                                              Matomo API request
         """
-        async with aiohttp.ClientSession() as session:
-            result = await self.fetch(session, **query_params)
-            if TYPE_CHECKING:
-                assert isinstance(result, list)
-            return result
+        result = await self.fetch(get_async_session(), **query_params)
+        if TYPE_CHECKING:
+            assert isinstance(result, list)
+        return result
 
     def get_matomo_id(self, token_auth: str) -> int:
         """
@@ -130,11 +130,8 @@ class MatomoApiClient:
 
         :return: ID of the connected Matomo instance
         """
-        # Initialize async event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         # Execute async request to Matomo API
-        response = loop.run_until_complete(
+        response = run_async(
             self.get_matomo_id_async(
                 token_auth=token_auth,
                 method="SitesManager.getSitesIdWithAtLeastViewAccess",
@@ -154,7 +151,7 @@ class MatomoApiClient:
     ) -> dict[str, Any]:
         """
         Async wrapper to fetch the total visits with :mod:`aiohttp`.
-        Opens a :class:`~aiohttp.ClientSession` and calls :func:`~integreat_cms.matomo_api.matomo_api_client.MatomoApiClient.fetch`.
+        Calls :func:`~integreat_cms.matomo_api.matomo_api_client.MatomoApiClient.fetch` with the shared session.
         Called from :func:`~integreat_cms.matomo_api.matomo_api_client.MatomoApiClient.get_total_visits`.
 
         :param query_params: The parameters which are passed to the Matomo API
@@ -163,14 +160,13 @@ class MatomoApiClient:
 
         :return: The parsed :mod:`json` result
         """
-        async with aiohttp.ClientSession() as session:
-            result = await self.fetch(
-                session,
-                **query_params,
-            )
-            if TYPE_CHECKING:
-                assert isinstance(result, dict)
-            return result
+        result = await self.fetch(
+            get_async_session(),
+            **query_params,
+        )
+        if TYPE_CHECKING:
+            assert isinstance(result, dict)
+        return result
 
     def get_total_visits(
         self, start_date: date, end_date: date, period: str = matomo_periods.DAY
@@ -194,11 +190,8 @@ class MatomoApiClient:
             "period": period,
         }
 
-        # Initialize async event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         # Execute async request to Matomo API
-        dataset = loop.run_until_complete(self.get_total_visits_async(query_params))
+        dataset = run_async(self.get_total_visits_async(query_params))
 
         return {
             # Send original labels for usage in the CSV export (convert to list because type dict_keys is not JSON-serializable)
@@ -219,20 +212,18 @@ class MatomoApiClient:
 
     async def get_visits_per_language_async(
         self,
-        loop: AbstractEventLoop,
         query_params: dict[str, Any],
         languages: list[Language],
     ) -> list[dict[str, Any]]:
         """
         Async wrapper to fetch the total visits with :mod:`aiohttp`.
-        Opens a :class:`~aiohttp.ClientSession`, creates a :class:`~asyncio.Task` for each language to call
+        Creates a :class:`~asyncio.Task` for each language to call
         :func:`~integreat_cms.matomo_api.matomo_api_client.MatomoApiClient.fetch` and waits for all tasks to finish with
         :func:`~asyncio.gather`.
         The returned list of gathered results has the correct order in which the tasks were created (at first the
         ordered list of languages and the last element is the task for the total visits).
         Called from :func:`~integreat_cms.matomo_api.matomo_api_client.MatomoApiClient.get_visits_per_language`.
 
-        :param loop: The asyncio event loop
         :param query_params: The parameters which are passed to the Matomo API
         :param languages: The list of languages which should be retrieved
         :raises ~integreat_cms.matomo_api.matomo_api_client.MatomoException: When a :class:`~aiohttp.ClientError` was raised during a
@@ -240,60 +231,60 @@ class MatomoApiClient:
 
         :return: The list of gathered results
         """
-        async with aiohttp.ClientSession() as session:
-            # Create tasks for visits by language
-            tasks = [
-                loop.create_task(
-                    self.fetch(
-                        session,
-                        **query_params,
-                        segment=f"pageUrl=@/{language.slug}/wp-json/extensions/v3/",
-                    )
-                )
-                for language in languages
-            ]
-            # Create separate task to gather offline download hits
-            tasks.append(
-                loop.create_task(
-                    self.fetch(
-                        session,
-                        **query_params,
-                        segment="pageUrl=@/wp-json/extensions/v3/pages",
-                    ),
+        session = get_async_session()
+        # Create tasks for visits by language
+        tasks = [
+            asyncio.create_task(
+                self.fetch(
+                    session,
+                    **query_params,
+                    segment=f"pageUrl=@/{language.slug}/wp-json/extensions/v3/",
                 )
             )
-            # Create separate task to gather WebApp download hits
-            tasks.append(
-                loop.create_task(
-                    self.fetch(
-                        session,
-                        **query_params,
-                        segment="pageUrl=@/wp-json/extensions/v3/children",
-                    ),
-                )
+            for language in languages
+        ]
+        # Create separate task to gather offline download hits
+        tasks.append(
+            asyncio.create_task(
+                self.fetch(
+                    session,
+                    **query_params,
+                    segment="pageUrl=@/wp-json/extensions/v3/pages",
+                ),
             )
-            # Create task for all downloads
-            tasks.append(
-                loop.create_task(
-                    self.fetch(
-                        session,
-                        **query_params,
-                    )
+        )
+        # Create separate task to gather WebApp download hits
+        tasks.append(
+            asyncio.create_task(
+                self.fetch(
+                    session,
+                    **query_params,
+                    segment="pageUrl=@/wp-json/extensions/v3/children",
+                ),
+            )
+        )
+        # Create task for all downloads
+        tasks.append(
+            asyncio.create_task(
+                self.fetch(
+                    session,
+                    **query_params,
                 )
             )
-            # Wait for all tasks to finish and collect the results
-            # (the results are sorted in the order the tasks were created)
-            result = await asyncio.gather(*tasks)
-            # We're not retrieving the matomo id as part of the tasks, thus we know that the result is a list of dicts, not a list of list of ints.
-            if TYPE_CHECKING:
+        )
+        # Wait for all tasks to finish and collect the results
+        # (the results are sorted in the order the tasks were created)
+        result = await asyncio.gather(*tasks)
+        # We're not retrieving the matomo id as part of the tasks, thus we know that the result is a list of dicts, not a list of list of ints.
+        if TYPE_CHECKING:
 
-                def is_dict_list(
-                    lst: list[dict[str, Any] | list[int]]
-                ) -> TypeGuard[list[dict[str, Any]]]:
-                    return all(isinstance(d, dict) for d in lst)
+            def is_dict_list(
+                lst: list[dict[str, Any] | list[int]]
+            ) -> TypeGuard[list[dict[str, Any]]]:
+                return all(isinstance(d, dict) for d in lst)
 
-                assert is_dict_list(result)
-            return result
+            assert is_dict_list(result)
+        return result
 
     def get_visits_per_language(
         self, start_date: date, end_date: date, period: str
@@ -327,13 +318,10 @@ class MatomoApiClient:
         # Convert colors to cycle to make sure it doesn't run out of elements if there are more languages than colors
         color_cycle = cycle(colors.CHOICES)
 
-        # Initialize async event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         # Execute async request to Matomo API
         logger.debug("Fetching visits for languages %r asynchronously.", languages)
-        datasets = loop.run_until_complete(
-            self.get_visits_per_language_async(loop, query_params, languages)
+        datasets = run_async(
+            self.get_visits_per_language_async(query_params, languages)
         )
         logger.debug("All asynchronous fetching tasks have finished.")
         # The last dataset contains the total visits
@@ -0,0 +1,342 @@
+"""
+This module contains a process-wide queue for the tracking of API requests in Matomo.
+Instead of starting a new thread and connection per tracked request, the tracking requests are buffered in a bounded
+queue and sent by a fixed number of worker threads to the
+`bulk tracking endpoint <https://developer.matomo.org/api-reference/tracking-api#bulk-tracking>`_ of Matomo.
+Batches which could not be delivered are retried later as one background job per site
+(see :mod:`~integreat_cms.cms.utils.background_job_utils`).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from collections import defaultdict
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+
+import requests
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, DatabaseError, transaction
+
+from ..cms.constants import job_status
+from ..cms.utils.background_job_utils import background_task, enqueue_job
+from ..core.utils.http_client import get_session
+
+if TYPE_CHECKING:
+    from typing import Any, Final
+
+    from ..cms.utils.background_job_utils import JobContext
+
+logger = logging.getLogger(__name__)
+
+#: The timeout of the bulk requests to Matomo in seconds
+REQUEST_TIMEOUT: Final[int] = 10
+
+#: The maximum time in seconds the queue is flushed on shutdown
+SHUTDOWN_TIMEOUT: Final[int] = 5
+
+
+class MatomoTrackingQueue:
+    """
+    A bounded queue of Matomo tracking requests which are sent in batches by a fixed pool of worker threads.
+    If the queue is full, new tracking requests are dropped and counted instead of blocking the API request.
+    The workers are started lazily on the first tracked request (and again after the process was forked or a worker
+    died).
+    """
+
+    #: The sentinel which tells a worker to stop
+    STOP: Final[object] = object()
+
+    def __init__(
+        self,
+        maxsize: int | None = None,
+        num_workers: int | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        """
+        Initialize the tracking queue
+
+        :param maxsize: The maximum number of buffered tracking requests
+                        (defaults to :attr:`~integreat_cms.core.settings.MATOMO_TRACKING_QUEUE_SIZE`)
+        :param num_workers: The number of worker threads
+                            (defaults to :attr:`~integreat_cms.core.settings.MATOMO_TRACKING_WORKERS`)
+        :param batch_size: The maximum number of tracking requests per bulk request
+                           (defaults to :attr:`~integreat_cms.core.settings.MATOMO_TRACKING_BATCH_SIZE`)
+        """
+        self.maxsize = maxsize
+        self.num_workers = num_workers
+        self.batch_size = batch_size
+        #: The number of dropped tracking requests because the queue was full
+        self.dropped = 0
+        #: The number of tracking requests which could not be delivered to Matomo
+        self.failed = 0
+        self.lock = threading.Lock()
+        self.queue: queue.Queue[dict[str, Any] | object] | None = None
+        self.workers: list[threading.Thread] = []
+        self.pid: int | None = None
+        atexit.register(self.shutdown)
+
+    def start(self) -> queue.Queue:
+        """
+        Start the worker threads if they are not running in the current process yet and replace workers which died
+
+        :return: The queue of the current process
+        """
+        with self.lock:
+            if self.pid == os.getpid() and self.queue:
+                for i, worker in enumerate(self.workers):
+                    if not worker.is_alive():
+                        logger.error(
+                            "Restarting dead Matomo tracking worker %r", worker
+                        )
+                        self.workers[i] = self.start_worker(self.queue, i)
+                return self.queue
+            # Threads are not inherited when the process is forked, so the queue has to be recreated
+            self.queue = queue.Queue(
+                maxsize=self.maxsize or settings.MATOMO_TRACKING_QUEUE_SIZE
+            )
+            self.workers = [
+                self.start_worker(self.queue, i)
+                for i in range(self.num_workers or settings.MATOMO_TRACKING_WORKERS)
+            ]
+            self.pid = os.getpid()
+            return self.queue
+
+    def start_worker(self, tracking_queue: queue.Queue, i: int) -> threading.Thread:
+        """
+        Start a worker thread
+
+        :param tracking_queue: The queue of the worker
+        :param i: The number of the worker
+        :return: The started thread
+        """
+        worker = threading.Thread(
+            target=self.work,
+            args=(tracking_queue,),
+            name=f"matomo-tracking-{i}",
+            daemon=True,
+        )
+        worker.start()
+        return worker
+
+    def track(self, data: dict[str, Any]) -> bool:
+        """
+        Add a tracking request to the queue without blocking
+
+        :param data: The parameters of the tracking request (including ``idsite`` and ``token_auth``)
+        :return: Whether the request was queued
+        """
+        try:
+            self.start().put_nowait(data)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+                dropped = self.dropped
+            # Only log every thousandth dropped request to avoid flooding the logs
+            if dropped % 1000 == 1:
+                logger.warning(
+                    "Matomo tracking queue is full, %d tracking requests dropped so far",
+                    dropped,
+                )
+            return False
+        return True
+
+    def work(self, tracking_queue: queue.Queue) -> None:
+        """
+        The loop of a worker thread: Wait for a tracking request, collect all further requests which are already
+        queued (up to the batch size) and send them to Matomo.
+        The shared session of the process is used to reuse the connections to Matomo.
+
+        :param tracking_queue: The queue of this worker
+        """
+        batch_size = self.batch_size or settings.MATOMO_TRACKING_BATCH_SIZE
+        session = get_session()
+        while True:
+            batch = [tracking_queue.get()]
+            while batch[-1] is not self.STOP and len(batch) < batch_size:
+                try:
+                    batch.append(tracking_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is self.STOP
+            if stop:
+                batch.pop()
+            try:
+                if batch:
+                    self.send(session, batch)  # type: ignore[arg-type]
+            # An unexpected error must not kill the worker, otherwise the queue fills up and all requests are dropped
+            # pylint: disable=broad-exception-caught
+            except Exception:
+                with self.lock:
+                    self.failed += len(batch)
+                logger.exception(
+                    "Matomo tracking worker failed to send %d tracking requests",
+                    len(batch),
+                )
+            finally:
+                # The worker threads do not handle requests, so their connections are not closed automatically
+                connection.close()
+                for _ in range(len(batch) + stop):
+                    tracking_queue.task_done()
+            if stop:
+                return
+
+    def send(self, session: requests.Session, batch: list[dict[str, Any]]) -> None:
+        """
+        Send a batch of tracking requests to the bulk tracking endpoint of Matomo.
+        Since the token authenticates the requests of one site, one bulk request per token is sent.
+
+        :param session: The shared HTTP session
+        :param batch: The tracking requests
+        """
+        requests_by_token: defaultdict[str, list[str]] = defaultdict(list)
+        site_ids: dict[str, int] = {}
+        for data in batch:
+            params = dict(data)
+            token = params.pop("token_auth")
+            site_ids[token] = params["idsite"]
+            requests_by_token[token].append(f"?{urlencode(params)}")
+        for token, tracking_requests in requests_by_token.items():
+            try:
+                post_tracking_requests(session, token, tracking_requests)
+            except requests.RequestException as e:
+                with self.lock:
+                    self.failed += len(tracking_requests)
+                # The token is not part of the url, so the error does not leak it
+                logger.error(
+                    "Matomo bulk tracking request with %d tracking requests failed with: %s",
+                    len(tracking_requests),
+                    e,
+                )
+                self.retry_later(site_ids[token], tracking_requests)
+
+    def retry_later(self, site_id: int, tracking_requests: list[str]) -> None:
+        """
+        Add the failed tracking requests to the pending retry job of the site or enqueue a new background job, so
+        there is at most one pending job per site even if Matomo is unavailable for a long time. The job keeps at most
+        :attr:`~integreat_cms.core.settings.MATOMO_TRACKING_QUEUE_SIZE` tracking requests, older requests are dropped.
+        The job only contains the Matomo id of the site, so the token is not stored in the job queue.
+
+        :param site_id: The Matomo id of the site
+        :param tracking_requests: The url-encoded tracking requests
+        """
+        if not settings.BACKGROUND_JOB_QUEUE_ENABLED:
+            # Without workers, the job would be executed right away while Matomo is still unavailable
+            return
+        # Get model instead of importing it to avoid circular imports
+        BackgroundJob = apps.get_model(app_label="cms", model_name="BackgroundJob")
+        max_requests = self.maxsize or settings.MATOMO_TRACKING_QUEUE_SIZE
+        try:
+            with transaction.atomic():
+                # Jobs which are locked are just being claimed by a worker, so they cannot be extended anymore
+                if (
+                    job := BackgroundJob.objects.select_for_update(skip_locked=True)
+                    .filter(
+                        task=f"{send_tracking_requests.__module__}.{send_tracking_requests.__qualname__}",
+                        status=job_status.PENDING,
+                        kwargs__site_id=site_id,
+                    )
+                    .first()
+                ):
+                    pending_requests = (
+                        job.kwargs["tracking_requests"] + tracking_requests
+                    )
+                    if (dropped := len(pending_requests) - max_requests) > 0:
+                        logger.warning(
+                            "Dropping %d failed tracking requests of Matomo site %d",
+                            dropped,
+                            site_id,
+                        )
+                    job.kwargs["tracking_requests"] = pending_requests[-max_requests:]
+                    job.save(update_fields=["kwargs"])
+                else:
+                    enqueue_job(
+                        send_tracking_requests,
+                        priority=-10,
+                        site_id=site_id,
+                        tracking_requests=tracking_requests[-max_requests:],
+                    )
+        except DatabaseError as e:
+            logger.error("Failed to enqueue failed Matomo tracking requests: %s", e)
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """
+        Flush the queue and stop the worker threads. This is called automatically when the process exits.
+
+        :param timeout: The maximum time in seconds to wait for each worker
+        """
+        with self.lock:
+            if self.pid != os.getpid() or not self.queue:
+                return
+            workers, tracking_queue = self.workers, self.queue
+            self.pid, self.workers, self.queue = None, [], None
+        try:
+            for _ in workers:
+                # The sentinels are queued after all pending tracking requests, so the queue is flushed first
+                tracking_queue.put(self.STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Matomo tracking queue could not be flushed in time")
+        for worker in workers:
+            worker.join(timeout)
+        if self.dropped:
+            logger.warning(
+                "Matomo tracking queue dropped %d tracking requests", self.dropped
+            )
+
+
+#: The tracking queue of the current process
+matomo_tracking_queue = MatomoTrackingQueue()
+
+
+def post_tracking_requests(
+    session: requests.Session, token: str, tracking_requests: list[str]
+) -> None:
+    """
+    Send tracking requests of one site to the bulk tracking endpoint of Matomo
+
+    :param session: The HTTP session
+    :param token: The Matomo token of the site
+    :param tracking_requests: The url-encoded tracking requests
+    :raises requests.RequestException: If the bulk request failed
+    """
+    response = session.post(
+        f"{settings.MATOMO_URL}/matomo.php",
+        json={"requests": tracking_requests, "token_auth": token},
+        timeout=REQUEST_TIMEOUT,
+    )
+    response.raise_for_status()
+
+
+# pylint: disable=unused-argument
+@background_task
+def send_tracking_requests(
+    context: JobContext, site_id: int, tracking_requests: list[str]
+) -> None:
+    """
+    Send tracking requests which could not be delivered by the tracking queue again
+
+    :param context: The context of the background job
+    :param site_id: The Matomo id of the site
+    :param tracking_requests: The url-encoded tracking requests
+    """
+    # Get model instead of importing it to avoid circular imports
+    Region = apps.get_model(app_label="cms", model_name="Region")
+    token = (
+        Region.objects.filter(matomo_id=site_id)
+        .exclude(matomo_token="")
+        .values_list("matomo_token", flat=True)
+        .first()
+    )
+    if not token:
+        logger.warning(
+            "Discarding %d tracking requests because Matomo site %d has no token anymore",
+            len(tracking_requests),
+            site_id,
+        )
+        return
+    post_tracking_requests(get_session(), token, tracking_requests)
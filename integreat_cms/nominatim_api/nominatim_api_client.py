@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
@@ -25,6 +26,24 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache
+def get_geolocator(nominatim_api_url: str) -> Nominatim:
+    """
+    Get the geocoder of the given Nominatim instance. The geocoder is shared by all clients of the process, so the
+    connections of its session are kept open between requests instead of creating a new session per client.
+
+    :param nominatim_api_url: The url of the Nominatim API
+    :return: The geocoder
+    """
+    nominatim_url = urlparse(nominatim_api_url)
+    return Nominatim(
+        domain=nominatim_url.netloc + nominatim_url.path,
+        scheme=nominatim_url.scheme,
+        user_agent=f"integreat-cms/{__version__} ({settings.HOSTNAME})",
+        timeout=settings.DEFAULT_REQUEST_TIMEOUT,
+    )
+
+
 class NominatimApiClient:
     """
     Client to interact with the Nominatim API.
@@ -40,13 +59,7 @@ class NominatimApiClient:
         if not settings.NOMINATIM_API_ENABLED:
             raise ImproperlyConfigured("Nominatim API is disabled")
         try:
-            nominatim_url = urlparse(settings.NOMINATIM_API_URL)
-            self.geolocator = Nominatim(
-                domain=nominatim_url.netloc + nominatim_url.path,
-                scheme=nominatim_url.scheme,
-                user_agent=f"integreat-cms/{__version__} ({settings.HOSTNAME})",
-                timeout=settings.DEFAULT_REQUEST_TIMEOUT,
-            )
+            self.geolocator = get_geolocator(settings.NOMINATIM_API_URL)
         except GeopyError as e:
             logger.exception(e)
             logger.error("Nominatim API client could not be initialized")
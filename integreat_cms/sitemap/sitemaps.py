@@ -145,7 +145,8 @@ class PageSitemap(WebappSitemap):
         self.queryset = self.queryset.filter(
             page__in=self.region.get_pages(),
             language=self.language,
-        ).distinct("page__pk")
+            is_latest_public=True,
+        )
 
 
 class EventSitemap(WebappSitemap):
@@ -176,8 +177,10 @@ class EventSitemap(WebappSitemap):
         super().__init__(region, language)
         # Filter queryset based on region and language
         self.queryset = self.queryset.filter(
-            event__in=self.region.events.all(), language=self.language
-        ).distinct("event__pk")
+            event__in=self.region.events.all(),
+            language=self.language,
+            is_latest_public=True,
+        )
 
 
 class POISitemap(WebappSitemap):
@@ -206,8 +209,10 @@ class POISitemap(WebappSitemap):
         super().__init__(region, language)
         # Filter queryset based on region and language
         self.queryset = self.queryset.filter(
-            poi__in=self.region.pois.all(), language=self.language
-        ).distinct("poi__pk")
+            poi__in=self.region.pois.all(),
+            language=self.language,
+            is_latest_public=True,
+        )
 
 
 class OfferSitemap(WebappSitemap):
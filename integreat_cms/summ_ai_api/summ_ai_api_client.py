@@ -17,6 +17,11 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
 
 from ..cms.utils.stringify_list import iter_to_string
+from ..cms.utils.translation_memory_utils import (
+    get_segment_hash,
+    TranslationMemory,
+)
+from ..core.utils.http_client import async_request, get_async_session, run_async
 from ..core.utils.machine_translation_api_client import MachineTranslationApiClient
 from ..core.utils.machine_translation_provider import MachineTranslationProvider
 from .utils import (
@@ -31,7 +36,6 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
-    from asyncio import AbstractEventLoop
     from collections.abc import Callable
     from typing import Any, Iterator
 
@@ -69,11 +73,25 @@ class SummAiApiClient(MachineTranslationApiClient):
         if not self.region.summ_ai_enabled:
             raise RuntimeError(f"SUMM.AI is disabled in {self.region!r}.")
 
+    @property
+    def output_language_level(self) -> str:
+        """
+        The language level of the translations
+
+        :return: ``"plain"`` if the region prefers Plain German, ``"easy"`` otherwise
+        """
+        return (
+            "plain"
+            if self.request.region.slug in settings.SUMM_AI_PLAIN_GERMAN_REGIONS
+            else "easy"
+        )
+
     async def translate_text_field(
         self, session: ClientSession, text_field: TextField
     ) -> TextField:
         """
-        Uses :meth:`aiohttp.ClientSession.post` to perform an asynchronous POST request to the SUMM.AI API.
+        Uses :func:`~integreat_cms.core.utils.http_client.async_request` to perform an asynchronous POST request to the
+        SUMM.AI API.
         After the translation is finished, the processing is delegated to the specific textfield's
         :meth:`~integreat_cms.summ_ai_api.utils.TextField.translate`.
 
@@ -92,12 +110,6 @@ class SummAiApiClient(MachineTranslationApiClient):
         logger.debug("Translating %r", text_field)
         # Use test region for development
         user = settings.TEST_REGION_SLUG if settings.DEBUG else self.region.slug
-        # Set the language level to "plain" if the region prefers Plain German
-        output_language_level = (
-            "plain"
-            if self.request.region.slug in settings.SUMM_AI_PLAIN_GERMAN_REGIONS
-            else "easy"
-        )
         if (
             text_field is None
             or (isinstance(text_field, TextField) and not text_field.text)
@@ -108,7 +120,9 @@ class SummAiApiClient(MachineTranslationApiClient):
             # Raise an exception without immediately catching it!
             raise SummAiRuntimeError("Field to translate is None or empty")
         try:
-            async with session.post(
+            async with async_request(
+                session,
+                "POST",
                 settings.SUMM_AI_API_URL,
                 headers={"Authorization": f"Bearer {settings.SUMM_AI_API_KEY}"},
                 json={
@@ -117,8 +131,10 @@ class SummAiApiClient(MachineTranslationApiClient):
                     "separator": settings.SUMM_AI_SEPARATOR,
                     "is_test": settings.SUMM_AI_TEST_MODE,
                     "is_initial": settings.SUMM_AI_IS_INITIAL,
-                    "output_language_level": output_language_level,
+                    "output_language_level": self.output_language_level,
                 },
+                # Set a custom SUMM.AI timeout
+                timeout=aiohttp.ClientTimeout(total=60 * settings.SUMM_AI_TIMEOUT),
             ) as response:
                 # Wait for the response
                 try:
@@ -149,7 +165,7 @@ class SummAiApiClient(MachineTranslationApiClient):
         return text_field
 
     async def translate_text_fields(
-        self, loop: AbstractEventLoop, text_fields: Iterator[TextField]
+        self, text_fields: Iterator[TextField]
     ) -> chain[list[TextField]]:
         """
         Translate a list of text fields from German into Easy German.
@@ -157,47 +173,45 @@ class SummAiApiClient(MachineTranslationApiClient):
         :meth:`~integreat_cms.summ_ai_api.summ_ai_api_client.SummAiApiClient.translate_text_field`
         for each entry.
 
-        :param loop: The asyncio event loop
         :param text_fields: The text fields to be translated
         :returns: The list of completed text fields
         """
 
-        # Set a custom SUMM.AI timeout
-        timeout = aiohttp.ClientTimeout(total=60 * settings.SUMM_AI_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            # Create tasks for each text field
-            tasks = [
-                # translate_text_field() gives us a coroutine that can be executed
-                # asynchronously as a task. If we have to repeat the task
-                # (e.g. if we run into rate limiting and have to resend the request),
-                # we need a NEW coroutine object.
-                # For that case, we need a representation of our function which can be
-                # evaluated when needed, giving a new coroutine for the task each time.
-                partial(self.translate_text_field, session, text_field)
-                for text_field in text_fields
-            ]
+        # Reuse the shared session to keep the connections to SUMM.AI open
+        session = get_async_session()
+        # Create tasks for each text field
+        tasks = [
+            # translate_text_field() gives us a coroutine that can be executed
+            # asynchronously as a task. If we have to repeat the task
+            # (e.g. if we run into rate limiting and have to resend the request),
+            # we need a NEW coroutine object.
+            # For that case, we need a representation of our function which can be
+            # evaluated when needed, giving a new coroutine for the task each time.
+            partial(self.translate_text_field, session, text_field)
+            for text_field in text_fields
+        ]
 
-            # If the translation is aborted, set the exception field
-            # to both signal that this wasn't translated and to display a reason why
-            def abort_function(task: partial, reason: Any) -> None:
-                # Retrieve field from arguments to translate_text_field()
-                field = task.args[1]
-                # Set the exception
-                field.exception = f"Machine translation aborted: {reason}"
+        # If the translation is aborted, set the exception field
+        # to both signal that this wasn't translated and to display a reason why
+        def abort_function(task: partial, reason: Any) -> None:
+            # Retrieve field from arguments to translate_text_field()
+            field = task.args[1]
+            # Set the exception
+            field.exception = f"Machine translation aborted: {reason}"
 
-            # A "patient" task queue which only hands out sleep tasks after a task was reported as failed
-            task_generator = PatientTaskQueue(tasks, abort_function=abort_function)
+        # A "patient" task queue which only hands out sleep tasks after a task was reported as failed
+        task_generator = PatientTaskQueue(tasks, abort_function=abort_function)
 
-            # Wait for all tasks to finish and collect the results
-            worker_results = await asyncio.gather(
-                *[
-                    worker(loop, task_generator, str(i))
-                    for i in range(settings.SUMM_AI_MAX_CONCURRENT_REQUESTS)
-                ]
-            )
-            # Put all results in one single list
-            all_results = chain(worker_results)
-            return all_results
+        # Wait for all tasks to finish and collect the results
+        worker_results = await asyncio.gather(
+            *[
+                worker(asyncio.get_running_loop(), task_generator, str(i))
+                for i in range(settings.SUMM_AI_MAX_CONCURRENT_REQUESTS)
+            ]
+        )
+        # Put all results in one single list
+        all_results = chain(worker_results)
+        return all_results
 
     def translate_queryset(self, queryset: list[Page], language_slug: str) -> None:
         """
@@ -221,19 +235,62 @@ class SummAiApiClient(MachineTranslationApiClient):
         ]
 
         # Aggregate all strings that need to be translated
-        text_fields = chain(
-            *[
-                translation_helper.get_text_fields()
-                for translation_helper in translation_helpers
-            ]
+        text_fields = list(
+            chain(
+                *[
+                    translation_helper.get_text_fields()
+                    for translation_helper in translation_helpers
+                ]
+            )
+        )
+
+        # Reuse previous translations of identical segments (but not the dummy translations of the test mode)
+        translation_memory = TranslationMemory(
+            "SUMM.AI",
+            settings.SUMM_AI_GERMAN_LANGUAGE_SLUG,
+            f"{settings.SUMM_AI_EASY_GERMAN_LANGUAGE_SLUG}-{self.output_language_level}",
+        )
+        memorized = (
+            {}
+            if settings.SUMM_AI_TEST_MODE
+            else translation_memory.lookup(field.text for field in text_fields)
+        )
+        # Only send segments which are not memorized yet and identical segments only once
+        missing_text_fields: dict[str, TextField] = {}
+        duplicate_text_fields: list[tuple[str, TextField]] = []
+        for text_field in text_fields:
+            segment_hash = get_segment_hash(text_field.text)
+            if segment_hash in memorized:
+                text_field.translate(memorized[segment_hash])
+            elif segment_hash in missing_text_fields:
+                duplicate_text_fields.append((segment_hash, text_field))
+            else:
+                missing_text_fields[segment_hash] = text_field
+        logger.debug(
+            "Translating %d of %d segments via SUMM.AI (%d memorized, %d duplicates)",
+            len(missing_text_fields),
+            len(text_fields),
+            len(text_fields) - len(missing_text_fields) - len(duplicate_text_fields),
+            len(duplicate_text_fields),
         )
 
-        # Initialize async event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Translate queryset asynchronously in parallel on the shared event loop
+        run_async(self.translate_text_fields(iter(missing_text_fields.values())))
 
-        # Translate queryset asynchronously in parallel
-        loop.run_until_complete(self.translate_text_fields(loop, text_fields))
+        # Apply the results to the duplicate segments
+        for segment_hash, text_field in duplicate_text_fields:
+            if exception := missing_text_fields[segment_hash].exception:
+                text_field.exception = exception
+            else:
+                text_field.translate(missing_text_fields[segment_hash].translated_text)
+        if not settings.SUMM_AI_TEST_MODE:
+            translation_memory.store(
+                {
+                    text_field.text: text_field.translated_text
+                    for text_field in missing_text_fields.values()
+                    if not text_field.exception
+                }
+            )
 
         # Commit changes to the database
         successes = []
@@ -137,6 +137,7 @@ class HTMLSegment(TextField):
 
         :param translated_text: The translated text
         """
+        self.translated_text = translated_text
         # Only do something if response was not empty (otherwise keep original text)
         if translated_text:
             # Split the text by newlines characters
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import logging
 from typing import TYPE_CHECKING
-from urllib.error import URLError
 
+import requests
 from django.apps import AppConfig, apps
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
@@ -44,7 +44,7 @@ class TextlabApiConfig(AppConfig):
                     logger.info(
                         "Textlab API is available at: %r", settings.TEXTLAB_API_URL
                     )
-                except (URLError, OSError) as e:
+                except requests.RequestException as e:
                     logger.info("Textlab API is unavailable: %r", e)
             else:
                 logger.info("Textlab API is disabled")
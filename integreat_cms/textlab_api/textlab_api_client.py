@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import json
 import logging
 from html import unescape
 from typing import TYPE_CHECKING
-from urllib.request import Request, urlopen
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 
+from ..core.utils.http_client import get_session
+
 if TYPE_CHECKING:
     from typing import Any
 
@@ -50,7 +50,7 @@ class TextlabClient:
         """
         Authorizes for the textlab api. On success, sets the token attribute.
 
-        :raises urllib.error.HTTPError: If the login was not successful
+        :raises requests.RequestException: If the login was not successful
         """
         data = {"identifier": self.username, "password": self.password}
         response = self.post_request("/user/login", data)
@@ -98,16 +98,13 @@ class TextlabClient:
         :param data: The data to send
         :param auth_token: The authorization token to use
         :return: The response json dictionary
-        :raises urllib.error.HTTPError: If the request failed
+        :raises requests.RequestException: If the request failed
         """
-        data_json: bytes = json.dumps(data).encode("utf-8")
-        request = Request(
+        headers = {"authorization": f"Bearer {auth_token}"} if auth_token else {}
+        response = get_session().post(
             f"{settings.TEXTLAB_API_URL.rstrip('/')}{path}",
-            data=data_json,
-            method="POST",
+            json=data,
+            headers=headers,
         )
-        if auth_token:
-            request.add_header("authorization", f"Bearer {auth_token}")
-        request.add_header("Content-Type", "application/json")
-        with urlopen(request) as response:
-            return json.loads(response.read().decode("utf-8"))
+        response.raise_for_status()
+        return response.json()
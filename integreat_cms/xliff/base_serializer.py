@@ -10,7 +10,6 @@ It extends :django-source:`django/core/serializers/base.py` and
 from __future__ import annotations
 
 import logging
-import xml.dom.minidom
 from typing import TYPE_CHECKING
 
 from django.conf import settings
@@ -39,16 +38,120 @@ logger = logging.getLogger(__name__)
 
 class XMLGeneratorWithCDATA(SimplerXMLGenerator):
     """
-    Subclass of SimplerXMLGenerator to provide a custom CDATA node
+    Subclass of SimplerXMLGenerator to provide a custom CDATA node and an indented output.
+
+    The output is identical to the result of :meth:`xml.dom.minidom.Node.toprettyxml`, but it is written directly to
+    the output stream instead of parsing the whole document into a DOM tree first:
+
+    * Each element starts on a new line and is indented by one tab per level
+    * Elements without content are written as empty-element tags (e.g. ``<target/>``)
+    * Elements which only contain text or ``CDATA`` are written on a single line
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        r"""
+        Initialize the XML generator
+
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied keyword arguments
+        """
+        super().__init__(*args, **kwargs)
+        #: The current depth of the element tree
+        self.depth = 0
+        #: The start tag of the current element which is not closed yet, because it is not known whether it is empty
+        self.pending_start_tag: str | None = None
+        #: Whether the current element contains inline text
+        self.inline = False
+
+    def close_pending_start_tag(self, end: str = ">") -> None:
+        """
+        Write the start tag of the current element if it is still pending
+
+        :param end: The end of the tag
+        """
+        if self.pending_start_tag is not None:
+            self._write(f"{self.pending_start_tag}{end}")
+            self.pending_start_tag = None
+
+    def startDocument(self) -> None:
+        """
+        Write the XML declaration
+        """
+        self._write('<?xml version="1.0" ?>\n')
+
+    def startElement(self, name: str, attrs: dict[str, str]) -> None:
+        """
+        Start an element on a new line. Namespace declarations come first, all other attributes are sorted.
+
+        :param name: The name of the element
+        :param attrs: The attributes of the element
+        """
+        self.close_pending_start_tag(">\n")
+        attributes = "".join(
+            f' {key}="{escape_attribute(value)}"'
+            for key, value in sorted(
+                attrs.items(),
+                key=lambda item: (not item[0].startswith("xmlns"), item[0]),
+            )
+        )
+        indent = "\t" * self.depth
+        self.pending_start_tag = f"{indent}<{name}{attributes}"
+        self.depth += 1
+        self.inline = False
+
+    def endElement(self, name: str) -> None:
+        """
+        End an element (as empty-element tag if it does not have any content)
+
+        :param name: The name of the element
+        """
+        self.depth -= 1
+        if self.pending_start_tag is not None:
+            self.close_pending_start_tag("/>\n")
+        elif self.inline:
+            self._write(f"</{name}>\n")
+        else:
+            indent = "\t" * self.depth
+            self._write(f"{indent}</{name}>\n")
+        self.inline = False
+
+    def characters(self, content: str) -> None:
+        """
+        Write escaped text content inline
+
+        :param content: The text content
+        """
+        if content:
+            self.close_pending_start_tag()
+            self._write(escape_attribute(content))
+            self.inline = True
+
     def cdata(self, content: str) -> None:
         """
-        Create a ``<![CDATA[]>``-block with the given content
+        Create a ``<![CDATA[]>``-block with the given content.
+        Like an XML parser, line breaks are normalized and empty blocks are omitted.
 
         :param content: The given ``CDATA`` content
         """
-        self.ignorableWhitespace(f"<![CDATA[{content}]]>")
+        if content := content.replace("\r\n", "\n").replace("\r", "\n"):
+            self.close_pending_start_tag()
+            self._write(f"<![CDATA[{content}]]>")
+            self.inline = True
+
+
+def escape_attribute(value: str) -> str:
+    """
+    Escape a text or attribute value like :mod:`xml.dom.minidom`
+
+    :param value: The unescaped value
+    :return: The escaped value
+    """
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
 
 
 class Serializer(xml_serializer.Serializer):
@@ -153,12 +256,12 @@ class Serializer(xml_serializer.Serializer):
     def getvalue(self) -> str | None:
         """
         Return the fully serialized translation (or ``None`` if the output stream is not seekable).
+        The output is already indented by :class:`~integreat_cms.xliff.base_serializer.XMLGeneratorWithCDATA`.
 
         :return: The output XLIFF string
         """
         if callable(getattr(self.stream, "getvalue", None)):
-            # Pretty print output
-            return xml.dom.minidom.parseString(self.stream.getvalue()).toprettyxml()
+            return self.stream.getvalue()
         return None
 
 
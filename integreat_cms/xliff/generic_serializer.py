@@ -7,7 +7,7 @@ from django.core.serializers.base import DeserializationError
 from . import base_serializer, xliff1_serializer, xliff2_serializer
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, IO
     from xml.dom.minidom import Element
 
     from django.core.serializers.base import DeserializedObject
@@ -26,9 +26,22 @@ class Deserializer(base_serializer.Deserializer):
     For deserialization, inspect the data and choose the correct version
     """
 
-    def __init__(self, *args: str, **kwargs: Any) -> None:
+    #: The deserializers of the supported XLIFF versions
+    deserializers: dict[str, type[base_serializer.Deserializer]] = {
+        "1.2": xliff1_serializer.Deserializer,
+        "2.0": xliff2_serializer.Deserializer,
+    }
+
+    def __init__(self, stream_or_string: IO | str, **kwargs: Any) -> None:
+        r"""
+        Initialize the deserializer of the XLIFF version of the given data
+
+        :param stream_or_string: The XLIFF file or its content
+        :param \**kwargs: The supplied keyword arguments
+        :raises ~django.core.serializers.base.DeserializationError: If the deserialization fails
+        """
         # Initialize the base xliff deserializer
-        super().__init__(*args, **kwargs)
+        super().__init__(stream_or_string, **kwargs)
         # Get XLIFF version and initialize deserializer of correct version
         for event, node in self.event_stream:
             if event == "START_ELEMENT" and node.nodeName == "xliff":
@@ -36,21 +49,26 @@ class Deserializer(base_serializer.Deserializer):
                     raise DeserializationError(
                         "The <xliff>-block does not contain a version attribute."
                     )
-                if version == "1.2":
-                    self.xliff_deserializer = xliff1_serializer.Deserializer(
-                        *args, **kwargs
-                    )
-                    return
-                if version == "2.0":
-                    self.xliff_deserializer = xliff2_serializer.Deserializer(
-                        *args, **kwargs
+                if version not in self.deserializers:
+                    raise DeserializationError(
+                        f"This serializer cannot process XLIFF version {version}."
                     )
-                    return
-                raise DeserializationError(
-                    f"This serializer cannot process XLIFF version {version}."
+                # The deserializer of the correct version reads the stream again from the beginning
+                self.stream.seek(0)
+                self.xliff_deserializer = self.deserializers[version](
+                    self.stream, **kwargs
                 )
+                return
         raise DeserializationError("The data does not contain an <xliff>-block.")
 
+    def __next__(self) -> DeserializedObject:
+        """
+        Return the next deserialized page translation of the deserializer of the correct version
+
+        :return: The next deserialized page translation
+        """
+        return next(self.xliff_deserializer)
+
     def get_object(self, node: Element) -> PageTranslation:
         """
         Retrieve an object from the serialized unit node.
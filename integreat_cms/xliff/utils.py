@@ -7,10 +7,13 @@ from __future__ import annotations
 import datetime
 import difflib
 import glob
+import hashlib
 import logging
 import os
 import uuid
+from collections import defaultdict
 from typing import TYPE_CHECKING
+from zipfile import ZIP_DEFLATED, ZipFile
 
 from django.conf import settings
 from django.contrib import messages
@@ -27,19 +30,18 @@ from linkcheck import update_lock
 
 from ..cms.constants import text_directions
 from ..cms.forms import PageTranslationForm
-from ..cms.models import Page, PageTranslation
-from ..cms.utils.file_utils import create_zip_archive
+from ..cms.models import Language, Page, PageTranslation
 from ..cms.utils.stringify_list import iter_to_string
+from ..cms.utils.translation_coverage_utils import update_translation_coverage
 from ..cms.utils.translation_utils import gettext_many_lazy as __
 
 if TYPE_CHECKING:
-    from typing import Any
-    from uuid import UUID
+    from collections.abc import Iterator
+    from typing import Any, Final
 
-    from django.core.serializers.base import DeserializedObject
     from django.http import HttpRequest
 
-    from ..cms.models.languages.language import Language
+    from ..cms.models import Region
     from ..cms.models.pages.page import PageQuerySet
 
 upload_storage = FileSystemStorage(location=settings.XLIFF_UPLOAD_DIR)
@@ -49,6 +51,20 @@ download_storage = FileSystemStorage(
 
 logger = logging.getLogger(__name__)
 
+#: The fields of page translations which are not stored in the compact representation of imports because they are
+#: either set explicitly for each new version or identify the translation
+COMPACT_EXCLUDED_FIELDS: Final[tuple[str, ...]] = (
+    "id",
+    "page_id",
+    "language_id",
+    "version",
+    "currently_in_translation",
+    "minor_edit",
+    "last_updated",
+    "is_latest",
+    "is_latest_public",
+)
+
 
 def pages_to_xliff_file(
     request: HttpRequest,
@@ -60,6 +76,9 @@ def pages_to_xliff_file(
     Export a list of page IDs to a ZIP archive containing XLIFF files for a specified target language (or just a single
     XLIFF file if only one page is converted)
 
+    The XLIFF files are not stored individually, but written directly into the ZIP archive one after another, so the
+    memory usage does not depend on the number of exported pages.
+
     :param request: The current request (used for error messages)
     :param pages: list of pages which should be translated
     :param target_languages: list of target languages (should exclude the region's default language)
@@ -72,74 +91,97 @@ def pages_to_xliff_file(
         pages,
         target_languages,
     )
-    # Generate unique directory for this export
-    dir_name = uuid.uuid4()
-    # Create XLIFF files
-    xliff_paths = {}
+    region = request.region
+    # Load all translations at once and reuse the region with its prebuilt language tree for all pages
+    pages = list(
+        pages.prefetch_translations()
+        .prefetch_public_translations()
+        .prefetch_public_or_draft_translations()
+    )
+    for page in pages:
+        page.region = region
+    # Collect the translations which can be exported
+    exports: list[tuple[str, PageTranslation]] = []
     for target_language in target_languages:
         for page in pages:
             try:
-                xliff_paths[f"{target_language}/{page}"] = page_to_xliff(
-                    page, target_language, dir_name, only_public=only_public
+                exports.append(
+                    get_xliff_export(page, target_language, only_public=only_public)
                 )
-            except RuntimeError as e:
-                messages.error(request, e)
             except RuntimeWarning as e:
                 messages.warning(request, e)
-    # Check how many XLIFF files were created
-    if not xliff_paths:
+    if not exports:
         return None
-    if len(xliff_paths) == 1:
-        # If only one xliff file was created, return it directly instead of creating zip file
-        page, xliff_file_path = xliff_paths.popitem()
-        xliff_file_url = download_storage.url(
-            os.path.relpath(xliff_file_path, settings.XLIFF_DOWNLOAD_DIR)
+    # Generate unique directory for this export
+    dir_name = uuid.uuid4()
+    if len(exports) == 1:
+        # If only one xliff file is created, return it directly instead of creating zip file
+        filename, target_page_translation = exports[0]
+        try:
+            xliff_content = serialize_xliff(
+                target_page_translation, only_public=only_public
+            )
+        except RuntimeError as e:
+            messages.error(request, e)
+            return None
+        actual_filename = download_storage.save(
+            f"{dir_name}/{filename}", ContentFile(xliff_content)
         )
+        mark_as_currently_in_translation(region, [target_page_translation])
+        xliff_file_url = download_storage.url(actual_filename)
         logger.info(
             "XLIFF export: %r converted to XLIFF file %r by %r",
-            page,
+            target_page_translation,
             xliff_file_url,
             request.user,
         )
         return xliff_file_url
     # Generate file path for ZIP archive
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M")
-    region = pages[0].region
     if len(target_languages) == 1:
         target_language = target_languages[0]
         zip_name = f"{region.slug}_{timestamp}_{region.get_source_language(target_language.slug).slug}_{target_language.slug}.zip"
     else:
         zip_name = f"{region.slug}_{timestamp}_multiple_languages.zip"
     actual_filename = download_storage.save(f"{dir_name}/{zip_name}", ContentFile(""))
-    # Create ZIP archive
-    create_zip_archive(
-        list(xliff_paths.values()), download_storage.path(actual_filename)
-    )
+    # Write the XLIFF files into the ZIP archive
+    exported_translations = []
+    with ZipFile(download_storage.path(actual_filename), "w", ZIP_DEFLATED) as zip_file:
+        for filename, target_page_translation, xliff_content in serialize_xliff_exports(
+            exports, only_public=only_public
+        ):
+            if isinstance(xliff_content, RuntimeError):
+                messages.error(request, xliff_content)
+                continue
+            zip_file.writestr(filename, xliff_content)
+            exported_translations.append(target_page_translation)
+            logger.debug("File %r added to ZIP archive", filename)
+    if not exported_translations:
+        download_storage.delete(actual_filename)
+        return None
+    mark_as_currently_in_translation(region, exported_translations)
     xliff_file_url = download_storage.url(actual_filename)
     logger.info(
         "XLIFF export: %r converted to XLIFF ZIP archive %r by %r",
-        xliff_paths.keys(),
+        exported_translations,
         xliff_file_url,
         request.user,
     )
     return xliff_file_url
 
 
-def page_to_xliff(
-    page: Page, target_language: Language, dir_name: UUID, only_public: bool = False
-) -> str:
+def get_xliff_export(
+    page: Page, target_language: Language, only_public: bool = False
+) -> tuple[str, PageTranslation]:
     """
-    Export a page to an XLIFF file for a specified target language
+    Get the target translation of a page which should be exported to XLIFF for a specified target language
 
     :param page: Page which should be translated
     :param target_language: The target language (should not be the region's default language)
-    :param dir_name: The directory in which the xliff files should be created
     :param only_public: Whether only public versions should be exported
     :raises RuntimeWarning: If the selected page translation does not have a source translation
 
-    :raises RuntimeError: When an unexpected error occurs during serialization
-
-    :return: The path of the generated XLIFF file
+    :return: The filename of the XLIFF file and the target translation
     """
     target_page_translation = (
         page.get_public_translation(target_language.slug)
@@ -176,9 +218,27 @@ def page_to_xliff(
                 target_language,
             )
         )
+    filename = (
+        f"{page.region.slug}_{source_translation.language.slug}_{target_language.slug}_"
+        f"{page.id}_{source_translation.version}_{source_translation.slug}.xliff"
+    )
+    return filename, target_page_translation
+
 
+def serialize_xliff(
+    target_page_translation: PageTranslation, only_public: bool = False
+) -> str:
+    """
+    Serialize a page translation to XLIFF
+
+    :param target_page_translation: The target translation (see :func:`get_xliff_export`)
+    :param only_public: Whether only public versions should be exported
+    :raises RuntimeError: When an unexpected error occurs during serialization
+
+    :return: The content of the XLIFF file
+    """
     try:
-        xliff_content = serializers.serialize(
+        return serializers.serialize(
             settings.XLIFF_EXPORT_VERSION,
             [target_page_translation],
             only_public=only_public,
@@ -199,94 +259,255 @@ def page_to_xliff(
             )
         ) from e
 
-    filename = (
-        f"{page.region.slug}_{source_translation.language.slug}_{target_language.slug}_"
-        f"{page.id}_{source_translation.version}_{source_translation.slug}.xliff"
+
+def serialize_xliff_exports(
+    exports: list[tuple[str, PageTranslation]], only_public: bool = False
+) -> Iterator[tuple[str, PageTranslation, str | RuntimeError]]:
+    """
+    Serialize page translations to XLIFF lazily one after another
+
+    :param exports: The filenames and target translations (see :func:`get_xliff_export`)
+    :param only_public: Whether only public versions should be exported
+    :return: An iterator over the filenames, target translations and XLIFF contents (or the errors)
+    """
+    for filename, target_page_translation in exports:
+        try:
+            xliff_content: str | RuntimeError = serialize_xliff(
+                target_page_translation, only_public=only_public
+            )
+        except RuntimeError as e:
+            xliff_content = e
+        yield filename, target_page_translation, xliff_content
+
+
+def mark_as_currently_in_translation(
+    region: Region, page_translations: list[PageTranslation]
+) -> None:
+    """
+    Set the "currently in translation" status for all versions of the exported target translations
+
+    :param region: The region of the translations
+    :param page_translations: The exported target translations (including temporary ones which do not exist yet)
+    """
+    page_ids_by_language: defaultdict[int, set[int]] = defaultdict(set)
+    for page_translation in page_translations:
+        page_ids_by_language[page_translation.language_id].add(page_translation.page_id)
+    for language_id, page_ids in page_ids_by_language.items():
+        versions = PageTranslation.objects.filter(
+            page_id__in=page_ids, language_id=language_id
+        )
+        if settings.REDIS_CACHE:
+            versions.invalidated_update(currently_in_translation=True)
+        else:
+            versions.update(currently_in_translation=True)
+    update_translation_coverage(
+        region, {page_translation.page_id for page_translation in page_translations}
     )
 
-    actual_filename = download_storage.save(
-        f"{dir_name}/{filename}", ContentFile(xliff_content)
+
+def get_file_hash(file_path: str) -> str:
+    """
+    Calculate the hash of a file without loading it into memory at once
+
+    :param file_path: The path of the file
+    :return: The hex digest of the SHA-256 hash of the file content
+    """
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        while chunk := file.read(65536):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def compact_page_translation(page_translation: PageTranslation) -> dict[str, Any]:
+    """
+    Convert a deserialized page translation into a compact representation which can be cached.
+    Only the fields which differ from the latest existing version of the translation are stored, all other fields are
+    restored from the latest version when the import is confirmed (see :func:`expand_page_translation`).
+    The id of this base version is stored as well, so imports can be rejected if the translation was changed in the
+    meantime.
+
+    :param page_translation: The deserialized page translation
+    :return: The ids of the page, language and base version and the changed fields
+    """
+    # Compare the imported translation to the latest existing version or the defaults of a new translation
+    existing_translation = PageTranslation.objects.filter(
+        page_id=page_translation.page_id,
+        language_id=page_translation.language_id,
+        is_latest=True,
+    ).first() or PageTranslation(
+        page_id=page_translation.page_id, language_id=page_translation.language_id
     )
-    logger.debug("Created XLIFF file %r", actual_filename)
+    return {
+        "page_id": page_translation.page_id,
+        "language_id": page_translation.language_id,
+        "base_version_id": existing_translation.id,
+        "fields": {
+            field.attname: getattr(page_translation, field.attname)
+            for field in page_translation._meta.concrete_fields
+            if field.attname not in COMPACT_EXCLUDED_FIELDS
+            and getattr(page_translation, field.attname)
+            != getattr(existing_translation, field.attname)
+        },
+    }
 
-    # Set "currently in translation" status for existing target translations
-    if settings.REDIS_CACHE:
-        target_page_translation.all_versions.invalidated_update(
-            currently_in_translation=True
-        )
-    else:
-        target_page_translation.all_versions.update(currently_in_translation=True)
 
-    return download_storage.path(actual_filename)
+def expand_page_translation(
+    compact: dict[str, Any],
+) -> tuple[PageTranslation, bool] | None:
+    """
+    Restore an imported page translation from its compact representation (see :func:`compact_page_translation`)
+    as new version of the latest existing translation
 
+    :param compact: The compact representation of the imported page translation
+    :return: The imported page translation and whether the latest existing translation differs from the version the
+             import was compared to (or ``None`` if the page does not exist anymore)
+    """
+    if not (
+        page := Page.objects.filter(id=compact["page_id"])
+        .select_related("region")
+        .first()
+    ):
+        return None
+    language = Language.objects.get(id=compact["language_id"])
+    page_translation = page.get_translation(language.slug) or PageTranslation(
+        page=page, language=language
+    )
+    base_changed = page_translation.id != compact["base_version_id"]
+    # Increment the version number
+    page_translation.version += 1
+    page_translation.currently_in_translation = False
+    page_translation.minor_edit = False
+    # Set the id to None to make sure a new object is stored in the database when save() is called
+    page_translation.id = None
+    for field_name, value in compact["fields"].items():
+        setattr(page_translation, field_name, value)
+    return page_translation, base_changed
+
+
+def deserialize_xliff_file(
+    request: HttpRequest, xliff_file_path: str, xliff_file_path_rel: str
+) -> list[dict[str, Any]] | None:
+    """
+    Deserialize an XLIFF file. The file is parsed as a stream, so only one ``<file>``-block is kept in memory at once.
 
-def xliffs_to_pages(
+    :param request: The current request (used for error messages)
+    :param xliff_file_path: The path of the xliff file
+    :param xliff_file_path_rel: The path of the xliff file relative to the upload directory
+    :return: The compact representations of the page translations (see :func:`compact_page_translation`) or ``None``
+             if the file could not be deserialized
+    """
+    logger.debug(
+        "Deserializing XLIFF file %r",
+        xliff_file_path,
+    )
+    try:
+        with open(xliff_file_path, "rb") as xliff_file:
+            # Try to deserialize the file
+            return [
+                compact_page_translation(deserialized.object)
+                for deserialized in serializers.deserialize("xliff", xliff_file)
+            ]
+    except Page.DoesNotExist:
+        logger.error(
+            "The page of XLIFF file %r does not exist.",
+            xliff_file_path,
+        )
+        messages.error(
+            request,
+            __(
+                _('The page referenced in XLIFF file "{}" could not be found.').format(
+                    xliff_file_path_rel
+                ),
+                _("Please contact the administrator."),
+            ),
+        )
+    # In this case, we want to catch all exceptions because the import of the other files should work even if
+    # some xliff files are broken or other unexpected errors occur
+    except Exception as e:  # pylint: disable=broad-except
+        # All these error should already have been prevented, so probably the XLIFF file is broken.
+        logger.exception(
+            "An unexpected error has occurred while importing XLIFF file %r: %s",
+            xliff_file_path,
+            e,
+        )
+        messages.error(
+            request,
+            __(
+                _(
+                    'An unexpected error has occurred while importing XLIFF file "{}".'
+                ).format(xliff_file_path_rel),
+                _("Please try again later or contact an administrator."),
+            ),
+        )
+    return None
+
+
+def get_xliff_imports(
     request: HttpRequest, xliff_dir: str
-) -> dict[str, list[DeserializedObject]]:
+) -> dict[str, dict[str, Any]]:
     """
-    Export a page to an XLIFF file for a specified target language
+    Deserialize all XLIFF files in a directory. The result is cached in a compact representation, which contains the
+    hash of each file and only the ids and changed fields of the imported page translations.
 
     :param request: The current request (used for error messages)
     :param xliff_dir: The directory containing the xliff files
-    :return: A dict of all page translations as ``DeserializedObject``
+    :return: A dict which maps the relative file paths to their hash and the compact page translations
     """
-    # Check if result is cached
-    if cached_result := cache.get(f"xliff-{xliff_dir}"):
+    # Get all xliff files in the given directory (sort for deterministic order)
+    file_hashes = {
+        os.path.relpath(xliff_file_path, xliff_dir): get_file_hash(xliff_file_path)
+        for xliff_file_path in sorted(
+            glob.glob(f"{xliff_dir}/**/*.xliff", recursive=True)
+        )
+    }
+    # Check if result is cached and the files did not change in the meantime
+    cached_result = cache.get(f"xliff-{xliff_dir}")
+    if cached_result is not None and {
+        xliff_file: xliff_import["hash"]
+        for xliff_file, xliff_import in cached_result["files"].items()
+    } == {
+        xliff_file: file_hash
+        for xliff_file, file_hash in file_hashes.items()
+        if xliff_file not in cached_result["failed"]
+    }:
         logger.debug(
             "Returning cached result for deserializing all XLIFF files of %r",
             xliff_dir,
         )
-        return cached_result
-    # Get all xliff files in the given directory (sort for deterministic order)
-    xliff_file_paths = sorted(glob.glob(f"{xliff_dir}/**/*.xliff", recursive=True))
-    page_translations = {}
-    for xliff_file_path in xliff_file_paths:
-        with open(xliff_file_path, "r", encoding="utf-8") as xliff_file:
-            logger.debug(
-                "Deserializing XLIFF file %r",
-                xliff_file_path,
-            )
-            xliff_file_path_rel = os.path.relpath(xliff_file_path, xliff_dir)
-            try:
-                # Try to deserialize the file
-                page_translations[xliff_file_path_rel] = list(
-                    serializers.deserialize("xliff", xliff_file.read())
-                )
-            except Page.DoesNotExist:
-                logger.error(
-                    "The page of XLIFF file %r does not exist.",
-                    xliff_file_path,
-                )
-                messages.error(
-                    request,
-                    __(
-                        _(
-                            'The page referenced in XLIFF file "{}" could not be found.'
-                        ).format(xliff_file_path_rel),
-                        _("Please contact the administrator."),
-                    ),
-                )
-            # In this case, we want to catch all exceptions because the import of the other files should work even if
-            # some xliff files are broken or other unexpected errors occur
-            except Exception as e:  # pylint: disable=broad-except
-                # All these error should already have been prevented, so probably the XLIFF file is broken.
-                logger.exception(
-                    "An unexpected error has occurred while importing XLIFF file %r: %s",
-                    xliff_file_path,
-                    e,
-                )
-                messages.error(
-                    request,
-                    __(
-                        _(
-                            'An unexpected error has occurred while importing XLIFF file "{}".'
-                        ).format(xliff_file_path_rel),
-                        _("Please try again later or contact an administrator."),
-                    ),
-                )
-    # Store deserialized objects in cache
-    cache.set(f"xliff-{xliff_dir}", page_translations)
-    return page_translations
+        return cached_result["files"]
+    result: dict[str, Any] = {"files": {}, "failed": []}
+    for xliff_file, file_hash in file_hashes.items():
+        page_translations = deserialize_xliff_file(
+            request, os.path.join(xliff_dir, xliff_file), xliff_file
+        )
+        if page_translations is None:
+            result["failed"].append(xliff_file)
+        else:
+            result["files"][xliff_file] = {
+                "hash": file_hash,
+                "page_translations": page_translations,
+            }
+    # Store compact representation of the deserialized objects in cache
+    cache.set(f"xliff-{xliff_dir}", result)
+    return result["files"]
+
+
+def xliffs_to_pages(
+    request: HttpRequest, xliff_dir: str
+) -> Iterator[tuple[str, PageTranslation, bool]]:
+    """
+    Import all XLIFF files of a directory as new versions of their page translations
+
+    :param request: The current request (used for error messages)
+    :param xliff_dir: The directory containing the xliff files
+    :return: An iterator over the relative file paths, the imported page translations and whether the existing
+             translations were changed since the files were deserialized (see :func:`expand_page_translation`)
+    """
+    for xliff_file, xliff_import in get_xliff_imports(request, xliff_dir).items():
+        for compact in xliff_import["page_translations"]:
+            if expanded := expand_page_translation(compact):
+                yield xliff_file, *expanded
 
 
 def get_xliff_import_diff(request: HttpRequest, xliff_dir: str) -> list[dict[str, Any]]:
@@ -298,84 +519,95 @@ def get_xliff_import_diff(request: HttpRequest, xliff_dir: str) -> list[dict[str
     :return: A dict containing data about the imported xliff files
     """
     diff: dict[str, dict] = {}
-    for xliff_file, deserialized_objects in xliffs_to_pages(request, xliff_dir).items():
-        for deserialized in deserialized_objects:
-            page_translation = deserialized.object
-            # The prefetched translations now also contain the new deserialized object with id None, so we have to delete
-            # the cached property and query it from the database again.
-            try:
-                del page_translation.page.prefetched_translations_by_language_slug
-            except AttributeError:
-                pass
-            existing_translation = page_translation.latest_version or PageTranslation(
-                page=page_translation.page,
-                language=page_translation.language,
-            )
-            if (translation_key := get_translation_key(existing_translation)) in diff:
-                # Show global error to indicate duplicate translation
-                messages.error(
-                    request,
-                    format_html(
-                        __(
-                            _(
-                                "Page <b>{}</b> from file <b>{}</b> was also translated in file <b>{}</b>."
-                            ),
-                            _(
-                                "Please check which of the files contains the most recent version and upload only this file."
-                            ),
-                            _(
-                                "If you confirm this import, only the first file will be imported and the latter will be ignored."
-                            ),
+    for xliff_file, page_translation, base_changed in xliffs_to_pages(
+        request, xliff_dir
+    ):
+        # The prefetched translations now also contain the new deserialized object with id None, so we have to delete
+        # the cached property and query it from the database again.
+        try:
+            del page_translation.page.prefetched_translations_by_language_slug
+        except AttributeError:
+            pass
+        existing_translation = page_translation.latest_version or PageTranslation(
+            page=page_translation.page,
+            language=page_translation.language,
+        )
+        if (translation_key := get_translation_key(existing_translation)) in diff:
+            # Show global error to indicate duplicate translation
+            messages.error(
+                request,
+                format_html(
+                    __(
+                        _(
+                            "Page <b>{}</b> from file <b>{}</b> was also translated in file <b>{}</b>."
+                        ),
+                        _(
+                            "Please check which of the files contains the most recent version and upload only this file."
+                        ),
+                        _(
+                            "If you confirm this import, only the first file will be imported and the latter will be ignored."
                         ),
-                        existing_translation.readable_title,
-                        diff[translation_key]["file"],
-                        xliff_file,
                     ),
-                )
-                # Show warning in the section of the first occurrence of this duplicate
-                diff[translation_key]["errors"].append(
-                    {
-                        "level_tag": "warning",
-                        "message": format_html(
-                            _(
-                                "This page was also translated in file <b>{}</b>, which will be ignored."
-                            ),
-                            xliff_file,
+                    existing_translation.readable_title,
+                    diff[translation_key]["file"],
+                    xliff_file,
+                ),
+            )
+            # Show warning in the section of the first occurrence of this duplicate
+            diff[translation_key]["errors"].append(
+                {
+                    "level_tag": "warning",
+                    "message": format_html(
+                        _(
+                            "This page was also translated in file <b>{}</b>, which will be ignored."
                         ),
-                    }
-                )
-                # Skip this duplicated translation
-                continue
-            diff[translation_key] = {
-                "file": xliff_file,
-                "existing": existing_translation,
-                "import": page_translation,
-                "source_diff": {
-                    "title": "\n".join(
-                        list(
-                            difflib.unified_diff(
-                                [existing_translation.title],
-                                [page_translation.title],
-                                lineterm="",
-                            )
-                        )[2:]
+                        xliff_file,
                     ),
-                    "content": "\n".join(
-                        list(
-                            difflib.unified_diff(
-                                existing_translation.content.splitlines(),
-                                page_translation.content.splitlines(),
-                                lineterm="",
-                            )
-                        )[2:]
+                }
+            )
+            # Skip this duplicated translation
+            continue
+        diff[translation_key] = {
+            "file": xliff_file,
+            "existing": existing_translation,
+            "import": page_translation,
+            "source_diff": {
+                "title": "\n".join(
+                    list(
+                        difflib.unified_diff(
+                            [existing_translation.title],
+                            [page_translation.title],
+                            lineterm="",
+                        )
+                    )[2:]
+                ),
+                "content": "\n".join(
+                    list(
+                        difflib.unified_diff(
+                            existing_translation.content.splitlines(),
+                            page_translation.content.splitlines(),
+                            lineterm="",
+                        )
+                    )[2:]
+                ),
+            },
+            "right_to_left": page_translation.language.text_direction
+            == text_directions.RIGHT_TO_LEFT,
+            "errors": get_xliff_import_errors_and_clean_translation(
+                request, page_translation, add_message_if_unchanged=True
+            )[0],
+        }
+        if base_changed:
+            # Compare the files to the current versions when the preview is shown again
+            cache.delete(f"xliff-{xliff_dir}")
+            diff[translation_key]["errors"].append(
+                {
+                    "level_tag": "warning",
+                    "message": _(
+                        "This page was changed after the XLIFF file was uploaded. Please reload this page to compare the file to the current version."
                     ),
-                },
-                "right_to_left": page_translation.language.text_direction
-                == text_directions.RIGHT_TO_LEFT,
-                "errors": get_xliff_import_errors_and_clean_translation(
-                    request, page_translation, add_message_if_unchanged=True
-                )[0],
-            }
+                }
+            )
     # Throw away the translation keys, only take the value dictionaries
     return list(diff.values())
 
@@ -395,101 +627,105 @@ def xliff_import_confirm(
 
     successful_imports = []
     imports_without_changes = []
+    outdated_imports = []
 
     # Acquire linkcheck lock to avoid race conditions between post_save signal and links.delete()
     with update_lock:
         # Iterate over all xliff files
-        for xliff_file, deserialized_objects in xliffs_to_pages(
+        # (typically, one xliff file contains exactly one page translation)
+        for xliff_file, page_translation, base_changed in xliffs_to_pages(
             request, xliff_dir
-        ).items():
-            # Iterate over all objects of one xliff file
-            # (typically, one xliff file contains exactly one page translation)
-            for deserialized in deserialized_objects:
-                page_translation = deserialized.object
-                errors, has_changed = get_xliff_import_errors_and_clean_translation(
-                    request, page_translation
+        ):
+            if base_changed:
+                # The unchanged fields would be taken from a version the user has not seen in the preview
+                logger.warning(
+                    "XLIFF import of %r not possible because %r was changed after the preview",
+                    xliff_file,
+                    page_translation,
+                )
+                outdated_imports.append(page_translation.readable_title)
+                success = False
+                continue
+            errors, has_changed = get_xliff_import_errors_and_clean_translation(
+                request, page_translation
+            )
+            if errors:
+                logger.warning(
+                    "XLIFF import of %r not possible because validation of %r failed with the errors: %r",
+                    xliff_file,
+                    page_translation,
+                    errors,
                 )
-                if errors:
-                    logger.warning(
-                        "XLIFF import of %r not possible because validation of %r failed with the errors: %r",
+
+                messages.error(
+                    request,
+                    format_html(
+                        "{} <ul>{}</ul>",
+                        _(
+                            "Page {} could not be imported successfully because of the errors:"
+                        ).format(page_translation.readable_title),
+                        format_html_join(
+                            "",
+                            "<li><i icon-name='alert-triangle' class='pb-1'></i>{}</li>",
+                            [[error["message"]] for error in errors],
+                        ),
+                    ),
+                )
+
+                success = False
+            else:
+                # Check if previous version already exists
+                if existing_translation := page_translation.latest_version:
+                    # Delete link objects of existing translation
+                    existing_translation.links.all().delete()
+                page_translation.machine_translated = machine_translated
+                # Confirm import and write changes to the database
+                try:
+                    # Use encapsulated transaction to allow rollback in case of IntegrityError
+                    with transaction.atomic():
+                        page_translation.save()
+                except IntegrityError as e:
+                    logger.error(
+                        "%s when importing new version for %r from %r by %r: %s",
+                        type(e).__name__,
+                        existing_translation,
                         xliff_file,
-                        page_translation,
-                        errors,
+                        request.user,
+                        e,
                     )
-
                     messages.error(
                         request,
                         format_html(
-                            "{} <ul>{}</ul>",
-                            _(
-                                "Page {} could not be imported successfully because of the errors:"
-                            ).format(page_translation.readable_title),
-                            format_html_join(
-                                "",
-                                "<li><i icon-name='alert-triangle' class='pb-1'></i>{}</li>",
-                                [[error["message"]] for error in errors],
+                            __(
+                                _(
+                                    "Page {} from the file <b>{}</b> could not be imported."
+                                ),
+                                _(
+                                    "Check if you have uploaded any other conflicting files for this page."
+                                ),
+                                _("If the problem persists, contact an administrator."),
                             ),
+                            page_translation.readable_title,
+                            xliff_file,
                         ),
                     )
-
-                    success = False
                 else:
-                    # Check if previous version already exists
-                    if existing_translation := page_translation.latest_version:
-                        # Delete link objects of existing translation
-                        existing_translation.links.all().delete()
-                    page_translation.machine_translated = machine_translated
-                    # Confirm import and write changes to the database
-                    try:
-                        # Use encapsulated transaction to allow rollback in case of IntegrityError
-                        with transaction.atomic():
-                            page_translation.save()
-                    except IntegrityError as e:
-                        logger.error(
-                            "%s when importing new version for %r from %r by %r: %s",
-                            type(e).__name__,
-                            existing_translation,
+                    if has_changed:
+                        logger.info(
+                            "%r of XLIFF file %r was imported successfully by %r",
+                            page_translation,
                             xliff_file,
                             request.user,
-                            e,
-                        )
-                        messages.error(
-                            request,
-                            format_html(
-                                __(
-                                    _(
-                                        "Page {} from the file <b>{}</b> could not be imported."
-                                    ),
-                                    _(
-                                        "Check if you have uploaded any other conflicting files for this page."
-                                    ),
-                                    _(
-                                        "If the problem persists, contact an administrator."
-                                    ),
-                                ),
-                                page_translation.readable_title,
-                                xliff_file,
-                            ),
                         )
+                        successful_imports.append(page_translation.readable_title)
                     else:
-                        if has_changed:
-                            logger.info(
-                                "%r of XLIFF file %r was imported successfully by %r",
-                                page_translation,
-                                xliff_file,
-                                request.user,
-                            )
-                            successful_imports.append(page_translation.readable_title)
-                        else:
-                            logger.info(
-                                "%r of XLIFF file %r was imported without changes by %r",
-                                existing_translation,
-                                xliff_file,
-                                request.user,
-                            )
-                            imports_without_changes.append(
-                                page_translation.readable_title
-                            )
+                        logger.info(
+                            "%r of XLIFF file %r was imported without changes by %r",
+                            existing_translation,
+                            xliff_file,
+                            request.user,
+                        )
+                        imports_without_changes.append(page_translation.readable_title)
 
     if successful_imports:
         messages.success(
@@ -501,6 +737,21 @@ def xliff_import_confirm(
             ).format(iter_to_string(successful_imports, quotation_char="")),
         )
 
+    if outdated_imports:
+        # Compare the files to the current versions when the preview is shown again
+        cache.delete(f"xliff-{xliff_dir}")
+        messages.error(
+            request,
+            __(
+                ngettext_lazy(
+                    "Page {} was changed after the XLIFF file was uploaded and could not be imported.",
+                    "Pages {} were changed after the XLIFF files were uploaded and could not be imported.",
+                    len(outdated_imports),
+                ).format(iter_to_string(outdated_imports, quotation_char="")),
+                _("Please check the current changes and confirm the import again."),
+            ),
+        )
+
     if imports_without_changes:
         messages.info(
             request,
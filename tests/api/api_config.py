@@ -149,28 +149,28 @@ API_ENDPOINTS: Final[list[tuple[str, str, str, int, int]]] = [
         "/augsburg/de/wp-json/extensions/v3/events/",
         "tests/api/expected-outputs/augsburg_de_events.json",
         200,
-        5,
+        6,
     ),
     (
         "/api/v3/augsburg/de/events/?combine_recurring=True",
         "/augsburg/de/wp-json/extensions/v3/events/?combine_recurring=True",
         "tests/api/expected-outputs/augsburg_de_events_combine_recurring.json",
         200,
-        5,
+        6,
     ),
     (
         "/api/v3/augsburg/en/events/",
         "/augsburg/en/wp-json/extensions/v3/events/",
         "tests/api/expected-outputs/augsburg_en_events.json",
         200,
-        5,
+        6,
     ),
     (
         "/api/v3/augsburg/ar/events/",
         "/augsburg/ar/wp-json/extensions/v3/events/",
         "tests/api/expected-outputs/augsburg_ar_events.json",
         200,
-        5,
+        6,
     ),
     (
         "/api/v3/augsburg/non-existing/events/",
@@ -212,21 +212,21 @@ API_ENDPOINTS: Final[list[tuple[str, str, str, int, int]]] = [
         "/nurnberg/de/wp-json/extensions/v3/events/",
         "tests/api/expected-outputs/nurnberg_de_events.json",
         200,
-        9,
+        10,
     ),
     (
         "/api/v3/nurnberg/en/events/",
         "/nurnberg/en/wp-json/extensions/v3/events/",
         "tests/api/expected-outputs/nurnberg_en_events.json",
         200,
-        9,
+        10,
     ),
     (
         "/api/v3/nurnberg/ar/events/",
         "/nurnberg/ar/wp-json/extensions/v3/events/",
         "tests/api/expected-outputs/nurnberg_ar_events.json",
         200,
-        5,
+        6,
     ),
     (
         "/api/v3/nurnberg/de/locations/",
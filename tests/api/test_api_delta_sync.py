@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from django.conf import settings
+from django.test.client import Client
+from django.utils import timezone
+
+from integreat_cms.cms.constants import status
+from integreat_cms.cms.models import Page, POI
+from tests.utils import get_response_content
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        "/api/v3/augsburg/de/pages/",
+        "/api/v3/augsburg/de/events/",
+        "/api/v3/augsburg/de/locations/",
+    ],
+)
+def test_api_delta_sync_future_timestamp(load_test_data: None, endpoint: str) -> None:
+    """
+    Check that the delta sync does not return any content if nothing changed since the given timestamp
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param endpoint: The url of the endpoint
+    """
+    client = Client()
+    response = client.get(endpoint, {"since": "2999-01-01T00:00:00+00:00"})
+    assert response.status_code == 200
+    assert json.loads(get_response_content(response)) == []
+
+    response = client.get(endpoint, {"since": "yesterday"})
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_api_delta_sync_pages(load_test_data: None) -> None:
+    """
+    Check that the delta sync of the pages endpoint contains changed pages and their descendants
+    and returns tombstones for archived pages
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    client = Client()
+    endpoint = "/api/v3/augsburg/de/pages/"
+    since = timezone.now().isoformat()
+    page = (
+        Page.objects.filter(region__slug="augsburg", explicitly_archived=False)
+        .exclude(lft=1)
+        .first()
+    )
+    descendant_ids = {
+        descendant.get_public_translation("de").id
+        for descendant in page.get_descendants()
+        if descendant.get_public_translation("de")
+    }
+
+    # Saving the page without changes only touches the page itself
+    page.save()
+    result = json.loads(get_response_content(client.get(endpoint, {"since": since})))
+    assert page.get_public_translation("de").id in {
+        item["id"] for item in result if not item.get("deleted")
+    }
+    assert descendant_ids <= {item["id"] for item in result}
+
+    page.explicitly_archived = True
+    page.save()
+    result = json.loads(get_response_content(client.get(endpoint, {"since": since})))
+    assert {"id", "url", "path", "deleted"} <= set(result[-1])
+    assert all(item.get("deleted") for item in result)
+
+
+@pytest.mark.django_db
+def test_api_delta_sync_locations(load_test_data: None) -> None:
+    """
+    Check that the delta sync of the locations endpoint contains changed locations and tombstones
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    client = Client()
+    endpoint = "/api/v3/augsburg/de/locations/"
+    since = timezone.now().isoformat()
+    poi = POI.objects.filter(
+        region__slug="augsburg",
+        archived=False,
+        translations__language__slug="de",
+        translations__status=status.PUBLIC,
+    ).first()
+    poi_translation = poi.get_public_translation("de")
+
+    poi.save()
+    result = json.loads(get_response_content(client.get(endpoint, {"since": since})))
+    assert [item["id"] for item in result] == [poi_translation.id]
+    assert not result[0].get("deleted")
+
+    poi.archived = True
+    poi.save()
+    result = json.loads(get_response_content(client.get(endpoint, {"since": since})))
+    assert result == [
+        {
+            "id": poi_translation.id,
+            "url": settings.BASE_URL + poi_translation.get_absolute_url(),
+            "path": poi_translation.get_absolute_url(),
+            "deleted": True,
+        }
+    ]
+
+
+@pytest.mark.django_db
+def test_api_pages_parent_without_public_translation(load_test_data: None) -> None:
+    """
+    Check that pages whose parent has no public translation are skipped in the streamed pages endpoint
+    and returned as tombstones by the delta sync
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    client = Client()
+    endpoint = "/api/v3/augsburg/de/pages/"
+    since = timezone.now().isoformat()
+    page = next(
+        page
+        for page in Page.objects.filter(
+            region__slug="augsburg",
+            explicitly_archived=False,
+            parent__explicitly_archived=False,
+        )
+        if page.get_public_translation("de")
+    )
+    page_translation = page.get_public_translation("de")
+    for parent_translation in page.parent.translations.filter(language__slug="de"):
+        parent_translation.status = status.DRAFT
+        parent_translation.save()
+
+    response = client.get(endpoint)
+    assert response.status_code == 200
+    result = json.loads(get_response_content(response))
+    assert result
+    assert page_translation.id not in {item["id"] for item in result}
+
+    result = json.loads(get_response_content(client.get(endpoint, {"since": since})))
+    assert {
+        "id": page_translation.id,
+        "url": settings.BASE_URL + page_translation.get_absolute_url(),
+        "path": page_translation.get_absolute_url(),
+        "deleted": True,
+    } in result
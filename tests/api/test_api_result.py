@@ -6,9 +6,15 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from pytest_django.fixtures import SettingsWrapper
+
 import pytest
 from django.test.client import Client
 
+from integreat_cms.cms.models import Region
+from integreat_cms.cms.utils.page_tree_index import get_page_tree_index
+from tests.utils import get_response_content
+
 from .api_config import API_ENDPOINTS
 
 
@@ -18,6 +24,7 @@ from .api_config import API_ENDPOINTS
 )
 def test_api_result(
     load_test_data: None,
+    settings: SettingsWrapper,
     django_assert_num_queries: Callable,
     endpoint: str,
     wp_endpoint: str,
@@ -31,6 +38,7 @@ def test_api_result(
     provided in the corresponding json file.
 
     :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
     :param django_assert_num_queries: The fixture providing the query assertion
     :param endpoint: The url of the new Django pattern
     :param wp_endpoint: The legacy url of the wordpress endpoint pattern
@@ -38,16 +46,23 @@ def test_api_result(
     :param expected_code: The expected HTTP status code
     :param expected_queries: The expected number of SQL queries
     """
+    # In production, the page tree indices are cached across requests, so build them before counting the queries
+    settings.PAGE_TREE_INDEX_CACHE_ENABLED = True
+    for region_id in Region.objects.values_list("id", flat=True):
+        get_page_tree_index(region_id)
     client = Client()
     with django_assert_num_queries(expected_queries):
         response = client.get(endpoint, format="json")
+        # Streaming responses execute their queries while the content is consumed
+        content = get_response_content(response)
     print(response.headers)
     assert response.status_code == expected_code
     with django_assert_num_queries(expected_queries):
         response_wp = client.get(wp_endpoint, format="json")
+        content_wp = get_response_content(response_wp)
     print(response_wp.headers)
     assert response_wp.status_code == expected_code
     with open(expected_result, encoding="utf-8") as f:
         result = json.load(f)
-        assert result == response.json()
-        assert result == response_wp.json()
+        assert result == json.loads(content)
+        assert result == json.loads(content_wp)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+from freezegun import freeze_time
+
+from integreat_cms.cms.models import PageTranslation, Region
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+def test_api_pages_snapshot(
+    load_test_data: None,
+    settings: SettingsWrapper,
+) -> None:
+    """
+    Check that the pages endpoint is served from a snapshot and that the snapshot is rebuilt after a page changed
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    """
+    settings.API_SNAPSHOTS_ENABLED = True
+    cache.clear()
+    client = Client()
+    endpoint = "/api/v3/augsburg/de/pages/"
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(endpoint, format="json")
+    assert response.status_code == 200
+    # The second request should not run any of the queries required to build the result
+    with CaptureQueriesContext(connection) as cached_queries:
+        cached_response = client.get(endpoint, format="json")
+    assert len(cached_queries) < len(queries)
+    assert cached_response.status_code == 200
+    assert cached_response.content == response.content
+
+    # Change the title of a page and check whether the snapshot is invalidated
+    page_translation = PageTranslation.objects.get(id=response.json()[0]["id"])
+    page_translation.title = "New snapshot title"
+    page_translation.save()
+    updated_response = client.get(endpoint, format="json")
+    assert updated_response.status_code == 200
+    assert any(
+        page["title"] == "New snapshot title" for page in updated_response.json()
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        "/api/v3/augsburg/de/pages/",
+        "/api/v3/augsburg/de/events/",
+        "/api/v3/augsburg/de/locations/",
+        "/api/v3/augsburg/de/offers/",
+        "/api/v3/augsburg/de/fcm/",
+    ],
+)
+def test_api_conditional_requests(
+    load_test_data: None, settings: SettingsWrapper, endpoint: str
+) -> None:
+    """
+    Check that the content endpoints answer conditional requests with HTTP status 304
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param endpoint: The url of the endpoint
+    """
+    settings.API_SNAPSHOTS_ENABLED = True
+    cache.clear()
+    client = Client()
+
+    response = client.get(endpoint, format="json")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    not_modified_response = client.get(endpoint, HTTP_IF_NONE_MATCH=etag)
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.content == b""
+
+    # After the region was changed, the content has to be delivered again
+    Region.objects.get(slug="augsburg").save()
+    modified_response = client.get(endpoint, HTTP_IF_NONE_MATCH=etag)
+    assert modified_response.status_code == 200
+    assert modified_response.headers["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_api_last_modified_granularity(
+    load_test_data: None, settings: SettingsWrapper
+) -> None:
+    """
+    Check that the ``Last-Modified`` header is only set after the second of the last change is over, because a later
+    change within the same second could otherwise not be detected with ``If-Modified-Since``
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    """
+    settings.API_SNAPSHOTS_ENABLED = True
+    client = Client()
+    endpoint = "/api/v3/augsburg/de/pages/"
+
+    with freeze_time("2024-04-11 10:30:00.5") as frozen_time:
+        cache.clear()
+        response = client.get(endpoint, format="json")
+        assert response.status_code == 200
+        assert "Last-Modified" not in response.headers
+
+        frozen_time.tick(1)
+        response = client.get(endpoint, format="json")
+        assert response.status_code == 200
+        last_modified = response.headers["Last-Modified"]
+        not_modified_response = client.get(
+            endpoint, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        assert not_modified_response.status_code == 304
+
+        # A change in the current second must not be answered with 304
+        frozen_time.tick(0.1)
+        Region.objects.get(slug="augsburg").save()
+        modified_response = client.get(endpoint, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert modified_response.status_code == 200
+        assert "Last-Modified" not in modified_response.headers
@@ -5,13 +5,12 @@ Test module for RecurrenceRule class
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
-from integreat_cms.cms.models import Event, RecurrenceRule
+import pytest
+from dateutil import rrule
 
-if TYPE_CHECKING:
-    from rrule import rrule
+from integreat_cms.cms.models import Event, RecurrenceRule
 
 
 class TestCreatingIcalRule:
@@ -41,7 +40,7 @@ class TestCreatingIcalRule:
         ical_rrule = recurrence_rule.to_ical_rrule_string()
         assert ical_rrule == "DTSTART:20200101T113000\nRRULE:FREQ=YEARLY"
 
-    def check_rrule(self, recurrence_rule: rrule, expected: str) -> None:
+    def check_rrule(self, recurrence_rule: RecurrenceRule, expected: str) -> None:
         self.test_event.recurrence_rule = recurrence_rule
         ical_rrule = recurrence_rule.to_ical_rrule_string()
         assert ical_rrule == expected
@@ -109,3 +108,99 @@ class TestCreatingIcalRule:
             recurrence_end_date=None,
         )
         self.check_rrule(recurrence_rule, "DTSTART:20300101T113000\nRRULE:FREQ=YEARLY")
+
+
+#: Recurrence rules which start on one of their recurrences, so they define the same dates as :mod:`dateutil.rrule`
+SEEK_TEST_RULES = [
+    ("DAILY", 3, None, None, None, datetime.date(2019, 3, 5)),
+    ("WEEKLY", 1, [0, 3], None, None, datetime.date(2019, 3, 4)),
+    ("WEEKLY", 3, [1, 4, 6], None, None, datetime.date(2019, 3, 5)),
+    ("MONTHLY", 1, None, 2, 1, datetime.date(2019, 3, 6)),
+    ("MONTHLY", 2, None, 4, 3, datetime.date(2019, 3, 15)),
+    ("YEARLY", 2, None, None, None, datetime.date(2019, 3, 5)),
+]
+
+
+@pytest.mark.parametrize(
+    "frequency,interval,weekdays,weekday,week,start_date", SEEK_TEST_RULES
+)
+def test_seek_matches_ical_rrule(
+    frequency: str,
+    interval: int,
+    weekdays: list[int] | None,
+    weekday: int | None,
+    week: int | None,
+    start_date: datetime.date,
+) -> None:
+    """
+    Check that seeking and iterating recurrences produces the same dates as :mod:`dateutil.rrule`
+
+    :param frequency: The frequency of the recurrence rule
+    :param interval: The interval of the recurrence rule
+    :param weekdays: The weekdays of weekly recurrence rules
+    :param weekday: The weekday of monthly recurrence rules
+    :param week: The week of monthly recurrence rules
+    :param start_date: The start date of the event
+    """
+    recurrence_end_date = datetime.date(2027, 6, 30)
+    recurrence_rule = RecurrenceRule(
+        frequency=frequency,
+        interval=interval,
+        weekdays_for_weekly=weekdays,
+        weekday_for_monthly=weekday,
+        week_for_monthly=week,
+        recurrence_end_date=recurrence_end_date,
+    )
+    kwargs = {}
+    if weekdays:
+        kwargs["byweekday"] = weekdays
+    elif week:
+        kwargs["byweekday"] = rrule.weekday(weekday, week)
+    expected = [
+        recurrence.date()
+        for recurrence in rrule.rrule(
+            getattr(rrule, frequency),
+            dtstart=datetime.datetime.combine(start_date, datetime.time()),
+            interval=interval,
+            until=datetime.datetime.combine(recurrence_end_date, datetime.time()),
+            **kwargs,
+        )
+    ]
+    assert list(recurrence_rule.iter_after(start_date)) == expected
+
+    for target_date in [
+        start_date - datetime.timedelta(days=10),
+        start_date + datetime.timedelta(days=1),
+        datetime.date(2024, 2, 29),
+        datetime.date(2025, 12, 31),
+    ]:
+        assert recurrence_rule.seek(start_date, target_date) == next(
+            (recurrence for recurrence in expected if recurrence >= target_date),
+            None,
+        )
+    from_date, to_date = datetime.date(2023, 1, 1), datetime.date(2024, 6, 30)
+    assert list(recurrence_rule.iter_between(start_date, from_date, to_date)) == [
+        recurrence for recurrence in expected if from_date <= recurrence <= to_date
+    ]
+    assert recurrence_rule.seek(start_date, datetime.date(2027, 7, 1)) is None
+
+
+def test_seek_leap_day() -> None:
+    """
+    Check that yearly recurrences on february 29 only take place in leap years
+    """
+    recurrence_rule = RecurrenceRule(
+        frequency="YEARLY",
+        interval=1,
+        weekdays_for_weekly=None,
+        weekday_for_monthly=None,
+        week_for_monthly=None,
+        recurrence_end_date=None,
+    )
+    start_date = datetime.date(2020, 2, 29)
+    assert recurrence_rule.seek(start_date, datetime.date(2021, 1, 1)) == datetime.date(
+        2024, 2, 29
+    )
+    assert recurrence_rule.seek(start_date, datetime.date(2097, 1, 1)) == datetime.date(
+        2104, 2, 29
+    )
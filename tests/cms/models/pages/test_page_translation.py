@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+
+from integreat_cms.cms.constants import status
+from integreat_cms.cms.models import Page, PageTranslation
+
+
+@pytest.mark.django_db
+def test_latest_version_markers_of_test_data(load_test_data: None) -> None:
+    """
+    Check that the latest version markers of the test data match the latest versions
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    translations = PageTranslation.objects.filter(page__region__slug="augsburg")
+    latest_ids = set(
+        translations.distinct("page__id", "language__id").values_list("id", flat=True)
+    )
+    latest_public_ids = set(
+        translations.filter(status=status.PUBLIC)
+        .distinct("page__id", "language__id")
+        .values_list("id", flat=True)
+    )
+    marked_ids = set(translations.filter(is_latest=True).values_list("id", flat=True))
+    marked_public_ids = set(
+        translations.filter(is_latest_public=True).values_list("id", flat=True)
+    )
+    assert latest_ids
+    assert marked_ids == latest_ids
+    assert marked_public_ids == latest_public_ids
+
+
+@pytest.mark.django_db
+def test_latest_version_markers(load_test_data: None) -> None:
+    """
+    Check that the latest version markers are updated when new versions are saved or deleted
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    page = Page.objects.filter(
+        region__slug="augsburg",
+        translations__language__slug="de",
+        translations__status=status.PUBLIC,
+    ).first()
+    public_version = page.get_public_translation("de")
+    latest_version = page.get_translation("de")
+    versions = page.translations.filter(language__slug="de")
+
+    # Create a new draft version
+    draft_version = PageTranslation.objects.get(id=latest_version.id)
+    draft_version.pk = None
+    draft_version.version += 1
+    draft_version.status = status.DRAFT
+    draft_version.save()
+    assert draft_version.is_latest
+    assert not draft_version.is_latest_public
+    assert list(versions.filter(is_latest=True)) == [draft_version]
+    assert list(versions.filter(is_latest_public=True)) == [public_version]
+    assert Page.objects.get(id=page.id).get_translation("de") == draft_version
+
+    # Publish the draft version
+    draft_version.status = status.PUBLIC
+    draft_version.save()
+    assert list(versions.filter(is_latest_public=True)) == [draft_version]
+
+    # Delete the new version again
+    draft_version.delete()
+    assert list(versions.filter(is_latest=True)) == [latest_version]
+    assert list(versions.filter(is_latest_public=True)) == [public_version]
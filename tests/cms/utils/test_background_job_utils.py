@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.contrib import messages
+
+from integreat_cms.cms.constants import job_status
+from integreat_cms.cms.utils.background_job_utils import (
+    background_task,
+    claim_job,
+    enqueue_job,
+    run_job,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_django.fixtures import SettingsWrapper
+
+    from integreat_cms.cms.utils.background_job_utils import JobContext
+
+
+@background_task
+def greet(context: JobContext, name: str) -> None:
+    """
+    A background task which reports its progress and adds a message
+
+    :param context: The context of the background job
+    :param name: The name to greet
+    """
+    context.set_progress(1, 2)
+    messages.success(context.request, f"Hello {name}")
+
+
+@background_task
+def fail(context: JobContext) -> None:
+    """
+    A background task which always fails
+
+    :param context: The context of the background job
+    :raises RuntimeError: Always
+    """
+    raise RuntimeError("Something went wrong")
+
+
+def unmarked(context: JobContext) -> None:
+    """
+    A function which is not marked as background task
+
+    :param context: The context of the background job
+    """
+
+
+@pytest.mark.django_db
+def test_unmarked_tasks_are_rejected() -> None:
+    """
+    Check that only functions which are marked as background task can be enqueued
+    """
+    with pytest.raises(ValueError):
+        enqueue_job(unmarked)
+
+
+@pytest.mark.django_db
+def test_job_is_run_by_worker(settings: SettingsWrapper) -> None:
+    """
+    Check that an enqueued job is claimed and executed by a worker and stores its messages
+
+    :param settings: The fixture providing the django settings
+    """
+    settings.BACKGROUND_JOB_QUEUE_ENABLED = True
+    low = enqueue_job(greet, name="low")
+    high = enqueue_job(greet, priority=1, name="high")
+    assert low.status == high.status == job_status.PENDING
+
+    job = claim_job()
+    assert job == high
+    assert job.status == job_status.RUNNING
+    assert job.attempts == 1
+    run_job(job)
+    job.refresh_from_db()
+    assert job.status == job_status.SUCCEEDED
+    assert job.progress == 100
+    assert job.messages == [{"level": "success", "message": "Hello high"}]
+
+    assert claim_job() == low
+    assert claim_job() is None
+
+
+@pytest.mark.django_db
+def test_failed_job_is_retried(settings: SettingsWrapper) -> None:
+    """
+    Check that a failed job is scheduled again until it has no attempts left
+
+    :param settings: The fixture providing the django settings
+    """
+    settings.BACKGROUND_JOB_QUEUE_ENABLED = True
+    settings.BACKGROUND_JOB_RETRY_DELAY = 0
+    enqueue_job(fail, max_attempts=2)
+
+    job = claim_job()
+    run_job(job)
+    job.refresh_from_db()
+    assert job.status == job_status.PENDING
+    assert job.error == "RuntimeError: Something went wrong"
+
+    job = claim_job()
+    assert job.attempts == 2
+    run_job(job)
+    job.refresh_from_db()
+    assert job.status == job_status.FAILED
+    assert job.finished_date
+    assert claim_job() is None
+
+
+@pytest.mark.django_db
+def test_job_is_run_immediately_without_workers(settings: SettingsWrapper) -> None:
+    """
+    Check that jobs are executed immediately if background tasks are disabled
+
+    :param settings: The fixture providing the django settings
+    """
+    settings.BACKGROUND_TASKS_ENABLED = False
+    job = enqueue_job(greet, name="world")
+    assert job.is_finished
+    assert job.status == job_status.SUCCEEDED
+    assert job.messages == [{"level": "success", "message": "Hello world"}]
+
+
+@pytest.mark.django_db
+def test_failed_job_is_not_retried_without_workers(settings: SettingsWrapper) -> None:
+    """
+    Check that a failing job fails immediately if background tasks are disabled, because no worker could retry it
+
+    :param settings: The fixture providing the django settings
+    """
+    settings.BACKGROUND_TASKS_ENABLED = False
+    job = enqueue_job(fail, max_attempts=3)
+    job.refresh_from_db()
+    assert job.status == job_status.FAILED
+    assert job.attempts == 1
+    assert job.error == "RuntimeError: Something went wrong"
+
+
+@pytest.mark.django_db
+def test_job_is_run_in_thread_without_queue(
+    settings: SettingsWrapper, django_capture_on_commit_callbacks: Callable
+) -> None:
+    """
+    Check that jobs are started in a background thread after the commit if the job queue is disabled, so they are not
+    left pending when no worker is running
+
+    :param settings: The fixture providing the django settings
+    :param django_capture_on_commit_callbacks: The fixture to capture :func:`~django.db.transaction.on_commit` callbacks
+    """
+    settings.BACKGROUND_TASKS_ENABLED = True
+    settings.BACKGROUND_JOB_QUEUE_ENABLED = False
+    with django_capture_on_commit_callbacks() as callbacks:
+        job = enqueue_job(greet, name="thread")
+    assert len(callbacks) == 1
+    job.refresh_from_db()
+    assert job.status == job_status.RUNNING
+    assert claim_job() is None
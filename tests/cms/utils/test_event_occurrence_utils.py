@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.utils import timezone
+
+from integreat_cms.cms.constants import frequency
+from integreat_cms.cms.models import Event, EventOccurrence, RecurrenceRule, Region
+from integreat_cms.cms.utils.event_occurrence_utils import (
+    ensure_event_occurrences,
+    get_horizon,
+    invalidate_event_occurrences,
+    update_event_occurrences,
+)
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+def create_event(region: Region, start: datetime, **rule_kwargs: object) -> Event:
+    r"""
+    Create an event which lasts two hours
+
+    :param region: The region of the event
+    :param start: The start of the event
+    :param \**rule_kwargs: The fields of the recurrence rule (if the event should be recurring)
+    :return: The event
+    """
+    recurrence_rule = (
+        RecurrenceRule.objects.create(weekdays_for_weekly=[], **rule_kwargs)
+        if rule_kwargs
+        else None
+    )
+    return Event.objects.create(
+        region=region,
+        start=start,
+        end=start + timedelta(hours=2),
+        recurrence_rule=recurrence_rule,
+    )
+
+
+@pytest.mark.django_db
+def test_event_occurrences(settings: SettingsWrapper) -> None:
+    """
+    Check that the occurrences of recurring events are materialized up to the horizon and rolled forward
+
+    :param settings: The fixture providing the django settings
+    """
+    region = Region.objects.create(name="Testregion")
+    tzinfo = ZoneInfo(region.timezone)
+    today = timezone.now().date()
+    start = datetime.combine(today - timedelta(days=10), time(10), tzinfo=tzinfo)
+    event = create_event(region, start, frequency=frequency.DAILY, interval=2)
+    event.refresh_from_db()
+
+    horizon = get_horizon(event)
+    assert event.occurrences_until == horizon
+    occurrences = list(event.occurrences.all())
+    # Every second day up to the horizon and the first occurrence after it
+    assert len(occurrences) == (horizon - start.date()).days // 2 + 2
+    assert all(
+        timezone.localtime(occurrence.start, tzinfo).time() == time(10)
+        and occurrence.end - occurrence.start == timedelta(hours=2)
+        for occurrence in occurrences
+    )
+
+    # Roll the horizon forward
+    settings.EVENT_OCCURRENCES_HORIZON_DAYS += 30
+    assert (
+        ensure_event_occurrences(
+            Event.objects.filter(id=event.id), horizon + timedelta(days=1)
+        )
+        == 1
+    )
+    event.refresh_from_db()
+    new_horizon = get_horizon(event)
+    assert event.occurrences_until == new_horizon
+    starts = list(event.occurrences.values_list("start", flat=True))
+    assert len(starts) == len(set(starts)) == (new_horizon - start.date()).days // 2 + 2
+
+
+@pytest.mark.django_db
+def test_event_occurrences_stale_update(settings: SettingsWrapper) -> None:
+    """
+    Check that an update based on outdated data (e.g. of a concurrent request) does not duplicate occurrences
+
+    :param settings: The fixture providing the django settings
+    """
+    region = Region.objects.create(name="Testregion")
+    start = datetime.combine(
+        timezone.now().date(), time(10), tzinfo=ZoneInfo(region.timezone)
+    )
+    event = create_event(region, start, frequency=frequency.DAILY, interval=1)
+    stale_event = Event.objects.get(id=event.id)
+    stale_event.occurrences_until = None
+
+    settings.EVENT_OCCURRENCES_HORIZON_DAYS += 30
+    update_event_occurrences(event)
+    update_event_occurrences(stale_event)
+    starts = list(event.occurrences.values_list("start", flat=True))
+    assert len(starts) == len(set(starts))
+    assert stale_event.occurrences_until == event.occurrences_until
+
+
+@pytest.mark.django_db
+def test_filter_upcoming() -> None:
+    """
+    Check that upcoming events are selected by their occurrences and by their recurrence rule if the occurrences are
+    not materialized yet
+    """
+    region = Region.objects.create(name="Testregion")
+    tzinfo = ZoneInfo(region.timezone)
+    today = timezone.now().date()
+    past_start = datetime.combine(today - timedelta(days=30), time(10), tzinfo=tzinfo)
+    past_event = create_event(region, past_start)
+    recurring_event = create_event(
+        region, past_start, frequency=frequency.DAILY, interval=1
+    )
+    assert EventOccurrence.objects.filter(event=past_event).count() == 1
+    assert set(Event.objects.filter(region=region).filter_upcoming()) == {
+        recurring_event
+    }
+
+    # Events without materialized occurrences are filtered by their recurrence rule
+    invalidate_event_occurrences(Event.objects.filter(region=region))
+    assert not EventOccurrence.objects.filter(event__region=region).exists()
+    assert set(Event.objects.filter(region=region).filter_upcoming()) == {
+        recurring_event
+    }
+
+    # Changing the recurrence rule rebuilds the occurrences
+    recurrence_rule = recurring_event.recurrence_rule
+    recurrence_rule.recurrence_end_date = today - timedelta(days=1)
+    recurrence_rule.save()
+    recurring_event.refresh_from_db()
+    assert recurring_event.occurrences_until == date.max
+    assert recurring_event.occurrences.count() == 30
+    assert not Event.objects.filter(region=region).filter_upcoming().exists()
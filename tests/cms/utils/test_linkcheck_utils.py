@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from linkcheck.models import Link, Url
+
+from integreat_cms.cms.models import LinkcheckStats, PageTranslation, Region
+from integreat_cms.cms.utils.linkcheck_utils import (
+    filter_urls,
+    get_linkcheck_stats,
+    get_region_links,
+    rebuild_linkcheck_stats,
+    replace_links,
+)
+
+
+@pytest.mark.django_db
+def test_get_linkcheck_stats(load_test_data: None) -> None:
+    """
+    Check that the linkcheck statistics match the url categories and are updated when the links of the region change
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    region = Region.objects.get(slug="augsburg")
+
+    stats = get_linkcheck_stats(region)
+    assert stats["counts"] == filter_urls(region.slug)[1]
+    with CaptureQueriesContext(connection) as queries:
+        assert get_linkcheck_stats(region) == stats
+    # Only the counters, the first invalid url and one of its links are loaded
+    assert len(queries) <= 3
+
+    # Ignore all links of one url which is not ignored yet
+    url = next(
+        link.url
+        for link in get_region_links(region).select_related("url")
+        if not link.ignore
+    )
+    for link in get_region_links(region).filter(url=url):
+        link.ignore = True
+        link.save()
+
+    new_stats = get_linkcheck_stats(region)
+    assert new_stats["counts"] == filter_urls(region.slug)[1]
+    assert (
+        new_stats["counts"]["number_ignored_urls"]
+        == stats["counts"]["number_ignored_urls"] + 1
+    )
+
+    # Checking a url moves it to another category without loading its links
+    url = next(
+        url
+        for url in filter_urls(region.slug, url_filter="valid")[0]
+        if url.type not in settings.LINKCHECK_IGNORED_URL_TYPES
+    )
+    url.status = False
+    url.message = "Broken"
+    with CaptureQueriesContext(connection) as queries:
+        url.save()
+    assert not any('"linkcheck_link"' in query["sql"] for query in queries)
+    assert get_linkcheck_stats(region)["counts"] == filter_urls(region.slug)[1]
+
+    # Deleting the links removes the url from the statistics
+    Link.objects.filter(url=url).delete()
+    assert get_linkcheck_stats(region)["counts"] == filter_urls(region.slug)[1]
+
+
+@pytest.mark.django_db
+def test_rebuild_linkcheck_stats_only_missing(load_test_data: None) -> None:
+    """
+    Check that a rebuild which waited for a concurrent rebuild does not build the statistics again
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    region = Region.objects.get(slug="augsburg")
+    rebuild_linkcheck_stats(region, only_missing=True)
+    stats_ids = set(
+        LinkcheckStats.objects.filter(region=region).values_list("id", flat=True)
+    )
+    assert stats_ids
+    rebuild_linkcheck_stats(region, only_missing=True)
+    assert (
+        set(LinkcheckStats.objects.filter(region=region).values_list("id", flat=True))
+        == stats_ids
+    )
+    # An explicit rebuild replaces the statistics
+    rebuild_linkcheck_stats(region)
+    assert not stats_ids & set(
+        LinkcheckStats.objects.filter(region=region).values_list("id", flat=True)
+    )
+
+
+@pytest.mark.django_db
+def test_replace_links(load_test_data: None) -> None:
+    """
+    Check that only the translations with matching links get new versions and that their link objects are moved
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    test_url = "https://integreat.app/augsburg/de/willkommen/"
+    replaced_url = "https://integreat.app/new-slug/de/willkommen/"
+    previous_versions = [
+        link.content_object for link in Link.objects.filter(url__url=test_url)
+    ]
+    number_of_versions = PageTranslation.objects.count()
+
+    replace_links("/augsburg/de/willkommen/", "/new-slug/de/willkommen/")
+
+    assert not Url.objects.filter(url=test_url).exists()
+    links = Link.objects.filter(url__url=replaced_url)
+    assert links.count() == len(previous_versions) == 3
+    for link in links:
+        assert link.content_object not in previous_versions
+        assert link.content_object.is_latest
+        assert replaced_url in link.content_object.content
+    for previous_version in previous_versions:
+        previous_version.refresh_from_db()
+        assert not previous_version.is_latest
+        assert not previous_version.links.exists()
+    assert PageTranslation.objects.count() == number_of_versions + sum(
+        isinstance(version, PageTranslation) for version in previous_versions
+    )
+    # The new internal url is checked immediately
+    new_url = Url.objects.get(url=replaced_url)
+    assert new_url.last_checked
+    assert new_url.status is False
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from integreat_cms.cms.models import Page, Region
+from integreat_cms.cms.utils.page_tree_index import (
+    get_page_tree_index,
+    get_page_tree_index_version_key,
+    PAGE_TREE_INDEX_PREFIX,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+def test_page_tree_index(load_test_data: None) -> None:
+    """
+    Check that the page tree index answers the same as the nested set queries
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    region = Region.objects.get(slug="augsburg")
+    tree_index = get_page_tree_index(region.id)
+    pages = list(region.pages.all())
+    assert len(tree_index) == len(pages)
+    for page in pages:
+        assert tree_index.get_parent_id(page.id) == page.parent_id
+        assert tree_index.get_ancestor_ids(page.id) == [
+            ancestor.id for ancestor in page.get_ancestors()
+        ]
+        assert list(tree_index.get_descendant_ids(page.id)) == [
+            descendant.id for descendant in page.get_descendants()
+        ]
+        assert tree_index.get_children_ids(page.id) == [
+            child.id for child in page.get_children()
+        ]
+        assert tree_index.is_archived(page.id) == page.archived
+
+
+@pytest.mark.django_db
+def test_page_tree_index_invalidation(load_test_data: None) -> None:
+    """
+    Check that the page tree index is rebuilt after the page tree changed
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    region = Region.objects.get(slug="augsburg")
+    page = region.pages.filter(explicitly_archived=False, lft=1).first()
+    assert not get_page_tree_index(region.id).is_archived(page.id)
+    page.explicitly_archived = True
+    page.save()
+    tree_index = get_page_tree_index(region.id)
+    assert tree_index.is_archived(page.id)
+    for descendant_id in tree_index.get_descendant_ids(page.id):
+        assert tree_index.is_implicitly_archived(descendant_id)
+        assert Page.objects.get(id=descendant_id).implicitly_archived
+
+
+@pytest.mark.django_db
+def test_cache_tree_descendants(load_test_data: None) -> None:
+    """
+    Check that the descendants of the cached page tree match the nested set queries
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    region = Region.objects.get(slug="augsburg")
+    for page in region.pages.all().cache_tree():
+        assert [descendant.id for descendant in page.get_cached_descendants()] == [
+            descendant.id for descendant in page.get_descendants()
+        ]
+        assert [child.id for child in page.cached_children] == [
+            child.id for child in page.get_children()
+        ]
+
+
+@pytest.mark.django_db
+def test_page_tree_index_cache(
+    load_test_data: None,
+    settings: SettingsWrapper,
+    django_capture_on_commit_callbacks: Callable,
+) -> None:
+    """
+    Check that a cached page tree index is returned without database queries and rebuilt after a page was saved and
+    again after the transaction was committed
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param django_capture_on_commit_callbacks: The fixture to capture :func:`~django.db.transaction.on_commit` callbacks
+    """
+    settings.PAGE_TREE_INDEX_CACHE_ENABLED = True
+    region = Region.objects.get(slug="augsburg")
+    with CaptureQueriesContext(connection) as queries:
+        tree_index = get_page_tree_index(region.id)
+    assert len(queries) == 1
+    with CaptureQueriesContext(connection) as queries:
+        assert get_page_tree_index(region.id) is not None
+    assert not queries
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        region.pages.first().save()
+    version = cache.get(get_page_tree_index_version_key(region.id))
+    with CaptureQueriesContext(connection) as queries:
+        assert len(get_page_tree_index(region.id)) == len(tree_index)
+    assert len(queries) == 1
+
+    # An index which was built by a concurrent request before the commit is not used afterwards
+    for callback in callbacks:
+        callback()
+    assert cache.get(get_page_tree_index_version_key(region.id)) != version
+    with CaptureQueriesContext(connection) as queries:
+        get_page_tree_index(region.id)
+    assert len(queries) == 1
+
+
+@pytest.mark.django_db
+def test_page_tree_index_cache_disabled(
+    load_test_data: None, settings: SettingsWrapper
+) -> None:
+    """
+    Check that the page tree index is built from the database on every request if the cache is disabled
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    """
+    settings.PAGE_TREE_INDEX_CACHE_ENABLED = False
+    region = Region.objects.get(slug="augsburg")
+    num_pages = region.pages.count()
+    for _ in range(2):
+        with CaptureQueriesContext(connection) as queries:
+            assert len(get_page_tree_index(region.id)) == num_pages
+        assert len(queries) == 1
+    assert cache.get(f"{PAGE_TREE_INDEX_PREFIX}_{region.id}") is None
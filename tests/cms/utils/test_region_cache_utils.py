@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from integreat_cms.cms.models import Region
+from integreat_cms.cms.utils.region_cache_utils import (
+    get_cached_region,
+    invalidate_region_cache,
+    local_region_cache,
+    REGION_CACHE_VERSION_KEY,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+def test_get_cached_region(load_test_data: None, settings: SettingsWrapper) -> None:
+    """
+    Check that cached regions are returned without database queries and invalidated when the region changes
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    """
+    settings.REGION_CACHE_ENABLED = True
+    cache.clear()
+    local_region_cache.clear()
+
+    region = get_cached_region("augsburg")
+    with CaptureQueriesContext(connection) as queries:
+        cached_region = get_cached_region("augsburg")
+        active_languages = cached_region.active_languages
+        default_language = cached_region.default_language
+    assert not queries
+    assert cached_region == region
+    assert cached_region is not region
+    assert active_languages == region.active_languages
+    assert default_language == region.default_language
+
+    # Modifications of a copy must not affect the cache
+    cached_region.name = "Modified"
+    assert get_cached_region("augsburg").name == region.name
+
+    # Saving the region invalidates the cache
+    db_region = Region.objects.get(slug="augsburg")
+    db_region.name = "Augsburg (new)"
+    db_region.save()
+    assert get_cached_region("augsburg").name == "Augsburg (new)"
+
+    # Changes of the language tree invalidate the cache as well
+    node = db_region.language_tree_nodes.exclude(
+        id=db_region.language_tree_root.id
+    ).first()
+    node.active = not node.active
+    node.save()
+    assert (node.language in get_cached_region("augsburg").active_languages) == (
+        node.active
+    )
+
+    with pytest.raises(Region.DoesNotExist):
+        get_cached_region("non-existing")
+
+
+@pytest.mark.django_db
+def test_region_cache_is_invalidated_after_commit(
+    load_test_data: None,
+    settings: SettingsWrapper,
+    django_capture_on_commit_callbacks: Callable,
+) -> None:
+    """
+    Check that the region cache is invalidated again after the transaction is committed, so regions which were
+    cached by concurrent requests before the commit are not used afterwards
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param django_capture_on_commit_callbacks: The fixture to capture :func:`~django.db.transaction.on_commit` callbacks
+    """
+    settings.REGION_CACHE_ENABLED = True
+    cache.clear()
+    local_region_cache.clear()
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        invalidate_region_cache()
+        # Simulate a concurrent request which caches the region before the commit
+        get_cached_region("augsburg")
+        version = cache.get(REGION_CACHE_VERSION_KEY)
+    assert len(callbacks) == 1
+
+    callbacks[0]()
+    assert cache.get(REGION_CACHE_VERSION_KEY) != version
+    assert not local_region_cache
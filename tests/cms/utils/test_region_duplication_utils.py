@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from integreat_cms.cms.models import LanguageTreeNode, Page
+from integreat_cms.cms.utils.region_duplication_utils import get_nested_set_values
+
+
+def test_nested_set_values_skip_subtrees() -> None:
+    """
+    Check that the nested set values of the copies are consistent if a subtree is not copied
+    """
+    # Two trees (1 > 2 > 3, 1 > 4 and 5), where the node 2 is skipped (e.g. because it's archived)
+    nodes = [
+        SimpleNamespace(id=1, parent_id=None),
+        SimpleNamespace(id=3, parent_id=2),
+        SimpleNamespace(id=4, parent_id=1),
+        SimpleNamespace(id=5, parent_id=None),
+    ]
+    assert get_nested_set_values(nodes, 10) == {
+        1: {"tree_id": 10, "lft": 1, "rgt": 4, "depth": 1},
+        4: {"tree_id": 10, "lft": 2, "rgt": 3, "depth": 2},
+        5: {"tree_id": 11, "lft": 1, "rgt": 2, "depth": 1},
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("model", [LanguageTreeNode, Page])
+def test_nested_set_values_match_source(
+    load_test_data: None, model: type[LanguageTreeNode | Page]
+) -> None:
+    """
+    Check that the nested set values of complete copies have the same structure as the source trees
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param model: The tree model
+    """
+    nodes = list(model.objects.filter(region_id=1).order_by("tree_id", "lft"))
+    values = get_nested_set_values(nodes, 1)
+    tree_ids = sorted({node.tree_id for node in nodes})
+    for node in nodes:
+        assert values[node.id] == {
+            "tree_id": tree_ids.index(node.tree_id) + 1,
+            "lft": node.lft,
+            "rgt": node.rgt,
+            "depth": node.depth,
+        }
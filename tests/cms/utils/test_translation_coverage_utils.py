@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+
+from integreat_cms.cms.models import (
+    PageTranslation,
+    PageTranslationCoverage,
+    Region,
+    TranslationCoverage,
+)
+from integreat_cms.cms.utils.translation_coverage_utils import (
+    calculate_translation_states,
+    get_translation_coverage,
+    rebuild_translation_coverage,
+)
+
+
+def get_stored_coverage(region: Region) -> dict[tuple[int, str], tuple[int, int]]:
+    """
+    Get the stored translation coverage of a region, ignoring empty entries
+
+    :param region: The region
+    :return: The number of pages and words per language id and translation state
+    """
+    return {
+        (coverage.language_id, coverage.translation_state): (
+            coverage.page_count,
+            coverage.word_count,
+        )
+        for coverage in TranslationCoverage.objects.filter(region=region)
+        if coverage.page_count or coverage.word_count
+    }
+
+
+@pytest.mark.django_db
+def test_translation_coverage_incremental_update(load_test_data: None) -> None:
+    """
+    Check that the translation coverage is built on demand and updated incrementally when page translations change,
+    resulting in the same statistics as a rebuild from scratch
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    region = Region.objects.get(slug="augsburg")
+    translation_count, word_count = get_translation_coverage(region)
+    assert region.default_language not in translation_count
+    translation_states = calculate_translation_states(region)
+    assert sum(sum(counter.values()) for counter in translation_count.values()) == sum(
+        len(page_states) for page_states in translation_states.values()
+    )
+    assert PageTranslationCoverage.objects.filter(page__region=region).count() == len(
+        translation_states
+    )
+
+    # Create a new major version in the default language, which makes the translations outdated
+    page_translation = region.pages.get(
+        id=next(iter(translation_states))
+    ).get_translation(region.default_language.slug)
+    page_translation.pk = None
+    page_translation.version += 1
+    page_translation.minor_edit = False
+    page_translation.content += " additional words"
+    page_translation.save()
+    updated_coverage = get_stored_coverage(region)
+
+    rebuild_translation_coverage(region)
+    assert get_stored_coverage(region) == updated_coverage
+
+    # Archiving the page removes it from the statistics
+    page = page_translation.page
+    page.archive()
+    assert not PageTranslationCoverage.objects.filter(page=page).exists()
+    archived_coverage = get_stored_coverage(region)
+    rebuild_translation_coverage(region)
+    assert get_stored_coverage(region) == archived_coverage
+
+
+@pytest.mark.django_db
+def test_translation_coverage_translation_deleted(load_test_data: None) -> None:
+    """
+    Check that the translation coverage is updated when a page translation is deleted
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    region = Region.objects.get(slug="augsburg")
+    get_translation_coverage(region)
+    coverage = get_stored_coverage(region)
+    page_translation = (
+        PageTranslation.objects.filter(page_id__in=calculate_translation_states(region))
+        .exclude(language=region.default_language)
+        .first()
+    )
+    page_translation.page.translations.filter(
+        language=page_translation.language
+    ).delete()
+    updated_coverage = get_stored_coverage(region)
+    assert updated_coverage != coverage
+
+    rebuild_translation_coverage(region)
+    assert get_stored_coverage(region) == updated_coverage
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from integreat_cms.cms.models import TranslationMemoryEntry
+from integreat_cms.cms.utils.translation_memory_utils import (
+    get_segment_hash,
+    normalize_segment,
+    TranslationMemory,
+)
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+def test_normalize_segment() -> None:
+    """
+    Check that insignificant whitespace does not change the hash of a segment, while line breaks do
+    """
+    assert normalize_segment("  Hello \t  world \n  again ") == "Hello world\nagain"
+    assert get_segment_hash("Hello  world") == get_segment_hash(" Hello world\t")
+    assert get_segment_hash("Hello world") != get_segment_hash("Hello\nworld")
+    # Composed and decomposed umlauts are equivalent
+    assert get_segment_hash("Gr\u00fc\u00dfe") == get_segment_hash("Gru\u0308\u00dfe")
+
+
+@pytest.mark.django_db
+def test_translation_memory_roundtrip(settings: SettingsWrapper) -> None:
+    """
+    Check that stored translations are found again and are separated per provider and language pair
+
+    :param settings: The fixture providing the django settings
+    """
+    settings.TRANSLATION_MEMORY_ENABLED = True
+    memory = TranslationMemory("DeepL", "de", "en-gb")
+    memory.store({"Hallo Welt": "Hello world", "Leer": ""})
+
+    memorized = memory.lookup(["Hallo  Welt ", "Unbekannt", "Leer"])
+    assert memorized == {get_segment_hash("Hallo Welt"): "Hello world"}
+    assert not TranslationMemory("DeepL", "de", "fr").lookup(["Hallo Welt"])
+    assert not TranslationMemory("SUMM.AI", "de", "en-gb").lookup(["Hallo Welt"])
+
+    # Storing a segment again updates the existing entry
+    memory.store({"Hallo Welt": "Hello, world"})
+    assert memory.lookup(["Hallo Welt"]) == {
+        get_segment_hash("Hallo Welt"): "Hello, world"
+    }
+    assert TranslationMemoryEntry.objects.count() == 1
+
+    # A disabled translation memory neither stores nor finds anything
+    settings.TRANSLATION_MEMORY_ENABLED = False
+    assert not memory.lookup(["Hallo Welt"])
+    memory.store({"Tschüss": "Bye"})
+    assert TranslationMemoryEntry.objects.count() == 1
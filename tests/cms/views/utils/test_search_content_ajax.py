@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from django.test.client import Client
+from django.urls import reverse
+
+from integreat_cms.cms.models import PageTranslation
+from integreat_cms.cms.views.utils.search_content_ajax import get_rank
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("archived", [False, True])
+def test_search_pages(
+    load_test_data: None, admin_client: Client, archived: bool
+) -> None:
+    """
+    Check that the live search returns the latest matching page translations with the requested archived state
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param admin_client: The fixture providing the logged in admin
+    :param archived: Whether archived pages should be searched
+    """
+    query = "e"
+    response = admin_client.post(
+        reverse(
+            "search_content_ajax",
+            kwargs={"region_slug": "augsburg", "language_slug": "de"},
+        ),
+        data=json.dumps(
+            {"query_string": query, "object_types": ["page"], "archived": archived}
+        ),
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+    results = response.json()["data"]
+    assert results
+    # Only compare the prefix ranking, because the alphabetical order depends on the collation of the database
+    prefix_mismatches = [get_rank(result["title"], query)[0] for result in results]
+    assert prefix_mismatches == sorted(prefix_mismatches)
+
+    expected_titles = {
+        translation.title
+        for translation in PageTranslation.objects.filter(
+            page__region__slug="augsburg", language__slug="de", is_latest=True
+        )
+        if translation.page.archived == archived
+        and (query in translation.title.lower() or query in translation.slug)
+    }
+    assert {result["title"] for result in results} <= expected_titles
+    assert len(results) == min(len(expected_titles), 20)
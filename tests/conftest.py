@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.management import call_command
 from django.test.client import AsyncClient, Client
 from pytest_httpserver.httpserver import HTTPServer
@@ -68,6 +69,15 @@ def load_test_data(django_db_setup: None, django_db_blocker: _DatabaseBlocker) -
         call_command("loaddata", "integreat_cms/cms/fixtures/test_data.json")
 
 
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    """
+    Clear the cache before each test, because data which was cached during a previous test might not match the rolled
+    back database anymore
+    """
+    cache.clear()
+
+
 @pytest.fixture(scope="function")
 def load_test_data_transactional(
     transactional_db: None, django_db_blocker: _DatabaseBlocker
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from integreat_cms.core.utils import http_client
+from integreat_cms.core.utils.http_client import (
+    async_request,
+    get_async_session,
+    get_http_metrics,
+    get_session,
+    run_async,
+)
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_django.fixtures import SettingsWrapper
+
+    from tests.mock import MockServer
+
+
+@pytest.fixture(name="fresh_session")
+def fixture_fresh_session(monkeypatch: MonkeyPatch) -> None:
+    """
+    Make sure a new session is created with the settings of the current test
+
+    :param monkeypatch: The fixture providing the monkeypatch object
+    """
+    monkeypatch.setattr(http_client, "session_of_process", None)
+
+
+def test_session_is_shared(monkeypatch: MonkeyPatch) -> None:
+    """
+    Check that the synchronous session is shared within a process and recreated after a fork
+
+    :param monkeypatch: The fixture providing the monkeypatch object
+    """
+    session = get_session()
+    assert get_session() is session
+    # Simulate a forked process
+    monkeypatch.setattr(http_client.os, "getpid", lambda: os.getpid() + 1)
+    assert get_session() is not session
+
+
+def test_session_retries_idempotent_requests(
+    settings: SettingsWrapper, mock_server: MockServer, fresh_session: None
+) -> None:
+    """
+    Check that idempotent requests are retried if the server is temporarily unavailable and that the requests are
+    recorded in the metrics
+
+    :param settings: The fixture providing the django settings
+    :param mock_server: The fixture providing the dummy http server
+    :param fresh_session: The fixture which resets the shared session
+    """
+    settings.HTTP_MAX_RETRIES = 2
+    settings.HTTP_RETRY_BACKOFF = 0
+    mock_server.configure("/unavailable", 503, {})
+    host = f"localhost:{mock_server.port}"
+    requests_before = get_http_metrics().get(host, {}).get("requests", 0)
+
+    response = get_session().get(f"http://{host}/unavailable")
+    assert response.status_code == 503
+    # The initial request and two retries
+    assert mock_server.requests_counter == 3
+    assert get_http_metrics()[host]["requests"] - requests_before == 3
+
+    # Non-idempotent requests are not retried
+    response = get_session().post(f"http://{host}/unavailable")
+    assert response.status_code == 503
+    assert mock_server.requests_counter == 4
+
+
+def test_async_requests_share_loop_and_session(
+    settings: SettingsWrapper, mock_server: MockServer
+) -> None:
+    """
+    Check that coroutines are run on a persistent event loop with a shared session and that idempotent requests are
+    retried
+
+    :param settings: The fixture providing the django settings
+    :param mock_server: The fixture providing the dummy http server
+    """
+    settings.HTTP_MAX_RETRIES = 1
+    settings.HTTP_RETRY_BACKOFF = 0
+    mock_server.configure("/data", 200, {"result": "success"})
+    mock_server.configure("/unavailable", 502, {})
+    url = f"http://localhost:{mock_server.port}"
+
+    async def fetch(path: str) -> tuple[int, object]:
+        async with async_request(
+            get_async_session(), "GET", f"{url}{path}"
+        ) as response:
+            return response.status, get_async_session()
+
+    status, session = run_async(fetch("/data"))
+    assert status == 200
+    assert run_async(fetch("/data"))[1] is session
+    assert mock_server.requests_counter == 2
+
+    status, _ = run_async(fetch("/unavailable"))
+    assert status == 502
+    assert mock_server.requests_counter == 4
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from django.http import JsonResponse
+
+from integreat_cms.core.utils.streaming_json_response import (
+    iter_json_array,
+    StreamingJsonResponse,
+)
+
+if TYPE_CHECKING:
+    from typing import Any
+
+ITEMS: list[list[Any]] = [
+    [],
+    [None],
+    [{"title": "Überschrift", "date": datetime.date(2024, 1, 1), "list": [1, 2.5]}],
+    [{"id": i, "content": "<p>" + "x" * i + "</p>"} for i in range(1000)],
+]
+
+
+@pytest.mark.parametrize("items", ITEMS)
+@pytest.mark.parametrize("chunk_size", [1, 100, 64 * 1024])
+def test_iter_json_array(items: list[Any], chunk_size: int) -> None:
+    """
+    Check that the streamed JSON array is identical to the output of :class:`~django.http.JsonResponse`
+
+    :param items: The items of the array
+    :param chunk_size: The minimal size of the chunks
+    """
+    expected = JsonResponse(items, safe=False).content.decode()
+    assert "".join(iter_json_array(iter(items), chunk_size=chunk_size)) == expected
+
+
+@pytest.mark.parametrize("items", ITEMS)
+def test_streaming_json_response(items: list[Any]) -> None:
+    """
+    Check that the streaming response is identical to :class:`~django.http.JsonResponse`
+
+    :param items: The items of the array
+    """
+    expected = JsonResponse(items, safe=False)
+    response = StreamingJsonResponse(item for item in items)
+    assert response["Content-Type"] == expected["Content-Type"]
+    assert b"".join(response.streaming_content) == expected.content
@@ -10,13 +10,16 @@ if TYPE_CHECKING:
     from django.db.models.base import ModelBase
     from _pytest.logging import LogCaptureFixture
     from django.test.client import Client
+    from _pytest.monkeypatch import MonkeyPatch
+    from werkzeug.wrappers import Request
 
 import pytest
 from django.apps import apps
+from django.contrib.messages import get_messages
 from django.urls import reverse
 from django.utils.html import strip_tags
 
-from integreat_cms.cms.constants import status
+from integreat_cms.cms.constants import job_status, status
 from integreat_cms.cms.models import (
     Event,
     EventTranslation,
@@ -27,7 +30,9 @@ from integreat_cms.cms.models import (
     Region,
 )
 from integreat_cms.cms.models.pois.poi import get_default_opening_hours
+from integreat_cms.cms.utils.background_job_utils import claim_job, run_job
 from integreat_cms.cms.utils.stringify_list import iter_to_string
+from integreat_cms.deepl_api import deepl_api_client
 from tests.mock import MockServer
 
 from ..conftest import (
@@ -48,22 +53,28 @@ TARGET_LANGUAGE_SLUG: Final[str] = "en"
 
 def setup_fake_deepl_api_server(mock_server: MockServer) -> None:
     """
-    Setup a mocked DeepL API server with dummy response
+    Setup a mocked DeepL API server with dummy response (one dummy translation per requested text)
 
     :param mock_server: The fixture providing the mock http server for faking the DeepL API server
     """
-    mock_server.configure(
-        "/v2/translate",
-        200,
-        {
+
+    def get_translations(request: Request) -> dict:
+        texts = (
+            request.get_json()["text"]
+            if request.is_json
+            else request.form.getlist("text")
+        )
+        return {
             "translations": [
                 {
                     "detected_source_language": "DE",
                     "text": "This is your translation from DeepL",
                 }
+                for _ in texts
             ]
-        },
-    )
+        }
+
+    mock_server.configure("/v2/translate", 200, get_translations)
 
 
 def setup_deepl_supported_languages(
@@ -214,6 +225,8 @@ def test_deepl_bulk_mt_pages(
             Region.objects.get(slug=REEGION_SLUG).mt_budget_used
             == translated_word_count
         )
+        # All texts of all pages are translated in one request
+        assert mock_server.requests_counter == 1
 
     elif role == ANONYMOUS:
         # For anonymous users, we want to redirect to the login form instead of showing an error
@@ -432,6 +445,121 @@ def test_deepl_bulk_mt_events(
         assert response.status_code == 403
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize("login_role_user", [MANAGEMENT], indirect=True)
+def test_deepl_bulk_mt_batches(
+    load_test_data: None,
+    login_role_user: tuple[Client, str],
+    settings: SettingsWrapper,
+    mock_server: MockServer,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """
+    Check that bulk machine translations are split into multiple requests which respect the limits of the DeepL API
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param login_role_user: The fixture providing the http client and the current role (see :meth:`~tests.conftest.login_role_user`)
+    :param settings: The fixture providing the django settings
+    :param mock_server: The fixture providing the mock http server used for faking the DeepL API server
+    :param monkeypatch: The fixture providing the monkeypatch object
+    """
+    setup_fake_deepl_api_server(mock_server)
+    settings.DEEPL_API_URL = f"http://localhost:{mock_server.port}"
+    settings.DEEPL_TRANSLATION_WORKERS = 2
+    setup_deepl_supported_languages(["de"], ["en-gb", "en-us"])
+    monkeypatch.setattr(deepl_api_client, "MAX_TEXTS_PER_REQUEST", 2)
+
+    client, _role = login_role_user
+    selected_ids = [2, 3, 6]
+    client.post(
+        reverse(
+            "machine_translation_pages",
+            kwargs={
+                "region_slug": REEGION_SLUG,
+                "language_slug": TARGET_LANGUAGE_SLUG,
+            },
+        ),
+        data={"selected_ids[]": selected_ids},
+    )
+
+    page_translations = get_content_translations(
+        Page, selected_ids, SOURCE_LANGUAGE_SLUG, TARGET_LANGUAGE_SLUG
+    )
+    source_texts = {
+        text
+        for page_translation in page_translations
+        for text in [
+            page_translation[SOURCE_LANGUAGE_SLUG].title,
+            page_translation[SOURCE_LANGUAGE_SLUG].content,
+        ]
+        if text
+    }
+    assert mock_server.requests_counter == (len(source_texts) + 1) // 2
+    for page_translation in page_translations:
+        assert page_translation[TARGET_LANGUAGE_SLUG].machine_translated is True
+        assert (
+            page_translation[TARGET_LANGUAGE_SLUG].title
+            == "This is your translation from DeepL"
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("login_role_user", [MANAGEMENT], indirect=True)
+def test_deepl_bulk_mt_background_job(
+    load_test_data: None,
+    login_role_user: tuple[Client, str],
+    settings: SettingsWrapper,
+    mock_server: MockServer,
+) -> None:
+    """
+    Check that bulk machine translations are executed by the background job workers if background tasks are enabled
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param login_role_user: The fixture providing the http client and the current role (see :meth:`~tests.conftest.login_role_user`)
+    :param settings: The fixture providing the django settings
+    :param mock_server: The fixture providing the mock http server used for faking the DeepL API server
+    """
+    setup_fake_deepl_api_server(mock_server)
+    settings.DEEPL_API_URL = f"http://localhost:{mock_server.port}"
+    settings.BACKGROUND_JOB_QUEUE_ENABLED = True
+    setup_deepl_supported_languages(["de"], ["en-gb", "en-us"])
+
+    client, _role = login_role_user
+    selected_ids = [2, 3]
+    response = client.post(
+        reverse(
+            "machine_translation_pages",
+            kwargs={
+                "region_slug": REEGION_SLUG,
+                "language_slug": TARGET_LANGUAGE_SLUG,
+            },
+        ),
+        data={"selected_ids[]": selected_ids},
+    )
+    assert response.status_code == 302
+    assert not mock_server.requests_counter
+
+    job = claim_job()
+    assert job
+    assert job.kwargs["model_label"] == "cms.Page"
+    status_url = reverse("background_job_status_ajax", kwargs={"job_id": job.id})
+    messages = [str(message) for message in get_messages(response.wsgi_request)]
+    assert any(status_url in message for message in messages)
+
+    run_job(job)
+    job.refresh_from_db()
+    assert job.status == job_status.SUCCEEDED
+    assert client.get(status_url).json()["status"] == job_status.SUCCEEDED
+    for page_translation in get_content_translations(
+        Page, selected_ids, SOURCE_LANGUAGE_SLUG, TARGET_LANGUAGE_SLUG
+    ):
+        assert page_translation[TARGET_LANGUAGE_SLUG].machine_translated is True
+        assert (
+            page_translation[TARGET_LANGUAGE_SLUG].title
+            == "This is your translation from DeepL"
+        )
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "login_role_user", PRIV_STAFF_ROLES + [AUTHOR, MANAGEMENT, EDITOR], indirect=True
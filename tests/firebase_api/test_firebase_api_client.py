@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 if TYPE_CHECKING:
     from typing import Any
@@ -15,6 +15,7 @@ import pytest
 from django.core.exceptions import ImproperlyConfigured
 
 from integreat_cms.cms.models import PushNotification, Region
+from integreat_cms.firebase_api import firebase_api_client
 from integreat_cms.firebase_api.firebase_api_client import FirebaseApiClient
 
 
@@ -291,3 +292,80 @@ class TestFirebaseApiClient:
             "augsburg-en-news",
             "augsburg-de-news",
         }
+
+    @pytest.mark.django_db
+    def test_send_all_tracks_results(
+        self, settings: SettingsWrapper, load_test_data: None, requests_mock: Mocker
+    ) -> None:
+        """
+        Tests that concurrently sent messages are tracked individually
+
+        :param settings: The Django settings
+        :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+        :param requests_mock: Fixture for mocking requests, see :doc:`requests-mock:pytest`
+        """
+
+        def evaluate_request(request: _RequestObjectProxy, context: _Context) -> object:
+            if request.json()["message"]["topic"].startswith("nurnberg"):
+                context.status_code = 404
+                return self.response_mock_data["404"]
+            return self.response_mock_data["200_success"]
+
+        requests_mock.post(settings.FCM_URL, json=evaluate_request)
+
+        settings.FCM_ENABLED = True
+        settings.FCM_SEND_WORKERS = 4
+
+        notification = PushNotification.objects.get(pk=1)
+        notification.regions.add(Region.objects.get(slug="nurnberg"))
+
+        pns = FirebaseApiClient(notification)
+        assert not pns.send_all()
+
+        assert requests_mock.call_count == 4
+        assert {
+            (result.region.slug, result.pnt.language.slug, result.status_code)
+            for result in pns.results
+        } == {
+            ("augsburg", "de", 200),
+            ("augsburg", "en", 200),
+            ("nurnberg", "de", 404),
+            ("nurnberg", "en", 404),
+        }
+        assert all(
+            result.fcm_id == "projects/integreat-2020/messages/1"
+            for result in pns.results
+            if result.success
+        )
+
+
+def test_access_token_is_cached(settings: SettingsWrapper) -> None:
+    """
+    Tests that the credentials are only loaded once and only refreshed when their token is no longer valid
+
+    :param settings: The Django settings
+    """
+    settings.FCM_CREDENTIALS = "/path/to/credentials.json"
+    credentials = MagicMock(valid=False, token="access token")
+
+    def refresh(request: object) -> None:
+        credentials.valid = True
+
+    credentials.refresh.side_effect = refresh
+    firebase_api_client.get_credentials.cache_clear()
+    with patch.object(
+        firebase_api_client.service_account.Credentials,
+        "from_service_account_file",
+        return_value=credentials,
+    ) as from_file:
+        # pylint: disable=protected-access
+        assert FirebaseApiClient._get_access_token() == "access token"
+        assert FirebaseApiClient._get_access_token() == "access token"
+        assert from_file.call_count == 1
+        assert credentials.refresh.call_count == 1
+
+        # Expired tokens are refreshed
+        credentials.valid = False
+        assert FirebaseApiClient._get_access_token() == "access token"
+        assert credentials.refresh.call_count == 2
+    firebase_api_client.get_credentials.cache_clear()
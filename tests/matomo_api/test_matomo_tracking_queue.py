@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from integreat_cms.cms.models import BackgroundJob
+from integreat_cms.matomo_api.matomo_tracking_queue import MatomoTrackingQueue
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+    from requests_mock.mocker import Mocker
+    from requests_mock.request import _RequestObjectProxy
+    from requests_mock.response import _Context
+
+
+def get_tracking_data(site_id: int, token: str) -> dict:
+    """
+    Get the parameters of a tracking request
+
+    :param site_id: The Matomo id of the site
+    :param token: The Matomo token of the site
+    :return: The parameters of the tracking request
+    """
+    return {
+        "idsite": site_id,
+        "token_auth": token,
+        "rec": 1,
+        "url": "https://cms.integreat-app.de/api/v3/augsburg/de/pages/",
+    }
+
+
+def test_tracking_requests_are_sent_in_batches(
+    settings: SettingsWrapper, requests_mock: Mocker
+) -> None:
+    """
+    Check that the tracking requests are sent to the bulk tracking endpoint with one request per token
+
+    :param settings: The fixture providing the django settings
+    :param requests_mock: The fixture providing the mocked requests
+    """
+    settings.MATOMO_URL = "https://matomo.example.com"
+    matomo_mock = requests_mock.post("https://matomo.example.com/matomo.php")
+    tracking_queue = MatomoTrackingQueue(num_workers=1, batch_size=10)
+    for _ in range(3):
+        assert tracking_queue.track(get_tracking_data(1, "token-1"))
+    assert tracking_queue.track(get_tracking_data(2, "token-2"))
+    tracking_queue.shutdown()
+
+    bodies = [request.json() for request in matomo_mock.request_history]
+    assert len(bodies) < 5
+    requests_by_token: dict[str, list[str]] = {}
+    for body in bodies:
+        requests_by_token.setdefault(body["token_auth"], []).extend(body["requests"])
+    assert len(requests_by_token["token-1"]) == 3
+    assert len(requests_by_token["token-2"]) == 1
+    assert requests_by_token["token-1"][0].startswith("?idsite=1&rec=1&url=")
+    assert "token" not in requests_by_token["token-1"][0]
+
+
+def test_tracking_requests_are_dropped_when_queue_is_full(
+    settings: SettingsWrapper, requests_mock: Mocker
+) -> None:
+    """
+    Check that tracking requests are dropped instead of blocking when the queue is full
+
+    :param settings: The fixture providing the django settings
+    :param requests_mock: The fixture providing the mocked requests
+    """
+    settings.MATOMO_URL = "https://matomo.example.com"
+    sending = threading.Event()
+    release = threading.Event()
+
+    def block_worker(request: _RequestObjectProxy, context: _Context) -> str:
+        """
+        Block the worker until the queue was filled
+
+        :param request: The request to Matomo
+        :param context: The context of the response
+        :return: The response body
+        """
+        sending.set()
+        release.wait(5)
+        return ""
+
+    matomo_mock = requests_mock.post(
+        "https://matomo.example.com/matomo.php", text=block_worker
+    )
+    tracking_queue = MatomoTrackingQueue(maxsize=1, num_workers=1)
+    assert tracking_queue.track(get_tracking_data(1, "token"))
+    assert sending.wait(5)
+    # The worker is busy, so the first request fills the queue and the second is dropped
+    assert tracking_queue.track(get_tracking_data(1, "token"))
+    assert not tracking_queue.track(get_tracking_data(1, "token"))
+    assert tracking_queue.dropped == 1
+    release.set()
+    tracking_queue.shutdown()
+    assert matomo_mock.call_count == 2
+    assert tracking_queue.failed == 0
+
+
+def test_worker_survives_unexpected_errors(
+    settings: SettingsWrapper, requests_mock: Mocker
+) -> None:
+    """
+    Check that an unexpected error while sending a batch does not kill the worker and that dead workers are restarted
+
+    :param settings: The fixture providing the django settings
+    :param requests_mock: The fixture providing the mocked requests
+    """
+    settings.MATOMO_URL = "https://matomo.example.com"
+    matomo_mock = requests_mock.post("https://matomo.example.com/matomo.php")
+    tracking_queue = MatomoTrackingQueue(num_workers=1)
+    with patch.object(tracking_queue, "send", side_effect=ValueError):
+        assert tracking_queue.track(get_tracking_data(1, "token"))
+        tracking_queue.start().join()
+    assert tracking_queue.failed == 1
+    assert tracking_queue.workers[0].is_alive()
+    # Simulate a worker which died nevertheless
+    dead_worker = threading.Thread(target=lambda: None)
+    dead_worker.start()
+    dead_worker.join()
+    tracking_queue.workers[0] = dead_worker
+    assert tracking_queue.track(get_tracking_data(1, "token"))
+    assert tracking_queue.workers[0] is not dead_worker
+    tracking_queue.shutdown()
+    assert matomo_mock.call_count == 1
+
+
+@pytest.mark.django_db
+def test_failed_tracking_requests_are_coalesced(settings: SettingsWrapper) -> None:
+    """
+    Check that failed tracking requests of a site are added to its pending retry job instead of creating a new job
+    per failed batch
+
+    :param settings: The fixture providing the django settings
+    """
+    settings.BACKGROUND_JOB_QUEUE_ENABLED = True
+    tracking_queue = MatomoTrackingQueue(maxsize=3)
+    tracking_queue.retry_later(1, ["?a", "?b"])
+    tracking_queue.retry_later(1, ["?c", "?d"])
+    tracking_queue.retry_later(2, ["?e"])
+    jobs = BackgroundJob.objects.order_by("id")
+    assert [job.kwargs for job in jobs] == [
+        {"site_id": 1, "tracking_requests": ["?b", "?c", "?d"]},
+        {"site_id": 2, "tracking_requests": ["?e"]},
+    ]
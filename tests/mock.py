@@ -1,4 +1,5 @@
 import json
+from collections.abc import Callable
 
 from pytest_httpserver.httpserver import HTTPServer
 from werkzeug.wrappers import Request, Response
@@ -13,10 +14,16 @@ class MockServer:
         self.requests_counter = 0
         self.http_server = http_server
 
-    def configure(self, path: str, response_status: int, response_data: dict) -> None:
+    def configure(
+        self,
+        path: str,
+        response_status: int,
+        response_data: dict | Callable[[Request], dict],
+    ) -> None:
         def handler(request: Request) -> Response:
             self.requests_counter += 1
-            return Response(json.dumps(response_data), status=response_status)
+            data = response_data(request) if callable(response_data) else response_data
+            return Response(json.dumps(data), status=response_status)
 
         self.http_server.expect_request(path).respond_with_handler(handler)
 
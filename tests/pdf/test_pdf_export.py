@@ -1,13 +1,26 @@
 from __future__ import annotations
 
 import io
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 from urllib.parse import quote, urlencode
 
 import PyPDF3
 import pytest
+from django.core.cache import cache
 from django.test.client import Client
 from django.urls import reverse
 
+from integreat_cms.cms.utils.pdf_utils import (
+    acquire_pdf_rendering_slot,
+    pdf_storage,
+    pending_pdfs,
+)
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
 
 # pylint: disable=too-many-locals
 @pytest.mark.django_db
@@ -140,3 +153,66 @@ def test_pdf_export_invalid(
     for response in [response_cms, response_api]:
         print(response.headers)
         assert response.status_code == 404
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("tests.pdf.dummy_django_app.static_urls")
+def test_pdf_export_pending(
+    load_test_data: None, client: Client, settings: SettingsWrapper
+) -> None:
+    """
+    Test whether concurrent requests for the same PDF wait for the pending rendering instead of rendering it again
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param client: The fixture providing the anonymous user
+    :param settings: The fixture providing the django settings
+    """
+    settings.PDF_RENDERING_WAIT_TIMEOUT = 0
+    kwargs = {"region_slug": "augsburg", "language_slug": "de"}
+    export_pdf_api = reverse("api:pdf_export", kwargs=kwargs)
+    url = f"{export_pdf_api}?{urlencode({'url': '/augsburg/de/willkommen/'})}"
+    filename = "6262976c99/Integreat - Deutsch - Willkommen.pdf"
+    if pdf_storage.exists(filename):
+        pdf_storage.delete(filename)
+    pending_rendering: Future = Future()
+    with patch.dict(pending_pdfs, {"6262976c99": pending_rendering}):
+        response = client.get(url)
+        assert response.status_code == 202
+        assert response.headers.get("Retry-After") == "5"
+        assert not pdf_storage.exists(filename)
+    # Without pending rendering, the PDF is rendered again
+    settings.PDF_RENDERING_WAIT_TIMEOUT = 60
+    response = client.get(url)
+    assert response.status_code == 302
+    assert response.headers.get("Location") == f"/pdf/{quote(filename)}"
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("tests.pdf.dummy_django_app.static_urls")
+def test_pdf_export_no_free_slot(
+    load_test_data: None, client: Client, settings: SettingsWrapper
+) -> None:
+    """
+    Test whether PDFs are not rendered if all global rendering slots are taken
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param client: The fixture providing the anonymous user
+    :param settings: The fixture providing the django settings
+    """
+    settings.PDF_RENDERING_SLOTS = 1
+    kwargs = {"region_slug": "augsburg", "language_slug": "de"}
+    export_pdf_api = reverse("api:pdf_export", kwargs=kwargs)
+    url = f"{export_pdf_api}?{urlencode({'url': '/augsburg/de/willkommen/'})}"
+    filename = "6262976c99/Integreat - Deutsch - Willkommen.pdf"
+    if pdf_storage.exists(filename):
+        pdf_storage.delete(filename)
+    assert acquire_pdf_rendering_slot() == 0
+    assert acquire_pdf_rendering_slot() is None
+    response = client.get(url)
+    assert response.status_code == 202
+    assert not pdf_storage.exists(filename)
+    # Once the slot is free again, the PDF is rendered and the slot is released afterwards
+    cache.delete("pdf_rendering_slot_0")
+    response = client.get(url)
+    assert response.status_code == 302
+    assert acquire_pdf_rendering_slot() == 0
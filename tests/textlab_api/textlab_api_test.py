@@ -13,6 +13,7 @@ from integreat_cms.cms.constants.roles import EDITOR
 from integreat_cms.cms.models.pages.page import Page
 from integreat_cms.cms.models.pages.page_translation import PageTranslation
 from integreat_cms.cms.models.regions.region import Region
+from integreat_cms.cms.views.utils.hix import is_hix_score_cached, lookup_hix_score
 from tests.mock import MockServer
 
 if TYPE_CHECKING:
@@ -317,3 +318,31 @@ def test_hix_response_400(
 
     assert page_translation.hix_score is None
     assert page_translation.hix_feedback is None
+
+
+@pytest.mark.django_db
+def test_hix_score_cache(
+    settings: SettingsWrapper,
+    mock_server: MockServer,
+) -> None:
+    """
+    Check that the HIX score of identical texts is only requested once from the TextLab API
+
+    :param settings: The fixture providing the django settings
+    :param mock_server: The fixture providing the dummy http server
+    """
+    # Setup a mocked Textlab API server with dummy responses
+    mock_server.configure("/user/login", 200, {"token": "dummy"})
+    mock_server.configure("/benchmark/420", 200, {"formulaHix": 20.0})
+
+    # Redirect call aimed at the Textlab API to the fake server
+    settings.TEXTLAB_API_URL = f"http://localhost:{mock_server.port}"
+
+    assert not is_hix_score_cached("Neuer Inhalt5\nZweite Zeile")
+    assert lookup_hix_score("Neuer Inhalt5\nZweite Zeile")["score"] == 20.0
+    assert mock_server.requests_counter == 2
+
+    # Texts which only differ in their line break characters share the same score
+    assert is_hix_score_cached("Neuer Inhalt5\r\nZweite Zeile")
+    assert lookup_hix_score("Neuer Inhalt5\r\nZweite Zeile")["score"] == 20.0
+    assert mock_server.requests_counter == 2
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from _pytest.logging import LogCaptureFixture
+    from django.http import HttpResponse, StreamingHttpResponse
 
 
 def get_messages(caplog: LogCaptureFixture) -> list[str]:
@@ -64,3 +65,15 @@ def assert_message_in_log(message: str, caplog: LogCaptureFixture) -> None:
         f"The following message: \n\n{message}\n\nwas not found in the message log:\n\n"
         + ("\n".join(messages) if messages else "empty message log.")
     )
+
+
+def get_response_content(response: HttpResponse | StreamingHttpResponse) -> bytes:
+    """
+    Get the content of a response, regardless of whether it is streamed or not
+
+    :param response: The response
+    :return: The content of the response
+    """
+    if response.streaming:
+        return b"".join(response.streaming_content)
+    return response.content
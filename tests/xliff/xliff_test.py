@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import filecmp
 import io
+import shutil
 import zipfile
 from os import listdir
 from os.path import isfile, join
@@ -13,6 +14,7 @@ from lxml.html import fromstring
 
 from integreat_cms.cms.constants import translation_status
 from integreat_cms.cms.models import Page
+from integreat_cms.xliff.utils import get_xliff_imports, xliffs_to_pages
 
 from ..conftest import (
     ANONYMOUS,
@@ -31,7 +33,7 @@ if TYPE_CHECKING:
     from typing import Any
 
     from _pytest.logging import LogCaptureFixture
-    from django.test.client import Client
+    from django.test.client import Client, RequestFactory
     from pytest_django.fixtures import SettingsWrapper
 
 
@@ -128,6 +130,53 @@ def test_xliff_export(
         assert response.status_code == 403
 
 
+@pytest.mark.django_db
+# Override urls to serve XLIFF files
+@pytest.mark.urls("tests.xliff.dummy_django_app.static_urls")
+def test_xliff_export_multiple_languages(
+    load_test_data: None,
+    admin_client: Client,
+) -> None:
+    """
+    This test checks whether the export into multiple languages writes the XLIFF files of all languages into one ZIP
+    archive
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param admin_client: The fixture providing the logged in admin
+    """
+    export_xliff = reverse(
+        "download_xliff_multiple_languages",
+        kwargs={"region_slug": "augsburg", "language_slug": "de"},
+    )
+    page_tree = reverse(
+        "pages", kwargs={"region_slug": "augsburg", "language_slug": "de"}
+    )
+    response = admin_client.post(
+        export_xliff,
+        data={
+            "selected_ids[]": [1, 2, 3, 4, 5],
+            "selected_language_slugs[]": ["en", "ar", "fa"],
+        },
+    )
+    assert response.status_code == 302
+    parsed_content = fromstring(admin_client.get(page_tree).content.decode("utf-8"))
+    download_links = [
+        link.attrib["href"]
+        for link in parsed_content.iter("a")
+        if "data-auto-download" in link.attrib
+    ]
+    assert len(download_links) == 1
+    response = admin_client.get(download_links[0])
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.getvalue()), "r") as zipped_file:
+        assert zipped_file.testzip() is None
+        assert {name.split("_")[2] for name in zipped_file.namelist()} == {
+            "en",
+            "ar",
+            "fa",
+        }
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     "import_1,import_2",
@@ -175,3 +224,60 @@ def test_xliff_import(
     else:
         # For logged in users, we want to show an error if they get a permission denied
         assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_xliff_import_cache(
+    load_test_data: None,
+    tmp_path: Path,
+    rf: RequestFactory,
+) -> None:
+    """
+    This test checks whether deserialized XLIFF imports are cached in a compact representation which only contains
+    the changed fields and is discarded when the uploaded files change
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param tmp_path: The fixture providing a temporary directory
+    :param rf: The fixture providing a request factory
+    """
+    xliff_file = "augsburg_de_en_1_2_willkommen.xliff"
+    shutil.copy(f"tests/xliff/files/import/{xliff_file}", tmp_path / xliff_file)
+    request = rf.get("/")
+
+    xliff_imports = get_xliff_imports(request, str(tmp_path))
+    assert list(xliff_imports) == [xliff_file]
+    (compact,) = xliff_imports[xliff_file]["page_translations"]
+    assert compact["page_id"] == 1
+    assert compact["fields"] == {
+        "title": "Updated title",
+        "content": "<p>Updated content</p>",
+    }
+    # The cached result is reused as long as the files did not change
+    assert get_xliff_imports(request, str(tmp_path)) == xliff_imports
+
+    ((page_translation, base_changed),) = [
+        (page_translation, base_changed)
+        for _, page_translation, base_changed in xliffs_to_pages(request, str(tmp_path))
+    ]
+    existing_translation = page_translation.page.get_translation("en")
+    assert compact["base_version_id"] == existing_translation.id
+    assert not base_changed
+    assert page_translation.id is None
+    assert page_translation.version == existing_translation.version + 1
+    assert page_translation.slug == existing_translation.slug
+    assert page_translation.title == "Updated title"
+
+    # A new version which was created after the files were deserialized is detected
+    existing_translation.pk = None
+    existing_translation.version += 1
+    existing_translation.save()
+    assert [
+        base_changed for _, _, base_changed in xliffs_to_pages(request, str(tmp_path))
+    ] == [True]
+
+    shutil.copy(
+        "tests/xliff/files/import/augsburg_de_en_1_2_willkommen_unchanged.xliff",
+        tmp_path / xliff_file,
+    )
+    # The cached result is discarded when a file changed
+    assert get_xliff_imports(request, str(tmp_path)) != xliff_imports
@@ -43,6 +43,11 @@ while [[ -z $(compgen -G "${PACKAGE_DIR}/static/dist/main.*.js") ]]; do
     sleep 1
 done
 
+# Execute background jobs in a separate worker process like in production
+export INTEGREAT_CMS_BACKGROUND_JOB_QUEUE_ENABLED=1
+echo -e "Starting background job worker in background..." | print_info | print_prefix "jobs" 35
+deescalate_privileges integreat-cms-cli run_background_jobs 2>&1 | print_prefix "jobs" 35 &
+
 # Show success message once dev server is up
 listen_for_devserver &
 